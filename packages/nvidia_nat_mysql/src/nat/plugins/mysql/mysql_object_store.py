@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+from collections.abc import AsyncIterator
 
 import aiomysql
 from aiomysql.pool import Pool
@@ -209,3 +210,23 @@ class MySQLObjectStore(ObjectStore):
                 except Exception:
                     await conn.rollback()
                     raise
+
+    @override
+    async def list_keys(self, prefix: str = "") -> AsyncIterator[str]:
+
+        if not self._conn_pool:
+            raise RuntimeError("Connection not established")
+
+        # Escape the LIKE wildcards of the prefix, the backslash is the default escape character
+        pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+        async with self._conn_pool.acquire() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"USE {self._schema};")
+                await cur.execute("SELECT path FROM object_meta WHERE path LIKE %s", (pattern, ))
+                while True:
+                    rows = await cur.fetchmany(1000)
+                    if not rows:
+                        break
+                    for (key, ) in rows:
+                        yield key
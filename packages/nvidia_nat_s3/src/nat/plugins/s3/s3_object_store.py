@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import logging
+from collections.abc import AsyncIterator
 
 import aioboto3
 from botocore.client import BaseClient
@@ -166,3 +167,12 @@ class S3ObjectStore(ObjectStore):
 
         if results.get('DeleteMarker', False):
             raise NoSuchKeyError(key=key, additional_message="Object was a delete marker")
+
+    async def list_keys(self, prefix: str = "") -> AsyncIterator[str]:
+        if self._client is None:
+            raise RuntimeError("Connection not established")
+
+        paginator = self._client.get_paginator("list_objects_v2")
+        async for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield obj["Key"]
@@ -115,3 +115,15 @@ class ObjectStoreTests:
         # Try to delete the object again
         with pytest.raises(NoSuchKeyError):
             await store.delete_object(key)
+
+    async def test_list_keys(self, store: ObjectStore):
+
+        prefix = f"test_prefix_{uuid.uuid4()}/"
+        keys = {f"{prefix}a", f"{prefix}b/c"}
+        for key in keys:
+            await store.put_object(key, ObjectStoreItem(data=b"test_value"))
+        await store.put_object(f"test_key_{uuid.uuid4()}", ObjectStoreItem(data=b"test_value"))
+
+        assert {key async for key in store.list_keys(prefix)} == keys
+        assert keys <= {key async for key in store.list_keys()}
+        assert [key async for key in store.list_keys(f"test_prefix_{uuid.uuid4()}/")] == []
@@ -16,6 +16,7 @@
 import asyncio
 import json
 import logging
+import random
 from abc import ABC
 from abc import abstractmethod
 from enum import Enum
@@ -37,6 +38,9 @@ TOOL_NOT_FOUND_ERROR_MESSAGE = "There is no tool named {tool_name}. Tool must be
 INPUT_SCHEMA_MESSAGE = ". Arguments must be provided as a valid JSON object following this format: {schema}"
 NO_INPUT_ERROR_MESSAGE = "No human input received to the agent, Please ask a valid question."
 
+# Upper bound of the delay between two attempts of a tool call, in seconds
+TOOL_CALL_MAX_BACKOFF = 30.0
+
 AGENT_LOG_PREFIX = "[AGENT]"
 AGENT_CALL_LOG_MESSAGE = f"\n{'-' * 30}\n" + \
                                  AGENT_LOG_PREFIX + "\n" + \
@@ -70,13 +74,16 @@ class BaseAgent(ABC):
                  llm: BaseChatModel,
                  tools: list[BaseTool],
                  callbacks: list[AsyncCallbackHandler] | None = None,
-                 detailed_logs: bool = False) -> None:
+                 detailed_logs: bool = False,
+                 tool_concurrency_limits: dict[str, int] | None = None) -> None:
         logger.debug("Initializing Agent Graph")
         self.llm = llm
         self.tools = tools
         self.callbacks = callbacks or []
         self.detailed_logs = detailed_logs
         self.graph = None
+        self.tool_concurrency_limits = tool_concurrency_limits or {}
+        self._tool_semaphores: dict[str, asyncio.Semaphore] = {}
 
     async def _stream_llm(self,
                           runnable: Any,
@@ -122,13 +129,34 @@ class BaseAgent(ABC):
         response = await self.llm.ainvoke(messages)
         return AIMessage(content=str(response.content))
 
-    async def _call_tool(self,
-                         tool: BaseTool,
-                         tool_input: dict[str, Any] | str,
-                         config: RunnableConfig | None = None,
-                         max_retries: int = 3) -> ToolMessage:
+    def _tool_semaphore(self, tool_name: str) -> asyncio.Semaphore | None:
+        """Return the semaphore bounding the concurrent calls of a tool, or None if the tool is not limited."""
+        limit = self.tool_concurrency_limits.get(tool_name)
+        if limit is None:
+            return None
+        if tool_name not in self._tool_semaphores:
+            self._tool_semaphores[tool_name] = asyncio.Semaphore(limit)
+        return self._tool_semaphores[tool_name]
+
+    async def _invoke_tool(self, tool: BaseTool, tool_input: dict[str, Any] | str, config: RunnableConfig | None):
+        semaphore = self._tool_semaphore(tool.name)
+        if semaphore is None:
+            return await tool.ainvoke(tool_input, config=config)
+        async with semaphore:
+            return await tool.ainvoke(tool_input, config=config)
+
+    async def _call_tool_with_retries(self,
+                                      tool: BaseTool,
+                                      tool_input: dict[str, Any] | str,
+                                      config: RunnableConfig | None = None,
+                                      max_retries: int = 3,
+                                      timeout: float | None = None) -> Any:
         """
-        Call a tool with retry logic and error handling.
+        Call a tool with retry logic, and return its raw output.
+
+        Failed attempts are retried after an exponential backoff with full jitter, so that concurrent calls failing
+        together do not retry in lockstep. Only the calling task waits for the backoff, and cancelling it interrupts
+        both the tool call and the backoff.
 
         Parameters
         ----------
@@ -140,51 +168,118 @@ class BaseAgent(ABC):
             The config to pass to the tool
         max_retries : int
             Maximum number of retry attempts (default: 3)
+        timeout : float | None
+            Time budget in seconds for all attempts, including the time spent waiting for a concurrency slot and between
+            retries. No attempt is started past the deadline, and an attempt in flight when it passes is abandoned.
 
         Returns
         -------
-        ToolMessage
-            The tool response
+        Any
+            The output of the tool
+
+        Raises
+        ------
+        Exception
+            The exception raised by the last attempt, or a TimeoutError if the time budget is exhausted
         """
+        if max_retries < 1:
+            raise ValueError("max_retries must be at least 1")
+
         last_exception = None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
 
         for attempt in range(1, max_retries + 1):
             try:
-                response = await tool.ainvoke(tool_input, config=config)
-
-                # Handle empty responses
-                if response is None or (isinstance(response, str) and response == ""):
-                    return ToolMessage(name=tool.name,
-                                       tool_call_id=tool.name,
-                                       content=f"The tool {tool.name} provided an empty response.")
-
-                return ToolMessage(name=tool.name, tool_call_id=tool.name, content=response)
+                async with asyncio.timeout_at(deadline):
+                    return await self._invoke_tool(tool, tool_input, config)
+
+            except TimeoutError as e:
+                if deadline is None or loop.time() < deadline:
+                    # Raised by the tool itself rather than by the deadline, retry as any other error
+                    last_exception = e
+                else:
+                    last_exception = TimeoutError(f"Tool call timed out after {timeout} seconds")
+                    break
 
             except Exception as e:
                 last_exception = e
 
-                # If this was the last attempt, don't sleep
-                if attempt == max_retries:
-                    break
+            # If this was the last attempt, don't sleep
+            if attempt == max_retries:
+                break
+
+            logger.warning("%s Tool call attempt %d/%d failed for tool %s: %s",
+                           AGENT_LOG_PREFIX,
+                           attempt,
+                           max_retries,
+                           tool.name,
+                           str(last_exception))
 
-                logger.warning("%s Tool call attempt %d/%d failed for tool %s: %s",
-                               AGENT_LOG_PREFIX,
-                               attempt,
-                               max_retries,
-                               tool.name,
-                               str(e))
+            # Exponential backoff with full jitter: uniform in [0, 2^attempt] seconds
+            sleep_time = random.uniform(0, min(2**attempt, TOOL_CALL_MAX_BACKOFF))
+            if deadline is not None and loop.time() + sleep_time >= deadline:
+                logger.debug("%s Not retrying tool call for %s, the retry would start past the deadline",
+                             AGENT_LOG_PREFIX,
+                             tool.name)
+                break
 
-                # Exponential backoff: 2^attempt seconds
-                sleep_time = 2**attempt
-                logger.debug("%s Retrying tool call for %s in %d seconds...", AGENT_LOG_PREFIX, tool.name, sleep_time)
-                await asyncio.sleep(sleep_time)
+            logger.debug("%s Retrying tool call for %s in %.2f seconds...", AGENT_LOG_PREFIX, tool.name, sleep_time)
+            await asyncio.sleep(sleep_time)
 
+        raise last_exception
+
+    @staticmethod
+    def _tool_error_message(tool: BaseTool, exception: BaseException) -> ToolMessage:
         # pylint: disable=C0209
-        # All retries exhausted, return error message
-        error_content = "Tool call failed after all retry attempts. Last error: %s" % str(last_exception)
+        error_content = "Tool call failed after all retry attempts. Last error: %s" % str(exception)
         logger.error("%s %s", AGENT_LOG_PREFIX, error_content)
         return ToolMessage(name=tool.name, tool_call_id=tool.name, content=error_content, status="error")
 
+    @staticmethod
+    def _empty_tool_response(response: Any) -> bool:
+        return response is None or (isinstance(response, str) and response == "")
+
+    async def _call_tool(self,
+                         tool: BaseTool,
+                         tool_input: dict[str, Any] | str,
+                         config: RunnableConfig | None = None,
+                         max_retries: int = 3,
+                         timeout: float | None = None) -> ToolMessage:
+        """
+        Call a tool with retry logic and error handling, see `_call_tool_with_retries`.
+
+        Parameters
+        ----------
+        tool : BaseTool
+            The tool to call
+        tool_input : Union[Dict[str, Any], str]
+            The input to pass to the tool
+        config : RunnableConfig | None
+            The config to pass to the tool
+        max_retries : int
+            Maximum number of retry attempts (default: 3)
+        timeout : float | None
+            Time budget in seconds for all attempts
+
+        Returns
+        -------
+        ToolMessage
+            The tool response, or an error message once all the attempts failed
+        """
+        try:
+            response = await self._call_tool_with_retries(tool, tool_input, config, max_retries, timeout)
+        except Exception as e:
+            return self._tool_error_message(tool, e)
+
+        # Handle empty responses
+        if self._empty_tool_response(response):
+            return ToolMessage(name=tool.name,
+                               tool_call_id=tool.name,
+                               content=f"The tool {tool.name} provided an empty response.")
+
+        return ToolMessage(name=tool.name, tool_call_id=tool.name, content=response)
+
     def _log_tool_response(self, tool_name: str, tool_input: Any, tool_response: str, max_chars: int = 1000) -> None:
         """
         Log tool response with consistent formatting and length limits.
@@ -75,11 +75,18 @@ class ReActAgentGraph(DualNodeAgent):
                  retry_agent_response_parsing_errors: bool = True,
                  parse_agent_response_max_retries: int = 1,
                  tool_call_max_retries: int = 1,
-                 pass_tool_call_errors_to_agent: bool = True):
-        super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
+                 pass_tool_call_errors_to_agent: bool = True,
+                 tool_call_timeout: float | None = None,
+                 tool_concurrency_limits: dict[str, int] | None = None):
+        super().__init__(llm=llm,
+                         tools=tools,
+                         callbacks=callbacks,
+                         detailed_logs=detailed_logs,
+                         tool_concurrency_limits=tool_concurrency_limits)
         self.parse_agent_response_max_retries = (parse_agent_response_max_retries
                                                  if retry_agent_response_parsing_errors else 1)
         self.tool_call_max_retries = tool_call_max_retries
+        self.tool_call_timeout = tool_call_timeout
         self.pass_tool_call_errors_to_agent = pass_tool_call_errors_to_agent
         logger.debug(
             "%s Filling the prompt variables 'tools' and 'tool_names', using the tools provided in the config.",
@@ -276,7 +283,8 @@ class ReActAgentGraph(DualNodeAgent):
             tool_response = await self._call_tool(requested_tool,
                                                   tool_input_dict,
                                                   RunnableConfig(callbacks=self.callbacks),
-                                                  max_retries=self.tool_call_max_retries)
+                                                  max_retries=self.tool_call_max_retries,
+                                                  timeout=self.tool_call_timeout)
 
             if self.detailed_logs:
                 self._log_tool_response(requested_tool.name, tool_input_dict, str(tool_response.content))
@@ -293,7 +301,8 @@ class ReActAgentGraph(DualNodeAgent):
             tool_response = await self._call_tool(requested_tool,
                                                   tool_input_str,
                                                   RunnableConfig(callbacks=self.callbacks),
-                                                  max_retries=self.tool_call_max_retries)
+                                                  max_retries=self.tool_call_max_retries,
+                                                  timeout=self.tool_call_timeout)
 
         if self.detailed_logs:
             self._log_tool_response(requested_tool.name, tool_input_str, str(tool_response.content))
@@ -17,6 +17,7 @@ import logging
 
 from pydantic import AliasChoices
 from pydantic import Field
+from pydantic import PositiveInt
 
 from nat.builder.builder import Builder
 from nat.builder.framework_enum import LLMFrameworkEnum
@@ -52,6 +53,13 @@ class ReActAgentWorkflowConfig(FunctionBaseConfig, name="react_agent"):
         description="Maximum number of times the Agent may retry parsing errors. "
         "Prevents the Agent from getting into infinite hallucination loops.")
     tool_call_max_retries: int = Field(default=1, description="The number of retries before raising a tool call error.")
+    tool_call_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Time budget in seconds for all the attempts of a tool call. No limit if unset.")
+    tool_concurrency_limits: dict[str, PositiveInt] = Field(
+        default_factory=dict,
+        description="Maximum number of concurrent calls per tool name, across the concurrent runs of the agent.")
     max_tool_calls: int = Field(default=15,
                                 validation_alias=AliasChoices("max_tool_calls", "max_iterations"),
                                 description="Maximum number of tool calls before stopping the agent.")
@@ -103,6 +111,8 @@ async def react_agent_workflow(config: ReActAgentWorkflowConfig, builder: Builde
         retry_agent_response_parsing_errors=config.retry_agent_response_parsing_errors,
         parse_agent_response_max_retries=config.parse_agent_response_max_retries,
         tool_call_max_retries=config.tool_call_max_retries,
+        tool_call_timeout=config.tool_call_timeout,
+        tool_concurrency_limits=config.tool_concurrency_limits,
         pass_tool_call_errors_to_agent=config.pass_tool_call_errors_to_agent).build_graph()
 
     async def _response_fn(input_message: ChatRequest) -> ChatResponse:
@@ -13,9 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 # pylint: disable=R0917
 import logging
+import re
 from json import JSONDecodeError
 
 from langchain_core.callbacks.base import AsyncCallbackHandler
@@ -67,9 +69,14 @@ class ReWOOAgentGraph(BaseAgent):
                  tools: list[BaseTool],
                  use_tool_schema: bool = True,
                  callbacks: list[AsyncCallbackHandler] | None = None,
-                 detailed_logs: bool = False):
+                 detailed_logs: bool = False,
+                 max_concurrent_steps: int = 4):
         super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
 
+        if max_concurrent_steps < 1:
+            raise ValueError("max_concurrent_steps must be at least 1")
+        self.max_concurrent_steps = max_concurrent_steps
+
         logger.debug(
             "%s Filling the prompt variables 'tools' and 'tool_names', using the tools provided in the config.",
             AGENT_LOG_PREFIX)
@@ -206,7 +213,103 @@ class ReWOOAgentGraph(BaseAgent):
             logger.exception("%s Failed to call planner_node: %s", AGENT_LOG_PREFIX, ex, exc_info=True)
             raise ex
 
+    @staticmethod
+    def _get_step_dependencies(steps: list) -> list[set[int]]:
+        """
+        Return, for each step, the indices of the earlier steps whose placeholders are referenced in its tool input.
+
+        Only earlier steps are considered, a reference to the placeholder of a later step is left as is, as it would
+        be when running the steps in order.
+        """
+        placeholders = []
+        dependencies = []
+        for index, step in enumerate(steps):
+            step_info = step.get("evidence", {}) if isinstance(step, dict) else {}
+            tool_input = step_info.get("tool_input", "")
+            tool_input = tool_input if isinstance(tool_input, str) else json.dumps(tool_input, default=str)
+
+            # A placeholder must not match the prefix of a longer one, "#E1" is not referenced by "#E10"
+            dependencies.append({
+                earlier
+                for earlier, placeholder in enumerate(placeholders)
+                if placeholder and re.search(re.escape(placeholder) + r"(?!\w)", tool_input)
+            })
+            placeholders.append(step_info.get("placeholder", ""))
+        return dependencies
+
+    async def _execute_step(self,
+                            step_index: int,
+                            step: dict,
+                            intermediate_results: dict[str, ToolMessage],
+                            available_placeholders: list[str]):
+        """Run the tool of a single plan step and record its output in `intermediate_results`."""
+        if not isinstance(step, dict) or "evidence" not in step:
+            logger.error("%s Invalid step format at index %s", AGENT_LOG_PREFIX, step_index)
+            return
+
+        step_info = step["evidence"]
+        placeholder = step_info.get("placeholder", "")
+        tool = step_info.get("tool", "")
+        tool_input = step_info.get("tool_input", "")
+
+        # Replace the placeholders of the earlier steps in the tool input with their output, longest first so that a
+        # placeholder is not replaced within a longer one
+        for _placeholder in sorted(available_placeholders, key=len, reverse=True):
+            if _placeholder not in intermediate_results:
+                continue
+            _tool_output = intermediate_results[_placeholder].content
+            # If the content is a list, get the first element which should be a dict
+            if isinstance(_tool_output, list):
+                _tool_output = _tool_output[0]
+                assert isinstance(_tool_output, dict)
+
+            tool_input = self._replace_placeholder(_placeholder, tool_input, _tool_output)
+
+        requested_tool = self._get_tool(tool)
+        if not requested_tool:
+            configured_tool_names = list(self.tools_dict.keys())
+            logger.warning(
+                "%s ReWOO Agent wants to call tool %s. In the ReWOO Agent's configuration within the config file,"
+                "there is no tool with that name: %s",
+                AGENT_LOG_PREFIX,
+                tool,
+                configured_tool_names)
+
+            intermediate_results[placeholder] = ToolMessage(content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(
+                tool_name=tool, tools=configured_tool_names),
+                                                            tool_call_id=tool)
+            return
+
+        if self.detailed_logs:
+            logger.debug("%s Calling tool %s with input: %s", AGENT_LOG_PREFIX, requested_tool.name, tool_input)
+
+        # Run the tool. Try to use structured input, if possible
+        tool_input_parsed = self._parse_tool_input(tool_input)
+        tool_response = await self._call_tool(requested_tool,
+                                              tool_input_parsed,
+                                              RunnableConfig(callbacks=self.callbacks),
+                                              max_retries=3)
+
+        # ToolMessage only accepts str or list[str | dict] as content.
+        # Convert into list if the response is a dict.
+        if isinstance(tool_response, dict):
+            tool_response = [tool_response]
+
+        tool_response_message = ToolMessage(name=tool, tool_call_id=tool, content=tool_response)
+
+        if self.detailed_logs:
+            self._log_tool_response(requested_tool.name, tool_input_parsed, str(tool_response))
+
+        intermediate_results[placeholder] = tool_response_message
+
     async def executor_node(self, state: ReWOOGraphState):
+        """
+        Run the remaining steps of the plan.
+
+        A step depends on the earlier steps whose placeholders appear in its tool input. Each step is started as soon as
+        the steps it depends on have completed, with at most `max_concurrent_steps` steps running at the same time, so
+        independent steps run concurrently and the plan completes in the time of its longest chain of dependent steps.
+        """
         try:
             logger.debug("%s Starting the ReWOO Executor Node", AGENT_LOG_PREFIX)
 
@@ -218,69 +321,49 @@ class ReWOOAgentGraph(BaseAgent):
                              current_step)
                 raise RuntimeError(f"ReWOO Executor is invoked with an invalid step number: {current_step}")
 
-            steps_content = state.steps.content
-            if isinstance(steps_content, list) and current_step < len(steps_content):
-                step = steps_content[current_step]
-                if isinstance(step, dict) and "evidence" in step:
-                    step_info = step["evidence"]
-                    placeholder = step_info.get("placeholder", "")
-                    tool = step_info.get("tool", "")
-                    tool_input = step_info.get("tool_input", "")
-                else:
-                    logger.error("%s Invalid step format at index %s", AGENT_LOG_PREFIX, current_step)
-                    return {"intermediate_results": state.intermediate_results}
-            else:
-                logger.error("%s Invalid steps content or index %s", AGENT_LOG_PREFIX, current_step)
+            steps = state.steps.content
+            if not isinstance(steps, list):
+                logger.error("%s Invalid steps content", AGENT_LOG_PREFIX)
                 return {"intermediate_results": state.intermediate_results}
 
             intermediate_results = state.intermediate_results
-
-            # Replace the placeholder in the tool input with the previous tool output
-            for _placeholder, _tool_output in intermediate_results.items():
-                _tool_output = _tool_output.content
-                # If the content is a list, get the first element which should be a dict
-                if isinstance(_tool_output, list):
-                    _tool_output = _tool_output[0]
-                    assert isinstance(_tool_output, dict)
-
-                tool_input = self._replace_placeholder(_placeholder, tool_input, _tool_output)
-
-            requested_tool = self._get_tool(tool)
-            if not requested_tool:
-                configured_tool_names = list(self.tools_dict.keys())
-                logger.warning(
-                    "%s ReWOO Agent wants to call tool %s. In the ReWOO Agent's configuration within the config file,"
-                    "there is no tool with that name: %s",
-                    AGENT_LOG_PREFIX,
-                    tool,
-                    configured_tool_names)
-
-                intermediate_results[placeholder] = ToolMessage(content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(
-                    tool_name=tool, tools=configured_tool_names),
-                                                                tool_call_id=tool)
-                return {"intermediate_results": intermediate_results}
-
-            if self.detailed_logs:
-                logger.debug("%s Calling tool %s with input: %s", AGENT_LOG_PREFIX, requested_tool.name, tool_input)
-
-            # Run the tool. Try to use structured input, if possible
-            tool_input_parsed = self._parse_tool_input(tool_input)
-            tool_response = await self._call_tool(requested_tool,
-                                                  tool_input_parsed,
-                                                  RunnableConfig(callbacks=self.callbacks),
-                                                  max_retries=3)
-
-            # ToolMessage only accepts str or list[str | dict] as content.
-            # Convert into list if the response is a dict.
-            if isinstance(tool_response, dict):
-                tool_response = [tool_response]
-
-            tool_response_message = ToolMessage(name=tool, tool_call_id=tool, content=tool_response)
-
-            if self.detailed_logs:
-                self._log_tool_response(requested_tool.name, tool_input_parsed, str(tool_response))
-
-            intermediate_results[placeholder] = tool_response_message
+            placeholders = [
+                step["evidence"].get("placeholder", "") if isinstance(step, dict) and "evidence" in step else ""
+                for step in steps
+            ]
+            dependencies = self._get_step_dependencies(steps)
+            semaphore = asyncio.Semaphore(self.max_concurrent_steps)
+            tasks: dict[int, asyncio.Task] = {}
+
+            async def run_step(step_index: int):
+                # The tasks of the earlier steps are created before any step starts running
+                for dependency in dependencies[step_index]:
+                    if dependency in tasks:
+                        await tasks[dependency]
+                async with semaphore:
+                    await self._execute_step(step_index,
+                                             steps[step_index],
+                                             intermediate_results,
+                                             placeholders[:step_index])
+
+            # A failing step cancels the steps still running
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for step_index, placeholder in enumerate(placeholders):
+                        if placeholder in intermediate_results:
+                            continue
+                        tasks[step_index] = task_group.create_task(run_step(step_index))
+            except ExceptionGroup as ex_group:
+                raise ex_group.exceptions[0] from ex_group
+
+            # Keep the results in the order of the plan, regardless of the order in which the steps completed
+            ordered_results = {
+                placeholder: intermediate_results[placeholder]
+                for placeholder in placeholders if placeholder in intermediate_results
+            }
+            ordered_results.update(intermediate_results)
+            intermediate_results.clear()
+            intermediate_results.update(ordered_results)
             return {"intermediate_results": intermediate_results}
 
         except Exception as ex:
@@ -62,6 +62,11 @@ class ReWOOAgentWorkflowConfig(FunctionBaseConfig, name="rewoo_agent"):
     additional_solver_instructions: str | None = Field(
         default=None,
         description="Additional instructions to provide to the agent in addition to the base solver prompt.")
+    max_concurrent_steps: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of independent plan steps the executor runs at the same time. "
+        "Set to 1 to run the steps one at a time.")
 
 
 @register_function(config_type=ReWOOAgentWorkflowConfig, framework_wrappers=[LLMFrameworkEnum.LANGCHAIN])
@@ -113,7 +118,8 @@ async def rewoo_agent_workflow(config: ReWOOAgentWorkflowConfig, builder: Builde
                                                  solver_prompt=solver_prompt,
                                                  tools=tools,
                                                  use_tool_schema=config.include_tool_input_schema_in_tool_description,
-                                                 detailed_logs=config.verbose).build_graph()
+                                                 detailed_logs=config.verbose,
+                                                 max_concurrent_steps=config.max_concurrent_steps).build_graph()
 
     async def _response_fn(input_message: ChatRequest) -> ChatResponse:
         try:
@@ -14,24 +14,44 @@
 # limitations under the License.
 
 # pylint: disable=R0917
+import asyncio
+import json
 import logging
+import typing
 
 from langchain_core.callbacks.base import AsyncCallbackHandler
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import ToolMessage
 from langchain_core.messages.base import BaseMessage
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
-from langgraph.prebuilt import ToolNode
 from pydantic import BaseModel
 from pydantic import Field
 
 from nat.agent.base import AGENT_CALL_LOG_MESSAGE
 from nat.agent.base import AGENT_LOG_PREFIX
+from nat.agent.base import TOOL_NOT_FOUND_ERROR_MESSAGE
 from nat.agent.base import AgentDecision
 from nat.agent.dual_node import DualNodeAgent
 
 logger = logging.getLogger(__name__)
 
+# Types of the content blocks a tool can return, as recognized by LangGraph's ToolNode
+_CONTENT_BLOCK_TYPES = ("image", "image_url", "text", "json")
+
+
+def _tool_message_content(response: typing.Any) -> str | list[dict]:
+    """Content of the message sent to the LLM for a tool output, serialized the same way as LangGraph's ToolNode."""
+    if isinstance(response, str):
+        return response
+    if isinstance(response, list) and all(
+            isinstance(block, dict) and block.get("type") in _CONTENT_BLOCK_TYPES for block in response):
+        return response
+    try:
+        return json.dumps(response, ensure_ascii=False)
+    except Exception:  # pylint: disable=broad-except
+        return str(response)
+
 
 class ToolCallAgentGraphState(BaseModel):
     """State schema for the Tool Calling Agent Graph"""
@@ -41,6 +61,7 @@ class ToolCallAgentGraphState(BaseModel):
 class ToolCallAgentGraph(DualNodeAgent):
     """Configurable LangGraph Tool Calling Agent. A Tool Calling Agent requires an LLM which supports tool calling.
     A tool Calling Agent utilizes the tool input parameters to select the optimal tool.  Supports handling tool errors.
+    The tool calls requested by the LLM in a single turn are executed concurrently.
     Argument "detailed_logs" toggles logging of inputs, outputs, and intermediate steps."""
 
     def __init__(self,
@@ -48,9 +69,19 @@ class ToolCallAgentGraph(DualNodeAgent):
                  tools: list[BaseTool],
                  callbacks: list[AsyncCallbackHandler] = None,
                  detailed_logs: bool = False,
-                 handle_tool_errors: bool = True):
-        super().__init__(llm=llm, tools=tools, callbacks=callbacks, detailed_logs=detailed_logs)
-        self.tool_caller = ToolNode(tools, handle_tool_errors=handle_tool_errors)
+                 handle_tool_errors: bool = True,
+                 tool_call_max_retries: int = 1,
+                 tool_call_timeout: float | None = None,
+                 tool_concurrency_limits: dict[str, int] | None = None):
+        super().__init__(llm=llm,
+                         tools=tools,
+                         callbacks=callbacks,
+                         detailed_logs=detailed_logs,
+                         tool_concurrency_limits=tool_concurrency_limits)
+        self.tools_by_name = {tool.name: tool for tool in tools}
+        self.handle_tool_errors = handle_tool_errors
+        self.tool_call_max_retries = tool_call_max_retries
+        self.tool_call_timeout = tool_call_timeout
         logger.debug("%s Initialized Tool Calling Agent Graph", AGENT_LOG_PREFIX)
 
     async def agent_node(self, state: ToolCallAgentGraphState):
@@ -88,22 +119,57 @@ class ToolCallAgentGraph(DualNodeAgent):
             logger.warning("%s Ending graph traversal", AGENT_LOG_PREFIX)
             return AgentDecision.END
 
+    async def _run_tool_call(self, tool_call: dict) -> ToolMessage:
+        tool = self.tools_by_name.get(tool_call["name"])
+        if tool is None:
+            logger.warning("%s Agent wants to call tool %s, which is not configured",
+                           AGENT_LOG_PREFIX,
+                           tool_call["name"])
+            return ToolMessage(name=tool_call["name"],
+                               tool_call_id=tool_call["id"],
+                               content=TOOL_NOT_FOUND_ERROR_MESSAGE.format(tool_name=tool_call["name"],
+                                                                           tools=list(self.tools_by_name.keys())),
+                               status="error")
+
+        try:
+            output = await self._call_tool_with_retries(tool,
+                                                        tool_call["args"],
+                                                        RunnableConfig(callbacks=self.callbacks),
+                                                        max_retries=self.tool_call_max_retries,
+                                                        timeout=self.tool_call_timeout)
+        except Exception as e:
+            if not self.handle_tool_errors:
+                # Callers may catch the exceptions of the tool, raise it as is
+                raise
+            response = self._tool_error_message(tool, e)
+        else:
+            if self._empty_tool_response(output):
+                content = f"The tool {tool.name} provided an empty response."
+            else:
+                content = _tool_message_content(output)
+            response = ToolMessage(name=tool.name, tool_call_id=tool_call["id"], content=content)
+
+        if self.detailed_logs:
+            self._log_tool_response(tool.name, tool_call["args"], str(response.content))
+
+        # the response must reference the tool call it answers, the LLM may call the same tool several times
+        return response.model_copy(update={"tool_call_id": tool_call["id"]})
+
     async def tool_node(self, state: ToolCallAgentGraphState):
         try:
             logger.debug("%s Starting Tool Node", AGENT_LOG_PREFIX)
             tool_calls = state.messages[-1].tool_calls
-            tools = [tool.get('name') for tool in tool_calls]
-            tool_input = state.messages[-1]
-            tool_response = await self.tool_caller.ainvoke(input={"messages": [tool_input]},
-                                                           config=RunnableConfig(callbacks=self.callbacks,
-                                                                                 configurable={}))
-            # this configurable = {} argument is needed due to a bug in LangGraph PreBuilt ToolNode ^
-
-            for response in tool_response.get('messages'):
-                if self.detailed_logs:
-                    self._log_tool_response(str(tools), str(tool_input), response.content)
-                state.messages += [response]
 
+            # the tool calls of a turn are independent of each other, run them concurrently
+            responses = await asyncio.gather(*(self._run_tool_call(tool_call) for tool_call in tool_calls),
+                                             return_exceptions=True)
+
+            # only raised when tool errors are not handled, once all the calls of the turn completed
+            for response in responses:
+                if isinstance(response, BaseException):
+                    raise response
+
+            state.messages += responses
             return state
         except Exception as ex:
             logger.exception("%s Failed to call tool_node: %s", AGENT_LOG_PREFIX, ex, exc_info=ex)
@@ -16,6 +16,7 @@
 import logging
 
 from pydantic import Field
+from pydantic import PositiveInt
 
 from nat.builder.builder import Builder
 from nat.builder.framework_enum import LLMFrameworkEnum
@@ -39,6 +40,16 @@ class ToolCallAgentWorkflowConfig(FunctionBaseConfig, name="tool_calling_agent")
     llm_name: LLMRef = Field(description="The LLM model to use with the tool calling agent.")
     verbose: bool = Field(default=False, description="Set the verbosity of the tool calling agent's logging.")
     handle_tool_errors: bool = Field(default=True, description="Specify ability to handle tool calling errors.")
+    tool_call_max_retries: int = Field(default=1,
+                                       ge=1,
+                                       description="The number of attempts of a tool call before reporting an error.")
+    tool_call_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Time budget in seconds for all the attempts of a tool call. No limit if unset.")
+    tool_concurrency_limits: dict[str, PositiveInt] = Field(
+        default_factory=dict,
+        description="Maximum number of concurrent calls per tool name. Tools which are not listed are not limited.")
     description: str = Field(default="Tool Calling Agent Workflow", description="Description of this functions use.")
     max_iterations: int = Field(default=15, description="Number of tool calls before stoping the tool calling agent.")
 
@@ -71,10 +82,14 @@ async def tool_calling_agent_workflow(config: ToolCallAgentWorkflowConfig, build
         raise ex
 
     # construct the Tool Calling Agent Graph from the configured llm, and tools
-    graph: CompiledGraph = await ToolCallAgentGraph(llm=llm,
-                                                    tools=tools,
-                                                    detailed_logs=config.verbose,
-                                                    handle_tool_errors=config.handle_tool_errors).build_graph()
+    graph: CompiledGraph = await ToolCallAgentGraph(
+        llm=llm,
+        tools=tools,
+        detailed_logs=config.verbose,
+        handle_tool_errors=config.handle_tool_errors,
+        tool_call_max_retries=config.tool_call_max_retries,
+        tool_call_timeout=config.tool_call_timeout,
+        tool_concurrency_limits=config.tool_concurrency_limits).build_graph()
 
     async def _response_fn(input_message: str) -> str:
         try:
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 import typing
 import uuid
 from collections.abc import Awaitable
@@ -21,6 +22,7 @@ from contextlib import contextmanager
 from contextvars import ContextVar
 
 from nat.builder.intermediate_step_manager import IntermediateStepManager
+from nat.builder.intermediate_step_manager import StepRecord
 from nat.builder.user_interaction_manager import UserInteractionManager
 from nat.data_models.authentication import AuthenticatedContext
 from nat.data_models.authentication import AuthFlowType
@@ -29,12 +31,23 @@ from nat.data_models.interactive import HumanResponse
 from nat.data_models.interactive import InteractionPrompt
 from nat.data_models.intermediate_step import IntermediateStep
 from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepState
 from nat.data_models.intermediate_step import IntermediateStepType
 from nat.data_models.intermediate_step import StreamEventData
 from nat.data_models.invocation_node import InvocationNode
+from nat.observability.metrics import GlobalMetricsRegistry
 from nat.runtime.user_metadata import RequestAttributes
 from nat.utils.reactive.subject import Subject
 
+_function_duration = GlobalMetricsRegistry.get().histogram("nat_function_duration_seconds",
+                                                           "Duration of function invocations.", ("function", ))
+_function_in_flight = GlobalMetricsRegistry.get().gauge("nat_function_in_flight",
+                                                        "Number of function invocations currently running.",
+                                                        ("function", ))
+_function_errors = GlobalMetricsRegistry.get().counter("nat_function_errors_total",
+                                                       "Number of function invocations which raised an exception.",
+                                                       ("function", ))
+
 
 class Singleton(type):
 
@@ -181,28 +194,59 @@ class Context:
         # 1) Set the active function in the contextvar
         fn_token = self._context_state.active_function.set(current_function_node)
 
-        # 2) Optionally record function start as an intermediate step
+        # 2) Record function start as an intermediate step. Payloads are only built when the event stream is observed
+
+        def _start_payload() -> IntermediateStepPayload:
+            return IntermediateStepPayload(UUID=current_function_id,
+                                           event_type=IntermediateStepType.FUNCTION_START,
+                                           name=function_name,
+                                           data=StreamEventData(input=input_data))
+
         step_manager = self.intermediate_step_manager
-        step_manager.push_intermediate_step(
-            IntermediateStepPayload(UUID=current_function_id,
-                                    event_type=IntermediateStepType.FUNCTION_START,
-                                    name=function_name,
-                                    data=StreamEventData(input=input_data)))
+        step_manager.push_lazy_intermediate_step(
+            StepRecord(UUID=current_function_id,
+                       event_type=IntermediateStepType.FUNCTION_START,
+                       event_state=IntermediateStepState.START,
+                       name=function_name),
+            _start_payload)
 
         manager = ActiveFunctionContextManager()
+        error: Exception | None = None
+
+        in_flight = _function_in_flight.labels(function_name)
+        in_flight.inc()
+        start_ns = time.perf_counter_ns()
 
         try:
             yield manager  # run the function body
+        except Exception as e:
+            error = e
+            raise
         finally:
-            # 3) Record function end
-
-            data = StreamEventData(input=input_data, output=manager.output)
-
-            step_manager.push_intermediate_step(
-                IntermediateStepPayload(UUID=current_function_id,
-                                        event_type=IntermediateStepType.FUNCTION_END,
-                                        name=function_name,
-                                        data=data))
+            _function_duration.labels(function_name).observe_ns(time.perf_counter_ns() - start_ns)
+            in_flight.dec()
+            if error is not None:
+                _function_errors.labels(function_name).inc()
+
+            # 3) Record function end, flagging failures so that samplers and exporters can identify them
+
+            def _end_payload() -> IntermediateStepPayload:
+                metadata = None
+                if error is not None:
+                    metadata = {"error": {"type": type(error).__name__, "message": str(error)}}
+
+                return IntermediateStepPayload(UUID=current_function_id,
+                                               event_type=IntermediateStepType.FUNCTION_END,
+                                               name=function_name,
+                                               metadata=metadata,
+                                               data=StreamEventData(input=input_data, output=manager.output))
+
+            step_manager.push_lazy_intermediate_step(
+                StepRecord(UUID=current_function_id,
+                           event_type=IntermediateStepType.FUNCTION_END,
+                           event_state=IntermediateStepState.END,
+                           name=function_name),
+                _end_payload)
 
             # 4) Unset the function contextvar
             self._context_state.active_function.reset(fn_token)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import typing
 from abc import ABC
@@ -28,6 +29,7 @@ from nat.builder.function_base import FunctionBase
 from nat.builder.function_base import InputT
 from nat.builder.function_base import SingleOutputT
 from nat.builder.function_base import StreamingOutputT
+from nat.builder.function_info import BatchCallableT
 from nat.builder.function_info import FunctionInfo
 from nat.data_models.function import FunctionBaseConfig
 
@@ -297,6 +299,79 @@ class Function(FunctionBase[InputT, StreamingOutputT, SingleOutputT], ABC):
                 raise e
 
 
+class _BatchDispatcher:
+    """
+    Combines concurrent invocations of a function into calls of its batch implementation.
+
+    Invocations made while a batch is being collected join the batch. An invocation which ends up alone in its batch
+    runs the single implementation itself. The batch implementation runs in a separate task, in the context of the
+    invocation which started the batch.
+    """
+
+    # Result of an invocation which should run the single implementation
+    _RUN_SINGLE = object()
+
+    def __init__(self,
+                 single_fn: _InvokeFnT,
+                 batch_fn: BatchCallableT,
+                 max_batch_size: int | None = None,
+                 max_batch_wait: float = 0.0):
+        self._single_fn = single_fn
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._max_batch_wait = max_batch_wait
+        self._pending: list[tuple[typing.Any, asyncio.Future]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, value: typing.Any) -> typing.Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((value, future))
+
+        if (self._max_batch_size is not None and len(self._pending) >= self._max_batch_size):
+            self._flush()
+        elif (self._flush_handle is None):
+            self._flush_handle = loop.call_later(self._max_batch_wait, self._flush)
+
+        result = await future
+        if (result is self._RUN_SINGLE):
+            return await self._single_fn(value)
+        return result
+
+    def _flush(self) -> None:
+        if (self._flush_handle is not None):
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        # Skip the invocations which were cancelled while waiting
+        batch = [(value, future) for value, future in self._pending if not future.done()]
+        self._pending = []
+
+        if (len(batch) == 1):
+            batch[0][1].set_result(self._RUN_SINGLE)
+        elif batch:
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[typing.Any, asyncio.Future]]) -> None:
+        try:
+            results = await self._batch_fn([value for value, _ in batch])
+
+            if (len(results) != len(batch)):
+                raise ValueError(f"batch_fn returned {len(results)} outputs for {len(batch)} inputs")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
 class LambdaFunction(Function[InputT, StreamingOutputT, SingleOutputT]):
 
     def __init__(self, *, config: FunctionBaseConfig, info: FunctionInfo, instance_name: str | None = None):
@@ -313,6 +388,13 @@ class LambdaFunction(Function[InputT, StreamingOutputT, SingleOutputT]):
         self._ainvoke_fn: _InvokeFnT = info.single_fn
         self._astream_fn: _StreamFnT = info.stream_fn
 
+        self._batch_dispatcher: _BatchDispatcher | None = None
+        if (info.batch_fn is not None):
+            self._batch_dispatcher = _BatchDispatcher(info.single_fn,
+                                                      info.batch_fn,
+                                                      max_batch_size=info.max_batch_size,
+                                                      max_batch_wait=info.max_batch_wait)
+
     @property
     def has_streaming_output(self) -> bool:
         return self._astream_fn is not None
@@ -322,6 +404,8 @@ class LambdaFunction(Function[InputT, StreamingOutputT, SingleOutputT]):
         return self._ainvoke_fn is not None
 
     async def _ainvoke(self, value: InputT) -> SingleOutputT:
+        if (self._batch_dispatcher is not None):
+            return await self._batch_dispatcher.submit(value)
         return await self._ainvoke_fn(value)
 
     async def _astream(self, value: InputT) -> AsyncGenerator[StreamingOutputT]:
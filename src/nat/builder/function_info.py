@@ -37,6 +37,7 @@ logger = logging.getLogger(__name__)
 P = typing.ParamSpec("P")
 SingleCallableT = Callable[P, Coroutine[None, None, typing.Any]]
 StreamCallableT = Callable[P, AsyncGenerator[typing.Any]]
+BatchCallableT = Callable[[list[typing.Any]], Coroutine[None, None, list[typing.Any]]]
 
 
 def _get_annotated_type(annotated_type: type) -> type:
@@ -80,6 +81,21 @@ def _validate_single_fn(single_fn: SingleCallableT | None) -> tuple[type, type]:
     return input_type, output_type
 
 
+def _validate_batch_fn(batch_fn: BatchCallableT | None, single_fn: SingleCallableT | None) -> None:
+
+    if batch_fn is None:
+        return
+
+    if single_fn is None:
+        raise ValueError("single_fn must be provided if batch_fn is provided")
+
+    if len(inspect.signature(batch_fn).parameters) != 1:
+        raise ValueError("batch_fn must have exactly one parameter")
+
+    if not inspect.iscoroutinefunction(batch_fn):
+        raise ValueError("batch_fn must be a coroutine")
+
+
 def _validate_stream_fn(stream_fn: StreamCallableT | None) -> tuple[type, type]:
 
     if stream_fn is None:
@@ -297,9 +313,15 @@ class FunctionInfo:
                  single_output_schema: type[BaseModel] | type[None],
                  stream_output_schema: type[BaseModel] | type[None],
                  description: str | None = None,
-                 converters: list[Callable] | None = None):
+                 converters: list[Callable] | None = None,
+                 batch_fn: BatchCallableT | None = None,
+                 max_batch_size: int | None = None,
+                 max_batch_wait: float = 0.0):
         self.single_fn = single_fn
         self.stream_fn = stream_fn
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_batch_wait = max_batch_wait
         self.input_schema = input_schema
         self.single_output_schema = single_output_schema
         self.stream_output_schema = stream_output_schema
@@ -310,6 +332,13 @@ class FunctionInfo:
         # be done in the `create()`` and `from_fn()` static methods.
         single_input_type, single_output_type = _validate_single_fn(single_fn)
         stream_input_type, stream_output_type = _validate_stream_fn(stream_fn)
+        _validate_batch_fn(batch_fn, single_fn)
+
+        if (max_batch_size is not None and max_batch_size < 1):
+            raise ValueError("max_batch_size must be at least 1")
+
+        if (max_batch_wait < 0):
+            raise ValueError("max_batch_wait cannot be negative")
 
         if ((NoneType not in (single_input_type, stream_input_type)) and (single_input_type != stream_input_type)):
             raise ValueError("single_fn and stream_fn must have the same input type")
@@ -359,7 +388,10 @@ class FunctionInfo:
                stream_to_single_fn: Callable[[AsyncGenerator[typing.Any]], Awaitable[typing.Any]]
                | None = None,
                description: str | None = None,
-               converters: list[Callable] | None = None) -> 'FunctionInfo':
+               converters: list[Callable] | None = None,
+               batch_fn: BatchCallableT | None = None,
+               max_batch_size: int | None = None,
+               max_batch_wait: float = 0.0) -> 'FunctionInfo':
 
         converters = converters or []
 
@@ -453,6 +485,9 @@ class FunctionInfo:
             final_single_fn_desc = FunctionDescriptor.from_function(final_single_fn)
 
             if (final_single_fn_desc.arg_count > 1):
+                if (batch_fn is not None):
+                    raise ValueError("batch_fn is only supported for functions with a single parameter")
+
                 if (input_schema is not None):
                     logger.warning("Using provided input_schema for multi-argument function")
                 else:
@@ -548,14 +583,20 @@ class FunctionInfo:
                             single_output_schema=single_output_schema,
                             stream_output_schema=stream_output_schema,
                             description=description,
-                            converters=converters)
+                            converters=converters,
+                            batch_fn=batch_fn,
+                            max_batch_size=max_batch_size,
+                            max_batch_wait=max_batch_wait)
 
     @staticmethod
     def from_fn(fn: SingleCallableT | StreamCallableT,
                 *,
                 input_schema: type[BaseModel] | None = None,
                 description: str | None = None,
-                converters: list[Callable] | None = None) -> 'FunctionInfo':
+                converters: list[Callable] | None = None,
+                batch_fn: BatchCallableT | None = None,
+                max_batch_size: int | None = None,
+                max_batch_wait: float = 0.0) -> 'FunctionInfo':
         """
         Creates a FunctionInfo object from either a single or stream function. Automatically determines the type of
         function and creates the appropriate FunctionInfo object. Supports type annotations for conversion functions.
@@ -570,6 +611,16 @@ class FunctionInfo:
             A description to set to the function, by default None
         converters : list[Callable] | None, optional
             A list of converters for converting to/from the function's input/output types, by default None
+        batch_fn : BatchCallableT | None, optional
+            A coroutine processing a list of inputs at once and returning the list of their outputs, in the same
+            order. Concurrent invocations of the function are combined into a single call of `batch_fn`, for example
+            to send several inputs in one model request. `fn` is still used for invocations which are not
+            concurrent with any other. Only supported when `fn` is a coroutine, by default None
+        max_batch_size : int | None, optional
+            The maximum number of inputs passed to `batch_fn` at once, by default None (no limit)
+        max_batch_wait : float, optional
+            The number of seconds to wait for more invocations before calling `batch_fn`, by default 0.0, which only
+            combines the invocations made before the event loop runs the batch
 
         Returns
         -------
@@ -624,4 +675,7 @@ class FunctionInfo:
                                    stream_fn=stream_fn,
                                    input_schema=input_schema,
                                    description=description,
-                                   converters=converters or [])
+                                   converters=converters or [],
+                                   batch_fn=batch_fn,
+                                   max_batch_size=max_batch_size,
+                                   max_batch_wait=max_batch_wait)
@@ -15,11 +15,15 @@
 
 import dataclasses
 import logging
+import time
 import typing
+from collections.abc import Callable
 
 from nat.data_models.intermediate_step import IntermediateStep
 from nat.data_models.intermediate_step import IntermediateStepPayload
 from nat.data_models.intermediate_step import IntermediateStepState
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.observability.metrics import GlobalMetricsRegistry
 from nat.utils.reactive.observable import OnComplete
 from nat.utils.reactive.observable import OnError
 from nat.utils.reactive.observable import OnNext
@@ -30,6 +34,22 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_llm_duration = GlobalMetricsRegistry.get().histogram("nat_llm_duration_seconds", "Duration of LLM calls.", ("model", ))
+_llm_tokens = GlobalMetricsRegistry.get().counter("nat_llm_tokens_total",
+                                                  "Number of tokens used by LLM calls.", ("model", "type"))
+
+
+@dataclasses.dataclass(slots=True)
+class StepRecord:
+    """
+    The fields of an intermediate step needed to track the active spans, used in place of the full payload when no
+    observer is subscribed to the event stream.
+    """
+    UUID: str
+    event_type: IntermediateStepType
+    event_state: IntermediateStepState
+    name: str | None = None
+
 
 @dataclasses.dataclass
 class OpenStep:
@@ -39,6 +59,7 @@ class OpenStep:
     step_parent_id: str
     prev_stack: list[str]
     active_stack: list[str]
+    start_time_ns: int = 0
 
 
 class IntermediateStepManager:
@@ -59,43 +80,92 @@ class IntermediateStepManager:
         if not isinstance(payload, IntermediateStepPayload):
             raise TypeError(f"Payload must be of type IntermediateStepPayload, not {type(payload)}")
 
+        tracked, parent_step_id = self._track_step(payload, payload)
+        if not tracked:
+            return
+
+        self._emit(parent_step_id, payload)
+
+    def push_lazy_intermediate_step(self, record: StepRecord,
+                                    payload_factory: Callable[[], IntermediateStepPayload]) -> None:
+        """
+        Pushes an intermediate step to the NAT Event Stream, only building its payload when the stream has observers.
+
+        The span stack is maintained the same way as `push_intermediate_step`, so steps pushed lazily can be mixed with
+        regular steps. `payload_factory` must return a payload matching `record`.
+        """
+
+        # LLM metrics are recorded from the token usage of the payload, it is always needed
+        payload = payload_factory() if record.event_type == IntermediateStepType.LLM_END else None
+
+        tracked, parent_step_id = self._track_step(record, payload)
+        if not tracked:
+            return
+
+        event_stream = self._context_state.event_stream.get()
+        if not getattr(event_stream, "has_observers", True):
+            return
+
+        self._emit(parent_step_id, payload if payload is not None else payload_factory())
+
+    def _emit(self, parent_step_id: str, payload: IntermediateStepPayload) -> None:
+        active_function = self._context_state.active_function.get()
+
+        intermediate_step = IntermediateStep(parent_id=parent_step_id,
+                                             function_ancestry=active_function,
+                                             payload=payload)
+
+        self._context_state.event_stream.get().on_next(intermediate_step)
+
+    def _track_step(self, step: IntermediateStepPayload | StepRecord,
+                    payload: IntermediateStepPayload | None) -> tuple[bool, str | None]:
+        """
+        Updates the active span id stack and the outstanding start steps for `step`.
+
+        Returns whether the step matched the tracked steps, and the id of its parent step.
+        """
+
         active_span_id_stack = self._context_state.active_span_id_stack.get()
 
-        if (payload.event_state == IntermediateStepState.START):
+        if (step.event_state == IntermediateStepState.START):
 
             prev_stack = active_span_id_stack
 
             parent_step_id = active_span_id_stack[-1]
 
             # Note, this must not mutate the active_span_id_stack in place
-            active_span_id_stack = active_span_id_stack + [payload.UUID]
+            active_span_id_stack = active_span_id_stack + [step.UUID]
             self._context_state.active_span_id_stack.set(active_span_id_stack)
 
-            self._outstanding_start_steps[payload.UUID] = OpenStep(step_id=payload.UUID,
-                                                                   step_name=payload.name or payload.UUID,
-                                                                   step_type=payload.event_type,
-                                                                   step_parent_id=parent_step_id,
-                                                                   prev_stack=prev_stack,
-                                                                   active_stack=active_span_id_stack)
+            self._outstanding_start_steps[step.UUID] = OpenStep(step_id=step.UUID,
+                                                                step_name=step.name or step.UUID,
+                                                                step_type=step.event_type,
+                                                                step_parent_id=parent_step_id,
+                                                                prev_stack=prev_stack,
+                                                                active_stack=active_span_id_stack,
+                                                                start_time_ns=time.perf_counter_ns())
 
             logger.debug("Pushed start step %s, name %s, type %s, parent %s, stack id %s",
-                         payload.UUID,
-                         payload.name,
-                         payload.event_type,
+                         step.UUID,
+                         step.name,
+                         step.event_type,
                          parent_step_id,
                          id(active_span_id_stack))
 
-        elif (payload.event_state == IntermediateStepState.END):
+        elif (step.event_state == IntermediateStepState.END):
 
             # Remove the current step from the outstanding steps
-            open_step = self._outstanding_start_steps.pop(payload.UUID, None)
+            open_step = self._outstanding_start_steps.pop(step.UUID, None)
 
             if (open_step is None):
-                logger.warning("Step id %s not found in outstanding start steps", payload.UUID)
-                return
+                logger.warning("Step id %s not found in outstanding start steps", step.UUID)
+                return False, None
 
             parent_step_id = open_step.step_parent_id
 
+            if (step.event_type == IntermediateStepType.LLM_END):
+                self._record_llm_metrics(payload, open_step)
+
             # Get the current and previous active span id stack.
             curr_stack = open_step.active_stack
             prev_stack = open_step.prev_stack
@@ -124,7 +194,7 @@ class IntermediateStepManager:
                 logger.warning(
                     "Step id %s not the last step in the stack. "
                     "Removing it from the stack but this is likely an error",
-                    payload.UUID)
+                    step.UUID)
 
             # Verify that the stack is now equal to the previous stack
             if (curr_stack != prev_stack):
@@ -132,36 +202,40 @@ class IntermediateStepManager:
                                "This is likely an error. Report this to the NeMo Agent toolkit team.")
 
             logger.debug("Popped end step %s, name %s, type %s, parent %s, stack id %s",
-                         payload.UUID,
-                         payload.name,
-                         payload.event_type,
+                         step.UUID,
+                         step.name,
+                         step.event_type,
                          parent_step_id,
                          id(curr_stack))
 
-        elif (payload.event_state == IntermediateStepState.CHUNK):
+        elif (step.event_state == IntermediateStepState.CHUNK):
 
             # Get the current step from the outstanding steps
-            open_step = self._outstanding_start_steps.get(payload.UUID, None)
+            open_step = self._outstanding_start_steps.get(step.UUID, None)
 
             # Generate a warning if the parent step id is not set to the current step id
             if (open_step is None):
                 logger.warning(
                     "Created a chunk for step %s, but no matching start step was found. "
                     "Chunks must be created with the same ID as the start step.",
-                    payload.UUID)
-                return
+                    step.UUID)
+                return False, None
 
             parent_step_id = open_step.step_parent_id
         else:
             assert False, "Invalid event state"
 
-        active_function = self._context_state.active_function.get()
+        return True, parent_step_id
 
-        intermediate_step = IntermediateStep(parent_id=parent_step_id,
-                                             function_ancestry=active_function,
-                                             payload=payload)
+    @staticmethod
+    def _record_llm_metrics(payload: IntermediateStepPayload, open_step: OpenStep) -> None:
+        model = payload.name or "unknown"
+        _llm_duration.labels(model).observe_ns(time.perf_counter_ns() - open_step.start_time_ns)
 
-        self._context_state.event_stream.get().on_next(intermediate_step)
+        if payload.usage_info is not None:
+            token_usage = payload.usage_info.token_usage
+            _llm_tokens.labels(model, "prompt").inc(token_usage.prompt_tokens)
+            _llm_tokens.labels(model, "completion").inc(token_usage.completion_tokens)
 
     def subscribe(self,
                   on_next: OnNext[IntermediateStep],
@@ -64,6 +64,7 @@ from nat.experimental.test_time_compute.models.stage_enums import PipelineTypeEn
 from nat.experimental.test_time_compute.models.stage_enums import StageTypeEnum
 from nat.experimental.test_time_compute.models.strategy_base import StrategyBase
 from nat.memory.interfaces import MemoryEditor
+from nat.object_store.instrumented_object_store import InstrumentedObjectStore
 from nat.object_store.interfaces import ObjectStore
 from nat.observability.exporter.base_exporter import BaseExporter
 from nat.profiler.decorators.framework_wrapper import chain_wrapped_build_fn
@@ -628,6 +629,7 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
         object_store_info = self._registry.get_object_store(type(config))
 
         info_obj = await self._get_exit_stack().enter_async_context(object_store_info.build_fn(config, self))
+        info_obj = InstrumentedObjectStore(str(name), info_obj)
 
         self._object_stores[name] = ConfiguredObjectStore(config=config, instance=info_obj)
 
@@ -787,6 +789,8 @@ class WorkflowBuilder(Builder, AbstractAsyncContextManager):
 
         # Only protect the shared state modifications (serialized)
         exporter = await self._get_exit_stack().enter_async_context(exporter_context_manager)
+        if config.sampling is not None:
+            exporter.set_sampling(config.sampling)
         self._telemetry_exporters[name] = ConfiguredTelemetryExporter(config=config, instance=exporter)
 
     def _log_build_failure(self,
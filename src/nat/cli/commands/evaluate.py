@@ -21,6 +21,7 @@ import click
 
 from nat.eval.evaluate import EvaluationRun
 from nat.eval.evaluate import EvaluationRunConfig
+from nat.eval.runners.sharded_eval_runner import ShardedEvaluationRunner
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,13 @@ logger = logging.getLogger(__name__)
     default=False,
     help="Skip the dataset entries that have a generated answer.",
 )
+@click.option(
+    "--resume",
+    is_flag=True,
+    default=False,
+    help="Resume an interrupted evaluation. Dataset entries whose workflow output was recorded in the checkpoint of "
+    "the output directory are not run again.",
+)
 @click.option(
     "--endpoint",
     type=str,
@@ -77,6 +85,26 @@ logger = logging.getLogger(__name__)
     default=1,
     help="Number of repetitions for the evaluation.",
 )
+@click.option(
+    "--num_shards",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Split the dataset into shards and run each shard in a separate process. The outputs of the shards are "
+    "merged once all shards have completed.",
+)
+@click.option(
+    "--shard_index",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Only run the given shard of '--num_shards' shards. Used to spread an evaluation across hosts sharing the "
+    "output directory, the outputs are combined with '--merge_shards' once all shards have completed.",
+)
+@click.option(
+    "--merge_shards",
+    is_flag=True,
+    default=False,
+    help="Merge the outputs written by '--num_shards' shards run with '--shard_index' instead of running the workflow.",
+)
 @click.option(
     "--override",
     type=(str, str),
@@ -91,10 +119,19 @@ def eval_command(ctx, **kwargs) -> None:
 
 async def run_and_evaluate(config: EvaluationRunConfig):
     # Run evaluation
+    if config.num_shards > 1 and config.shard_index is None:
+        await ShardedEvaluationRunner(config=config).run_all()
+        return
+
     eval_runner = EvaluationRun(config=config)
     await eval_runner.run_and_evaluate()
 
 
+async def merge_shard_outputs(config: EvaluationRunConfig):
+    eval_runner = EvaluationRun(config=config)
+    await eval_runner.merge_shards()
+
+
 @eval_command.result_callback(replace=True)
 def process_nat_eval(
     processors,  # pylint: disable=unused-argument
@@ -104,9 +141,13 @@ def process_nat_eval(
     result_json_path: str,
     skip_workflow: bool,
     skip_completed_entries: bool,
+    resume: bool,
     endpoint: str,
     endpoint_timeout: int,
     reps: int,
+    num_shards: int,
+    shard_index: int | None,
+    merge_shards: bool,
     override: tuple[tuple[str, str], ...],
 ):
     """
@@ -118,12 +159,27 @@ def process_nat_eval(
         raise click.UsageError("The options '--skip_workflow' and '--endpoint' are mutually exclusive. "
                                "Please use only one of them.")
 
+    # Only the local workflow run is checkpointed
+    if resume and (skip_workflow or endpoint):
+        raise click.UsageError("The option '--resume' cannot be used with '--skip_workflow' or '--endpoint'.")
+
     # You cannot run multiple repetitions if you are skipping the workflow or skipping completed entries
     if reps > 1 and (skip_workflow or skip_completed_entries):
         raise click.UsageError("The options '--reps' and '--skip_workflow' or '--skip_completed_entries' are mutually "
                                "exclusive. You cannot run multiple repetitions if you are skipping the workflow or "
                                "have a partially completed dataset.")
 
+    # The outputs of the shards are merged from their checkpoints, which are only written by local workflow runs
+    if num_shards > 1 and (skip_workflow or endpoint):
+        raise click.UsageError("The option '--num_shards' cannot be used with '--skip_workflow' or '--endpoint'.")
+
+    if shard_index is not None and shard_index >= num_shards:
+        raise click.UsageError("The option '--shard_index' must be less than '--num_shards'.")
+
+    if merge_shards and (num_shards < 2 or shard_index is not None):
+        raise click.UsageError("The option '--merge_shards' requires '--num_shards' greater than 1 and cannot be used "
+                               "with '--shard_index'.")
+
     # Create the configuration object
     config = EvaluationRunConfig(
         config_file=config_file,
@@ -131,9 +187,15 @@ def process_nat_eval(
         result_json_path=result_json_path,
         skip_workflow=skip_workflow,
         skip_completed_entries=skip_completed_entries,
+        resume=resume,
         endpoint=endpoint,
         endpoint_timeout=endpoint_timeout,
         reps=reps,
         override=override,
+        num_shards=num_shards,
+        shard_index=shard_index,
     )
-    asyncio.run(run_and_evaluate(config))
+    if merge_shards:
+        asyncio.run(merge_shard_outputs(config))
+    else:
+        asyncio.run(run_and_evaluate(config))
@@ -24,6 +24,7 @@ from pydantic import BaseModel
 
 from nat.tool.mcp.exceptions import MCPError
 from nat.tool.mcp.mcp_client import MCPBuilder
+from nat.tool.mcp.mcp_session_pool import get_session_pool
 from nat.utils.exception_handlers.mcp import format_mcp_error
 
 # Suppress verbose logs from mcp.client.sse and httpx
@@ -117,11 +118,12 @@ async def list_tools_and_schemas(url: str, tool_name: str | None = None) -> list
     """
     builder = MCPBuilder(url=url)
     try:
-        if tool_name:
-            tool = await builder.get_tool(tool_name)
-            return [format_tool(tool)]
-        tools = await builder.get_tools()
-        return [format_tool(tool) for tool in tools.values()]
+        async with get_session_pool(url):
+            if tool_name:
+                tool = await builder.get_tool(tool_name)
+                return [format_tool(tool)]
+            tools = await builder.get_tools()
+            return [format_tool(tool) for tool in tools.values()]
     except MCPError as e:
         format_mcp_error(e, include_traceback=False)
         return []
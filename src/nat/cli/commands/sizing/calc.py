@@ -113,6 +113,28 @@ logger = logging.getLogger(__name__)
     default=300,
     help="Timeout for the remote workflow endpoint in seconds (default: 300).",
 )
+@click.option(
+    "--adaptive",
+    is_flag=True,
+    required=False,
+    default=False,
+    help="Ramp up the concurrency with open-loop load against the endpoint until a target is exceeded, then bisect "
+    "around the knee. The --concurrencies list is not used. Requires --endpoint and a target.",
+)
+@click.option(
+    "--level_duration",
+    type=float,
+    required=False,
+    default=60.0,
+    help="Duration in seconds of the load applied at each concurrency in adaptive mode (default: 60).",
+)
+@click.option(
+    "--max_concurrency",
+    type=int,
+    required=False,
+    default=256,
+    help="Largest concurrency tested in adaptive mode (default: 256).",
+)
 @click.pass_context
 def calc_command(ctx,
                  config_file,
@@ -126,7 +148,10 @@ def calc_command(ctx,
                  num_passes,
                  append_calc_outputs,
                  endpoint,
-                 endpoint_timeout):
+                 endpoint_timeout,
+                 adaptive,
+                 level_duration,
+                 max_concurrency):
     """Estimate GPU count and plot metrics for a workflow profile."""
     # Only use CLI concurrencies, with default
     concurrencies_list = [int(x) for x in concurrencies.split(",") if x.strip()]
@@ -159,6 +184,12 @@ def calc_command(ctx,
         if not config_file:
             click.echo("Config file is required in online mode.")
             return
+        if adaptive and not endpoint:
+            click.echo("Adaptive mode requires --endpoint.")
+            return
+        if adaptive and target_llm_latency == 0 and target_workflow_runtime == 0:
+            click.echo("Adaptive mode requires --target_llm_latency or --target_workflow_runtime.")
+            return
         if target_llm_latency == 0 and target_workflow_runtime == 0:
             click.echo("Both --target_llm_latency and --target_workflow_runtime are 0. "
                        "GPU count will not be estimated.")
@@ -181,6 +212,9 @@ def calc_command(ctx,
         append_job=append_calc_outputs,
         endpoint=endpoint,
         endpoint_timeout=endpoint_timeout,
+        adaptive=adaptive,
+        adaptive_level_duration=level_duration,
+        adaptive_max_concurrency=max_concurrency,
     )
 
     async def run_calc() -> CalcRunnerOutput:
@@ -274,6 +308,28 @@ def calc_command(ctx,
 
         click.echo(tabulate(table, headers=headers, tablefmt="github"))
 
+        # Display the result of the adaptive sweep
+        adaptive_sweep = results.adaptive_sweep
+        if adaptive_sweep is not None:
+            click.echo("")
+            click.echo(click.style("=== ADAPTIVE SWEEP ===", fg="bright_blue", bold=True))
+            click.echo(f"Base workflow runtime: {adaptive_sweep.base_workflow_runtime:.3f}s")
+            if adaptive_sweep.sustainable_concurrency == 0:
+                click.echo(click.style("No tested concurrency met the targets.", fg="red", bold=True))
+            else:
+                throughput = adaptive_sweep.sustainable_throughput
+                low, high = throughput.ninety_fifth_interval
+                click.echo(
+                    click.style(
+                        f"Sustainable concurrency: {adaptive_sweep.sustainable_concurrency}, "
+                        f"throughput: {throughput.mean:.2f} requests/s (95% CI {low:.2f} - {high:.2f})",
+                        fg="green",
+                        bold=True))
+            if adaptive_sweep.knee_concurrency is None:
+                click.echo("The targets were met up to the max concurrency.")
+            else:
+                click.echo(f"Targets exceeded at concurrency: {adaptive_sweep.knee_concurrency}")
+
         # Display slope-based GPU estimates if they are available
         if results.gpu_estimates.gpu_estimate_by_llm_latency is not None or \
                 results.gpu_estimates.gpu_estimate_by_wf_runtime is not None:
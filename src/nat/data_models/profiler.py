@@ -43,6 +43,7 @@ class PrefixSpanConfig(BaseModel):
 class ProfilerConfig(BaseModel):
 
     base_metrics: bool = False
+    online_metrics: bool = False
     token_usage_forecast: bool = False
     token_uniqueness_forecast: bool = False
     workflow_runtime_forecast: bool = False
@@ -15,12 +15,45 @@
 
 import typing
 
+from pydantic import BaseModel
+from pydantic import Field
+
 from nat.data_models.common import BaseModelRegistryTag
 from nat.data_models.common import TypedBaseModel
 
 
+class TailSamplingConfig(BaseModel):
+    """Tail-based sampling rules. Spans of a trace are buffered until the root span closes and the whole trace is
+    kept when any of the rules match."""
+
+    keep_errors: bool = Field(default=True, description="Keep traces in which any step raised an exception.")
+    latency_threshold: float | None = Field(
+        default=None, gt=0, description="Keep traces whose root span lasted at least this many seconds.")
+    name_patterns: list[str] = Field(
+        default_factory=list,
+        description="Keep traces containing a step whose name matches any of these regular expressions.")
+    max_buffered_events: int = Field(
+        default=10000,
+        gt=0,
+        description="Maximum number of events buffered per trace. Traces exceeding this limit are dropped.")
+
+
+class TraceSamplingConfig(BaseModel):
+    """Per-exporter trace sampling configuration."""
+
+    ratio: float = Field(default=1.0,
+                         ge=0.0,
+                         le=1.0,
+                         description="Fraction of traces exported unconditionally (head-based sampling). The "
+                         "decision is derived from the root step ID so that it is consistent across exporters.")
+    tail: TailSamplingConfig | None = Field(
+        default=None, description="Tail-based rules used to keep traces which were not selected by `ratio`.")
+
+
 class TelemetryExporterBaseConfig(TypedBaseModel, BaseModelRegistryTag):
-    pass
+
+    sampling: TraceSamplingConfig | None = Field(
+        default=None, description="Optional trace sampling. When unset, every trace is exported.")
 
 
 TelemetryExporterConfigT = typing.TypeVar("TelemetryExporterConfigT", bound=TelemetryExporterBaseConfig)
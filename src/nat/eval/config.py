@@ -32,6 +32,8 @@ class EvaluationRunConfig(BaseModel):
     result_json_path: str = "$"
     skip_workflow: bool = False
     skip_completed_entries: bool = False
+    # if true, items recorded in the checkpoint of a previous run are restored instead of running the workflow again
+    resume: bool = False
     endpoint: str | None = None  # only used when running the workflow remotely
     endpoint_timeout: int = 300
     reps: int = 1
@@ -44,6 +46,10 @@ class EvaluationRunConfig(BaseModel):
     # number of passes at each concurrency, if 0 the dataset is adjusted to a multiple of the
     # concurrency. The is only used if adjust_dataset_size is true
     num_passes: int = 0
+    # number of shards the dataset is split into, each shard is run by a separate process
+    num_shards: int = 1
+    # if set, only the items of this shard are run and the outputs are written to the directory of the shard
+    shard_index: int | None = None
 
 
 class EvaluationRunOutput(BaseModel):
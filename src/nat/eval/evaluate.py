@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import asyncio
+import functools
 import logging
 import shutil
 from pathlib import Path
@@ -23,6 +24,7 @@ from uuid import uuid4
 from pydantic import BaseModel
 from tqdm import tqdm
 
+from nat.data_models.dataset_handler import EvalDatasetConfig
 from nat.data_models.evaluate import EvalConfig
 from nat.data_models.evaluate import JobEvictionPolicy
 from nat.eval.config import EvaluationRunConfig
@@ -34,9 +36,15 @@ from nat.eval.evaluator.evaluator_model import EvalOutput
 from nat.eval.usage_stats import UsageStats
 from nat.eval.usage_stats import UsageStatsItem
 from nat.eval.usage_stats import UsageStatsLLM
+from nat.eval.utils.eval_checkpoint import CHECKPOINT_FILE_NAME
+from nat.eval.utils.eval_checkpoint import EvalCheckpoint
 from nat.eval.utils.output_uploader import OutputUploader
+from nat.eval.utils.sharding import merge_eval_outputs
+from nat.eval.utils.sharding import select_shard
+from nat.eval.utils.sharding import shard_output_dir
 from nat.eval.utils.weave_eval import WeaveEvaluationIntegration
 from nat.profiler.data_models import ProfilerResults
+from nat.profiler.online_profiler import OnlineProfiler
 from nat.runtime.session import SessionManager
 
 logger = logging.getLogger(__name__)
@@ -74,6 +82,12 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         # usage stats
         self.usage_stats: UsageStats = UsageStats()
 
+        # running profiler metrics, computed while the workflow is running when enabled
+        self.online_profiler: OnlineProfiler | None = None
+
+        # per-item workflow outputs, used to resume an interrupted run
+        self.checkpoint: EvalCheckpoint | None = None
+
         # workflow output file
         self.workflow_output_file: Path | None = None
 
@@ -157,11 +171,15 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
 
                 runner_result = None
                 intermediate_future = None
+                on_step = None
+                if self.online_profiler is not None:
+                    example_id = self.online_profiler.start_example()
+                    on_step = functools.partial(self.online_profiler.observe, example_id)
 
                 try:
 
                     # Start usage stats and intermediate steps collection in parallel
-                    intermediate_future = pull_intermediate()
+                    intermediate_future = pull_intermediate(on_step=on_step)
                     runner_result = runner.result()
                     base_output = await runner_result
                     intermediate_steps = await intermediate_future
@@ -179,9 +197,15 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                         if coro is not None:
                             asyncio.ensure_future(coro).cancel()
 
+                    if self.online_profiler is not None:
+                        self.online_profiler.end_example(example_id, completed=False)
+
                     stop_event.set()
                     return
 
+                if self.online_profiler is not None:
+                    self.online_profiler.end_example(example_id)
+
                 try:
                     base_output = runner.convert(base_output, to_type=str)
                 except ValueError:
@@ -204,13 +228,12 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 item.trajectory = self.intermediate_step_adapter.validate_intermediate_steps(intermediate_steps)
                 usage_stats_item = self._compute_usage_stats(item)
 
+                if self.checkpoint is not None:
+                    await self.checkpoint.record(item)
+
                 self.weave_eval.log_prediction(item, output)
                 await self.weave_eval.log_usage_stats(item, usage_stats_item)
 
-        async def wrapped_run(item: EvalInputItem) -> None:
-            await run_one(item)
-            pbar.update(1)
-
         # if self.config.skip_complete is set skip eval_input_items with a non-empty output_obj
         if self.config.skip_completed_entries:
             eval_input_items = [item for item in self.eval_input.eval_input_items if not item.output_obj]
@@ -219,10 +242,39 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 return
         else:
             eval_input_items = self.eval_input.eval_input_items
+
+        # Items restored from the checkpoint of a previous run are not run again
+        if self.checkpoint is not None:
+            eval_input_items = [item for item in eval_input_items if not self.checkpoint.is_completed(item)]
+            if not eval_input_items:
+                logger.info("All items were restored from the checkpoint. Skipping workflow pass altogether.")
+                return
+
+        # A fixed number of workers pull items as they become free, rather than creating a coroutine per item
+        pending_items = iter(eval_input_items)
+
+        async def worker() -> None:
+            for item in pending_items:
+                if stop_event.is_set():
+                    return
+                await run_one(item)
+                pbar.update(1)
+
+        num_workers = max(1, min(self.eval_config.general.max_concurrency, len(eval_input_items)))
         pbar = tqdm(total=len(eval_input_items), desc="Running workflow")
-        await asyncio.gather(*[wrapped_run(item) for item in eval_input_items])
+        await asyncio.gather(*[worker() for _ in range(num_workers)])
         pbar.close()
 
+    def setup_checkpoint(self):
+        '''Create the checkpoint of the run, restoring the items recorded by a previous run when resuming'''
+        self.checkpoint = EvalCheckpoint(self.eval_config.general.output_dir / CHECKPOINT_FILE_NAME)
+        if not self.config.resume:
+            self.checkpoint.reset()
+            return
+
+        for item in self.checkpoint.restore(self.eval_input):
+            self._compute_usage_stats(item)
+
     async def run_workflow_remote(self):
         from nat.eval.remote_workflow import EvaluationRemoteWorkflowHandler
         handler = EvaluationRemoteWorkflowHandler(self.config, self.eval_config.general.max_concurrency)
@@ -251,7 +303,16 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                                          self.eval_config.general.output_dir,
                                          write_output=self.config.write_output)
 
-        return await profiler_runner.run(all_stats)
+        # Reuse the metrics computed while the workflow was running instead of recomputing them
+        online_metrics = None
+        if self.online_profiler is not None:
+            online_metrics = self.online_profiler.snapshot()
+            # Items which were not run by this evaluation, such as previously completed entries, were not observed
+            if online_metrics.examples_completed != sum(1 for stats in all_stats if stats):
+                logger.info("Online profiler metrics do not cover all items, recomputing them")
+                online_metrics = None
+
+        return await profiler_runner.run(all_stats, online_metrics=online_metrics)
 
     def cleanup_output_directory(self):
         '''Remove contents of the output directory if it exists'''
@@ -401,15 +462,8 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
 
         return workflow_type
 
-    async def run_and_evaluate(self,
-                               session_manager: SessionManager | None = None,
-                               job_id: str | None = None) -> EvaluationRunOutput:
-        """
-        Run the workflow with the specified config file and evaluate the dataset
-        """
-        logger.info("Starting evaluation run with config file: %s", self.config.config_file)
-
-        from nat.builder.eval_builder import WorkflowEvalBuilder
+    def _load_run_config(self):
+        """Load the configuration file, applying the overrides, and return it."""
         from nat.runtime.loader import load_config
 
         # Load and override the config
@@ -418,24 +472,116 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
         else:
             config = load_config(self.config.config_file)
         self.eval_config = config.eval
-        workflow_alias = self._get_workflow_alias(config.workflow.type)
-        logger.debug("Loaded %s evaluation configuration: %s", workflow_alias, self.eval_config)
-
-        # Cleanup the output directory
-        if self.eval_config.general.output:
-            self.cleanup_output_directory()
+        return config
 
-        # Generate a job_id if append_job_id_to_output_dir is enabled and no job_id provided
+    def _resolve_job_id(self, job_id: str | None) -> str | None:
+        """Generate a job_id if append_job_id_to_output_dir is enabled and no job_id provided"""
+        # The shards of a sharded run are given the job id of the run, a shard run on its own has no job id
+        if self.config.shard_index is not None:
+            return job_id
         if (self.eval_config.general.output
                 and self.eval_config.general.output.job_management.append_job_id_to_output_dir and not job_id):
+            # A resumed run continues the most recent job which recorded a checkpoint
+            if self.config.resume:
+                job_id = self._find_resumable_job_id()
+                if job_id:
+                    logger.info("Resuming job: %s", job_id)
+                    return job_id
+                logger.warning("No job with an evaluation checkpoint found in %s, starting a new job",
+                               self.eval_config.general.output_dir / "jobs")
             job_id = "job_" + str(uuid4())
             logger.info("Generated job ID for output directory: %s", job_id)
+        return job_id
+
+    def _find_resumable_job_id(self) -> str | None:
+        """Return the id of the job whose checkpoint, or the checkpoint of one of its shards, was last written."""
+        jobs_dir = self.eval_config.general.output_dir / "jobs"
+        if not jobs_dir.is_dir():
+            return None
+
+        checkpoints = list(jobs_dir.glob(f"*/**/{CHECKPOINT_FILE_NAME}"))
+        if not checkpoints:
+            return None
+
+        latest = max(checkpoints, key=lambda f: f.stat().st_mtime)
+        return latest.relative_to(jobs_dir).parts[0]
+
+    def _set_output_dir(self, job_id: str | None):
+        output_dir = self.eval_config.general.output_dir
 
         # If a job id is provided keep the data per-job
         if job_id:
-            self.eval_config.general.output_dir = self.eval_config.general.output_dir / f"jobs/{job_id}"
-            if self.eval_config.general.output:
-                self.eval_config.general.output.dir = self.eval_config.general.output_dir
+            output_dir = output_dir / f"jobs/{job_id}"
+
+        # Each shard of a sharded run writes its outputs to its own directory
+        if self.config.shard_index is not None:
+            output_dir = shard_output_dir(output_dir, self.config.shard_index)
+
+        self.eval_config.general.output_dir = output_dir
+        if self.eval_config.general.output:
+            self.eval_config.general.output.dir = output_dir
+
+    def _create_dataset_handler(self, dataset_config: EvalDatasetConfig) -> DatasetHandler:
+        return DatasetHandler(dataset_config=dataset_config,
+                              reps=self.config.reps,
+                              concurrency=self.eval_config.general.max_concurrency,
+                              num_passes=self.config.num_passes,
+                              adjust_dataset_size=self.config.adjust_dataset_size)
+
+    async def _finalize(self, dataset_handler: DatasetHandler, job_id: str | None) -> EvaluationRunOutput:
+        """Profile the workflow, then publish and upload the outputs of the run."""
+        # A shard is profiled together with the other shards once they are merged
+        if self.config.shard_index is None:
+            profiler_results = await self.profile_workflow()
+        else:
+            profiler_results = ProfilerResults()
+
+        # compute total runtime
+        if self.usage_stats.usage_stats_items:
+            self.usage_stats.total_runtime = max(self.usage_stats.usage_stats_items.values(),
+                                                 key=lambda x: x.max_timestamp).max_timestamp - \
+                min(self.usage_stats.usage_stats_items.values(), key=lambda x: x.min_timestamp).min_timestamp
+        else:
+            self.usage_stats.total_runtime = 0.0
+
+        # Publish the results
+        self.publish_output(dataset_handler, profiler_results)
+
+        # Run custom scripts and upload evaluation outputs to S3
+        if self.eval_config.general.output and self.config.shard_index is None:
+            output_uploader = OutputUploader(self.eval_config.general.output, job_id=job_id)
+            output_uploader.run_custom_scripts()
+            await output_uploader.upload_directory()
+
+        return EvaluationRunOutput(workflow_output_file=self.workflow_output_file,
+                                   evaluator_output_files=self.evaluator_output_files,
+                                   workflow_interrupted=self.workflow_interrupted,
+                                   eval_input=self.eval_input,
+                                   evaluation_results=self.evaluation_results,
+                                   usage_stats=self.usage_stats,
+                                   profiler_results=profiler_results)
+
+    async def run_and_evaluate(self,
+                               session_manager: SessionManager | None = None,
+                               job_id: str | None = None) -> EvaluationRunOutput:
+        """
+        Run the workflow with the specified config file and evaluate the dataset
+        """
+        logger.info("Starting evaluation run with config file: %s", self.config.config_file)
+
+        from nat.builder.eval_builder import WorkflowEvalBuilder
+
+        config = self._load_run_config()
+        workflow_alias = self._get_workflow_alias(config.workflow.type)
+        logger.debug("Loaded %s evaluation configuration: %s", workflow_alias, self.eval_config)
+
+        # Cleanup the output directory, unless resuming from the checkpoint it contains. The shards of a sharded run
+        # share the output directory, which is cleaned up before the shards are started.
+        if self.eval_config.general.output and not self.config.resume and self.config.shard_index is None:
+            self.cleanup_output_directory()
+
+        job_id = self._resolve_job_id(job_id)
+        self._set_output_dir(job_id)
 
         # Load the input dataset
         # For multiple datasets, one handler per dataset can be created
@@ -448,12 +594,14 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                 workflow_interrupted=self.workflow_interrupted,
             )
 
-        dataset_handler = DatasetHandler(dataset_config=dataset_config,
-                                         reps=self.config.reps,
-                                         concurrency=self.eval_config.general.max_concurrency,
-                                         num_passes=self.config.num_passes,
-                                         adjust_dataset_size=self.config.adjust_dataset_size)
+        dataset_handler = self._create_dataset_handler(dataset_config)
         self.eval_input = dataset_handler.get_eval_input_from_dataset(self.config.dataset)
+        if self.config.shard_index is not None:
+            self.eval_input = select_shard(self.eval_input, self.config.shard_index, self.config.num_shards)
+            logger.info("Running shard %d of %d with %d items",
+                        self.config.shard_index,
+                        self.config.num_shards,
+                        len(self.eval_input.eval_input_items))
         if not self.eval_input.eval_input_items:
             logger.info("Dataset is empty. Nothing to evaluate.")
             return EvaluationRunOutput(
@@ -468,6 +616,9 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
             self.weave_eval.initialize_logger(workflow_alias, self.eval_input, config)
 
             # Run workflow
+            if self.config.write_output and not self.config.endpoint and not self.config.skip_workflow:
+                self.setup_checkpoint()
+
             if self.config.endpoint:
                 await self.run_workflow_remote()
             else:
@@ -475,36 +626,70 @@ class EvaluationRun:  # pylint: disable=too-many-public-methods
                     if session_manager is None:
                         session_manager = SessionManager(eval_workflow.build(),
                                                          max_concurrency=self.eval_config.general.max_concurrency)
-                    await self.run_workflow_local(session_manager)
+                    # The online profiler needs the live event stream, which is only available for local runs
+                    profiler_config = self.eval_config.general.profiler
+                    if profiler_config and profiler_config.online_metrics:
+                        self.online_profiler = OnlineProfiler()
+                    try:
+                        await self.run_workflow_local(session_manager)
+                    finally:
+                        if self.checkpoint is not None:
+                            self.checkpoint.close()
 
             # Evaluate
             evaluators = {name: eval_workflow.get_evaluator(name) for name in self.eval_config.evaluators}
             await self.run_evaluators(evaluators)
 
-        # Profile the workflow
-        profiler_results = await self.profile_workflow()
+        return await self._finalize(dataset_handler, job_id)
 
-        # compute total runtime
-        if self.usage_stats.usage_stats_items:
-            self.usage_stats.total_runtime = max(self.usage_stats.usage_stats_items.values(),
-                                                 key=lambda x: x.max_timestamp).max_timestamp - \
-                min(self.usage_stats.usage_stats_items.values(), key=lambda x: x.min_timestamp).min_timestamp
-        else:
-            self.usage_stats.total_runtime = 0.0
+    def prepare_sharded_run(self, job_id: str | None = None) -> str | None:
+        """
+        Prepare the output directory shared by the shards of a sharded run, and return the job id the shards and
+        `merge_shards` should use.
+        """
+        self._load_run_config()
+        if self.eval_config.general.output and not self.config.resume:
+            self.cleanup_output_directory()
+        return self._resolve_job_id(job_id)
 
-        # Publish the results
-        self.publish_output(dataset_handler, profiler_results)
+    async def merge_shards(self, job_id: str | None = None) -> EvaluationRunOutput:
+        """
+        Combine the outputs written by the shards of a sharded run into the outputs of a single run.
 
-        # Run custom scripts and upload evaluation outputs to S3
-        if self.eval_config.general.output:
-            output_uploader = OutputUploader(self.eval_config.general.output, job_id=job_id)
-            output_uploader.run_custom_scripts()
-            await output_uploader.upload_directory()
+        The workflow output of each item is restored from the checkpoint of its shard, the evaluator outputs of the
+        shards are merged, and the profiler is run once over the trajectories of all shards.
+        """
+        logger.info("Merging %d evaluation shards for config file: %s", self.config.num_shards, self.config.config_file)
 
-        return EvaluationRunOutput(workflow_output_file=self.workflow_output_file,
-                                   evaluator_output_files=self.evaluator_output_files,
-                                   workflow_interrupted=self.workflow_interrupted,
-                                   eval_input=self.eval_input,
-                                   evaluation_results=self.evaluation_results,
-                                   usage_stats=self.usage_stats,
-                                   profiler_results=profiler_results)
+        self._load_run_config()
+        self._set_output_dir(job_id)
+
+        dataset_config = self.eval_config.general.dataset
+        if not dataset_config:
+            raise ValueError("No dataset found, nothing to merge")
+
+        dataset_handler = self._create_dataset_handler(dataset_config)
+        self.eval_input = dataset_handler.get_eval_input_from_dataset(self.config.dataset)
+
+        shard_outputs: dict[str, list[EvalOutput]] = {name: [] for name in self.eval_config.evaluators}
+        for shard_index in range(self.config.num_shards):
+            shard_dir = shard_output_dir(self.eval_config.general.output_dir, shard_index)
+            for item in EvalCheckpoint(shard_dir / CHECKPOINT_FILE_NAME).restore(self.eval_input):
+                self._compute_usage_stats(item)
+
+            for evaluator_name, outputs in shard_outputs.items():
+                output_file = shard_dir / f"{evaluator_name}_output.json"
+                if output_file.exists():
+                    outputs.append(EvalOutput.model_validate_json(output_file.read_text(encoding="utf-8")))
+                else:
+                    logger.warning("Shard %d has no output for evaluator %s", shard_index, evaluator_name)
+
+        missing = sum(1 for item in self.eval_input.eval_input_items if not item.trajectory)
+        if missing:
+            logger.warning("%d items were not completed by any shard", missing)
+            self.workflow_interrupted = True
+
+        self.evaluation_results = [(name, merge_eval_outputs(outputs)) for name, outputs in shard_outputs.items()
+                                   if outputs]
+
+        return await self._finalize(dataset_handler, job_id)
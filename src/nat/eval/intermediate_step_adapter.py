@@ -34,9 +34,13 @@ class IntermediateStepAdapter:
             return intermediate_steps
         return [step for step in intermediate_steps if step.event_type in event_filter]
 
-    def validate_intermediate_steps(self, intermediate_steps: list[dict]) -> list[IntermediateStep]:
+    def validate_intermediate_steps(self, intermediate_steps: list[dict | IntermediateStep]) -> list[IntermediateStep]:
         validated_steps = []
         for step_data in intermediate_steps:
+            if isinstance(step_data, IntermediateStep):
+                # Steps collected from the event stream are already validated
+                validated_steps.append(step_data)
+                continue
             try:
                 validated_steps.append(IntermediateStep.model_validate(step_data))
             except Exception as e:
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from nat.eval.config import EvaluationRunConfig
+from nat.eval.config import EvaluationRunOutput
+from nat.eval.evaluate import EvaluationRun
+
+logger = logging.getLogger(__name__)
+
+
+def _run_shard(config: EvaluationRunConfig, job_id: str | None) -> bool:
+    """Run a single shard in a worker process and return whether its workflow was interrupted."""
+    output = asyncio.run(EvaluationRun(config).run_and_evaluate(job_id=job_id))
+    return output.workflow_interrupted
+
+
+class ShardedEvaluationRunner:
+    """
+    Run an evaluation with the dataset split into shards, each shard run by a separate process.
+
+    Every shard builds its own workflow and session manager, so the workflow runs on as many cores as there are
+    shards. Once all shards have completed, their outputs are merged into the outputs of a single evaluation run.
+    """
+
+    def __init__(self, config: EvaluationRunConfig):
+        if config.num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        self.config = config
+
+    def shard_configs(self) -> list[EvaluationRunConfig]:
+        return [
+            self.config.model_copy(update={"shard_index": shard_index}) for shard_index in range(self.config.num_shards)
+        ]
+
+    async def run_all(self, job_id: str | None = None) -> EvaluationRunOutput:
+        """
+        Run all shards and merge their outputs.
+        """
+        job_id = EvaluationRun(self.config).prepare_sharded_run(job_id)
+
+        # Spawned rather than forked, the workers must not inherit the event loop of this process
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.config.num_shards,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = [
+                loop.run_in_executor(executor, _run_shard, shard_config, job_id)
+                for shard_config in self.shard_configs()
+            ]
+            results = await asyncio.gather(*futures, return_exceptions=True)
+
+        for shard_index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error("Shard %d failed: %s", shard_index, result, exc_info=result)
+
+        return await EvaluationRun(self.config.model_copy()).merge_shards(job_id)
@@ -15,6 +15,7 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
 
 from nat.builder.context import Context
 from nat.data_models.intermediate_step import IntermediateStep
@@ -22,19 +23,24 @@ from nat.data_models.intermediate_step import IntermediateStep
 logger = logging.getLogger(__name__)
 
 
-def pull_intermediate() -> asyncio.Future[list[dict]]:
+def pull_intermediate(
+        on_step: Callable[[IntermediateStep], None] | None = None) -> asyncio.Future[list[IntermediateStep]]:
     """
     Subscribes to the runner's event stream using callbacks.
     Intermediate steps are collected and, when complete, the future is set
-    with the list of dumped intermediate steps.
+    with the list of intermediate steps.
+
+    If provided, `on_step` is additionally called with each step as it is emitted.
     """
     future = asyncio.Future()
-    intermediate_steps = []  # We'll store the dumped steps here.
+    intermediate_steps: list[IntermediateStep] = []
     context = Context.get()
 
     def on_next_cb(item: IntermediateStep):
-        # Append each new intermediate step (dumped to dict) to the list.
-        intermediate_steps.append(item.model_dump())
+        # The steps are kept as emitted, dumping and re-validating each step would only copy it
+        intermediate_steps.append(item)
+        if on_step is not None:
+            on_step(item)
 
     def on_error_cb(exc: Exception):
         logger.error("Hit on_error: %s", exc)
@@ -0,0 +1,129 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import threading
+import typing
+from pathlib import Path
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.eval.evaluator.evaluator_model import EvalInput
+from nat.eval.evaluator.evaluator_model import EvalInputItem
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE_NAME = "eval_checkpoint.jsonl"
+
+
+def _item_key(item_id: typing.Any) -> str:
+    # Ids read back from JSON may differ in type from the dataset ids, e.g. numpy integers, compare them as strings
+    return str(item_id)
+
+
+class EvalCheckpoint:
+    """
+    Records the workflow output of each evaluated item to a JSON lines file as soon as the item completes.
+
+    Each line holds the id, output and trajectory of one item. An interrupted evaluation can be resumed by restoring the
+    recorded items and only running the workflow for the remaining ones.
+
+    The file is kept open while items are recorded, and items are serialized and written in a worker thread so that
+    recording does not block the other workflow runs. Call `close` once the workflow pass is done.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._completed: set[str] = set()
+        self._file: typing.TextIO | None = None
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Discard any previously recorded items."""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._file = open(self.path, "w", encoding="utf-8")
+        self._completed.clear()
+
+    def restore(self, eval_input: EvalInput) -> list[EvalInputItem]:
+        """
+        Populate the output and trajectory of the items recorded in the checkpoint, and return the restored items.
+        Recorded items which are not part of `eval_input` are ignored.
+        """
+        if not self.path.exists():
+            logger.warning("No evaluation checkpoint found at %s, running the workflow for all items", self.path)
+            return []
+
+        records: dict[str, dict] = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written line is expected if the previous run was killed while writing
+                    logger.warning("Ignoring malformed line %d of checkpoint %s", line_number, self.path)
+                    continue
+                records[_item_key(record["id"])] = record
+
+        restored = []
+        for item in eval_input.eval_input_items:
+            record = records.get(_item_key(item.id))
+            if record is None:
+                continue
+            item.output_obj = record["output_obj"]
+            item.trajectory = [IntermediateStep.model_validate(step) for step in record["trajectory"]]
+            self._completed.add(_item_key(item.id))
+            restored.append(item)
+
+        logger.info("Restored %d of %d items from checkpoint %s",
+                    len(restored),
+                    len(eval_input.eval_input_items),
+                    self.path)
+        return restored
+
+    def is_completed(self, item: EvalInputItem) -> bool:
+        return _item_key(item.id) in self._completed
+
+    async def record(self, item: EvalInputItem) -> None:
+        """Append a completed item to the checkpoint."""
+        await asyncio.to_thread(self._write, item)
+        self._completed.add(_item_key(item.id))
+
+    def _write(self, item: EvalInputItem) -> None:
+        record = {
+            "id": item.id,
+            "output_obj": item.output_obj,
+            "trajectory": [step.model_dump(mode="json") for step in item.trajectory],
+        }
+        line = json.dumps(record, default=str) + "\n"
+
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            # Flushed per item, so that a crash loses at most the items in flight
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the checkpoint file, recording another item opens it again."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numbers
+import typing
+import zlib
+from pathlib import Path
+
+from nat.eval.evaluator.evaluator_model import EvalInput
+from nat.eval.evaluator.evaluator_model import EvalOutput
+
+
+def shard_of(item_id: typing.Any, num_shards: int) -> int:
+    """
+    Return the shard an item belongs to.
+
+    The shard is derived from a stable hash of the item id, so that processes on different hosts assign items to the
+    same shards without any coordination.
+    """
+    return zlib.crc32(str(item_id).encode("utf-8")) % num_shards
+
+
+def select_shard(eval_input: EvalInput, shard_index: int, num_shards: int) -> EvalInput:
+    """Return the items of `eval_input` which belong to the given shard."""
+    return EvalInput(
+        eval_input_items=[item for item in eval_input.eval_input_items if shard_of(item.id, num_shards) == shard_index])
+
+
+def shard_output_dir(output_dir: Path, shard_index: int) -> Path:
+    return output_dir / "shards" / f"shard_{shard_index}"
+
+
+def merge_eval_outputs(outputs: list[EvalOutput]) -> EvalOutput:
+    """
+    Combine the outputs of an evaluator run separately on each shard.
+
+    The average score is the mean of the shard averages weighted by the number of items of each shard, which matches
+    the average over all items for evaluators reporting the mean item score. When a shard reports a non-numeric
+    average score the combined average score is `None`.
+    """
+    items = [item for output in outputs for item in output.eval_output_items]
+
+    weighted_sum = 0.0
+    num_items = 0
+    for output in outputs:
+        if not output.eval_output_items:
+            continue
+        if not isinstance(output.average_score, numbers.Real):
+            return EvalOutput(average_score=None, eval_output_items=items)
+        weighted_sum += output.average_score * len(output.eval_output_items)
+        num_items += len(output.eval_output_items)
+
+    average_score = weighted_sum / num_items if num_items else 0.0
+    return EvalOutput(average_score=average_score, eval_output_items=items)
@@ -0,0 +1,149 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import csv
+import json
+import logging
+import time
+import typing
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from nat.runtime.session import SessionManager
+
+logger = logging.getLogger(__name__)
+
+BATCH_INPUT_SUFFIXES = (".jsonl", ".csv")
+
+
+class BatchRunStats(BaseModel):
+    """Throughput and latency of a batch run, latencies only include the time spent running the workflow."""
+    inputs: int
+    errors: int
+    elapsed_seconds: float
+    inputs_per_second: float
+    latency_mean_seconds: float
+    latency_p50_seconds: float
+    latency_p90_seconds: float
+    latency_p99_seconds: float
+
+    def summary(self) -> str:
+        return (f"{self.inputs} inputs ({self.errors} errors) in {self.elapsed_seconds:.2f}s, "
+                f"{self.inputs_per_second:.2f} inputs/s, latency mean {self.latency_mean_seconds:.3f}s, "
+                f"p50 {self.latency_p50_seconds:.3f}s, p90 {self.latency_p90_seconds:.3f}s, "
+                f"p99 {self.latency_p99_seconds:.3f}s")
+
+
+def is_batch_input_file(path: Path) -> bool:
+    return path.suffix.lower() in BATCH_INPUT_SUFFIXES
+
+
+def read_batch_inputs(path: Path) -> Iterator[typing.Any]:
+    """
+    Lazily read the inputs of a JSONL or CSV file.
+
+    Each line of a JSONL file is a JSON encoded input. The first row of a CSV file is a header, each following row is an
+    input: the value of the column if there is a single column, otherwise a dictionary of the columns.
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield next(iter(row.values())) if len(row) == 1 else row
+            return
+
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number} of {path}: {e}") from e
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(percentile / 100 * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def run_batch(session_manager: SessionManager,
+                    inputs: typing.Iterable[typing.Any],
+                    output: typing.TextIO,
+                    session_kwargs: dict[str, typing.Any] | None = None) -> BatchRunStats:
+    """
+    Run the workflow for each input and write one JSON line per input to `output`, in input order, as soon as the
+    outputs of all the previous inputs are written.
+
+    Inputs are read as runs complete, at most twice `session_manager.max_concurrency` inputs are pending at a time so
+    that arbitrarily large inputs can be streamed. A failed input is written with its error and doesn't stop the batch.
+    """
+    window = max(1, 2 * session_manager.max_concurrency) if session_manager.max_concurrency > 0 else 256
+    session_kwargs = session_kwargs or {}
+    latencies: list[float] = []
+    count = 0
+    errors = 0
+
+    async def _run(index: int, payload: typing.Any) -> dict[str, typing.Any]:
+        try:
+            async with session_manager.session(**session_kwargs) as session:
+                async with session.run(payload) as runner:
+                    start = time.perf_counter()
+                    result = await runner.result()
+                    latencies.append(time.perf_counter() - start)
+            return {"index": index, "output": to_jsonable_python(result, fallback=str), "error": None}
+        except Exception as e:
+            logger.error("Error running input %d: %s", index, e)
+            return {"index": index, "output": None, "error": str(e)}
+
+    def _write(record: dict[str, typing.Any]) -> None:
+        nonlocal count, errors
+        count += 1
+        if record["error"] is not None:
+            errors += 1
+        output.write(json.dumps(record) + "\n")
+        output.flush()
+
+    pending: deque[asyncio.Task] = deque()
+    start = time.perf_counter()
+    try:
+        for index, payload in enumerate(inputs):
+            if len(pending) >= window:
+                _write(await pending.popleft())
+            pending.append(asyncio.create_task(_run(index, payload)))
+
+        while pending:
+            _write(await pending.popleft())
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return BatchRunStats(inputs=count,
+                         errors=errors,
+                         elapsed_seconds=elapsed,
+                         inputs_per_second=count / elapsed if elapsed > 0 else 0.0,
+                         latency_mean_seconds=sum(latencies) / len(latencies) if latencies else 0.0,
+                         latency_p50_seconds=_percentile(latencies, 50),
+                         latency_p90_seconds=_percentile(latencies, 90),
+                         latency_p99_seconds=_percentile(latencies, 99))
@@ -29,4 +29,9 @@ class ConsoleFrontEndConfig(FrontEndBaseConfig, name="console"):
                                           alias="input",
                                           description="A single input to submit the the workflow.")
     input_file: Path | None = Field(default=None,
-                                    description="Path to a json file of inputs to submit to the workflow.")
+                                    description=("Path to a json file of inputs to submit to the workflow. A .jsonl or "
+                                                 ".csv file is run in batch mode, one input per line or row."))
+    output_file: str | None = Field(default=None,
+                                    description=("Path of the JSON lines file the outputs of a batch run are written "
+                                                 "to. Defaults to the standard output."))
+    max_concurrency: int = Field(default=8, description="The maximum number of inputs which run at the same time.")
@@ -15,15 +15,21 @@
 
 import asyncio
 import logging
+import sys
+from contextlib import nullcontext
 
 import click
 from colorama import Fore
 
+from nat.builder.workflow import Workflow
 from nat.data_models.interactive import HumanPromptModelType
 from nat.data_models.interactive import HumanResponse
 from nat.data_models.interactive import HumanResponseText
 from nat.data_models.interactive import InteractionPrompt
 from nat.front_ends.console.authentication_flow_handler import ConsoleAuthenticationFlowHandler
+from nat.front_ends.console.batch import is_batch_input_file
+from nat.front_ends.console.batch import read_batch_inputs
+from nat.front_ends.console.batch import run_batch
 from nat.front_ends.console.console_front_end_config import ConsoleFrontEndConfig
 from nat.front_ends.simple_base.simple_front_end_plugin_base import SimpleFrontEndPluginBase
 from nat.runtime.session import SessionManager
@@ -59,6 +65,26 @@ class ConsoleFrontEndPlugin(SimpleFrontEndPluginBase[ConsoleFrontEndConfig]):
         if (not self.front_end_config.input_query and not self.front_end_config.input_file):
             raise click.UsageError("Must specify either --input_query or --input_file")
 
+    def create_session_manager(self, workflow: Workflow) -> SessionManager:
+        return SessionManager(workflow, max_concurrency=self.front_end_config.max_concurrency)
+
+    async def run_batch_file(self, session_manager: SessionManager):
+        """Stream the inputs of a JSONL or CSV file through the workflow, writing the outputs as JSON lines."""
+        input_file = self.front_end_config.input_file
+        output_file = self.front_end_config.output_file
+        logger.info("Running the inputs of %s in batch mode", input_file)
+
+        with (open(output_file, "w", encoding="utf-8") if output_file else nullcontext(sys.stdout)) as output:
+            stats = await run_batch(session_manager,
+                                    read_batch_inputs(input_file),
+                                    output,
+                                    session_kwargs={
+                                        "user_input_callback": prompt_for_input_cli,
+                                        "user_authentication_callback": self.auth_flow_handler.authenticate
+                                    })
+
+        logger.info(f"\n{'-' * 50}\n{Fore.GREEN}Batch Run:\n%s{Fore.RESET}\n{'-' * 50}", stats.summary())
+
     async def run_workflow(self, session_manager: SessionManager):
 
         assert session_manager is not None, "Session manager must be provided"
@@ -82,6 +108,10 @@ class ConsoleFrontEndPlugin(SimpleFrontEndPluginBase[ConsoleFrontEndConfig]):
 
             runner_outputs = await asyncio.gather(*[run_single_query(query) for query in input_list])
 
+        elif (self.front_end_config.input_file and is_batch_input_file(self.front_end_config.input_file)):
+            await self.run_batch_file(session_manager)
+            return
+
         elif (self.front_end_config.input_file):
 
             # Run the workflow
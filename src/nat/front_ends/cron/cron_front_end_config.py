@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import field_validator
+from pydantic import model_validator
+
+from nat.data_models.front_end import FrontEndBaseConfig
+from nat.front_ends.cron.cron_schedule import CronSchedule
+
+
+class CronFrontEndConfig(FrontEndBaseConfig, name="cron"):
+    """
+    A front end that runs workflows on schedules, for each input object found under a prefix of an object store.
+    """
+
+    class Job(BaseModel):
+        name: str = Field(description="Name of the job, used in logs.")
+        schedule: str = Field(description="Cron expression of the times the job runs, in local time "
+                              "(e.g. '0 2 * * *' runs the job every day at 2am).")
+        function_name: str | None = Field(
+            default=None, description="The name of the function to run for each input. Defaults to the workflow.")
+        object_store: str = Field(description="The name of the object store the inputs are read from and the "
+                                  "outputs are written to.")
+        input_prefix: str = Field(default="",
+                                  description="The prefix of the keys of the input objects. The key of each "
+                                  "input object is the input of the workflow.")
+        output_prefix: str = Field(default="cron_outputs/",
+                                   min_length=1,
+                                   description="The prefix of the keys of the output objects. The output of an input "
+                                   "is written to the output prefix followed by the input key without the input "
+                                   "prefix, and a '.json' extension.")
+        skip_completed: bool = Field(default=True,
+                                     description="Skip the inputs which already have an output, so that each run "
+                                     "only processes new inputs and an interrupted run resumes where it stopped.")
+        max_concurrency: int = Field(default=8,
+                                     ge=1,
+                                     description="Maximum number of inputs of the job which run at the same time.")
+        jitter: float = Field(default=0.0,
+                              ge=0.0,
+                              description="Maximum random delay in seconds added to each scheduled run, spreads the "
+                              "load of replicas sharing the same schedule.")
+
+        @field_validator("schedule")
+        @classmethod
+        def _validate_schedule(cls, value: str) -> str:
+            CronSchedule(value)
+            return value
+
+        @model_validator(mode="after")
+        def _validate_prefixes(self):
+            # Keys under the output prefix are never inputs, an output prefix covering the input prefix leaves no input
+            if self.input_prefix.startswith(self.output_prefix):
+                raise ValueError(f"The output prefix '{self.output_prefix}' of job {self.name} cannot contain the "
+                                 f"input prefix '{self.input_prefix}'")
+            return self
+
+    jobs: list[Job] = Field(default_factory=list, description="The scheduled jobs.")
+    run_once: bool = Field(default=False,
+                           description="Run each job once, immediately, then exit. Useful when the runs are "
+                           "triggered by an external scheduler.")
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import random
+from datetime import datetime
+
+from nat.builder.front_end import FrontEndBase
+from nat.builder.workflow_builder import WorkflowBuilder
+from nat.front_ends.cron.cron_front_end_config import CronFrontEndConfig
+from nat.front_ends.cron.cron_job import run_cron_job
+from nat.front_ends.cron.cron_schedule import CronSchedule
+from nat.runtime.session import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+class CronFrontEndPlugin(FrontEndBase[CronFrontEndConfig]):
+    """Runs the configured jobs on their schedules until the process is stopped, or once with `run_once`."""
+
+    async def run(self) -> None:
+        if not self.front_end_config.jobs:
+            raise ValueError("The cron front end requires at least one job in `general.front_end.jobs`")
+
+        async with WorkflowBuilder.from_config(config=self.full_config) as builder:
+            async with asyncio.TaskGroup() as task_group:
+                for job in self.front_end_config.jobs:
+                    session_manager = SessionManager(builder.build(entry_function=job.function_name),
+                                                     max_concurrency=job.max_concurrency)
+                    if self.front_end_config.run_once:
+                        task_group.create_task(self.run_job(job, session_manager, builder))
+                    else:
+                        task_group.create_task(self.run_scheduled_job(job, session_manager, builder))
+
+    async def run_job(self, job: CronFrontEndConfig.Job, session_manager: SessionManager,
+                      builder: WorkflowBuilder) -> None:
+        if job.jitter > 0:
+            await asyncio.sleep(random.uniform(0, job.jitter))
+
+        logger.info("Running job %s", job.name)
+        object_store = await builder.get_object_store_client(job.object_store)
+        stats = await run_cron_job(job, session_manager, object_store)
+        logger.info(stats.summary())
+
+    async def run_scheduled_job(self,
+                                job: CronFrontEndConfig.Job,
+                                session_manager: SessionManager,
+                                builder: WorkflowBuilder) -> None:
+        schedule = CronSchedule(job.schedule)
+        while True:
+            # Scheduled from the end of the previous run, a run which overruns the next scheduled time skips it
+            next_run = schedule.next_after(datetime.now())
+            logger.info("Next run of job %s at %s", job.name, next_run.isoformat(sep=" "))
+            await asyncio.sleep(max(0.0, (next_run - datetime.now()).total_seconds()))
+
+            try:
+                await self.run_job(job, session_manager, builder)
+            except Exception as e:
+                # A failed run, e.g. an unavailable object store, must not stop the following runs
+                logger.exception("Job %s failed: %s", job.name, e)
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import time
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from nat.front_ends.cron.cron_front_end_config import CronFrontEndConfig
+from nat.object_store.interfaces import ObjectStore
+from nat.object_store.models import ObjectStoreItem
+from nat.runtime.session import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+class CronJobStats(BaseModel):
+    """Summary of a run of a scheduled job."""
+    job: str
+    inputs: int
+    skipped: int
+    errors: int
+    elapsed_seconds: float
+
+    def summary(self) -> str:
+        return (f"Job {self.job}: {self.inputs} inputs ({self.errors} errors, {self.skipped} already completed) in "
+                f"{self.elapsed_seconds:.2f}s")
+
+
+def get_output_key(job: CronFrontEndConfig.Job, input_key: str) -> str:
+    return f"{job.output_prefix}{input_key.removeprefix(job.input_prefix)}.json"
+
+
+async def run_cron_job(job: CronFrontEndConfig.Job, session_manager: SessionManager,
+                       object_store: ObjectStore) -> CronJobStats:
+    """
+    Run the workflow for each object under the input prefix of the job, and write each output as a JSON object under
+    the output prefix.
+
+    Input keys are streamed from the object store, at most `job.max_concurrency` inputs are in flight at a time. A
+    failed input is logged and has no output, so that it is retried by the next run.
+    """
+    start = time.perf_counter()
+    completed: set[str] = set()
+    if job.skip_completed:
+        completed = {key async for key in object_store.list_keys(job.output_prefix)}
+
+    semaphore = asyncio.Semaphore(job.max_concurrency)
+    tasks: set[asyncio.Task] = set()
+    inputs = skipped = errors = 0
+
+    async def _run(input_key: str, output_key: str) -> None:
+        nonlocal errors
+        try:
+            async with session_manager.session() as session:
+                async with session.run(input_key) as runner:
+                    result = await runner.result()
+
+            data = json.dumps(to_jsonable_python(result, fallback=str)).encode("utf-8")
+            await object_store.upsert_object(
+                output_key,
+                ObjectStoreItem(data=data, content_type="application/json", metadata={"input_key": input_key}))
+        except Exception as e:
+            errors += 1
+            logger.error("Job %s failed for input %s: %s", job.name, input_key, e)
+        finally:
+            semaphore.release()
+
+    try:
+        async for input_key in object_store.list_keys(job.input_prefix):
+            # Outputs may be written under the input prefix
+            if input_key.startswith(job.output_prefix):
+                continue
+
+            inputs += 1
+            output_key = get_output_key(job, input_key)
+            if output_key in completed:
+                skipped += 1
+                continue
+
+            await semaphore.acquire()
+            task = asyncio.create_task(_run(input_key, output_key))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return CronJobStats(job=job.name,
+                        inputs=inputs,
+                        skipped=skipped,
+                        errors=errors,
+                        elapsed_seconds=time.perf_counter() - start)
@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import calendar
+from datetime import datetime
+from datetime import timedelta
+
+_ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+# (name, minimum, maximum) of the five fields of a cron expression
+_FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day of month", 1, 31), ("month", 1, 12), ("day of week", 0, 7))
+
+# Upper bound of the days searched for the next run, schedules such as February 30th never run
+_MAX_SEARCH_DAYS = 366 * 8
+
+
+def _parse_field(value: str, name: str, minimum: int, maximum: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in value.split(","):
+        range_part, _, step_part = part.partition("/")
+        try:
+            step = int(step_part) if step_part else 1
+            if range_part == "*":
+                start, end = minimum, maximum
+            elif "-" in range_part:
+                start_part, end_part = range_part.split("-", 1)
+                start, end = int(start_part), int(end_part)
+            else:
+                start = int(range_part)
+                # "5/15" is every 15 units starting at 5
+                end = maximum if step_part else start
+        except ValueError as e:
+            raise ValueError(f"Invalid {name} field '{value}' in cron expression") from e
+
+        if step < 1 or start < minimum or end > maximum or start > end:
+            raise ValueError(f"Invalid {name} field '{value}' in cron expression, values range from {minimum} to "
+                             f"{maximum}")
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+class CronSchedule:
+    """
+    A schedule defined by a standard five field cron expression: `minute hour day-of-month month day-of-week`.
+
+    Fields accept `*`, values, ranges (`1-5`), lists (`1,15`) and steps (`*/15`, `0-12/2`). Day of week 0 and 7 are
+    Sunday. As in cron, when both the day of month and the day of week are restricted a day matching either runs. The
+    `@hourly`, `@daily`, `@weekly`, `@monthly` and `@yearly` aliases are supported.
+
+    Args:
+        expression (str): The cron expression
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        fields = _ALIASES.get(expression.strip(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression '{expression}', expected 5 fields")
+
+        minutes, hours, days, months, weekdays = (_parse_field(field, *spec) for field, spec in zip(fields, _FIELDS))
+        self._minutes = minutes
+        self._hours = hours
+        self._days = days
+        self._months = months
+        # Convert cron weekdays, 0 is Sunday, to Python weekdays, 0 is Monday
+        self._weekdays = frozenset((weekday - 1) % 7 for weekday in weekdays)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def __repr__(self) -> str:
+        return f"CronSchedule({self.expression!r})"
+
+    def _matches_day(self, moment: datetime) -> bool:
+        day_matches = moment.day in self._days
+        weekday_matches = moment.weekday() in self._weekdays
+        if self._any_day or self._any_weekday:
+            return day_matches and weekday_matches
+        return day_matches or weekday_matches
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first time of the schedule strictly after `moment`, with the same time zone as `moment`."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=_MAX_SEARCH_DAYS)
+
+        while candidate < limit:
+            if candidate.month not in self._months:
+                days_in_month = calendar.monthrange(candidate.year, candidate.month)[1]
+                candidate = candidate.replace(day=1, hour=0, minute=0) + timedelta(days=days_in_month)
+            elif not self._matches_day(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self._hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self._minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+
+        raise ValueError(f"Cron expression '{self.expression}' never runs")
@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections.abc import AsyncIterator
+
+from nat.cli.register_workflow import register_front_end
+from nat.data_models.config import Config
+from nat.front_ends.cron.cron_front_end_config import CronFrontEndConfig
+
+
+@register_front_end(config_type=CronFrontEndConfig)
+async def register_cron_front_end(config: CronFrontEndConfig, full_config: Config) -> AsyncIterator:
+    from nat.front_ends.cron.cron_front_end_plugin import CronFrontEndPlugin
+
+    yield CronFrontEndPlugin(full_config=full_config)
@@ -25,6 +25,7 @@ from pydantic import field_validator
 from nat.data_models.component_ref import ObjectStoreRef
 from nat.data_models.front_end import FrontEndBaseConfig
 from nat.data_models.step_adaptor import StepAdaptorConfig
+from nat.profiler.online_profiler import OnlineProfilerMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +110,9 @@ class EvaluateStatusResponse(BaseAsyncStatusResponse):
     config_file: str = Field(description="Path to the configuration file used for evaluation")
     output_path: str | None = Field(default=None,
                                     description="Path to the output file if the job completed successfully")
+    profiler_metrics: OnlineProfilerMetrics | None = Field(
+        default=None,
+        description="Live profiler metrics of a running job, available when the profiler's `online_metrics` is enabled")
 
 
 class AsyncGenerationStatusResponse(BaseAsyncStatusResponse):
@@ -117,6 +121,13 @@ class AsyncGenerationStatusResponse(BaseAsyncStatusResponse):
         description="Output of the generate request, this is only available if the job completed successfully.")
 
 
+class BatchGenerateResponseItem(BaseModel):
+    """One line of the newline delimited JSON response of the batch generate endpoint."""
+    index: int = Field(description="Position of the input in the request")
+    output: typing.Any = Field(default=None, description="Output of the workflow, if it succeeded")
+    error: str | None = Field(default=None, description="Error message, if the workflow failed")
+
+
 class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
     """
     A FastAPI based front end that allows a NAT workflow to be served as a microservice.
@@ -146,6 +157,11 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
                          "non-streaming requests based on the 'stream' parameter, following the "
                          "OpenAI Chat Completions API specification exactly."),
         )
+        priority: int = Field(
+            default=0,
+            description=("Priority of the requests of this endpoint when waiting for admission, requests of higher "
+                         "priority start first. Only used when `admission_control` is configured."),
+        )
 
     class Endpoint(EndpointBase):
         function_name: str = Field(description="The name of the function to call for this endpoint")
@@ -176,6 +192,44 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             description="Sets a maximum time in seconds for browsers to cache CORS responses.",
         )
 
+    class AdmissionControl(BaseModel):
+        max_concurrency: int = Field(default=8,
+                                     ge=1,
+                                     description="Maximum number of workflow runs executing at the same time, "
+                                     "shared by all the endpoints.")
+        min_concurrency: int = Field(default=1,
+                                     ge=1,
+                                     description="Lower bound of the concurrency limit when it adapts to latency.")
+        max_queue_size: int = Field(default=64,
+                                    ge=0,
+                                    description="Maximum number of requests waiting to start, additional requests are "
+                                    "rejected with a 429 status code.")
+        target_latency: float | None = Field(
+            default=None,
+            gt=0,
+            description="Workflow run latency in seconds above which the concurrency limit is decreased. If None, the "
+            "concurrency limit is fixed to `max_concurrency`.")
+        backoff_ratio: float = Field(default=0.9,
+                                     gt=0,
+                                     lt=1,
+                                     description="Factor applied to the concurrency limit when a run exceeds "
+                                     "`target_latency`.")
+
+    class ObjectStorePipeline(BaseModel):
+        function_name: str | None = Field(
+            default=None,
+            description="The name of the function run for each uploaded file, with the key of the file as input. "
+            "Defaults to the workflow.")
+        key_prefix: str = Field(default="", description="Only the files uploaded under this prefix are processed.")
+        output_suffix: str = Field(default=".result.json",
+                                   description="The output of a file is stored as JSON next to the file, at the key "
+                                   "of the file followed by this suffix.")
+        max_workers: int = Field(default=4, ge=1, description="Maximum number of files processed at the same time.")
+        max_queue_size: int = Field(default=1000,
+                                    ge=1,
+                                    description="Maximum number of files waiting to be processed, files uploaded "
+                                    "while the queue is full are not processed.")
+
     root_path: str = Field(default="", description="The root path for the API")
     host: str = Field(default="localhost", description="Host to bind the server to")
     port: int = Field(default=8000, description="Port to bind the server to", ge=0, le=65535)
@@ -184,6 +238,19 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
     max_running_async_jobs: int = Field(default=10,
                                         description="Maximum number of async jobs to run concurrently",
                                         ge=1)
+    max_batch_inputs: int = Field(default=256,
+                                  description="Maximum number of inputs accepted by the batch generate endpoint",
+                                  ge=1)
+    job_store_url: str | None = Field(
+        default=None,
+        description="URL of the store tracking async generation and evaluation jobs, either `sqlite:///path/to/jobs.db` "
+        "or `redis://host:port/db`. A shared store lets any worker report the status of a job created by another "
+        "worker. If None, jobs are kept in the memory of each worker.")
+    admission_control: AdmissionControl | None = Field(
+        default=None,
+        description="Bounded, prioritized admission of workflow runs. Requests carrying an `X-Request-Timeout` header "
+        "are rejected with a 503 status code if they cannot start within that many seconds. If None, each endpoint "
+        "runs up to 8 workflows at the same time and queues additional requests without limit.")
     step_adaptor: StepAdaptorConfig = StepAdaptorConfig()
 
     workflow: typing.Annotated[EndpointBase, Field(description="Endpoint for the default workflow.")] = EndpointBase(
@@ -205,6 +272,11 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
         default="/auth/redirect",
         description="OAuth2.0 authentication callback endpoint. If None, no OAuth2 callback endpoint is created.")
 
+    metrics_path: str | None = Field(
+        default="/metrics",
+        description="Endpoint exposing in-process metrics in the Prometheus text format. If None, no metrics endpoint "
+        "is created.")
+
     endpoints: list[Endpoint] = Field(
         default_factory=list,
         description=("Additional endpoints to add to the FastAPI app which run functions within the NAT configuration. "
@@ -231,6 +303,10 @@ class FastApiFrontEndConfig(FrontEndBaseConfig, name="fastapi"):
             "Object store reference for the FastAPI app. If present, static files can be uploaded via a POST "
             "request to '/static' and files will be served from the object store. The files will be served from the "
             "object store at '/static/{file_name}'."))
+    object_store_pipeline: ObjectStorePipeline | None = Field(
+        default=None,
+        description="Process the files uploaded to the object store through '/static' in background workers, and "
+        "store the output of each file next to it. Requires `object_store`. If None, uploads are only stored.")
 
 
 # Compatibility aliases with previous releases
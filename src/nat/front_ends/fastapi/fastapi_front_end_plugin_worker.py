@@ -16,26 +16,30 @@
 import asyncio
 import logging
 import os
-import time
+import re
 import typing
 from abc import ABC
 from abc import abstractmethod
 from collections.abc import Awaitable
 from collections.abc import Callable
+from contextlib import AsyncExitStack
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import BackgroundTasks
 from fastapi import Body
 from fastapi import FastAPI
+from fastapi import Query
 from fastapi import Request
 from fastapi import Response
 from fastapi import UploadFile
 from fastapi.exceptions import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from pydantic import Field
+from starlette.requests import ClientDisconnect
 from starlette.websockets import WebSocket
 
 from nat.builder.workflow_builder import WorkflowBuilder
@@ -54,22 +58,38 @@ from nat.front_ends.fastapi.auth_flow_handlers.websocket_flow_handler import Flo
 from nat.front_ends.fastapi.auth_flow_handlers.websocket_flow_handler import WebSocketAuthenticationFlowHandler
 from nat.front_ends.fastapi.fastapi_front_end_config import AsyncGenerateResponse
 from nat.front_ends.fastapi.fastapi_front_end_config import AsyncGenerationStatusResponse
+from nat.front_ends.fastapi.fastapi_front_end_config import BatchGenerateResponseItem
 from nat.front_ends.fastapi.fastapi_front_end_config import EvaluateRequest
 from nat.front_ends.fastapi.fastapi_front_end_config import EvaluateResponse
 from nat.front_ends.fastapi.fastapi_front_end_config import EvaluateStatusResponse
 from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from nat.front_ends.fastapi.job_store import JobInfo
-from nat.front_ends.fastapi.job_store import JobStore
+from nat.front_ends.fastapi.job_store import JobStoreBase
+from nat.front_ends.fastapi.job_store import create_job_store
 from nat.front_ends.fastapi.message_handler import WebSocketMessageHandler
+from nat.front_ends.fastapi.object_store_pipeline import ObjectStorePipeline
+from nat.front_ends.fastapi.object_store_pipeline import PipelineObjectStore
+from nat.front_ends.fastapi.response_helpers import cancel_on_disconnect
+from nat.front_ends.fastapi.response_helpers import generate_batch_response_as_str
+from nat.front_ends.fastapi.response_helpers import generate_chat_response_from_stream
 from nat.front_ends.fastapi.response_helpers import generate_single_response
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response_as_str
 from nat.front_ends.fastapi.response_helpers import generate_streaming_response_full_as_str
 from nat.front_ends.fastapi.step_adaptor import StepAdaptor
 from nat.object_store.models import ObjectStoreItem
+from nat.observability.metrics import PROMETHEUS_CONTENT_TYPE
+from nat.observability.metrics import GlobalMetricsRegistry
+from nat.runtime.admission import AdmissionController
+from nat.runtime.admission import AdmissionRejectedError
+from nat.runtime.admission import request_deadline
 from nat.runtime.session import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Long polling of the job status endpoints
+JOB_STATUS_WAIT_QUERY = Query(
+    default=0, ge=0, le=300, description="Wait up to `wait` seconds for the job to finish before returning its status.")
+
 
 class FastApiFrontEndPluginWorkerBase(ABC):
 
@@ -83,6 +103,8 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
         self._cleanup_tasks: list[str] = []
         self._cleanup_tasks_lock = asyncio.Lock()
+        self._job_stores: list[JobStoreBase] = []
+        self._object_store_pipeline: ObjectStorePipeline | None = None
         self._http_flow_handler: HTTPAuthenticationFlowHandler | None = HTTPAuthenticationFlowHandler()
 
     @property
@@ -121,6 +143,16 @@ class FastApiFrontEndPluginWorkerBase(ABC):
 
                     self._cleanup_tasks.clear()
 
+                # Close the job stores, then the pipeline, even when closing one of them fails
+                async with AsyncExitStack() as stack:
+                    if self._object_store_pipeline is not None:
+                        stack.push_async_callback(self._object_store_pipeline.aclose)
+                        self._object_store_pipeline = None
+
+                    for job_store in reversed(self._job_stores):
+                        stack.push_async_callback(job_store.aclose)
+                    self._job_stores.clear()
+
             logger.debug("Closing NAT server from process %s", os.getpid())
 
         nat_app = FastAPI(lifespan=lifespan)
@@ -128,12 +160,45 @@ class FastApiFrontEndPluginWorkerBase(ABC):
         # Configure app CORS.
         self.set_cors_config(nat_app)
 
+        @nat_app.exception_handler(AdmissionRejectedError)
+        async def admission_rejected_handler(request: Request, exc: AdmissionRejectedError):
+            return JSONResponse(status_code=exc.status_code,
+                                content={"detail": str(exc)},
+                                headers={"Retry-After": str(exc.retry_after)})
+
+        @nat_app.exception_handler(ClientDisconnect)
+        async def client_disconnect_handler(request: Request, exc: ClientDisconnect):
+            # Nobody reads the response, 499 is the de facto status code for requests closed by the client
+            return Response(status_code=499)
+
         @nat_app.middleware("http")
         async def authentication_log_filter(request: Request, call_next: Callable[[Request], Awaitable[Response]]):
             return await self._suppress_authentication_logs(request, call_next)
 
         return nat_app
 
+    def create_admission_controller(self) -> AdmissionController | None:
+        """
+        Create the admission controller shared by the workflow endpoints, if admission control is configured.
+        """
+        admission_control = self.front_end_config.admission_control
+        if admission_control is None:
+            return None
+
+        return AdmissionController(max_concurrency=admission_control.max_concurrency,
+                                   min_concurrency=admission_control.min_concurrency,
+                                   max_queue_size=admission_control.max_queue_size,
+                                   target_latency=admission_control.target_latency,
+                                   backoff_ratio=admission_control.backoff_ratio)
+
+    def create_job_store(self, namespace: str) -> JobStoreBase:
+        """
+        Create a job store for the jobs of `namespace`, shared by all the workers when `job_store_url` is configured.
+        """
+        job_store = create_job_store(self.front_end_config.job_store_url, namespace=namespace)
+        self._job_stores.append(job_store)
+        return job_store
+
     def set_cors_config(self, nat_app: FastAPI) -> None:
         """
         Set the cross origin resource sharing configuration.
@@ -209,16 +274,16 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         self._outstanding_flows_lock = asyncio.Lock()
 
     @staticmethod
-    async def _periodic_cleanup(name: str, job_store: JobStore, sleep_time_sec: int = 300):
+    async def _periodic_cleanup(name: str, job_store: JobStoreBase, sleep_time_sec: int = 300):
         while True:
             try:
-                job_store.cleanup_expired_jobs()
+                await job_store.cleanup_expired_jobs()
                 logger.debug("Expired %s jobs cleaned up", name)
             except Exception as e:
                 logger.error("Error during %s job cleanup: %s", name, e)
             await asyncio.sleep(sleep_time_sec)
 
-    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStore, sleep_time_sec: int = 300):
+    async def create_cleanup_task(self, app: FastAPI, name: str, job_store: JobStoreBase, sleep_time_sec: int = 300):
         # Schedule periodic cleanup of expired jobs on first job creation
         attr_name = f"{name}_cleanup_task"
 
@@ -247,16 +312,27 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
     async def add_routes(self, app: FastAPI, builder: WorkflowBuilder):
 
-        await self.add_default_route(app, SessionManager(builder.build()))
+        admission_controller = self.create_admission_controller()
+
+        await self.add_default_route(
+            app,
+            SessionManager(builder.build(),
+                           admission_controller=admission_controller,
+                           priority=self.front_end_config.workflow.priority))
         await self.add_evaluate_route(app, SessionManager(builder.build()))
         await self.add_static_files_route(app, builder)
         await self.add_authorization_route(app)
+        await self.add_metrics_route(app)
 
         for ep in self.front_end_config.endpoints:
 
             entry_workflow = builder.build(entry_function=ep.function_name)
 
-            await self.add_route(app, endpoint=ep, session_manager=SessionManager(entry_workflow))
+            await self.add_route(app,
+                                 endpoint=ep,
+                                 session_manager=SessionManager(entry_workflow,
+                                                                admission_controller=admission_controller,
+                                                                priority=ep.priority))
 
     async def add_default_route(self, app: FastAPI, session_manager: SessionManager):
 
@@ -277,9 +353,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking evaluation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store(namespace="evaluation")
         # Don't run multiple evaluations at the same time
         evaluation_lock = asyncio.Lock()
+        # Evaluations in progress, used to report live profiler metrics
+        running_evaluations: dict[str, EvaluationRun] = {}
 
         async def run_evaluation(job_id: str, config_file: str, reps: int, session_manager: SessionManager):
             """Background task to run the evaluation."""
@@ -289,20 +367,23 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     eval_config = EvaluationRunConfig(config_file=Path(config_file), dataset=None, reps=reps)
 
                     # Create a new EvaluationRun with the evaluation-specific config
-                    job_store.update_status(job_id, "running")
+                    await job_store.update_status(job_id, "running")
                     eval_runner = EvaluationRun(eval_config)
+                    running_evaluations[job_id] = eval_runner
                     output: EvaluationRunOutput = await eval_runner.run_and_evaluate(session_manager=session_manager,
                                                                                      job_id=job_id)
                     if output.workflow_interrupted:
-                        job_store.update_status(job_id, "interrupted")
+                        await job_store.update_status(job_id, "interrupted")
                     else:
                         parent_dir = os.path.dirname(
                             output.workflow_output_file) if output.workflow_output_file else None
 
-                        job_store.update_status(job_id, "success", output_path=str(parent_dir))
+                        await job_store.update_status(job_id, "success", output_path=str(parent_dir))
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, str(e))
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
+                finally:
+                    running_evaluations.pop(job_id, None)
 
         async def start_evaluation(request: EvaluateRequest, background_tasks: BackgroundTasks, http_request: Request):
             """Handle evaluation requests."""
@@ -311,11 +392,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 # if job_id is present and already exists return the job info
                 if request.job_id:
-                    job = job_store.get_job(request.job_id)
+                    job = await job_store.get_job(request.job_id)
                     if job:
                         return EvaluateResponse(job_id=job.job_id, status=job.status)
 
-                job_id = job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
+                job_id = await job_store.create_job(request.config_file, request.job_id, request.expiry_seconds)
                 await self.create_cleanup_task(app=app, name="async_evaluation", job_store=job_store)
                 background_tasks.add_task(run_evaluation, job_id, request.config_file, request.reps, session_manager)
 
@@ -323,6 +404,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
         def translate_job_to_response(job: JobInfo) -> EvaluateStatusResponse:
             """Translate a JobInfo object to an EvaluateStatusResponse."""
+            eval_runner = running_evaluations.get(job.job_id)
+            profiler_metrics = None
+            if eval_runner is not None and eval_runner.online_profiler is not None:
+                profiler_metrics = eval_runner.online_profiler.snapshot()
+
             return EvaluateStatusResponse(job_id=job.job_id,
                                           status=job.status,
                                           config_file=str(job.config_file),
@@ -330,15 +416,18 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                           output_path=str(job.output_path),
                                           created_at=job.created_at,
                                           updated_at=job.updated_at,
-                                          expires_at=job_store.get_expires_at(job))
+                                          expires_at=job_store.get_expires_at(job),
+                                          profiler_metrics=profiler_metrics)
 
-        async def get_job_status(job_id: str, http_request: Request) -> EvaluateStatusResponse:
-            """Get the status of an evaluation job."""
+        async def get_job_status(job_id: str,
+                                 http_request: Request,
+                                 wait: float = JOB_STATUS_WAIT_QUERY) -> EvaluateStatusResponse:
+            """Get the status of an evaluation job, optionally waiting for the job to finish."""
             logger.info("Getting status for job %s", job_id)
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await (job_store.wait_for_job(job_id, timeout=wait) if wait > 0 else job_store.get_job(job_id))
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -351,7 +440,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_last_job()
+                job = await job_store.get_last_job()
                 if not job:
                     logger.warning("No jobs found when requesting last job status")
                     raise HTTPException(status_code=404, detail="No jobs found")
@@ -365,10 +454,10 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                 if status is None:
                     logger.info("Getting all jobs")
-                    jobs = job_store.get_all_jobs()
+                    jobs = await job_store.get_all_jobs()
                 else:
                     logger.info("Getting jobs with status %s", status)
-                    jobs = job_store.get_jobs_by_status(status)
+                    jobs = await job_store.get_jobs_by_status(status)
                 logger.info("Found %d jobs", len(jobs))
                 return [translate_job_to_response(job) for job in jobs]
 
@@ -425,10 +514,26 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
         if not self.front_end_config.object_store:
             logger.debug("No object store configured, skipping static files route")
+            if self.front_end_config.object_store_pipeline is not None:
+                logger.warning("The object store pipeline requires an object store, uploads will not be processed")
             return
 
         object_store_client = await builder.get_object_store_client(self.front_end_config.object_store)
 
+        pipeline_config = self.front_end_config.object_store_pipeline
+        if pipeline_config is not None:
+            # Uploads are processed in the background, the outputs are written directly to the object store
+            self._object_store_pipeline = ObjectStorePipeline(SessionManager(
+                builder.build(entry_function=pipeline_config.function_name),
+                max_concurrency=pipeline_config.max_workers),
+                                                              object_store_client,
+                                                              key_prefix=pipeline_config.key_prefix,
+                                                              output_suffix=pipeline_config.output_suffix,
+                                                              max_workers=pipeline_config.max_workers,
+                                                              max_queue_size=pipeline_config.max_queue_size)
+            self._object_store_pipeline.start()
+            object_store_client = PipelineObjectStore(object_store_client, self._object_store_pipeline)
+
         def sanitize_path(path: str) -> str:
             sanitized_path = os.path.normpath(path.strip("/"))
             if sanitized_path == ".":
@@ -536,12 +641,17 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 le=300,
                 description="Attempt to perform the job synchronously up until `sync_timeout` sectonds, "
                 "if the job hasn't been completed by then a job_id will be returned with a status code of 202.")
-            expiry_seconds: int = Field(default=JobStore.DEFAULT_EXPIRY,
-                                        ge=JobStore.MIN_EXPIRY,
-                                        le=JobStore.MAX_EXPIRY,
+            expiry_seconds: int = Field(default=JobStoreBase.DEFAULT_EXPIRY,
+                                        ge=JobStoreBase.MIN_EXPIRY,
+                                        le=JobStoreBase.MAX_EXPIRY,
                                         description="Optional time (in seconds) before the job expires. "
                                         "Clamped between 600 (10 min) and 86400 (24h).")
 
+        class BatchGenerateRequest(BaseModel):
+            inputs: list[GenerateBodyType] = Field(min_length=1,
+                                                   max_length=self.front_end_config.max_batch_inputs,
+                                                   description="Inputs to run the workflow with")
+
         # Ensure that the input is in the body. POD types are treated as query parameters
         if (not issubclass(GenerateBodyType, BaseModel)):
             GenerateBodyType = typing.Annotated[GenerateBodyType, Body()]
@@ -561,7 +671,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
         }
 
         # Create job store for tracking async generation jobs
-        job_store = JobStore()
+        job_store = self.create_job_store(
+            namespace=re.sub(r"\W", "_", f"generation{endpoint.path or endpoint.openai_api_path or ''}"))
 
         # Run up to max_running_async_jobs jobs at the same time
         async_job_concurrency = asyncio.Semaphore(self._front_end_config.max_running_async_jobs)
@@ -575,7 +686,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 async with session_manager.session(request=request,
                                                    user_authentication_callback=self._http_flow_handler.authenticate):
 
-                    return await generate_single_response(None, session_manager, result_type=result_type)
+                    return await cancel_on_disconnect(
+                        request, generate_single_response(None, session_manager, result_type=result_type))
 
             return get_single
 
@@ -586,6 +698,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 async with session_manager.session(request=request,
                                                    user_authentication_callback=self._http_flow_handler.authenticate):
 
+                    session_manager.check_admission()
                     return StreamingResponse(headers={"Content-Type": "text/event-stream; charset=utf-8"},
                                              content=generate_streaming_response_as_str(
                                                  None,
@@ -593,14 +706,16 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                                  streaming=streaming,
                                                  step_adaptor=self.get_step_adaptor(),
                                                  result_type=result_type,
-                                                 output_type=output_type))
+                                                 output_type=output_type,
+                                                 request=request))
 
             return get_stream
 
         def get_streaming_raw_endpoint(streaming: bool, result_type: type | None, output_type: type | None):
 
-            async def get_stream(filter_steps: str | None = None):
+            async def get_stream(request: Request, filter_steps: str | None = None):
 
+                session_manager.check_admission()
                 return StreamingResponse(headers={"Content-Type": "text/event-stream; charset=utf-8"},
                                          content=generate_streaming_response_full_as_str(
                                              None,
@@ -608,7 +723,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                              streaming=streaming,
                                              result_type=result_type,
                                              output_type=output_type,
-                                             filter_steps=filter_steps))
+                                             filter_steps=filter_steps,
+                                             request=request))
 
             return get_stream
 
@@ -621,7 +737,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 async with session_manager.session(request=request,
                                                    user_authentication_callback=self._http_flow_handler.authenticate):
 
-                    return await generate_single_response(payload, session_manager, result_type=result_type)
+                    return await cancel_on_disconnect(
+                        request, generate_single_response(payload, session_manager, result_type=result_type))
 
             return post_single
 
@@ -635,6 +752,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 async with session_manager.session(request=request,
                                                    user_authentication_callback=self._http_flow_handler.authenticate):
 
+                    session_manager.check_admission()
                     return StreamingResponse(headers={"Content-Type": "text/event-stream; charset=utf-8"},
                                              content=generate_streaming_response_as_str(
                                                  payload,
@@ -642,10 +760,27 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                                  streaming=streaming,
                                                  step_adaptor=self.get_step_adaptor(),
                                                  result_type=result_type,
-                                                 output_type=output_type))
+                                                 output_type=output_type,
+                                                 request=request))
 
             return post_stream
 
+        def post_batch_endpoint(request_type: type, result_type: type | None):
+
+            async def post_batch(request: Request, payload: request_type):
+
+                async with session_manager.session(request=request,
+                                                   user_authentication_callback=self._http_flow_handler.authenticate):
+
+                    session_manager.check_admission()
+                    return StreamingResponse(headers={"Content-Type": "application/x-ndjson"},
+                                             content=generate_batch_response_as_str(payload.inputs,
+                                                                                    session_manager=session_manager,
+                                                                                    result_type=result_type,
+                                                                                    request=request))
+
+            return post_batch
+
         def post_streaming_raw_endpoint(request_type: type,
                                         streaming: bool,
                                         result_type: type | None,
@@ -654,8 +789,9 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
             Stream raw intermediate steps without any step adaptor translations.
             """
 
-            async def post_stream(payload: request_type, filter_steps: str | None = None):
+            async def post_stream(request: Request, payload: request_type, filter_steps: str | None = None):
 
+                session_manager.check_admission()
                 return StreamingResponse(headers={"Content-Type": "text/event-stream; charset=utf-8"},
                                          content=generate_streaming_response_full_as_str(
                                              payload,
@@ -663,7 +799,8 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                              streaming=streaming,
                                              result_type=result_type,
                                              output_type=output_type,
-                                             filter_steps=filter_steps))
+                                             filter_steps=filter_steps,
+                                             request=request))
 
             return post_stream
 
@@ -680,6 +817,7 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                 async with session_manager.session(request=request):
                     if stream_requested:
                         # Return streaming response
+                        session_manager.check_admission()
                         return StreamingResponse(headers={"Content-Type": "text/event-stream; charset=utf-8"},
                                                  content=generate_streaming_response_as_str(
                                                      payload,
@@ -687,61 +825,37 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                                                      streaming=True,
                                                      step_adaptor=self.get_step_adaptor(),
                                                      result_type=ChatResponseChunk,
-                                                     output_type=ChatResponseChunk))
-                    else:
-                        # Return single response - check if workflow supports non-streaming
-                        try:
-                            response.headers["Content-Type"] = "application/json"
-                            return await generate_single_response(payload, session_manager, result_type=ChatResponse)
-                        except ValueError as e:
-                            if "Cannot get a single output value for streaming workflows" in str(e):
-                                # Workflow only supports streaming, but client requested non-streaming
-                                # Fall back to streaming and collect the result
-                                chunks = []
-                                async for chunk_str in generate_streaming_response_as_str(
-                                        payload,
-                                        session_manager=session_manager,
-                                        streaming=True,
-                                        step_adaptor=self.get_step_adaptor(),
-                                        result_type=ChatResponseChunk,
-                                        output_type=ChatResponseChunk):
-                                    if chunk_str.startswith("data: ") and not chunk_str.startswith("data: [DONE]"):
-                                        chunk_data = chunk_str[6:].strip()  # Remove "data: " prefix
-                                        if chunk_data:
-                                            try:
-                                                chunk_json = ChatResponseChunk.model_validate_json(chunk_data)
-                                                if (chunk_json.choices and len(chunk_json.choices) > 0
-                                                        and chunk_json.choices[0].delta
-                                                        and chunk_json.choices[0].delta.content is not None):
-                                                    chunks.append(chunk_json.choices[0].delta.content)
-                                            except Exception:
-                                                continue
-
-                                # Create a single response from collected chunks
-                                content = "".join(chunks)
-                                single_response = ChatResponse.from_string(content)
-                                response.headers["Content-Type"] = "application/json"
-                                return single_response
-                            else:
-                                raise
+                                                     output_type=ChatResponseChunk,
+                                                     request=request))
+
+                    response.headers["Content-Type"] = "application/json"
+                    if session_manager.workflow.has_single_output:
+                        return await cancel_on_disconnect(
+                            request, generate_single_response(payload, session_manager, result_type=ChatResponse))
+
+                    # The workflow only supports streaming, aggregate its chunks into a single response
+                    return await cancel_on_disconnect(request,
+                                                      generate_chat_response_from_stream(payload, session_manager))
 
             return post_openai_api_compatible
 
         async def run_generation(job_id: str, payload: typing.Any, session_manager: SessionManager, result_type: type):
             """Background task to run the evaluation."""
+            # The deadline of the request submitting the job doesn't apply to the job
+            request_deadline.set(None)
             async with async_job_concurrency:
                 try:
                     result = await generate_single_response(payload=payload,
                                                             session_manager=session_manager,
                                                             result_type=result_type)
-                    job_store.update_status(job_id, "success", output=result)
+                    await job_store.update_status(job_id, "success", output=result)
                 except Exception as e:
                     logger.error("Error in evaluation job %s: %s", job_id, e)
-                    job_store.update_status(job_id, "failure", error=str(e))
+                    await job_store.update_status(job_id, "failure", error=str(e))
 
         def _job_status_to_response(job: JobInfo) -> AsyncGenerationStatusResponse:
             job_output = job.output
-            if job_output is not None:
+            if isinstance(job_output, BaseModel):
                 job_output = job_output.model_dump()
             return AsyncGenerationStatusResponse(job_id=job.job_id,
                                                  status=job.status,
@@ -762,11 +876,11 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                     # if job_id is present and already exists return the job info
                     if request.job_id:
-                        job = job_store.get_job(request.job_id)
+                        job = await job_store.get_job(request.job_id)
                         if job:
                             return AsyncGenerateResponse(job_id=job.job_id, status=job.status)
 
-                    job_id = job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
+                    job_id = await job_store.create_job(job_id=request.job_id, expiry_seconds=request.expiry_seconds)
                     await self.create_cleanup_task(app=app, name="async_generation", job_store=job_store)
 
                     # The fastapi/starlette background tasks won't begin executing until after the response is sent
@@ -783,30 +897,28 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
 
                     background_tasks.add_task(wrapped_task, task)
 
-                    now = time.time()
-                    sync_timeout = now + request.sync_timeout
-                    while time.time() < sync_timeout:
-                        job = job_store.get_job(job_id)
+                    if request.sync_timeout > 0:
+                        # Woken up as soon as the job finishes
+                        job = await job_store.wait_for_job(job_id, timeout=request.sync_timeout)
                         if job is not None and job.status not in job_store.ACTIVE_STATUS:
                             # If the job is done, return the result
                             response.status_code = 200
                             return _job_status_to_response(job)
 
-                        # Sleep for a short time before checking again
-                        await asyncio.sleep(0.1)
-
                     response.status_code = 202
                     return AsyncGenerateResponse(job_id=job_id, status="submitted")
 
             return start_async_generation
 
-        async def get_async_job_status(job_id: str, http_request: Request) -> AsyncGenerationStatusResponse:
-            """Get the status of an async job."""
+        async def get_async_job_status(job_id: str,
+                                       http_request: Request,
+                                       wait: float = JOB_STATUS_WAIT_QUERY) -> AsyncGenerationStatusResponse:
+            """Get the status of an async job, optionally waiting for the job to finish."""
             logger.info("Getting status for job %s", job_id)
 
             async with session_manager.session(request=http_request):
 
-                job = job_store.get_job(job_id)
+                job = await (job_store.wait_for_job(job_id, timeout=wait) if wait > 0 else job_store.get_job(job_id))
                 if not job:
                     logger.warning("Job %s not found", job_id)
                     raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -935,6 +1047,18 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
                     responses={500: response_500},
                 )
 
+                if (workflow.has_single_output):
+                    app.add_api_route(
+                        path=f"{endpoint.path}/batch",
+                        endpoint=post_batch_endpoint(request_type=BatchGenerateRequest,
+                                                     result_type=GenerateSingleResponseType),
+                        methods=[endpoint.method],
+                        response_model=BatchGenerateResponseItem,
+                        description="Run the workflow for each input, the outputs are returned as newline delimited "
+                        "JSON in the order they complete.",
+                        responses={500: response_500},
+                    )
+
                 app.add_api_route(
                     path=f"{endpoint.path}/async",
                     endpoint=post_async_generation(request_type=AsyncGenerateRequest,
@@ -1028,6 +1152,23 @@ class FastApiFrontEndPluginWorker(FastApiFrontEndPluginWorkerBase):
             else:
                 raise ValueError(f"Unsupported method {endpoint.method}")
 
+    async def add_metrics_route(self, app: FastAPI):
+
+        if not self.front_end_config.metrics_path:
+            return
+
+        async def get_metrics() -> Response:
+            """
+            Render the in-process metrics in the Prometheus text format.
+            """
+            return Response(content=GlobalMetricsRegistry.get().render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+        app.add_api_route(path=self.front_end_config.metrics_path,
+                          endpoint=get_metrics,
+                          methods=["GET"],
+                          include_in_schema=False,
+                          description="Prometheus metrics for function, session, LLM and object store latency.")
+
     async def add_authorization_route(self, app: FastAPI):
 
         from fastapi.responses import HTMLResponse
@@ -19,6 +19,7 @@ import logging
 from nat.builder.context import Context
 from nat.data_models.api_server import ResponseIntermediateStep
 from nat.data_models.intermediate_step import IntermediateStep
+from nat.utils.producer_consumer_queue import QueueClosed
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,13 @@ async def pull_intermediate(_q, adapter):
     async def set_intermediate_done():
         intermediate_done.set()
 
+    async def put(item):
+        try:
+            await _q.put(item)
+        except QueueClosed:
+            # The consumer is gone, e.g. the client disconnected while the workflow was being cancelled
+            pass
+
     def on_next_cb(item: IntermediateStep):
         """
         Synchronously called whenever the runner publishes an event.
@@ -53,7 +61,7 @@ async def pull_intermediate(_q, adapter):
             adapted = adapter.process(item)
 
         if adapted is not None:
-            loop.create_task(_q.put(adapted))
+            loop.create_task(put(adapted))
 
     def on_error_cb(exc: Exception):
         """
@@ -13,17 +13,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import os
 import shutil
 import threading
+import time
+import typing
+from abc import ABC
+from abc import abstractmethod
 from datetime import UTC
 from datetime import datetime
 from datetime import timedelta
 from enum import Enum
+from urllib.parse import urlparse
 from uuid import uuid4
 
 from pydantic import BaseModel
+from pydantic import Field
 
 logger = logging.getLogger(__name__)
 
@@ -47,10 +54,18 @@ class JobInfo(BaseModel):
     created_at: datetime
     updated_at: datetime
     expiry_seconds: int
-    output: BaseModel | None = None
+    output: typing.Any = Field(default=None,
+                               description="Output of the job. Jobs read from a shared job store hold the JSON "
+                               "serializable form of the output.")
 
 
-class JobStore:
+class JobStoreBase(ABC):
+    """
+    Abstract interface of the store tracking the async generation and evaluation jobs.
+
+    Callers waiting on a job are woken up when the job finishes. Stores shared by several workers are polled every
+    `poll_interval` seconds in addition, so that jobs finishing on another worker are noticed.
+    """
 
     MIN_EXPIRY = 600  # 10 minutes
     MAX_EXPIRY = 86400  # 24 hours
@@ -59,14 +74,14 @@ class JobStore:
     # active jobs are exempt from expiry
     ACTIVE_STATUS = {"running", "submitted"}
 
+    poll_interval: float | None = None
+
     def __init__(self):
-        self._jobs = {}
-        self._lock = threading.Lock()  # Ensure thread safety for job operations
+        # Futures of the callers waiting for a job to finish, with the event loop each future belongs to
+        self._waiters: dict[str, list[tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._waiters_lock = threading.Lock()
 
-    def create_job(self,
-                   config_file: str | None = None,
-                   job_id: str | None = None,
-                   expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+    def _new_job(self, config_file: str | None, job_id: str | None, expiry_seconds: int) -> JobInfo:
         if job_id is None:
             job_id = str(uuid4())
 
@@ -74,53 +89,191 @@ class JobStore:
         if expiry_seconds != clamped_expiry:
             logger.info("Clamped expiry_seconds from %d to %d for job %s", expiry_seconds, clamped_expiry, job_id)
 
-        job = JobInfo(job_id=job_id,
-                      status=JobStatus.SUBMITTED,
-                      config_file=config_file,
-                      created_at=datetime.now(UTC),
-                      updated_at=datetime.now(UTC),
-                      error=None,
-                      output_path=None,
-                      expiry_seconds=clamped_expiry)
+        now = datetime.now(UTC)
+        return JobInfo(job_id=job_id,
+                       status=JobStatus.SUBMITTED,
+                       config_file=config_file,
+                       created_at=now,
+                       updated_at=now,
+                       error=None,
+                       output_path=None,
+                       expiry_seconds=clamped_expiry)
+
+    @abstractmethod
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = DEFAULT_EXPIRY) -> str:
+        """Create a job in the submitted status and return its ID."""
+        pass
+
+    @abstractmethod
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: typing.Any = None) -> None:
+        """
+        Update the status of a job. Implementations must call `_notify_finished` when the job leaves the active
+        statuses.
+
+        Raises:
+            ValueError: If the job does not exist.
+        """
+        pass
+
+    @abstractmethod
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        """Get a job by its ID."""
+        pass
+
+    @abstractmethod
+    async def get_last_job(self) -> JobInfo | None:
+        """Get the last created job."""
+        pass
+
+    @abstractmethod
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        """Get all jobs with the specified status."""
+        pass
+
+    @abstractmethod
+    async def get_all_jobs(self) -> list[JobInfo]:
+        """Get all jobs in the store."""
+        pass
+
+    @abstractmethod
+    async def cleanup_expired_jobs(self) -> None:
+        """
+        Cleanup expired jobs, keeping the most recent one.
+        Updated_at is used instead of created_at to determine the most recent job.
+        This is because jobs may not be processed in the order they are created.
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """Release the resources held by the store."""
+        pass
+
+    def get_expires_at(self, job: JobInfo) -> datetime | None:
+        """Get the time for a job to expire."""
+        if job.status in self.ACTIVE_STATUS:
+            return None
+        return job.updated_at + timedelta(seconds=job.expiry_seconds)
+
+    @staticmethod
+    def _remove_output(job: JobInfo) -> None:
+        if job.output_path:
+            logger.info("Cleaning up output directory for job %s at %s", job.job_id, job.output_path)
+            # If it is a file remove it
+            if os.path.isfile(job.output_path):
+                os.remove(job.output_path)
+            # If it is a directory remove it
+            elif os.path.isdir(job.output_path):
+                shutil.rmtree(job.output_path)
+
+    def _notify_finished(self, job_id: str) -> None:
+        """Wake up the callers waiting on a job, may be called from any thread."""
+        with self._waiters_lock:
+            waiters = self._waiters.pop(job_id, [])
+
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(self._wake_waiter, waiter)
+
+    @staticmethod
+    def _wake_waiter(waiter: asyncio.Future) -> None:
+        if not waiter.done():
+            waiter.set_result(None)
+
+    async def wait_for_job(self, job_id: str, timeout: float | None = None) -> JobInfo | None:
+        """
+        Wait until a job finishes, or until `timeout` seconds have elapsed.
+
+        The caller is woken up as soon as the status of the job is updated, without polling the store. Returns the job
+        in its current status, or None if the job does not exist.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            waiter = loop.create_future()
+            with self._waiters_lock:
+                self._waiters.setdefault(job_id, []).append((loop, waiter))
+
+            try:
+                # Registered before reading the job, so that a job finishing in between is not missed
+                job = await self.get_job(job_id)
+                if job is None or job.status not in self.ACTIVE_STATUS:
+                    return job
+
+                wait_time = None if deadline is None else deadline - time.monotonic()
+                if self.poll_interval is not None:
+                    wait_time = self.poll_interval if wait_time is None else min(wait_time, self.poll_interval)
+
+                if wait_time is None or wait_time > 0:
+                    try:
+                        async with asyncio.timeout(wait_time):
+                            await waiter
+                    except TimeoutError:
+                        pass
+            finally:
+                with self._waiters_lock:
+                    waiters = self._waiters.get(job_id)
+                    if waiters is not None and (loop, waiter) in waiters:
+                        waiters.remove((loop, waiter))
+                        if not waiters:
+                            del self._waiters[job_id]
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return await self.get_job(job_id)
+
+
+class JobStore(JobStoreBase):
+    """Job store keeping the jobs in the memory of the process, jobs are only visible to the worker creating them."""
+
+    def __init__(self):
+        super().__init__()
+        self._jobs: dict[str, JobInfo] = {}
+        self._lock = threading.Lock()  # Ensure thread safety for job operations
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        job = self._new_job(config_file, job_id, expiry_seconds)
 
         with self._lock:
-            self._jobs[job_id] = job
+            self._jobs[job.job_id] = job
 
-        logger.info("Created new job %s with config %s", job_id, config_file)
-        return job_id
+        logger.info("Created new job %s with config %s", job.job_id, config_file)
+        return job.job_id
 
-    def update_status(self,
-                      job_id: str,
-                      status: str,
-                      error: str | None = None,
-                      output_path: str | None = None,
-                      output: BaseModel | None = None):
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: typing.Any = None) -> None:
         if job_id not in self._jobs:
             raise ValueError(f"Job {job_id} not found")
 
         with self._lock:
             job = self._jobs[job_id]
-            job.status = status
+            job.status = JobStatus(status)
             job.error = error
             job.output_path = output_path
             job.updated_at = datetime.now(UTC)
             job.output = output
 
-    def get_status(self, job_id: str) -> JobInfo | None:
-        with self._lock:
-            return self._jobs.get(job_id)
+        if status not in self.ACTIVE_STATUS:
+            self._notify_finished(job_id)
 
-    def list_jobs(self):
-        with self._lock:
-            return self._jobs
-
-    def get_job(self, job_id: str) -> JobInfo | None:
-        """Get a job by its ID."""
+    async def get_job(self, job_id: str) -> JobInfo | None:
         with self._lock:
             return self._jobs.get(job_id)
 
-    def get_last_job(self) -> JobInfo | None:
-        """Get the last created job."""
+    async def get_last_job(self) -> JobInfo | None:
         with self._lock:
             if not self._jobs:
                 logger.info("No jobs found in job store")
@@ -129,55 +282,57 @@ class JobStore:
             logger.info("Retrieved last job %s created at %s", last_job.job_id, last_job.created_at)
             return last_job
 
-    def get_jobs_by_status(self, status: str) -> list[JobInfo]:
-        """Get all jobs with the specified status."""
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
         with self._lock:
             return [job for job in self._jobs.values() if job.status == status]
 
-    def get_all_jobs(self) -> list[JobInfo]:
-        """Get all jobs in the store."""
+    async def get_all_jobs(self) -> list[JobInfo]:
         with self._lock:
             return list(self._jobs.values())
 
-    def get_expires_at(self, job: JobInfo) -> datetime | None:
-        """Get the time for a job to expire."""
-        if job.status in self.ACTIVE_STATUS:
-            return None
-        return job.updated_at + timedelta(seconds=job.expiry_seconds)
-
-    def cleanup_expired_jobs(self):
-        """
-        Cleanup expired jobs, keeping the most recent one.
-        Updated_at is used instead of created_at to determine the most recent job.
-        This is because jobs may not be processed in the order they are created.
-        """
+    async def cleanup_expired_jobs(self) -> None:
         now = datetime.now(UTC)
 
         # Filter out active jobs
         with self._lock:
-            finished_jobs = {job_id: job for job_id, job in self._jobs.items() if job.status not in self.ACTIVE_STATUS}
+            finished_jobs = [job for job in self._jobs.values() if job.status not in self.ACTIVE_STATUS]
 
-        # Sort finished jobs by updated_at descending
-        sorted_finished = sorted(finished_jobs.items(), key=lambda item: item[1].updated_at, reverse=True)
+        if not finished_jobs:
+            return
 
         # Always keep the most recent finished job
-        jobs_to_check = sorted_finished[1:]
+        most_recent = max(finished_jobs, key=lambda job: job.updated_at)
 
-        expired_ids = []
-        for job_id, job in jobs_to_check:
+        expired_jobs = []
+        for job in finished_jobs:
             expires_at = self.get_expires_at(job)
-            if expires_at and now > expires_at:
-                expired_ids.append(job_id)
+            if job is not most_recent and expires_at and now > expires_at:
+                expired_jobs.append(job)
                 # cleanup output dir if present
-                if job.output_path:
-                    logger.info("Cleaning up output directory for job %s at %s", job_id, job.output_path)
-                    # If it is a file remove it
-                    if os.path.isfile(job.output_path):
-                        os.remove(job.output_path)
-                    # If it is a directory remove it
-                    elif os.path.isdir(job.output_path):
-                        shutil.rmtree(job.output_path)
+                self._remove_output(job)
 
         with self._lock:
-            for job_id in expired_ids:
-                del self._jobs[job_id]
+            for job in expired_jobs:
+                del self._jobs[job.job_id]
+
+
+def create_job_store(url: str | None, namespace: str) -> JobStoreBase:
+    """
+    Create the job store for `url`, jobs of different namespaces are kept apart within a shared store.
+
+    Supported URLs are `sqlite:///path/to/jobs.db` and `redis://host:port/db`, if `url` is None the jobs are kept in
+    the memory of the process.
+    """
+    if url is None:
+        return JobStore()
+
+    scheme = urlparse(url).scheme
+    if scheme == "sqlite":
+        from nat.front_ends.fastapi.sqlite_job_store import SQLiteJobStore
+        return SQLiteJobStore(url, namespace=namespace)
+
+    if scheme in ("redis", "rediss"):
+        from nat.front_ends.fastapi.redis_job_store import RedisJobStore
+        return RedisJobStore(url, namespace=namespace)
+
+    raise ValueError(f"Unsupported job store URL scheme '{scheme}', expected 'sqlite', 'redis' or 'rediss'")
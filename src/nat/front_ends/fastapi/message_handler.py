@@ -86,8 +86,11 @@ class WebSocketMessageHandler:
 
     async def __aexit__(self, exc_type, exc_value, traceback) -> None:
 
-        # TODO: Handle the exit  # pylint: disable=fixme
-        pass
+        # The client is gone, stop the workflow still running for it
+        task = self._running_workflow_task
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
 
     async def run(self) -> None:
         """
@@ -150,6 +153,12 @@ class WebSocketMessageHandler:
         :param user_message_as_validated_type: A WebSocketUserMessage Data Model instance.
         """
 
+        # Only one workflow runs per connection, the replies of the running workflow refer to its message id
+        if self._running_workflow_task is not None:
+            logger.warning("Ignoring message %s, a workflow is already running for this connection",
+                           user_message_as_validated_type.id)
+            return
+
         try:
             self._message_parent_id = user_message_as_validated_type.id
             self._workflow_schema_type = user_message_as_validated_type.schema_type
@@ -160,7 +169,7 @@ class WebSocketMessageHandler:
             if content is None:
                 raise ValueError(f"User message content could not be found: {user_message_as_validated_type}")
 
-            if isinstance(content, TextContent) and (self._running_workflow_task is None):
+            if isinstance(content, TextContent):
 
                 def _done_callback(task: asyncio.Task):  # pylint: disable=unused-argument
                     self._running_workflow_task = None
@@ -169,8 +178,8 @@ class WebSocketMessageHandler:
                     self._run_workflow(content.text,
                                        self._conversation_id,
                                        result_type=self._schema_output_mapping[self._workflow_schema_type],
-                                       output_type=self._schema_output_mapping[
-                                           self._workflow_schema_type])).add_done_callback(_done_callback)
+                                       output_type=self._schema_output_mapping[self._workflow_schema_type]))
+                self._running_workflow_task.add_done_callback(_done_callback)
 
         except ValueError as e:
             logger.error("User message content not found: %s", str(e), exc_info=True)
@@ -294,6 +303,7 @@ class WebSocketMessageHandler:
                             result_type: type | None = None,
                             output_type: type | None = None) -> None:
 
+        cancelled = False
         try:
             async with self._session_manager.session(
                     conversation_id=conversation_id,
@@ -314,7 +324,13 @@ class WebSocketMessageHandler:
 
                     await self.create_websocket_message(data_model=value, status=WebSocketMessageStatus.IN_PROGRESS)
 
+        except asyncio.CancelledError:
+            # Cancelled because the client disconnected, there is nobody to notify
+            cancelled = True
+            raise
+
         finally:
-            await self.create_websocket_message(data_model=SystemResponseContent(),
-                                                message_type=WebSocketMessageType.RESPONSE_MESSAGE,
-                                                status=WebSocketMessageStatus.COMPLETE)
+            if not cancelled:
+                await self.create_websocket_message(data_model=SystemResponseContent(),
+                                                    message_type=WebSocketMessageType.RESPONSE_MESSAGE,
+                                                    status=WebSocketMessageStatus.COMPLETE)
@@ -0,0 +1,183 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import typing
+from collections.abc import AsyncIterator
+
+from pydantic_core import to_jsonable_python
+
+from nat.object_store.interfaces import ObjectStore
+from nat.object_store.models import ObjectStoreItem
+from nat.observability.metrics import GlobalMetricsRegistry
+from nat.runtime.session import SessionManager
+
+logger = logging.getLogger(__name__)
+
+_pipeline_queue_depth = GlobalMetricsRegistry.get().gauge(
+    "nat_object_store_pipeline_queue_depth", "Number of uploaded objects waiting to be processed.").labels()
+_pipeline_dropped = GlobalMetricsRegistry.get().counter(
+    "nat_object_store_pipeline_dropped_total",
+    "Number of uploaded objects which were not processed because the queue was full.").labels()
+_pipeline_errors = GlobalMetricsRegistry.get().counter("nat_object_store_pipeline_errors_total",
+                                                       "Number of uploaded objects which failed to process.").labels()
+
+
+class ObjectStorePipeline:
+    """
+    Runs a workflow for the objects written to an object store, and stores the output of each object next to it.
+
+    Keys are queued by `submit` and processed by a fixed number of background workers, with the key as the input of the
+    workflow. The output is written as JSON at the key followed by `output_suffix`. The queue is bounded, keys
+    submitted while it is full are dropped, so that a burst of uploads can't exhaust the memory of the server.
+
+    Args:
+        session_manager (SessionManager): Runs the workflow
+        object_store (ObjectStore): The object store the outputs are written to
+        key_prefix (str): Only the keys starting with this prefix are processed
+        output_suffix (str): Suffix appended to the key of an object to get the key of its output
+        max_workers (int): The number of objects processed at the same time
+        max_queue_size (int): The maximum number of keys waiting to be processed
+    """
+
+    def __init__(self,
+                 session_manager: SessionManager,
+                 object_store: ObjectStore,
+                 *,
+                 key_prefix: str = "",
+                 output_suffix: str = ".result.json",
+                 max_workers: int = 4,
+                 max_queue_size: int = 1000):
+        if not output_suffix:
+            raise ValueError("output_suffix cannot be empty, outputs would overwrite their objects")
+
+        self._session_manager = session_manager
+        self._object_store = object_store
+        self._key_prefix = key_prefix
+        self._output_suffix = output_suffix
+        self._max_workers = max_workers
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue_size)
+        self._workers: list[asyncio.Task] = []
+
+    def get_output_key(self, key: str) -> str:
+        return key + self._output_suffix
+
+    def accepts(self, key: str) -> bool:
+        # Outputs are never processed, even when written by a client
+        return key.startswith(self._key_prefix) and not key.endswith(self._output_suffix)
+
+    def submit(self, key: str) -> bool:
+        """Queue an object to be processed, returns False if the key is not processed."""
+        if not self.accepts(key):
+            return False
+
+        try:
+            self._queue.put_nowait(key)
+        except asyncio.QueueFull:
+            _pipeline_dropped.inc()
+            logger.warning("Object store pipeline queue is full, %s will not be processed", key)
+            return False
+
+        _pipeline_queue_depth.inc()
+        return True
+
+    async def process(self, key: str) -> None:
+        """Run the workflow for an object and store its output."""
+        async with self._session_manager.session() as session:
+            async with session.run(key) as runner:
+                result = await runner.result()
+
+        data = json.dumps(to_jsonable_python(result, fallback=str)).encode("utf-8")
+        await self._object_store.upsert_object(
+            self.get_output_key(key),
+            ObjectStoreItem(data=data, content_type="application/json", metadata={"input_key": key}))
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._queue.get()
+            _pipeline_queue_depth.dec()
+            try:
+                await self.process(key)
+            except Exception as e:
+                _pipeline_errors.inc()
+                logger.error("Object store pipeline failed to process %s: %s", key, e)
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._work()) for _ in range(self._max_workers)]
+
+    async def join(self) -> None:
+        """Wait until all the queued objects are processed."""
+        await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Stop the workers, objects which are still queued are not processed."""
+        if not self._queue.empty():
+            logger.warning("Object store pipeline stopped with %d objects not processed", self._queue.qsize())
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            _pipeline_queue_depth.dec()
+            self._queue.task_done()
+
+
+class PipelineObjectStore(ObjectStore):
+    """
+    Wraps an object store client and submits the key of each object written through it to a pipeline.
+
+    Args:
+        inner (ObjectStore): The object store client to wrap.
+        pipeline (ObjectStorePipeline): The pipeline processing the written objects.
+    """
+
+    def __init__(self, inner: ObjectStore, pipeline: ObjectStorePipeline):
+        self._inner = inner
+        self._pipeline = pipeline
+
+    @property
+    def inner(self) -> ObjectStore:
+        return self._inner
+
+    async def put_object(self, key: str, item: ObjectStoreItem) -> None:
+        await self._inner.put_object(key, item)
+        self._pipeline.submit(key)
+
+    async def upsert_object(self, key: str, item: ObjectStoreItem) -> None:
+        await self._inner.upsert_object(key, item)
+        self._pipeline.submit(key)
+
+    async def get_object(self, key: str) -> ObjectStoreItem:
+        return await self._inner.get_object(key)
+
+    async def delete_object(self, key: str) -> None:
+        return await self._inner.delete_object(key)
+
+    def list_keys(self, prefix: str = "") -> AsyncIterator[str]:
+        return self._inner.list_keys(prefix)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Expose implementation specific attributes of the wrapped client
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
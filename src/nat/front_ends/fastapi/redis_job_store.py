@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import typing
+from datetime import UTC
+from datetime import datetime
+
+from nat.front_ends.fastapi.job_store import JobInfo
+from nat.front_ends.fastapi.job_store import JobStatus
+from nat.front_ends.fastapi.job_store import JobStoreBase
+
+logger = logging.getLogger(__name__)
+
+
+class RedisJobStore(JobStoreBase):
+    """
+    Job store backed by Redis, shared by all the workers connected to the same server.
+
+    Each job is stored as a JSON string. Sorted sets index the jobs by creation time, and the finished jobs by update
+    and expiry time, so that the periodic cleanup only reads the expired jobs. Workers publish the ID of the jobs which
+    finish, waking up the callers waiting on them on every worker.
+
+    Args:
+        url (str): The URL of the Redis server, `redis://host:port/db`
+        namespace (str): Prefix of the keys holding the jobs
+    """
+
+    # Fallback in case a notification is missed while reconnecting
+    poll_interval = 5.0
+
+    def __init__(self, url: str, namespace: str = "jobs"):
+        super().__init__()
+
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ImportError("The redis package is required to use a Redis job store. "
+                              "Install it with `uv pip install nvidia-nat[redis]`.") from e
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._prefix = f"nat:{namespace}"
+        self._created_key = f"{self._prefix}:created"
+        self._finished_key = f"{self._prefix}:finished"
+        self._expiry_key = f"{self._prefix}:expiry"
+        self._channel = f"{self._prefix}:finished"
+        self._listener: asyncio.Task | None = None
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self._prefix}:job:{job_id}"
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        job = self._new_job(config_file, job_id, expiry_seconds)
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self._job_key(job.job_id), job.model_dump_json())
+            pipe.zadd(self._created_key, {job.job_id: job.created_at.timestamp()})
+            await pipe.execute()
+
+        logger.info("Created new job %s with config %s", job.job_id, config_file)
+        return job.job_id
+
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: typing.Any = None) -> None:
+        job = await self.get_job(job_id)
+        if job is None:
+            raise ValueError(f"Job {job_id} not found")
+
+        job.status = JobStatus(status)
+        job.error = error
+        job.output_path = output_path
+        job.updated_at = datetime.now(UTC)
+        job.output = output
+
+        finished = status not in self.ACTIVE_STATUS
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(self._job_key(job_id), job.model_dump_json())
+            if finished:
+                pipe.zadd(self._finished_key, {job_id: job.updated_at.timestamp()})
+                pipe.zadd(self._expiry_key, {job_id: self.get_expires_at(job).timestamp()})
+                pipe.publish(self._channel, job_id)
+            else:
+                pipe.zrem(self._finished_key, job_id)
+                pipe.zrem(self._expiry_key, job_id)
+            await pipe.execute()
+
+        if finished:
+            self._notify_finished(job_id)
+
+    async def _get_jobs(self, job_ids: list[str]) -> list[JobInfo]:
+        if not job_ids:
+            return []
+        values = await self._client.mget([self._job_key(job_id) for job_id in job_ids])
+        return [JobInfo.model_validate_json(value) for value in values if value is not None]
+
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        jobs = await self._get_jobs([job_id])
+        return jobs[0] if jobs else None
+
+    async def get_last_job(self) -> JobInfo | None:
+        jobs = await self._get_jobs(await self._client.zrevrange(self._created_key, 0, 0))
+        if not jobs:
+            logger.info("No jobs found in job store")
+            return None
+        return jobs[0]
+
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        return [job for job in await self.get_all_jobs() if job.status == status]
+
+    async def get_all_jobs(self) -> list[JobInfo]:
+        return await self._get_jobs(await self._client.zrange(self._created_key, 0, -1))
+
+    async def cleanup_expired_jobs(self) -> None:
+        now = datetime.now(UTC).timestamp()
+
+        # Always keep the most recent finished job
+        most_recent = await self._client.zrevrange(self._finished_key, 0, 0)
+        expired_ids = [
+            job_id for job_id in await self._client.zrangebyscore(self._expiry_key, "-inf", now)
+            if job_id not in most_recent
+        ]
+
+        for job in await self._get_jobs(expired_ids):
+            # cleanup output dir if present
+            self._remove_output(job)
+
+        if expired_ids:
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.delete(*(self._job_key(job_id) for job_id in expired_ids))
+                for key in (self._created_key, self._finished_key, self._expiry_key):
+                    pipe.zrem(key, *expired_ids)
+                await pipe.execute()
+
+    async def _listen(self) -> None:
+        pubsub = self._client.pubsub()
+        try:
+            await pubsub.subscribe(self._channel)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    self._notify_finished(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Stopped listening for finished jobs on %s: %s", self._channel, e)
+        finally:
+            await pubsub.reset()
+
+    async def wait_for_job(self, job_id: str, timeout: float | None = None) -> JobInfo | None:
+        # Jobs may finish on other workers, listen to their notifications
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+        return await super().wait_for_job(job_id, timeout=timeout)
+
+    async def aclose(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+        await self._client.close()
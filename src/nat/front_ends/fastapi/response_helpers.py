@@ -14,18 +14,77 @@
 # limitations under the License.
 
 import asyncio
+import logging
 import typing
 from collections.abc import AsyncGenerator
+from collections.abc import Awaitable
 
+from starlette.requests import ClientDisconnect
+from starlette.requests import Request
+
+from nat.data_models.api_server import ChatResponse
+from nat.data_models.api_server import ChatResponseChunk
 from nat.data_models.api_server import ResponseIntermediateStep
 from nat.data_models.api_server import ResponsePayloadOutput
 from nat.data_models.api_server import ResponseSerializable
 from nat.data_models.step_adaptor import StepAdaptorConfig
+from nat.front_ends.fastapi.fastapi_front_end_config import BatchGenerateResponseItem
 from nat.front_ends.fastapi.intermediate_steps_subscriber import pull_intermediate
 from nat.front_ends.fastapi.step_adaptor import StepAdaptor
 from nat.runtime.session import SessionManager
 from nat.utils.producer_consumer_queue import AsyncIOProducerConsumerQueue
 
+logger = logging.getLogger(__name__)
+
+_T = typing.TypeVar("_T")
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    """Return once the client of `request` disconnects. The request body must have been read already."""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def cancel_on_disconnect(request: Request, awaitable: Awaitable[_T]) -> _T:
+    """
+    Await `awaitable`, cancelling it if the client of `request` disconnects first, so that no more model calls are made
+    for a response nobody will read.
+
+    Raises:
+        ClientDisconnect: If the client disconnected before `awaitable` completed
+    """
+    task = asyncio.ensure_future(awaitable)
+    watcher = asyncio.create_task(wait_for_disconnect(request))
+    try:
+        await asyncio.wait((task, watcher), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+            # Let the workflow release its concurrency slot and close its spans before returning
+            await asyncio.gather(task, return_exceptions=True)
+
+    if task.cancelled() and watcher.done() and not watcher.cancelled():
+        raise ClientDisconnect()
+    return task.result()
+
+
+async def _run_until_disconnected(request: Request, task: asyncio.Task, q: AsyncIOProducerConsumerQueue) -> None:
+    await wait_for_disconnect(request)
+    task.cancel()
+    await q.close()
+
+
+async def _close_stream(pull_task: asyncio.Task, watcher: asyncio.Task | None) -> None:
+    if watcher is not None:
+        watcher.cancel()
+    if not pull_task.done():
+        # The consumer stopped early, stop the workflow before leaving the run
+        pull_task.cancel()
+    await asyncio.gather(pull_task, return_exceptions=True)
+
 
 async def generate_streaming_response_as_str(payload: typing.Any,
                                              *,
@@ -33,14 +92,16 @@ async def generate_streaming_response_as_str(payload: typing.Any,
                                              streaming: bool,
                                              step_adaptor: StepAdaptor = StepAdaptor(StepAdaptorConfig()),
                                              result_type: type | None = None,
-                                             output_type: type | None = None) -> AsyncGenerator[str]:
+                                             output_type: type | None = None,
+                                             request: Request | None = None) -> AsyncGenerator[str]:
 
     async for item in generate_streaming_response(payload,
                                                   session_manager=session_manager,
                                                   streaming=streaming,
                                                   step_adaptor=step_adaptor,
                                                   result_type=result_type,
-                                                  output_type=output_type):
+                                                  output_type=output_type,
+                                                  request=request):
 
         if (isinstance(item, ResponseSerializable)):
             yield item.get_stream_data()
@@ -55,7 +116,12 @@ async def generate_streaming_response(payload: typing.Any,
                                       streaming: bool,
                                       step_adaptor: StepAdaptor = StepAdaptor(StepAdaptorConfig()),
                                       result_type: type | None = None,
-                                      output_type: type | None = None) -> AsyncGenerator[ResponseSerializable]:
+                                      output_type: type | None = None,
+                                      request: Request | None = None) -> AsyncGenerator[ResponseSerializable]:
+    """
+    Run the workflow and yield its output and intermediate steps. When `request` is provided, the workflow is cancelled
+    as soon as its client disconnects.
+    """
 
     async with session_manager.run(payload) as runner:
 
@@ -88,21 +154,20 @@ async def generate_streaming_response(payload: typing.Any,
 
             await q.close()
 
-        try:
-            # Start the result stream
-            asyncio.create_task(pull_result())
+        # Start the result stream
+        pull_task = asyncio.create_task(pull_result())
+        watcher = asyncio.create_task(_run_until_disconnected(request, pull_task, q)) if request is not None else None
 
+        try:
             async for item in q:
 
                 if (isinstance(item, ResponseSerializable)):
                     yield item
                 else:
                     yield ResponsePayloadOutput(payload=item)
-        except Exception as e:
-            # Handle exceptions here
-            raise e
         finally:
             await q.close()
+            await _close_stream(pull_task, watcher)
 
 
 async def generate_single_response(
@@ -117,13 +182,83 @@ async def generate_single_response(
         return await runner.result(to_type=result_type)
 
 
+async def generate_chat_response_from_stream(payload: typing.Any, session_manager: SessionManager) -> ChatResponse:
+    """
+    Run a streaming only workflow and aggregate its chunks into a single chat completion.
+
+    The chunks are consumed directly from the workflow, without subscribing to intermediate steps or serializing them as
+    server-sent events.
+    """
+    contents: list[str] = []
+    usage = None
+
+    async with session_manager.run(payload) as runner:
+        async for chunk in runner.result_stream(to_type=ChatResponseChunk):
+            if chunk.usage is not None:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            # Chunks carry their content either as a delta or, for chunks built with `from_string`, as a message
+            choice = chunk.choices[0]
+            message = choice.delta or choice.message
+            if message is not None and message.content is not None:
+                contents.append(message.content)
+
+    return ChatResponse.from_string("".join(contents), usage=usage)
+
+
+async def generate_batch_response_as_str(inputs: list[typing.Any],
+                                         *,
+                                         session_manager: SessionManager,
+                                         result_type: type | None = None,
+                                         request: Request | None = None) -> AsyncGenerator[str]:
+    """
+    Run the workflow for each input and yield the outputs as newline delimited JSON, in the order they complete.
+
+    At most `session_manager.max_concurrency` inputs are run at the same time, so that a batch doesn't flood the
+    admission queue. Concurrent invocations of functions with a batch implementation are combined by the function.
+    """
+    semaphore = asyncio.Semaphore(session_manager.max_concurrency or len(inputs))
+
+    async def _run(index: int, payload: typing.Any) -> BatchGenerateResponseItem:
+        async with semaphore:
+            try:
+                output = await generate_single_response(payload, session_manager, result_type=result_type)
+                return BatchGenerateResponseItem(index=index, output=output)
+            except Exception as e:
+                logger.error("Error running batch input %d: %s", index, e)
+                return BatchGenerateResponseItem(index=index, error=str(e))
+
+    pending = {asyncio.ensure_future(_run(index, payload)) for index, payload in enumerate(inputs)}
+    watcher = asyncio.create_task(wait_for_disconnect(request)) if request is not None else None
+
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending if watcher is None else pending | {watcher},
+                                         return_when=asyncio.FIRST_COMPLETED)
+            if watcher in done:
+                # The client is gone, stop the remaining runs
+                break
+
+            for task in done:
+                pending.discard(task)
+                yield task.result().model_dump_json() + "\n"
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
 async def generate_streaming_response_full(payload: typing.Any,
                                            *,
                                            session_manager: SessionManager,
                                            streaming: bool,
                                            result_type: type | None = None,
                                            output_type: type | None = None,
-                                           filter_steps: str | None = None) -> AsyncGenerator[ResponseSerializable]:
+                                           filter_steps: str | None = None,
+                                           request: Request | None = None) -> AsyncGenerator[ResponseSerializable]:
     """
     Similar to generate_streaming_response but provides raw ResponseIntermediateStep objects
     without any step adaptor translations.
@@ -154,10 +289,11 @@ async def generate_streaming_response_full(payload: typing.Any,
             await intermediate_complete.wait()
             await q.close()
 
-        try:
-            # Start the result stream
-            asyncio.create_task(pull_result())
+        # Start the result stream
+        pull_task = asyncio.create_task(pull_result())
+        watcher = asyncio.create_task(_run_until_disconnected(request, pull_task, q)) if request is not None else None
 
+        try:
             async for item in q:
                 if (isinstance(item, ResponseIntermediateStep)):
                     # Filter intermediate steps if filter_steps is provided
@@ -165,11 +301,9 @@ async def generate_streaming_response_full(payload: typing.Any,
                         yield item
                 else:
                     yield ResponsePayloadOutput(payload=item)
-        except Exception as e:
-            # Handle exceptions here
-            raise e
         finally:
             await q.close()
+            await _close_stream(pull_task, watcher)
 
 
 async def generate_streaming_response_full_as_str(payload: typing.Any,
@@ -178,7 +312,8 @@ async def generate_streaming_response_full_as_str(payload: typing.Any,
                                                   streaming: bool,
                                                   result_type: type | None = None,
                                                   output_type: type | None = None,
-                                                  filter_steps: str | None = None) -> AsyncGenerator[str]:
+                                                  filter_steps: str | None = None,
+                                                  request: Request | None = None) -> AsyncGenerator[str]:
     """
     Similar to generate_streaming_response but converts the response to a string format.
     """
@@ -187,7 +322,8 @@ async def generate_streaming_response_full_as_str(payload: typing.Any,
                                                        streaming=streaming,
                                                        result_type=result_type,
                                                        output_type=output_type,
-                                                       filter_steps=filter_steps):
+                                                       filter_steps=filter_steps,
+                                                       request=request):
         if (isinstance(item, ResponseIntermediateStep) or isinstance(item, ResponsePayloadOutput)):
             yield item.get_stream_data()
         else:
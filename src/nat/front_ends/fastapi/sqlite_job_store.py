@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import typing
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+from nat.front_ends.fastapi.job_store import JobInfo
+from nat.front_ends.fastapi.job_store import JobStatus
+from nat.front_ends.fastapi.job_store import JobStoreBase
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteJobStore(JobStoreBase):
+    """
+    Job store backed by a SQLite database, shared by all the workers of a host.
+
+    The finished jobs are indexed by expiry time, so that the periodic cleanup only reads the expired jobs. A job
+    finishing on another worker is noticed by waiting callers within `poll_interval` seconds.
+
+    Args:
+        url (str): The URL of the database, `sqlite:///path/to/jobs.db`
+        namespace (str): Name of the table holding the jobs
+    """
+
+    poll_interval = 0.5
+
+    def __init__(self, url: str, namespace: str = "jobs"):
+        super().__init__()
+
+        if not namespace.isidentifier():
+            raise ValueError(f"Invalid job store namespace '{namespace}'")
+
+        parsed = urlparse(url)
+        path = parsed.path[1:] if parsed.path.startswith("/") else parsed.path
+        self._table = f"nat_{namespace}_jobs"
+
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Accessed from the worker threads of `asyncio.to_thread`, serialized by the lock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path or ":memory:", timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self._table} (
+                    job_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    expires_at REAL,
+                    job TEXT NOT NULL
+                )""")
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._table}_expires_at ON {self._table} (expires_at)")
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._table}_created_at ON {self._table} (created_at)")
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._table}_updated_at ON {self._table} (updated_at)")
+            self._connection.execute(f"CREATE INDEX IF NOT EXISTS {self._table}_status ON {self._table} (status)")
+
+    def _execute(self, query: str, parameters: tuple = ()) -> list[tuple]:
+        with self._lock, self._connection:
+            return self._connection.execute(query, parameters).fetchall()
+
+    async def _run(self, query: str, parameters: tuple = ()) -> list[tuple]:
+        return await asyncio.to_thread(self._execute, query, parameters)
+
+    def _row_values(self, job: JobInfo) -> tuple:
+        expires_at = self.get_expires_at(job)
+        return (job.status.value,
+                job.created_at.timestamp(),
+                job.updated_at.timestamp(),
+                expires_at.timestamp() if expires_at is not None else None,
+                job.model_dump_json())
+
+    @staticmethod
+    def _to_jobs(rows: list[tuple]) -> list[JobInfo]:
+        return [JobInfo.model_validate_json(row[0]) for row in rows]
+
+    async def create_job(self,
+                         config_file: str | None = None,
+                         job_id: str | None = None,
+                         expiry_seconds: int = JobStoreBase.DEFAULT_EXPIRY) -> str:
+        job = self._new_job(config_file, job_id, expiry_seconds)
+
+        await self._run(
+            f"INSERT OR REPLACE INTO {self._table} (job_id, status, created_at, updated_at, expires_at, job) "
+            "VALUES (?, ?, ?, ?, ?, ?)", (job.job_id, *self._row_values(job)))
+
+        logger.info("Created new job %s with config %s", job.job_id, config_file)
+        return job.job_id
+
+    def _update_status(self, job_id: str, status: str, error: str | None, output_path: str | None,
+                       output: typing.Any) -> None:
+        with self._lock, self._connection:
+            rows = self._connection.execute(f"SELECT job FROM {self._table} WHERE job_id = ?", (job_id, )).fetchall()
+            if not rows:
+                raise ValueError(f"Job {job_id} not found")
+
+            job = JobInfo.model_validate_json(rows[0][0])
+            job.status = JobStatus(status)
+            job.error = error
+            job.output_path = output_path
+            job.updated_at = datetime.now(UTC)
+            job.output = output
+
+            self._connection.execute(
+                f"UPDATE {self._table} SET status = ?, created_at = ?, updated_at = ?, expires_at = ?, job = ? "
+                "WHERE job_id = ?", (*self._row_values(job), job_id))
+
+    async def update_status(self,
+                            job_id: str,
+                            status: str,
+                            error: str | None = None,
+                            output_path: str | None = None,
+                            output: typing.Any = None) -> None:
+        await asyncio.to_thread(self._update_status, job_id, status, error, output_path, output)
+
+        if status not in self.ACTIVE_STATUS:
+            self._notify_finished(job_id)
+
+    async def get_job(self, job_id: str) -> JobInfo | None:
+        jobs = self._to_jobs(await self._run(f"SELECT job FROM {self._table} WHERE job_id = ?", (job_id, )))
+        return jobs[0] if jobs else None
+
+    async def get_last_job(self) -> JobInfo | None:
+        jobs = self._to_jobs(await self._run(f"SELECT job FROM {self._table} ORDER BY created_at DESC LIMIT 1"))
+        if not jobs:
+            logger.info("No jobs found in job store")
+            return None
+        return jobs[0]
+
+    async def get_jobs_by_status(self, status: str) -> list[JobInfo]:
+        return self._to_jobs(await self._run(f"SELECT job FROM {self._table} WHERE status = ?", (status, )))
+
+    async def get_all_jobs(self) -> list[JobInfo]:
+        return self._to_jobs(await self._run(f"SELECT job FROM {self._table}"))
+
+    async def cleanup_expired_jobs(self) -> None:
+        now = datetime.now(UTC).timestamp()
+
+        # Always keep the most recent finished job
+        expired_jobs = self._to_jobs(await self._run(
+            f"SELECT job FROM {self._table} WHERE expires_at < ? AND job_id NOT IN ("
+            f"SELECT job_id FROM {self._table} WHERE expires_at IS NOT NULL ORDER BY updated_at DESC LIMIT 1)",
+            (now, )))
+
+        for job in expired_jobs:
+            # cleanup output dir if present
+            self._remove_output(job)
+            await self._run(f"DELETE FROM {self._table} WHERE job_id = ?", (job.job_id, ))
+
+    async def aclose(self) -> None:
+        with self._lock:
+            self._connection.close()
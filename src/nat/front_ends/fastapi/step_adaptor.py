@@ -15,7 +15,6 @@
 
 import html
 import logging
-from functools import reduce
 from textwrap import dedent
 
 from nat.data_models.api_server import ResponseIntermediateStep
@@ -23,6 +22,7 @@ from nat.data_models.api_server import ResponseSerializable
 from nat.data_models.intermediate_step import IntermediateStep
 from nat.data_models.intermediate_step import IntermediateStepCategory
 from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepState
 from nat.data_models.intermediate_step import IntermediateStepType
 from nat.data_models.invocation_node import InvocationNode
 from nat.data_models.step_adaptor import StepAdaptorConfig
@@ -39,6 +39,18 @@ class StepAdaptor:
         self._history: list[IntermediateStep] = []
         self.config = config
 
+        # Indexes of the history, avoiding a scan of the whole history for each step
+        self._start_steps: dict[tuple[IntermediateStepType, str], IntermediateStep] = {}
+        self._llm_output: dict[str, str] = {}
+
+    def _track(self, step: IntermediateStep) -> None:
+        self._history.append(step)
+
+        if step.event_state == IntermediateStepState.START:
+            self._start_steps.setdefault((step.event_type, step.UUID), step)
+        elif step.event_type == IntermediateStepType.LLM_NEW_TOKEN and step.data is not None:
+            self._llm_output[step.UUID] = self._llm_output.get(step.UUID, "") + str(step.data.chunk)
+
     def _step_matches_filter(self, step: IntermediateStep, config: StepAdaptorConfig) -> bool:
         """
         Returns True if this intermediate step should be included (based on the config.mode).
@@ -68,8 +80,7 @@ class StepAdaptor:
         output_str: str | None = None
 
         # Find the start in the history with matching run_id
-        start_step = next(
-            (x for x in self._history if x.event_type == IntermediateStepType.LLM_START and x.UUID == step.UUID), None)
+        start_step = self._start_steps.get((IntermediateStepType.LLM_START, step.UUID))
 
         if not start_step:
             # If we don't have a start step, we can't do anything
@@ -79,12 +90,8 @@ class StepAdaptor:
 
         if step.event_type == IntermediateStepType.LLM_NEW_TOKEN:
 
-            # Find all of the previous LLM chunks and concatenate them
-            output_str = reduce(
-                lambda x, y: x + y,
-                (str(x.data.chunk)
-                 for x in self._history if x.event_type == IntermediateStepType.LLM_NEW_TOKEN and x.UUID == step.UUID),
-                "")
+            # All of the previous LLM chunks, concatenated
+            output_str = self._llm_output.get(step.UUID, "")
 
         elif step.event_type == IntermediateStepType.LLM_END:
             output_str = str(step.data.output)
@@ -128,8 +135,7 @@ class StepAdaptor:
         output_str: str | None = None
 
         # Find the start in the history with matching run_id
-        start_step = next(
-            (x for x in self._history if x.event_type == IntermediateStepType.TOOL_START and x.UUID == step.UUID), None)
+        start_step = self._start_steps.get((IntermediateStepType.TOOL_START, step.UUID))
 
         if not start_step:
             # If we don't have a start step, we can't do anything
@@ -211,10 +217,7 @@ class StepAdaptor:
 
         if step.event_type == IntermediateStepType.FUNCTION_END:
             # Find the start event with matching UUID
-            start_step = next(
-                (x
-                 for x in self._history if x.event_type == IntermediateStepType.FUNCTION_START and x.UUID == step.UUID),
-                None)
+            start_step = self._start_steps.get((IntermediateStepType.FUNCTION_START, step.UUID))
 
             # For function end events, display output data
             if step.data and hasattr(step.data, 'output'):
@@ -292,7 +295,7 @@ class StepAdaptor:
     def process(self, step: IntermediateStep) -> ResponseSerializable | None:  # pylint: disable=R1710
 
         # Track the chunk
-        self._history.append(step)
+        self._track(step)
         payload = step.payload
         ancestry = step.function_ancestry
 
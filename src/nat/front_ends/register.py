@@ -18,5 +18,6 @@
 # isort:skip_file
 
 from .console import register as console_register
+from .cron import register as cron_register
 from .fastapi import register as fastapi_register
 from .mcp import register as mcp_register
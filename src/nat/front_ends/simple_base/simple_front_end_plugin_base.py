@@ -21,6 +21,7 @@ from io import StringIO
 import click
 
 from nat.builder.front_end import FrontEndBase
+from nat.builder.workflow import Workflow
 from nat.builder.workflow_builder import WorkflowBuilder
 from nat.data_models.front_end import FrontEndConfigT
 from nat.runtime.session import SessionManager
@@ -46,9 +47,12 @@ class SimpleFrontEndPluginBase(FrontEndBase[FrontEndConfigT], ABC):
                 click.echo(stream.getvalue())
 
             workflow = builder.build()
-            session_manager = SessionManager(workflow)
+            session_manager = self.create_session_manager(workflow)
             await self.run_workflow(session_manager)
 
+    def create_session_manager(self, workflow: Workflow) -> SessionManager:
+        return SessionManager(workflow)
+
     @abstractmethod
     async def run_workflow(self, session_manager: SessionManager):
         pass
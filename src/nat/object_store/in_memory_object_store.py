@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import asyncio
+from collections.abc import AsyncIterator
 
 from nat.builder.builder import Builder
 from nat.cli.register_workflow import register_object_store
@@ -70,6 +71,13 @@ class InMemoryObjectStore(ObjectStore):
         except KeyError:
             raise NoSuchKeyError(key)
 
+    @override
+    async def list_keys(self, prefix: str = "") -> AsyncIterator[str]:
+        async with self._lock:
+            keys = [key for key in self._store if key.startswith(prefix)]
+        for key in keys:
+            yield key
+
 
 @register_object_store(config_type=InMemoryObjectStoreConfig)
 async def in_memory_object_store(config: InMemoryObjectStoreConfig, builder: Builder):
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import typing
+from collections.abc import AsyncIterator
+
+from nat.object_store.interfaces import ObjectStore
+from nat.object_store.models import ObjectStoreItem
+from nat.observability.metrics import GlobalMetricsRegistry
+
+_object_store_duration = GlobalMetricsRegistry.get().histogram("nat_object_store_duration_seconds",
+                                                               "Duration of object store operations.",
+                                                               ("object_store", "operation"))
+_object_store_errors = GlobalMetricsRegistry.get().counter("nat_object_store_errors_total",
+                                                           "Number of object store operations which raised an error.",
+                                                           ("object_store", "operation"))
+
+
+class InstrumentedObjectStore(ObjectStore):
+    """
+    Wraps an object store client and records the latency and errors of each operation.
+
+    Args:
+        name (str): The name of the object store, used as the `object_store` metric label.
+        inner (ObjectStore): The object store client to wrap.
+    """
+
+    def __init__(self, name: str, inner: ObjectStore):
+        self._name = name
+        self._inner = inner
+
+    @property
+    def inner(self) -> ObjectStore:
+        return self._inner
+
+    async def _call(self, operation: str, coro: typing.Awaitable):
+        start_ns = time.perf_counter_ns()
+        try:
+            return await coro
+        except Exception:
+            _object_store_errors.labels(self._name, operation).inc()
+            raise
+        finally:
+            _object_store_duration.labels(self._name, operation).observe_ns(time.perf_counter_ns() - start_ns)
+
+    async def put_object(self, key: str, item: ObjectStoreItem) -> None:
+        return await self._call("put", self._inner.put_object(key, item))
+
+    async def upsert_object(self, key: str, item: ObjectStoreItem) -> None:
+        return await self._call("upsert", self._inner.upsert_object(key, item))
+
+    async def get_object(self, key: str) -> ObjectStoreItem:
+        return await self._call("get", self._inner.get_object(key))
+
+    async def delete_object(self, key: str) -> None:
+        return await self._call("delete", self._inner.delete_object(key))
+
+    async def list_keys(self, prefix: str = "") -> AsyncIterator[str]:
+        # Records the duration of the whole listing, including the time spent by the caller between keys
+        start_ns = time.perf_counter_ns()
+        try:
+            async for key in self._inner.list_keys(prefix):
+                yield key
+        except Exception:
+            _object_store_errors.labels(self._name, "list").inc()
+            raise
+        finally:
+            _object_store_duration.labels(self._name, "list").observe_ns(time.perf_counter_ns() - start_ns)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Expose implementation specific attributes of the wrapped client
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
@@ -15,6 +15,7 @@
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 
 from .models import ObjectStoreItem
 
@@ -70,6 +71,21 @@ class ObjectStore(ABC):
         """
         pass
 
+    def list_keys(self, prefix: str = "") -> AsyncIterator[str]:
+        """
+        Iterate over the keys of the items in the object store which start with the given prefix.
+
+        Args:
+            prefix (str): The prefix of the keys to list, all the keys are listed by default.
+
+        Returns:
+            AsyncIterator[str]: The keys, in no particular order.
+
+        Raises:
+            NotImplementedError: If the object store does not support listing its keys.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support listing keys")
+
     @abstractmethod
     async def delete_object(self, key: str) -> None:
         """
@@ -28,7 +28,9 @@ from typing import overload
 
 from nat.builder.context import ContextState
 from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.telemetry_exporter import TraceSamplingConfig
 from nat.observability.exporter.exporter import Exporter
+from nat.observability.trace_sampler import TraceSampler
 from nat.utils.reactive.subject import Subject
 from nat.utils.type_utils import override
 
@@ -141,6 +143,8 @@ class BaseExporter(Exporter):
         # Get the event loop (set to None if not available, will be set later)
         self._loop = None
         self._is_isolated_instance = False
+        self._sampling_config: TraceSamplingConfig | None = None
+        self._sampler: TraceSampler | None = None
 
         # Track instance creation
         BaseExporter._instance_count += 1
@@ -253,6 +257,25 @@ class BaseExporter(Exporter):
         """
         return self._is_isolated_instance
 
+    @property
+    def sampling_config(self) -> TraceSamplingConfig | None:
+        """Get the trace sampling configuration of the exporter.
+
+        Returns:
+            TraceSamplingConfig | None: The sampling configuration, or None if every trace is exported.
+        """
+        return self._sampling_config
+
+    def set_sampling(self, config: TraceSamplingConfig | None) -> None:
+        """Configure trace sampling for the exporter.
+
+        The configuration takes effect the next time the exporter is started, and is shared with isolated instances.
+
+        Args:
+            config (TraceSamplingConfig | None): The sampling configuration, or None to export every trace.
+        """
+        self._sampling_config = config
+
     @abstractmethod
     def export(self, event: IntermediateStep) -> None:
         """This method is called on each event from the event stream to initiate the trace export.
@@ -296,8 +319,18 @@ class BaseExporter(Exporter):
             logger.error("Event stream subject does not support subscription")
             return None
 
-        def on_next_wrapper(event: IntermediateStep) -> None:
-            self.export(event)
+        if self._sampling_config is not None:
+            sampler = TraceSampler(self._sampling_config)
+            self._sampler = sampler
+
+            def on_next_wrapper(event: IntermediateStep) -> None:
+                for sampled_event in sampler.offer(event):
+                    self.export(sampled_event)
+        else:
+            self._sampler = None
+
+            def on_next_wrapper(event: IntermediateStep) -> None:
+                self.export(event)
 
         self._subscription = subject.subscribe(
             on_next=on_next_wrapper,
@@ -395,6 +428,16 @@ class BaseExporter(Exporter):
         if not self._running:
             return
 
+        if self._sampler is not None:
+            # Export traces that were still buffered while the exporter can still schedule export tasks
+            for event in self._sampler.flush():
+                self.export(event)
+            logger.debug("%s: Sampling kept %d traces and dropped %d traces",
+                         self.name,
+                         self._sampler.traces_kept,
+                         self._sampler.traces_dropped)
+            self._sampler = None
+
         self._running = False
         self._shutdown_event.set()
 
@@ -445,5 +488,6 @@ class BaseExporter(Exporter):
         # Reset basic attributes that aren't descriptors but need isolation
         isolated_instance._subscription = None
         isolated_instance._running = False
+        isolated_instance._sampler = None
 
         return isolated_instance
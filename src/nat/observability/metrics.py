@@ -0,0 +1,285 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process metrics with a Prometheus text exposition.
+
+Recording a sample costs a dictionary lookup and a few integer operations. No lock is taken on the recording path:
+metrics are updated from the event loop thread, and under the GIL a concurrent update from another thread can at worst
+lose a single sample, which is acceptable for monitoring purposes.
+"""
+
+import math
+import threading
+import typing
+from collections.abc import Sequence
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Counter:
+    """A monotonically increasing value."""
+
+    __slots__ = ("value", )
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int | float = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    """A value which can go up and down, such as the number of in-flight requests."""
+
+    __slots__ = ("value", )
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: int | float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: int | float = 1) -> None:
+        self.value -= amount
+
+    def set(self, value: int | float) -> None:
+        self.value = value
+
+
+class Histogram:
+    """A log-linear (HDR-style) histogram of durations recorded in nanoseconds.
+
+    Each power of two between `2**min_exponent` and `2**max_exponent` nanoseconds is split into `2**sub_bucket_bits`
+    equally sized buckets, which bounds the relative error of any quantile by `2**-sub_bucket_bits`. The bucket of a
+    sample is computed with integer bit operations only.
+
+    Args:
+        min_exponent (int): Samples below `2**min_exponent` ns share the first bucket. Defaults to 12 (about 4 us).
+        max_exponent (int): Samples of `2**max_exponent` ns and above share the last bucket. Defaults to 37
+            (about 137 s).
+        sub_bucket_bits (int): Number of bits used to split each power of two. Defaults to 3, which bounds the
+            quantile error by 12.5% with 202 buckets per histogram. Each additional bit halves the error and doubles
+            the number of buckets exported per labeled series.
+    """
+
+    __slots__ = ("_min_exponent",
+                 "_max_exponent",
+                 "_sub_bucket_bits",
+                 "_sub_bucket_mask",
+                 "_min_value",
+                 "_counts",
+                 "sum_ns")
+
+    def __init__(self, min_exponent: int = 12, max_exponent: int = 37, sub_bucket_bits: int = 3):
+        if not 0 <= sub_bucket_bits <= min_exponent < max_exponent:
+            raise ValueError("Expected 0 <= sub_bucket_bits <= min_exponent < max_exponent")
+
+        self._min_exponent = min_exponent
+        self._max_exponent = max_exponent
+        self._sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_mask = (1 << sub_bucket_bits) - 1
+        self._min_value = 1 << min_exponent
+        # One underflow bucket, the log-linear buckets, and one overflow bucket
+        self._counts = [0] * (((max_exponent - min_exponent) << sub_bucket_bits) + 2)
+        self.sum_ns = 0
+
+    def observe_ns(self, value_ns: int) -> None:
+        """Record a duration.
+
+        Args:
+            value_ns (int): The duration in nanoseconds, usually the difference of two `time.perf_counter_ns` calls.
+        """
+        self.sum_ns += value_ns
+        if value_ns < self._min_value:
+            self._counts[0] += 1
+            return
+
+        exponent = value_ns.bit_length() - 1
+        if exponent >= self._max_exponent:
+            self._counts[-1] += 1
+            return
+
+        sub_bucket = (value_ns >> (exponent - self._sub_bucket_bits)) & self._sub_bucket_mask
+        self._counts[1 + ((exponent - self._min_exponent) << self._sub_bucket_bits) + sub_bucket] += 1
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def upper_bounds_ns(self) -> list[float]:
+        """Return the exclusive upper bound of each bucket in nanoseconds. The last bound is infinite."""
+        bounds: list[float] = [float(self._min_value)]
+        for exponent in range(self._min_exponent, self._max_exponent):
+            width = 1 << (exponent - self._sub_bucket_bits)
+            for sub_bucket in range(1, (1 << self._sub_bucket_bits) + 1):
+                bounds.append(float((1 << exponent) + sub_bucket * width))
+        bounds.append(math.inf)
+        return bounds
+
+    def bucket_counts(self) -> list[int]:
+        """Return a snapshot of the per-bucket counts, aligned with `upper_bounds_ns`."""
+        return list(self._counts)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile of the recorded durations.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The upper bound of the bucket containing the quantile, in nanoseconds. Samples in the overflow bucket
+            are reported as `2**max_exponent`. Returns 0.0 when nothing was recorded.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantile must be between 0 and 1")
+
+        counts = self.bucket_counts()
+        total = sum(counts)
+        if total == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(q * total))
+        bounds = self.upper_bounds_ns()
+        seen = 0
+        for bound, bucket_count in zip(bounds, counts):
+            seen += bucket_count
+            if seen >= rank:
+                return bound if bound != math.inf else float(1 << self._max_exponent)
+
+        return float(1 << self._max_exponent)
+
+
+_MetricT = typing.TypeVar("_MetricT", Counter, Gauge, Histogram)
+
+
+class MetricFamily(typing.Generic[_MetricT]):
+    """A named metric with one child per combination of label values."""
+
+    def __init__(self,
+                 name: str,
+                 documentation: str,
+                 kind: str,
+                 label_names: Sequence[str],
+                 factory: typing.Callable[[], _MetricT]):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.label_names = tuple(label_names)
+        self._factory = factory
+        self._children: dict[tuple[str, ...], _MetricT] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> _MetricT:
+        """Return the child for the given label values, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.label_names):
+                raise ValueError(f"Metric {self.name} expects labels {self.label_names}, got {values}")
+            # Creation is rare, the lock only guards against two threads creating the same child
+            with self._lock:
+                child = self._children.setdefault(values, self._factory())
+        return child
+
+    def children(self) -> list[tuple[tuple[str, ...], _MetricT]]:
+        return list(self._children.items())
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str | None = None) -> str:
+    pairs = [f'{name}="{_escape_label_value(str(value))}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """A collection of metric families which can be rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._families: dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self,
+                       name: str,
+                       documentation: str,
+                       kind: str,
+                       label_names: Sequence[str],
+                       factory: typing.Callable[[], typing.Any]) -> MetricFamily:
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = MetricFamily(name, documentation, kind, label_names, factory)
+                self._families[name] = family
+            elif family.kind != kind or family.label_names != tuple(label_names):
+                raise ValueError(f"Metric {name} is already registered as a {family.kind} "
+                                 f"with labels {family.label_names}")
+            return family
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> MetricFamily[Counter]:
+        """Register a counter, or return the existing counter with the same name."""
+        return self._get_or_create(name, documentation, "counter", label_names, Counter)
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> MetricFamily[Gauge]:
+        """Register a gauge, or return the existing gauge with the same name."""
+        return self._get_or_create(name, documentation, "gauge", label_names, Gauge)
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> MetricFamily[Histogram]:
+        """Register a duration histogram reported in seconds, or return the existing histogram with the same name."""
+        return self._get_or_create(name, documentation, "histogram", label_names, Histogram)
+
+    def get(self, name: str) -> MetricFamily | None:
+        return self._families.get(name)
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        for family in sorted(self._families.values(), key=lambda f: f.name):
+            lines.append(f"# HELP {family.name} {family.documentation}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+
+            for label_values, child in sorted(family.children(), key=lambda item: item[0]):
+                if isinstance(child, Histogram):
+                    counts = child.bucket_counts()
+                    cumulative = 0
+                    for bound_ns, bucket_count in zip(child.upper_bounds_ns(), counts):
+                        cumulative += bucket_count
+                        le = _format_value(bound_ns / 1e9 if bound_ns != math.inf else math.inf)
+                        labels = _format_labels(family.label_names, label_values, f'le="{le}"')
+                        lines.append(f"{family.name}_bucket{labels} {cumulative}")
+                    labels = _format_labels(family.label_names, label_values)
+                    lines.append(f"{family.name}_sum{labels} {_format_value(child.sum_ns / 1e9)}")
+                    lines.append(f"{family.name}_count{labels} {cumulative}")
+                else:
+                    labels = _format_labels(family.label_names, label_values)
+                    lines.append(f"{family.name}{labels} {_format_value(child.value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+class GlobalMetricsRegistry:
+
+    _global_registry: MetricsRegistry = MetricsRegistry()
+
+    @staticmethod
+    def get() -> MetricsRegistry:
+        return GlobalMetricsRegistry._global_registry
@@ -14,16 +14,53 @@
 # limitations under the License.
 
 import asyncio
+import dataclasses
+import gzip
 import logging
+import os
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from nat.observability.mixin.file_compression import FileCompression
 from nat.observability.mixin.file_mode import FileMode
 from nat.observability.mixin.resource_conflict_mixin import ResourceConflictMixin
 
 logger = logging.getLogger(__name__)
 
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") and "SC_IOV_MAX" in os.sysconf_names else 1024
+
+
+@dataclasses.dataclass
+class _WriteBuffer:
+    """Buffered write state. Shared by reference between isolated copies of an exporter writing the same file."""
+
+    chunks: list[bytes] = dataclasses.field(default_factory=list)
+    size: int = 0
+    file_size: int | None = None
+    first_write: bool = True
+    flush_handle: asyncio.TimerHandle | None = None
+    flush_task: asyncio.Task | None = None
+
+
+def _writev_all(fd: int, chunks: list[bytes]) -> None:
+    """Write all chunks to a file descriptor using as few system calls as possible."""
+    if not hasattr(os, "writev"):
+        data = memoryview(b"".join(chunks))
+        while data:
+            data = data[os.write(fd, data):]
+        return
+
+    for start in range(0, len(chunks), _IOV_MAX):
+        batch = chunks[start:start + _IOV_MAX]
+        written = os.writev(fd, batch)
+        expected = sum(len(chunk) for chunk in batch)
+        if written < expected:
+            remaining = memoryview(b"".join(batch))[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+
 
 class FileExportMixin(ResourceConflictMixin):
     """Mixin for file-based exporters.
@@ -31,6 +68,10 @@ class FileExportMixin(ResourceConflictMixin):
     This mixin provides file I/O functionality for exporters that need to write
     serialized data to local files, with support for file overwriting and rolling logs.
 
+    When `buffer_size` is set, serialized items are accumulated in memory and written in a worker thread with a
+    single vectored write once the buffer is full or `flush_interval` seconds have passed. Rolled files can
+    optionally be compressed.
+
     Automatically detects and prevents file path conflicts between multiple instances
     by raising ResourceConflictError during initialization.
     """
@@ -45,6 +86,9 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size: int = 10 * 1024 * 1024,  # 10MB default
             max_files: int = 5,
             cleanup_on_init: bool = False,
+            buffer_size: int = 0,
+            flush_interval: float = 1.0,
+            compression: FileCompression = FileCompression.NONE,
             **kwargs):
         """Initialize the file exporter with the specified output_path and project.
 
@@ -56,6 +100,10 @@ class FileExportMixin(ResourceConflictMixin):
             max_file_size (int): Maximum file size in bytes before rolling. Defaults to 10MB.
             max_files (int): Maximum number of rolled files to keep. Defaults to 5.
             cleanup_on_init (bool): Clean up old files during initialization. Defaults to False.
+            buffer_size (int): Number of bytes to buffer before writing. When 0, every item is written immediately.
+                Defaults to 0.
+            flush_interval (float): Maximum seconds buffered items wait before being written. Defaults to 1.0.
+            compression (FileCompression): Compression applied to rolled files. Defaults to no compression.
 
         Raises:
             ResourceConflictError: If another FileExportMixin instance is already using
@@ -68,8 +116,20 @@ class FileExportMixin(ResourceConflictMixin):
         self._max_file_size = max_file_size
         self._max_files = max_files
         self._cleanup_on_init = cleanup_on_init
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._compression = FileCompression(compression)
         self._lock = asyncio.Lock()
         self._first_write = True
+        self._write_buffer = _WriteBuffer()
+
+        if self._compression == FileCompression.ZSTD:
+            try:
+                import zstandard  # noqa: F401  # pylint: disable=unused-import
+            except ImportError as e:
+                logger.error("zstandard is not installed. Please install zstandard to compress rolled files with "
+                             "zstd or use gzip compression.")
+                raise e
 
         # Initialize file paths first, then check for conflicts via ResourceConflictMixin
         self._setup_file_paths()
@@ -115,7 +175,7 @@ class FileExportMixin(ResourceConflictMixin):
 
         # Add cleanup pattern for rolling files
         if self._enable_rolling:
-            cleanup_pattern = f"{self._base_filename}_*{self._file_extension}"
+            cleanup_pattern = self._rolled_file_pattern
             pattern_key = f"{self._base_dir.resolve()}:{cleanup_pattern}"
             identifiers["cleanup_pattern"] = pattern_key
 
@@ -130,7 +190,7 @@ class FileExportMixin(ResourceConflictMixin):
                         f"Use different project names or output paths to avoid conflicts.")
             case "cleanup_pattern":
                 return (f"Rolling file cleanup conflict detected: Both instances would use pattern "
-                        f"'{self._base_filename}_*{self._file_extension}' in directory '{self._base_dir}', "
+                        f"'{self._rolled_file_pattern}' in directory '{self._base_dir}', "
                         f"causing one to delete the other's files. "
                         f"Current instance (project: '{self._project}'), "
                         f"existing instance (project: '{existing_instance._project}'). "
@@ -138,11 +198,16 @@ class FileExportMixin(ResourceConflictMixin):
             case _:
                 return f"Unknown file resource conflict: {resource_type} = {identifier}"
 
+    @property
+    def _rolled_file_pattern(self) -> str:
+        """Glob pattern matching the rolled files of this exporter."""
+        return f"{self._base_filename}_*{self._file_extension}{self._compression.suffix}"
+
     def _cleanup_old_files_sync(self) -> None:
         """Synchronous version of cleanup for use during initialization."""
         try:
             # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
+            pattern = self._rolled_file_pattern
             rolled_files = list(self._base_dir.glob(pattern))
 
             # Sort by modification time (newest first)
@@ -187,17 +252,65 @@ class FileExportMixin(ResourceConflictMixin):
             self._current_file_path.rename(rolled_path)
             logger.info("Rolled log file to: %s", rolled_path)
 
+            if self._compression != FileCompression.NONE:
+                await asyncio.to_thread(self._compress_file, rolled_path)
+
             # Clean up old files
             await self._cleanup_old_files()
 
         except OSError as e:
             logger.error("Error rolling file %s: %s", self._current_file_path, e)
 
+    def _roll_file_sync(self) -> None:
+        """Roll the current file from a worker thread, used by the buffered write path."""
+        if not self._current_file_path.exists():
+            return
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        rolled_path = self._base_dir / f"{self._base_filename}_{timestamp}{self._file_extension}"
+
+        try:
+            self._current_file_path.rename(rolled_path)
+            logger.info("Rolled log file to: %s", rolled_path)
+
+            if self._compression != FileCompression.NONE:
+                self._compress_file(rolled_path)
+
+            self._cleanup_old_files_sync()
+
+        except OSError as e:
+            logger.error("Error rolling file %s: %s", self._current_file_path, e)
+
+    def _compress_file(self, path: Path) -> Path:
+        """Compress a rolled file next to itself and remove the uncompressed copy.
+
+        Args:
+            path (Path): The rolled file to compress.
+
+        Returns:
+            Path: The path of the compressed file.
+        """
+        compressed_path = path.with_name(f"{path.name}{self._compression.suffix}")
+
+        with open(path, "rb") as src:
+            if self._compression == FileCompression.GZIP:
+                with gzip.open(compressed_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                import zstandard
+
+                with open(compressed_path, "wb") as dst:
+                    zstandard.ZstdCompressor().copy_stream(src, dst)
+
+        path.unlink()
+        logger.debug("Compressed rolled file to: %s", compressed_path)
+        return compressed_path
+
     async def _cleanup_old_files(self) -> None:
         """Remove old rolled files beyond the maximum count."""
         try:
             # Find all rolled files matching our pattern
-            pattern = f"{self._base_filename}_*{self._file_extension}"
+            pattern = self._rolled_file_pattern
             rolled_files = list(self._base_dir.glob(pattern))
 
             # Sort by modification time (newest first)
@@ -220,6 +333,10 @@ class FileExportMixin(ResourceConflictMixin):
         Args:
             item (str | list[str]): The string or list of strings to export.
         """
+        if self._buffer_size > 0:
+            await self._buffer_item(item)
+            return
+
         try:
             # Lazy import to avoid slow startup times
             import aiofiles
@@ -250,6 +367,94 @@ class FileExportMixin(ResourceConflictMixin):
         except Exception as e:
             logger.error("Error exporting event: %s", e, exc_info=True)
 
+    async def _buffer_item(self, item: str | list[str]) -> None:
+        """Add an item to the write buffer, flushing it when full.
+
+        Args:
+            item (str | list[str]): The string or list of strings to buffer.
+        """
+        lines = item if isinstance(item, list) else [item]
+        if not lines:
+            return
+
+        buffer = self._write_buffer
+        data = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        buffer.chunks.append(data)
+        buffer.size += len(data)
+
+        if buffer.size >= self._buffer_size:
+            await self.flush()
+        elif buffer.flush_handle is None:
+            buffer.flush_handle = asyncio.get_running_loop().call_later(self._flush_interval, self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        """Timer callback flushing the buffer in the background."""
+        buffer = self._write_buffer
+        buffer.flush_handle = None
+        if buffer.flush_task is None or buffer.flush_task.done():
+            buffer.flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Write all buffered items to the current file.
+
+        This is a no-op when buffering is disabled or nothing is buffered.
+        """
+        buffer = self._write_buffer
+
+        async with self._lock:
+            if buffer.flush_handle is not None:
+                buffer.flush_handle.cancel()
+                buffer.flush_handle = None
+
+            if not buffer.chunks:
+                return
+
+            # Swap the buffer under the lock so that concurrent flushes keep the write order
+            chunks = buffer.chunks
+            buffer.chunks = []
+            buffer.size = 0
+
+            try:
+                await asyncio.to_thread(self._write_chunks, chunks)
+            except Exception as e:
+                logger.error("Error exporting %d buffered chunks: %s", len(chunks), e, exc_info=True)
+
+    def _write_chunks(self, chunks: list[bytes]) -> None:
+        """Write buffered chunks to disk. Runs in a worker thread while holding the export lock.
+
+        Args:
+            chunks (list[bytes]): The encoded chunks to write, in order.
+        """
+        buffer = self._write_buffer
+
+        if self._enable_rolling:
+            if buffer.file_size is None:
+                try:
+                    buffer.file_size = self._current_file_path.stat().st_size
+                except OSError:
+                    buffer.file_size = 0
+
+            if buffer.file_size >= self._max_file_size:
+                self._roll_file_sync()
+                buffer.file_size = 0
+
+        flags = os.O_WRONLY | os.O_CREAT
+        if buffer.first_write and self._mode == FileMode.OVERWRITE:
+            flags |= os.O_TRUNC
+            buffer.file_size = 0
+        else:
+            flags |= os.O_APPEND
+        buffer.first_write = False
+
+        fd = os.open(self._current_file_path, flags, 0o644)
+        try:
+            _writev_all(fd, chunks)
+        finally:
+            os.close(fd)
+
+        if buffer.file_size is not None:
+            buffer.file_size += sum(len(chunk) for chunk in chunks)
+
     def get_current_file_path(self) -> Path:
         """Get the current file path being written to.
 
@@ -272,6 +477,8 @@ class FileExportMixin(ResourceConflictMixin):
             "cleanup_on_init": self._cleanup_on_init,
             "project": self._project,
             "effective_project": self._project,
+            "buffer_size": self._buffer_size,
+            "compression": self._compression,
         }
 
         if self._enable_rolling:
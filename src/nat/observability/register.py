@@ -22,6 +22,7 @@ from nat.cli.register_workflow import register_logging_method
 from nat.cli.register_workflow import register_telemetry_exporter
 from nat.data_models.logging import LoggingBaseConfig
 from nat.data_models.telemetry_exporter import TelemetryExporterBaseConfig
+from nat.observability.mixin.file_compression import FileCompression
 from nat.observability.mixin.file_mode import FileMode
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,15 @@ class FileTelemetryExporterConfig(TelemetryExporterBaseConfig, name="file"):
         description="Maximum file size in bytes before rolling to a new file.")
     max_files: int = Field(default=5, description="Maximum number of rolled files to keep.")
     cleanup_on_init: bool = Field(default=False, description="Clean up old files during initialization.")
+    buffer_size: int = Field(
+        default=64 * 1024,  # 64KB
+        ge=0,
+        description="Number of bytes to buffer in memory before writing. Set to 0 to write every trace immediately.")
+    flush_interval: float = Field(default=1.0,
+                                  gt=0,
+                                  description="Maximum seconds buffered traces wait before being written.")
+    compression: FileCompression = Field(default=FileCompression.NONE,
+                                         description="Compression applied to rolled files: 'none', 'gzip' or 'zstd'.")
 
 
 @register_telemetry_exporter(config_type=FileTelemetryExporterConfig)
@@ -52,13 +62,21 @@ async def file_telemetry_exporter(config: FileTelemetryExporterConfig, builder:
 
     from nat.observability.exporter.file_exporter import FileExporter
 
-    yield FileExporter(output_path=config.output_path,
-                       project=config.project,
-                       mode=config.mode,
-                       enable_rolling=config.enable_rolling,
-                       max_file_size=config.max_file_size,
-                       max_files=config.max_files,
-                       cleanup_on_init=config.cleanup_on_init)
+    exporter = FileExporter(output_path=config.output_path,
+                            project=config.project,
+                            mode=config.mode,
+                            enable_rolling=config.enable_rolling,
+                            max_file_size=config.max_file_size,
+                            max_files=config.max_files,
+                            cleanup_on_init=config.cleanup_on_init,
+                            buffer_size=config.buffer_size,
+                            flush_interval=config.flush_interval,
+                            compression=config.compression)
+    try:
+        yield exporter
+    finally:
+        # Write out traces still buffered when the workflow shuts down
+        await exporter.flush()
 
 
 class ConsoleLoggingMethodConfig(LoggingBaseConfig, name="console"):
@@ -0,0 +1,194 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import hashlib
+import logging
+import re
+import uuid
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepState
+from nat.data_models.intermediate_step import TraceMetadata
+from nat.data_models.telemetry_exporter import TraceSamplingConfig
+
+logger = logging.getLogger(__name__)
+
+_ROOT_PARENT_ID = "root"
+_EMPTY: tuple[IntermediateStep, ...] = ()
+
+
+@dataclasses.dataclass
+class _TraceState:
+    """Sampling state of a single trace, keyed by the UUID of its root step."""
+
+    sampled: bool
+    start_time: float
+    buffer: list[IntermediateStep] | None = None
+    errored: bool = False
+    matched: bool = False
+
+
+def is_error_step(event: IntermediateStep) -> bool:
+    """Return True if the step carries an `error` entry in its metadata."""
+    metadata = event.payload.metadata
+    if isinstance(metadata, dict):
+        return "error" in metadata
+    if isinstance(metadata, TraceMetadata):
+        return bool(metadata.model_extra) and "error" in metadata.model_extra
+    return False
+
+
+class TraceSampler:
+    """Decides which traces an exporter receives.
+
+    A trace is the tree of steps below a step whose parent is `root`. Traces selected by the head sampling ratio are
+    forwarded as they arrive. When tail sampling is configured, the remaining traces are buffered until their root step
+    ends and are forwarded only if they errored, exceeded the latency threshold or contained a step matching one of the
+    name patterns. Without tail sampling, unselected traces are dropped immediately.
+
+    A sampler holds per-run state and is created each time an exporter starts.
+
+    Args:
+        config (TraceSamplingConfig): The sampling configuration.
+    """
+
+    def __init__(self, config: TraceSamplingConfig):
+        self._config = config
+        self._tail = config.tail
+        # Compare the top 64 bits of the root UUID, or a stable 64 bit hash of other root ids, against this bound to get
+        # a deterministic head decision
+        self._ratio_bound = int(config.ratio * (1 << 64))
+        self._name_pattern: re.Pattern | None = None
+        if self._tail is not None and self._tail.name_patterns:
+            self._name_pattern = re.compile("|".join(f"(?:{p})" for p in self._tail.name_patterns))
+
+        self._step_roots: dict[str, str] = {}
+        self._traces: dict[str, _TraceState] = {}
+
+        self.traces_kept = 0
+        self.traces_dropped = 0
+
+    def _head_sampled(self, root_id: str) -> bool:
+        if self._ratio_bound >= (1 << 64):
+            return True
+        if self._ratio_bound <= 0:
+            return False
+        try:
+            value = uuid.UUID(root_id).int >> 64
+        except ValueError:
+            # A stable hash, so that every process makes the same decision, unlike the salted built-in hash()
+            value = int.from_bytes(hashlib.blake2b(root_id.encode("utf-8"), digest_size=8).digest(), "big")
+        return value < self._ratio_bound
+
+    def offer(self, event: IntermediateStep) -> tuple[IntermediateStep, ...]:
+        """Offer an event to the sampler.
+
+        Args:
+            event (IntermediateStep): The event received from the event stream.
+
+        Returns:
+            tuple[IntermediateStep, ...]: The events which should be exported now. This is empty when the event is
+            dropped or buffered, and may contain a whole buffered trace once its root step ends.
+        """
+        step_id = event.UUID
+        state_kind = event.event_state
+
+        if state_kind == IntermediateStepState.START:
+            root_id = step_id if event.parent_id == _ROOT_PARENT_ID else self._step_roots.get(event.parent_id)
+            if root_id is None:
+                # Parent started before the exporter subscribed, we cannot attribute it to a trace
+                return (event, )
+            self._step_roots[step_id] = root_id
+            if root_id == step_id:
+                sampled = self._head_sampled(root_id)
+                self._traces[root_id] = _TraceState(sampled=sampled,
+                                                    start_time=event.event_timestamp,
+                                                    buffer=[] if not sampled and self._tail else None)
+        else:
+            root_id = self._step_roots.get(step_id)
+            if root_id is None:
+                return (event, )
+            if state_kind == IntermediateStepState.END:
+                del self._step_roots[step_id]
+
+        trace = self._traces.get(root_id)
+        if trace is None:
+            # Trace was dropped after exceeding the buffer limit
+            return _EMPTY
+
+        if trace.sampled:
+            if step_id == root_id and state_kind == IntermediateStepState.END:
+                del self._traces[root_id]
+                self.traces_kept += 1
+            return (event, )
+
+        if trace.buffer is None:
+            if step_id == root_id and state_kind == IntermediateStepState.END:
+                del self._traces[root_id]
+                self.traces_dropped += 1
+            return _EMPTY
+
+        return self._buffer_event(root_id, trace, event)
+
+    def _buffer_event(self, root_id: str, trace: _TraceState, event: IntermediateStep) -> tuple[IntermediateStep, ...]:
+        tail = self._tail
+        assert tail is not None and trace.buffer is not None
+
+        trace.buffer.append(event)
+
+        if not trace.errored and tail.keep_errors and is_error_step(event):
+            trace.errored = True
+        if not trace.matched and self._name_pattern is not None and event.name and self._name_pattern.search(
+                event.name):
+            trace.matched = True
+
+        if event.UUID == root_id and event.event_state == IntermediateStepState.END:
+            del self._traces[root_id]
+            duration = event.event_timestamp - trace.start_time
+            slow = tail.latency_threshold is not None and duration >= tail.latency_threshold
+            if trace.errored or trace.matched or slow:
+                self.traces_kept += 1
+                return tuple(trace.buffer)
+            self.traces_dropped += 1
+            return _EMPTY
+
+        if len(trace.buffer) > tail.max_buffered_events:
+            logger.warning("Trace %s exceeded %d buffered events and will not be exported",
+                           root_id,
+                           tail.max_buffered_events)
+            del self._traces[root_id]
+            self.traces_dropped += 1
+
+        return _EMPTY
+
+    def flush(self) -> tuple[IntermediateStep, ...]:
+        """Release all buffered traces whose root step never ended.
+
+        Incomplete traces are kept since they usually belong to a failed or cancelled run.
+
+        Returns:
+            tuple[IntermediateStep, ...]: The buffered events, in arrival order per trace.
+        """
+        pending: list[IntermediateStep] = []
+        for trace in self._traces.values():
+            if trace.buffer:
+                pending.extend(trace.buffer)
+                self.traces_kept += 1
+
+        self._traces.clear()
+        self._step_roots.clear()
+
+        return tuple(pending)
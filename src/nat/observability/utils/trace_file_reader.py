@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import io
+import logging
+import re
+from collections.abc import Iterable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.observability.mixin.file_compression import FileCompression
+
+logger = logging.getLogger(__name__)
+
+# Rolled files are named `<base>_<YYYYmmdd_HHMMSS_ffffff><ext>`, optionally followed by a compression suffix
+_COMPRESSION_SUFFIXES = "|".join(re.escape(c.suffix) for c in FileCompression if c.suffix)
+_TIMESTAMP_PATTERN = r"\d{8}_\d{6}_\d{6}"
+_TRACE_FILE_PATTERN = re.compile(rf"(?P<base>.+?)(?:_(?P<timestamp>{_TIMESTAMP_PATTERN}))?(?P<extension>\.[^.]+)"
+                                 rf"(?P<compression>{_COMPRESSION_SUFFIXES})?")
+
+
+def _infer_base_filename(directory: Path) -> str:
+    candidates = set()
+    for f in directory.iterdir():
+        match = _TRACE_FILE_PATTERN.fullmatch(f.name)
+        if f.is_file() and match:
+            candidates.add(f"{match['base']}{match['extension']}")
+
+    if len(candidates) != 1:
+        raise ValueError(f"Unable to determine the trace files in '{directory}', found {sorted(candidates)}. "
+                         "Pass the name of the exporter's current file as `base_filename`.")
+    return candidates.pop()
+
+
+def find_trace_files(path: str | Path, base_filename: str | None = None) -> list[Path]:
+    """Find the files written by a file exporter, oldest first.
+
+    Args:
+        path (str | Path): A single trace file, or the directory containing the current and rolled trace files.
+        base_filename (str | None): Name of the exporter's current file in the directory, e.g. `traces.jsonl`. Other
+            files in the directory are ignored. Inferred when the directory holds the files of a single exporter.
+
+    Returns:
+        list[Path]: The trace files. Rolled segments are ordered by the timestamp in their name and precede the
+        current file.
+    """
+    path = Path(path)
+    if path.is_file():
+        return [path]
+
+    if not path.is_dir():
+        raise FileNotFoundError(f"Trace path '{path}' does not exist")
+
+    base_filename = base_filename or _infer_base_filename(path)
+    base_path = Path(base_filename)
+    segment_pattern = re.compile(rf"{re.escape(base_path.stem)}(?:_(?P<timestamp>{_TIMESTAMP_PATTERN}))?"
+                                 rf"{re.escape(base_path.suffix)}(?P<compression>{_COMPRESSION_SUFFIXES})?")
+
+    segments: dict[str, Path] = {}
+    for f in path.iterdir():
+        match = segment_pattern.fullmatch(f.name)
+        if not match or not f.is_file():
+            continue
+        timestamp = match["timestamp"] or ""
+        # A rolled file which is being compressed exists both with and without the compression suffix, only the
+        # uncompressed copy is complete until the compression finishes.
+        if timestamp in segments and not match["compression"]:
+            segments[timestamp] = f
+        else:
+            segments.setdefault(timestamp, f)
+
+    # The current file has no timestamp and is the most recent segment
+    return [segments[timestamp] for timestamp in sorted(segments, key=lambda t: (not t, t))]
+
+
+def _open_trace_file(path: Path) -> IO[str]:
+    if path.name.endswith(FileCompression.GZIP.suffix):
+        return gzip.open(path, "rt", encoding="utf-8")
+
+    if path.name.endswith(FileCompression.ZSTD.suffix):
+        try:
+            import zstandard
+        except ImportError as e:
+            logger.error("zstandard is not installed. Please install zstandard to read zstd compressed trace files.")
+            raise e
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True),
+                                encoding="utf-8")
+
+    return open(path, encoding="utf-8")
+
+
+def _decode_errors() -> tuple[type[Exception], ...]:
+    """Errors raised while reading a trace file which is corrupted, truncated or not text."""
+    try:
+        import zstandard
+    except ImportError:
+        return (UnicodeDecodeError, EOFError, OSError)
+    return (UnicodeDecodeError, EOFError, OSError, zstandard.ZstdError)
+
+
+def read_intermediate_steps(path: str | Path, base_filename: str | None = None) -> Iterator[IntermediateStep]:
+    """Stream the intermediate steps written by a file exporter.
+
+    Plain, gzip and zstd compressed files are supported. Lines which are not valid intermediate steps are skipped,
+    as is the remainder of a file which cannot be decoded.
+
+    Args:
+        path (str | Path): A single trace file, or the directory containing the current and rolled trace files.
+        base_filename (str | None): Name of the exporter's current file in the directory, see `find_trace_files`.
+
+    Yields:
+        IntermediateStep: The steps in the order they were written.
+    """
+    for trace_file in find_trace_files(path, base_filename):
+        line_number = 0
+        try:
+            with _open_trace_file(trace_file) as f:
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        step = IntermediateStep.model_validate_json(line)
+                    except ValueError as e:
+                        logger.warning("Skipping invalid intermediate step at %s:%d: %s", trace_file, line_number, e)
+                        continue
+                    yield step
+        except _decode_errors() as e:
+            logger.error("Unable to decode trace file %s after line %d, skipping the rest of the file: %s",
+                         trace_file,
+                         line_number,
+                         e)
+
+
+def group_steps_by_trace(steps: Iterable[IntermediateStep]) -> list[list[IntermediateStep]]:
+    """Group intermediate steps by the workflow run they belong to.
+
+    A run is the tree of steps below a step whose parent is `root`. The result has the shape expected by
+    `ProfilerRunner.run`, which allows profiling exported traces offline.
+
+    Args:
+        steps (Iterable[IntermediateStep]): The steps to group, in the order they were emitted.
+
+    Returns:
+        list[list[IntermediateStep]]: One list of steps per run, ordered by the start of each run.
+    """
+    step_roots: dict[str, str] = {}
+    traces: dict[str, list[IntermediateStep]] = {}
+
+    for step in steps:
+        root_id = step_roots.get(step.UUID)
+        if root_id is None:
+            root_id = step.UUID if step.parent_id == "root" else step_roots.get(step.parent_id, step.parent_id)
+            step_roots[step.UUID] = root_id
+
+        traces.setdefault(root_id, []).append(step)
+
+    return list(traces.values())
@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import copy
+import functools
 import logging
 import shutil
 import time
@@ -23,12 +24,14 @@ from pathlib import Path
 from pydantic import ValidationError
 
 from nat.eval.config import EvaluationRunConfig
+from nat.eval.evaluator.evaluator_model import EvalInputItem
 from nat.eval.runners.config import MultiEvaluationRunConfig
 from nat.eval.runners.multi_eval_runner import MultiEvaluationRunner
 from nat.profiler.calc.calculations import LinearFitResult
 from nat.profiler.calc.calculations import calc_gpu_estimate_based_on_slope
 from nat.profiler.calc.calculations import calc_gpu_estimate_for_single_concurrency
 from nat.profiler.calc.calculations import compute_slope
+from nat.profiler.calc.data_models import AdaptiveSweepResult
 from nat.profiler.calc.data_models import CalcAlerts
 from nat.profiler.calc.data_models import CalcData
 from nat.profiler.calc.data_models import CalcRunnerConfig
@@ -36,12 +39,18 @@ from nat.profiler.calc.data_models import CalcRunnerOutput
 from nat.profiler.calc.data_models import FitConfig
 from nat.profiler.calc.data_models import FitResults
 from nat.profiler.calc.data_models import GPUEstimates
+from nat.profiler.calc.data_models import LoadLevelResult
 from nat.profiler.calc.data_models import SizingMetricPerItem
 from nat.profiler.calc.data_models import SizingMetrics
 from nat.profiler.calc.data_models import SizingMetricsAlerts
+from nat.profiler.calc.load_generator import PoissonLoadGenerator
+from nat.profiler.inference_metrics_model import InferenceMetricsModel
 
 logger = logging.getLogger(__name__)
 
+# Number of requests sent one at a time to measure the base workflow runtime in adaptive mode
+ADAPTIVE_CALIBRATION_REQUESTS = 5
+
 
 class LinearFitAnalyzer:
     """Handles linear regression analysis for concurrency vs time metrics."""
@@ -139,17 +148,21 @@ class CalcRunner:
         Validate the configuration parameters.
         Raises ValueError if configuration is invalid.
         """
-        # atleast two concurrencies are needed to estimate the GPU count
-        if len(self.config.concurrencies) < 2:
-            raise ValueError("Atleast two concurrencies are needed to estimate the GPU count.")
+        if self.config.adaptive:
+            # The concurrencies list is not used, the concurrencies are chosen by the sweep
+            self._validate_adaptive_config()
+        else:
+            # atleast two concurrencies are needed to estimate the GPU count
+            if len(self.config.concurrencies) < 2:
+                raise ValueError("Atleast two concurrencies are needed to estimate the GPU count.")
 
-        # if the same value is repeated in the concurrencies list, raise an error
-        if len(self.config.concurrencies) != len(set(self.config.concurrencies)):
-            raise ValueError("Concurrencies list contains duplicate values.")
+            # if the same value is repeated in the concurrencies list, raise an error
+            if len(self.config.concurrencies) != len(set(self.config.concurrencies)):
+                raise ValueError("Concurrencies list contains duplicate values.")
 
-        # The value of the concurrencies has to be greater than 0
-        if any(concurrency <= 0 for concurrency in self.config.concurrencies):
-            raise ValueError("Concurrencies list contains values less than or equal to 0.")
+            # The value of the concurrencies has to be greater than 0
+            if any(concurrency <= 0 for concurrency in self.config.concurrencies):
+                raise ValueError("Concurrencies list contains values less than or equal to 0.")
 
         if self.config.offline_mode:
             # In offline mode target test parameters are needed to estimate the GPU count
@@ -176,6 +189,18 @@ class CalcRunner:
             if self.target_users <= 0:
                 logger.warning("Target users is 0. Tests will be run but the GPU count will not be estimated.")
 
+    def _validate_adaptive_config(self) -> None:
+        if self.config.offline_mode:
+            raise ValueError("Adaptive mode is not supported in offline mode.")
+        if not self.config.endpoint:
+            raise ValueError("Adaptive mode requires an endpoint to send the load to.")
+        if self.target_llm_latency <= 0 and self.target_wf_runtime <= 0:
+            raise ValueError("Adaptive mode requires target_llm_latency or target_workflow_runtime to stop the sweep.")
+        if self.config.adaptive_level_duration <= 0:
+            raise ValueError("Adaptive level duration must be greater than 0.")
+        if self.config.adaptive_max_concurrency < 1:
+            raise ValueError("Adaptive max concurrency must be at least 1.")
+
     @property
     def target_llm_latency(self) -> float:
         return self.config.target_llm_latency_p95
@@ -608,6 +633,119 @@ class CalcRunner:
 
         return calc_runner_output
 
+    def _within_targets(self, sizing_metrics: SizingMetrics) -> bool:
+        """Check whether a load level met the p95 targets without any failed request."""
+        if sizing_metrics.alerts.workflow_interrupted or not sizing_metrics.per_item_metrics:
+            return False
+        if self.target_wf_runtime > 0 and sizing_metrics.workflow_runtime_p95 > self.target_wf_runtime:
+            return False
+        if self.target_llm_latency > 0 and sizing_metrics.llm_latency_p95 > self.target_llm_latency:
+            return False
+        return True
+
+    async def run_adaptive_sweep(self, load_generator: PoissonLoadGenerator) -> AdaptiveSweepResult:
+        """
+        Find the largest concurrency meeting the targets.
+
+        The base workflow runtime W is measured by sending requests one at a time. A concurrency C is then tested by
+        sending requests with Poisson arrivals at C / W requests per second, the rate which keeps C requests in flight
+        on average when the latency does not degrade with load (Little's law). The concurrency is doubled until a
+        level exceeds the targets, and the knee is then located by bisecting between the last level within the
+        targets and the first level exceeding them.
+        """
+        base_workflow_runtime = await load_generator.calibrate(ADAPTIVE_CALIBRATION_REQUESTS)
+        logger.info("Base workflow runtime: %.3fs", base_workflow_runtime)
+
+        levels: dict[int, LoadLevelResult] = {}
+
+        async def run_level(concurrency: int) -> bool:
+            rate = concurrency / base_workflow_runtime
+            load_result, sizing_metrics = await load_generator.run(rate, self.config.adaptive_level_duration)
+            load_result.within_targets = self._within_targets(sizing_metrics)
+            levels[concurrency] = load_result
+            self.metrics_per_concurrency[concurrency] = sizing_metrics
+            logger.info("Concurrency %d (%.2f rps): p95 LLM latency=%.3fs, p95 workflow runtime=%.3fs, failed=%d, %s",
+                        concurrency,
+                        rate,
+                        sizing_metrics.llm_latency_p95,
+                        sizing_metrics.workflow_runtime_p95,
+                        load_result.requests_failed,
+                        "within targets" if load_result.within_targets else "targets exceeded")
+            return load_result.within_targets
+
+        # Ramp up
+        sustainable = 0
+        knee = None
+        concurrency = 1
+        while True:
+            if not await run_level(concurrency):
+                knee = concurrency
+                break
+            sustainable = concurrency
+            if concurrency >= self.config.adaptive_max_concurrency:
+                break
+            concurrency = min(concurrency * 2, self.config.adaptive_max_concurrency)
+
+        # Bisect around the knee
+        while knee is not None and knee - sustainable > 1:
+            concurrency = (sustainable + knee) // 2
+            if await run_level(concurrency):
+                sustainable = concurrency
+            else:
+                knee = concurrency
+
+        # Keep the levels ordered by concurrency for the fit and the report
+        self.metrics_per_concurrency = dict(sorted(self.metrics_per_concurrency.items()))
+
+        return AdaptiveSweepResult(
+            base_workflow_runtime=base_workflow_runtime,
+            sustainable_concurrency=sustainable,
+            knee_concurrency=knee,
+            sustainable_throughput=levels[sustainable].throughput if sustainable else InferenceMetricsModel(),
+            levels=dict(sorted(levels.items())))
+
+    def _load_dataset_items(self) -> list[EvalInputItem]:
+        """Load the items of the dataset configured in the config file."""
+        from nat.eval.dataset_handler.dataset_handler import DatasetHandler
+        from nat.runtime.loader import load_config
+
+        dataset_config = load_config(self.config.config_file).eval.general.dataset
+        if not dataset_config:
+            raise ValueError("A dataset is required in the eval config to generate load.")
+
+        dataset_handler = DatasetHandler(dataset_config=dataset_config, reps=1, concurrency=1)
+        return dataset_handler.get_eval_input_from_dataset(None).eval_input_items
+
+    async def run_adaptive(self) -> CalcRunnerOutput:
+        """
+        Run in adaptive mode.
+        1. Ramp up the load against the endpoint until a target is exceeded and bisect around the knee
+        2. Calculate GPU estimates from the tested concurrencies
+        3. Write the output to the online subdirectory
+        """
+        import aiohttp
+
+        from nat.eval.remote_workflow import EvaluationRemoteWorkflowHandler
+
+        items = self._load_dataset_items()
+        eval_run_config = EvaluationRunConfig(config_file=self.config.config_file,
+                                              endpoint=self.config.endpoint,
+                                              endpoint_timeout=self.config.endpoint_timeout)
+        handler = EvaluationRemoteWorkflowHandler(eval_run_config, max_concurrency=1)
+
+        # The connection pool is not limited, a limit would turn the open-loop load into a closed loop
+        timeout = aiohttp.ClientTimeout(total=self.config.endpoint_timeout)
+        async with aiohttp.ClientSession(timeout=timeout, connector=aiohttp.TCPConnector(limit=0)) as session:
+            load_generator = PoissonLoadGenerator(functools.partial(handler.run_workflow_remote_single, session), items)
+            adaptive_sweep = await self.run_adaptive_sweep(load_generator)
+
+        calc_runner_output = self.generate_calc_runner_output()
+        calc_runner_output.adaptive_sweep = adaptive_sweep
+
+        self.write_output(self.config.output_dir, calc_runner_output)
+
+        return calc_runner_output
+
     async def run(self) -> CalcRunnerOutput:
         """
         online mode:
@@ -616,6 +754,11 @@ class CalcRunner:
         3. Calculate GPU estimates
         4. Write the output to the online subdirectory
 
+        adaptive mode:
+        1. Ramp up open-loop load against the endpoint until a target is exceeded, then bisect around the knee
+        2. Calculate GPU estimates from the tested concurrencies
+        3. Write the output to the online subdirectory
+
         offline mode:
         1. Read previous jobs in online mode and only append unique concurrency values to metrics_per_concurrency
         2. Calculate GPU estimates
@@ -623,5 +766,7 @@ class CalcRunner:
         """
         if self.config.offline_mode:
             return self.run_offline()
+        elif self.config.adaptive:
+            return await self.run_adaptive()
         else:
             return await self.run_online()
@@ -19,6 +19,8 @@ from pathlib import Path
 from pydantic import BaseModel
 from pydantic import Field
 
+from nat.profiler.inference_metrics_model import InferenceMetricsModel
+
 
 class FitConfig(BaseModel):
     """
@@ -79,6 +81,14 @@ class CalcRunnerConfig(BaseModel):
     # Configuration for linear fit and outlier detection
     fit_config: FitConfig = Field(default_factory=FitConfig)
 
+    # if true, instead of running the concurrencies list the concurrency is ramped up with an open-loop load
+    # generator against the endpoint until a target is exceeded, and then bisected around the knee
+    adaptive: bool = False
+    # duration in seconds of the load applied at each concurrency in adaptive mode
+    adaptive_level_duration: float = 60.0
+    # largest concurrency tested in adaptive mode
+    adaptive_max_concurrency: int = 256
+
 
 # Sizing metrics are gathered from the evaluation runs and used as input by the calculator.
 class SizingMetricPerItem(BaseModel):
@@ -174,6 +184,38 @@ class CalcData(BaseModel):
     sizing_metrics: SizingMetrics = Field(default_factory=SizingMetrics)
 
 
+class LoadLevelResult(BaseModel):
+    """
+    Result of applying open-loop load at a single concurrency in adaptive mode.
+    """
+    # arrival rate of the requests in requests per second
+    offered_rps: float = 0.0
+    # number of requests sent, completed successfully and failed
+    requests_sent: int = 0
+    requests_completed: int = 0
+    requests_failed: int = 0
+    # rate of successfully completed requests in requests per second
+    throughput: InferenceMetricsModel = Field(default_factory=InferenceMetricsModel)
+    # if true, the p95 latencies and the failures were within the targets
+    within_targets: bool = False
+
+
+class AdaptiveSweepResult(BaseModel):
+    """
+    Result of an adaptive concurrency sweep.
+    """
+    # mean workflow runtime of a request sent without any other load, used to convert concurrencies to arrival rates
+    base_workflow_runtime: float = 0.0
+    # largest tested concurrency within the targets, 0 if none was
+    sustainable_concurrency: int = 0
+    # smallest tested concurrency exceeding the targets, None if the targets were met up to the max concurrency
+    knee_concurrency: int | None = None
+    # throughput at the sustainable concurrency in requests per second
+    sustainable_throughput: InferenceMetricsModel = Field(default_factory=InferenceMetricsModel)
+    # load results per tested concurrency
+    levels: dict[int, LoadLevelResult] = {}
+
+
 class CalcRunnerOutput(BaseModel):
     """
     Output of the calc runner.
@@ -186,3 +228,6 @@ class CalcRunnerOutput(BaseModel):
 
     # Per-concurrency data (GPU estimates, out-of-range runs, and sizing metrics)
     calc_data: dict[int, CalcData] = {}
+
+    # Result of the adaptive concurrency sweep, only set in adaptive mode
+    adaptive_sweep: AdaptiveSweepResult | None = None
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Open-loop load generator for sizing a workflow hosted on a remote endpoint.
+
+Requests are sent at exponentially distributed intervals, i.e. with Poisson arrivals, regardless of whether earlier
+requests have completed. Unlike a closed loop with a fixed number of workers, a slow server does not slow down the
+arrival of requests, so queueing shows up in the measured latencies instead of being hidden by the load generator.
+"""
+
+import asyncio
+import copy
+import itertools
+import logging
+import math
+import random
+import time
+from collections.abc import Awaitable
+from collections.abc import Callable
+
+import numpy as np
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.eval.evaluator.evaluator_model import EvalInputItem
+from nat.profiler.calc.data_models import LoadLevelResult
+from nat.profiler.calc.data_models import SizingMetricPerItem
+from nat.profiler.calc.data_models import SizingMetrics
+from nat.profiler.calc.data_models import SizingMetricsAlerts
+from nat.profiler.inference_metrics_model import InferenceMetricsModel
+
+logger = logging.getLogger(__name__)
+
+# Sends a request for the item and fills its output and trajectory, the output is None if the request failed
+SendRequest = Callable[[EvalInputItem], Awaitable[None]]
+
+
+def llm_latencies(trajectory: list[IntermediateStep]) -> list[float]:
+    """Return the latency of each LLM call of a trajectory, matching the end of a call to its start by UUID."""
+    starts: dict[str, float] = {}
+    latencies = []
+    for step in trajectory:
+        if step.event_type == IntermediateStepType.LLM_START:
+            starts[step.UUID] = step.event_timestamp
+        elif step.event_type == IntermediateStepType.LLM_END and step.UUID in starts:
+            latencies.append(step.event_timestamp - starts.pop(step.UUID))
+    return latencies
+
+
+def throughput_estimate(count: int, duration: float) -> InferenceMetricsModel:
+    """
+    Estimate a request rate with confidence intervals from the number of requests completed over a duration.
+
+    The count is treated as a Poisson variable, as in `ProfilerRunner._compute_throughput_estimates`.
+    """
+    if count == 0 or duration <= 0:
+        return InferenceMetricsModel()
+
+    rate = count / duration
+    standard_error = rate / math.sqrt(count)
+
+    intervals = {}
+    for confidence, zvalue in \
+            [("ninetieth_interval", 1.645), ("ninety_fifth_interval", 1.96), ("ninety_ninth_interval", 2.576)]:
+        intervals[confidence] = (max(rate - zvalue * standard_error, 0.0), rate + zvalue * standard_error)
+
+    return InferenceMetricsModel(n=count, mean=rate, **intervals)
+
+
+class PoissonLoadGenerator:
+    """
+    Applies open-loop load with Poisson arrivals to a workflow.
+
+    Parameters
+    ----------
+    send_request : SendRequest
+        Sends a single request, typically `EvaluationRemoteWorkflowHandler.run_workflow_remote_single` bound to a
+        client session.
+    items : list[EvalInputItem]
+        The dataset items, requests cycle through them in order.
+    seed : int | None
+        Seed of the arrival times, for reproducible load.
+    """
+
+    def __init__(self, send_request: SendRequest, items: list[EvalInputItem], seed: int | None = None):
+        if not items:
+            raise ValueError("At least one dataset item is needed to generate load")
+
+        self._send_request = send_request
+        self._items = itertools.cycle(items)
+        self._random = random.Random(seed)
+
+    async def _timed_request(self, scheduled: float) -> tuple[float, EvalInputItem]:
+        # The request is sent to the workflow by the caller, the item must not be shared between concurrent requests
+        item = copy.deepcopy(next(self._items))
+        try:
+            await self._send_request(item)
+        except Exception as e:
+            logger.debug("Request failed: %s", e)
+            item.output_obj = None
+        # Latency is measured from the scheduled arrival so that delays in the load generator are not hidden
+        return time.monotonic() - scheduled, item
+
+    async def calibrate(self, num_requests: int) -> float:
+        """Send requests one at a time and return their mean latency in seconds."""
+        latencies = []
+        for _ in range(num_requests):
+            latency, item = await self._timed_request(time.monotonic())
+            if item.output_obj is None:
+                raise RuntimeError("Calibration request failed, check that the endpoint is reachable")
+            latencies.append(latency)
+        return sum(latencies) / len(latencies)
+
+    async def run(self, rate: float, duration: float) -> tuple[LoadLevelResult, SizingMetrics]:
+        """
+        Send requests with Poisson arrivals at `rate` requests per second for `duration` seconds, wait for all of them
+        to complete, and return the load results together with the sizing metrics of the completed requests.
+        """
+        if rate <= 0 or duration <= 0:
+            raise ValueError("rate and duration must be positive")
+
+        start = time.monotonic()
+        next_arrival = start
+        tasks: list[asyncio.Task] = []
+        while True:
+            next_arrival += self._random.expovariate(rate)
+            if next_arrival - start >= duration:
+                break
+            delay = next_arrival - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self._timed_request(next_arrival)))
+
+        results = await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - start
+
+        workflow_runtimes = []
+        call_latencies = []
+        per_item_metrics = {}
+        for index, (latency, item) in enumerate(results):
+            if item.output_obj is None:
+                continue
+            item_llm_latencies = llm_latencies(item.trajectory)
+            workflow_runtimes.append(latency)
+            call_latencies.extend(item_llm_latencies)
+            per_item_metrics[index] = SizingMetricPerItem(llm_latency=sum(item_llm_latencies) /
+                                                          len(item_llm_latencies) if item_llm_latencies else 0.0,
+                                                          workflow_runtime=latency)
+
+        num_failed = len(results) - len(workflow_runtimes)
+        load_result = LoadLevelResult(offered_rps=rate,
+                                      requests_sent=len(results),
+                                      requests_completed=len(workflow_runtimes),
+                                      requests_failed=num_failed,
+                                      throughput=throughput_estimate(len(workflow_runtimes), elapsed))
+        sizing_metrics = SizingMetrics(
+            llm_latency_p95=float(np.percentile(call_latencies, 95)) if call_latencies else 0.0,
+            workflow_runtime_p95=float(np.percentile(workflow_runtimes, 95)) if workflow_runtimes else 0.0,
+            total_runtime=elapsed,
+            per_item_metrics=per_item_metrics,
+            alerts=SizingMetricsAlerts(workflow_interrupted=num_failed > 0))
+
+        return load_result, sizing_metrics
@@ -32,9 +32,12 @@ An enhanced script that:
 import logging
 import os
 
+import numpy as np
 import pandas as pd
 
 from nat.data_models.intermediate_step import IntermediateStep
+from nat.profiler.inference_optimization.concurrency_timeline import concurrency_at
+from nat.profiler.inference_optimization.concurrency_timeline import concurrency_segments
 from nat.profiler.inference_optimization.data_models import CallNode
 from nat.profiler.inference_optimization.data_models import ConcurrencyDistribution
 from nat.profiler.inference_optimization.data_models import NestedCallProfilingResult
@@ -47,56 +50,48 @@ logger = logging.getLogger(__name__)
 # 1) Build the Nested Call Tree PER EXAMPLE
 # --------------------------------------------------------------------------------
 
+_UNKNOWN_NAMES = {"LLM": "unknown_llm", "TOOL": "unknown_tool", "FUNCTION": "unknown_function"}
 
-def build_call_tree_for_example(example_df: pd.DataFrame) -> list[CallNode]:
-    """
-    Stack-based approach for a single example:
 
-    1. Sort events by timestamp ascending.
-    2. On `*_START` => push a new node, attach to parent's children if stack not empty.
-    3. On `*_END` => pop from stack if matches the top's UUID, finalize end_time/duration.
+def _parse_op_type(evt: str) -> str | None:
+    if evt.startswith("LLM_"):
+        return "LLM"
+    if evt.startswith("TOOL_"):
+        return "TOOL"
+    if evt.startswith("FUNCTION_"):
+        return "FUNCTION"
+    if evt.startswith("SPAN_"):
+        return "FUNCTION"
+    return None
 
-    Returns:
-      A list of top-level calls for this example.
+
+def _column(df: pd.DataFrame, name: str) -> list:
+    return df[name].tolist() if name in df.columns else [None] * len(df)
+
+
+def _build_call_tree(event_types: list, uuids: list, timestamps: list, names: dict[str, list], begin: int,
+                     end: int) -> list[CallNode]:
+    """
+    Build the call tree of the events in ``[begin, end)``, which must belong to a single example and be sorted by
+    timestamp. Columns are passed as plain lists, which is much cheaper than iterating over DataFrame rows.
     """
     stack: list[CallNode] = []
     top_level_dict: dict[str, CallNode] = {}
     partial_map: dict[str, CallNode] = {}
 
-    def parse_op_type(evt: str) -> str | None:
-        evt = evt.upper()
-        if evt.startswith("LLM_"):
-            return "LLM"
-        if evt.startswith("TOOL_"):
-            return "TOOL"
-        if evt.startswith("FUNCTION_"):
-            return "FUNCTION"
-        if evt.startswith("SPAN_"):
-            return "FUNCTION"
-        return None
-
-    def get_op_name(row: pd.Series, op_type: str) -> str:
-        if op_type == "LLM":
-            return row.get("llm_name") or "unknown_llm"
-        if op_type == "FUNCTION":
-            return row.get("function_name") or "unknown_function"
-        if op_type == "TOOL":
-            return row.get("tool_name") or "unknown_tool"
-
-        return "unknown_op"
-
-    for _, row in example_df.iterrows():
-        et = row["event_type"].value.upper()
-        uuid = str(row["UUID"])
-        ts = float(row["event_timestamp"])
-
-        op_type = parse_op_type(et)
+    for i in range(begin, end):
+        et = event_types[i].value.upper()
+
+        op_type = _parse_op_type(et)
         if not op_type:
             # not an LLM_/TOOL_ event => skip
             continue
 
+        uuid = str(uuids[i])
+        ts = float(timestamps[i])
+
         if et.endswith("_START"):
-            name = get_op_name(row, op_type)
+            name = names[op_type][i] or _UNKNOWN_NAMES[op_type]
             node = CallNode(uuid=uuid,
                             operation_type=op_type,
                             operation_name=name,
@@ -132,12 +127,34 @@ def build_call_tree_for_example(example_df: pd.DataFrame) -> list[CallNode]:
     # we won't forcibly remove them
 
     # collect top-level nodes
-    roots = []
-    for _, node in top_level_dict.items():
-        if node.parent is None:
-            roots.append(node)
+    return [node for node in top_level_dict.values() if node.parent is None]
 
-    return roots
+
+def _name_columns(df: pd.DataFrame) -> dict[str, list]:
+    return {
+        "LLM": _column(df, "llm_name"),
+        "TOOL": _column(df, "tool_name"),
+        "FUNCTION": _column(df, "function_name"),
+    }
+
+
+def build_call_tree_for_example(example_df: pd.DataFrame) -> list[CallNode]:
+    """
+    Stack-based approach for a single example:
+
+    1. Sort events by timestamp ascending.
+    2. On `*_START` => push a new node, attach to parent's children if stack not empty.
+    3. On `*_END` => pop from stack if matches the top's UUID, finalize end_time/duration.
+
+    Returns:
+      A list of top-level calls for this example.
+    """
+    return _build_call_tree(_column(example_df, "event_type"),
+                            _column(example_df, "UUID"),
+                            _column(example_df, "event_timestamp"),
+                            _name_columns(example_df),
+                            0,
+                            len(example_df))
 
 
 def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list[CallNode]:
@@ -158,14 +175,21 @@ def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list
     dfc = df.copy()
     dfc.sort_values(["example_number", "event_timestamp"], inplace=True)
 
+    # Extract the columns once, each example is then a contiguous range of the sorted rows
+    event_types = _column(dfc, "event_type")
+    uuids = _column(dfc, "UUID")
+    timestamps = _column(dfc, "event_timestamp")
+    names = _name_columns(dfc)
+
+    example_numbers = dfc["example_number"].to_numpy()
+    bounds = np.flatnonzero(example_numbers[1:] != example_numbers[:-1]) + 1
+    starts = np.concatenate(([0], bounds)).tolist()
+    ends = np.concatenate((bounds, [len(dfc)])).tolist()
+
     # We'll collect top-level calls for each example
     all_roots: list[CallNode] = []
-
-    for _, group_df in dfc.groupby("example_number"):
-        # Build the call tree for this single example
-        # group_df is already sorted within this example
-        roots_for_example = build_call_tree_for_example(group_df)
-        all_roots.extend(roots_for_example)
+    for begin, end in zip(starts, ends):
+        all_roots.extend(_build_call_tree(event_types, uuids, timestamps, names, begin, end))
 
     return all_roots
 
@@ -175,71 +199,44 @@ def build_call_tree_per_example(all_steps: list[list[IntermediateStep]]) -> list
 # --------------------------------------------------------------------------------
 
 
-def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribution:
-    """
-    Build a timeline of (start, +1), (end, -1) from all calls, then:
-      - Sort events by time
-      - Create segments [ (t_i, t_{i+1}, concurrency) ]
-      - Compute concurrency percentiles (p50, p90, p95, p99) based on total time spent at each concurrency.
-      - This concurrency is across ALL calls from ALL examples.
+def _flatten(roots: list[CallNode]) -> list[CallNode]:
+    """Return all calls in depth-first pre-order."""
+    all_nodes: list[CallNode] = []
+    stack = list(reversed(roots))
+    while stack:
+        node = stack.pop()
+        all_nodes.append(node)
+        stack.extend(reversed(node.children))
+    return all_nodes
 
-    Returns:
-    --------
-    ConcurrencyDistribution
-        with the piecewise segments + concurrency percentiles.
-    """
-    # Flatten
-    all_nodes = []
 
-    def dfs(n: CallNode):
-        all_nodes.append(n)
-        for c in n.children:
-            dfs(c)
+def _timeline(all_nodes: list[CallNode]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    start_times = np.fromiter((n.start_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    end_times = np.fromiter((n.end_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    # partial or invalid => skip
+    valid = start_times <= end_times
+    return concurrency_segments(start_times[valid], end_times[valid])
 
-    for r in roots:
-        dfs(r)
 
-    if not all_nodes:
-        return ConcurrencyDistribution(timeline_segments=[], p50=0, p90=0, p95=0, p99=0)
+def _concurrency_distribution(seg_starts: np.ndarray, seg_ends: np.ndarray,
+                              seg_concurrency: np.ndarray) -> ConcurrencyDistribution:
+    timeline_segments: list[tuple[float, float,
+                                  int]] = list(zip(seg_starts.tolist(), seg_ends.tolist(), seg_concurrency.tolist()))
 
-    events = []
-    for n in all_nodes:
-        st = n.start_time
-        et = n.end_time
-        if st > et:
-            # partial or invalid => skip
-            continue
-        events.append((st, +1))
-        events.append((et, -1))
-
-    events.sort(key=lambda x: x[0])
-    timeline_segments: list[tuple[float, float, int]] = []
-    curr_concurrency = 0
-    prev_time = events[0][0]
-
-    for _, (t, delta) in enumerate(events):
-        if t > prev_time:
-            # segment is [prev_time, t) at concurrency=curr_concurrency
-            timeline_segments.append((prev_time, t, curr_concurrency))
-        curr_concurrency += delta
-        prev_time = t
-
-    # Summaries
-    total_time = 0.0
-    concurrency_durations: dict[int, float] = {}
-
-    for (seg_start, seg_end, c_val) in timeline_segments:
-        length = seg_end - seg_start
-        if length <= 0:
-            continue
-        total_time += length
-        concurrency_durations[c_val] = concurrency_durations.get(c_val, 0) + length
+    if len(timeline_segments) == 0:
+        return ConcurrencyDistribution(timeline_segments=timeline_segments, p50=0, p90=0, p95=0, p99=0)
+
+    # Summaries, accumulated in timeline order
+    lengths = seg_ends - seg_starts
+    total_time = float(np.cumsum(lengths)[-1])
 
     if total_time <= 0:
         return ConcurrencyDistribution(timeline_segments=timeline_segments, p50=0, p90=0, p95=0, p99=0)
 
-    # Build concurrency-level distribution
-    sorted_levels = sorted(concurrency_durations.items(), key=lambda x: x[0])  # ascending concurrency
+    # Build concurrency-level distribution, ascending concurrency
+    level_durations = np.bincount(seg_concurrency, weights=lengths)
+    present = np.bincount(seg_concurrency) > 0
+    sorted_levels = [(level, float(level_durations[level])) for level in np.flatnonzero(present).tolist()]
 
     def concurrency_at_percentile(p: float) -> float:
         threshold = total_time * (p / 100.0)
@@ -264,6 +261,26 @@ def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribu
                                    p99=p99_val)
 
 
+def compute_time_based_concurrency(roots: list[CallNode]) -> ConcurrencyDistribution:
+    """
+    Build a timeline of (start, +1), (end, -1) from all calls, then:
+      - Sort events by time
+      - Create segments [ (t_i, t_{i+1}, concurrency) ]
+      - Compute concurrency percentiles (p50, p90, p95, p99) based on total time spent at each concurrency.
+      - This concurrency is across ALL calls from ALL examples.
+
+    Returns:
+    --------
+    ConcurrencyDistribution
+        with the piecewise segments + concurrency percentiles.
+    """
+    all_nodes = _flatten(roots)
+    if not all_nodes:
+        return ConcurrencyDistribution(timeline_segments=[], p50=0, p90=0, p95=0, p99=0)
+
+    return _concurrency_distribution(*_timeline(all_nodes))
+
+
 def find_midpoint_concurrency(node: CallNode, segments: list[tuple[float, float, int]]) -> float:
     """
     Approximate concurrency for a node by finding the concurrency in timeline_segments
@@ -365,26 +382,33 @@ def analyze_calls_and_build_result(roots: list[CallNode], output_dir: str | None
                                          textual_report="No calls found.")
 
     # Flatten all calls
-    all_nodes: list[CallNode] = []
-
-    def dfs(n: CallNode):
-        all_nodes.append(n)
-        for c in n.children:
-            dfs(c)
-
-    for r in roots:
-        dfs(r)
+    all_nodes = _flatten(roots)
 
     # 1) concurrency across all calls
-    concurrency_info = compute_time_based_concurrency(roots)
+    seg_starts, seg_ends, seg_concurrency = _timeline(all_nodes)
+    concurrency_info = _concurrency_distribution(seg_starts, seg_ends, seg_concurrency)
+
+    # Midpoint (or start if zero-length) concurrency of every node at once
+    start_times = np.fromiter((n.start_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    end_times = np.fromiter((n.end_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    midpoints = np.where(start_times >= end_times, start_times, 0.5 * (start_times + end_times))
+    midpoint_concurrency = concurrency_at(midpoints, seg_starts, seg_ends, seg_concurrency).tolist()
+
+    # Subtree times, computed once per node with children visited before their parents
+    self_times: dict[int, float] = {}
+    subtree_times: dict[int, float] = {}
+    for node in reversed(all_nodes):
+        self_t = node.compute_self_time()
+        subtree_t = self_t
+        for c in node.children:
+            subtree_t += subtree_times[id(c)]
+        self_times[id(node)] = self_t
+        subtree_times[id(node)] = subtree_t
 
     # 2) build NodeMetrics
     node_metrics_map: dict[str, NodeMetrics] = {}
-    for node in all_nodes:
-        self_t = node.compute_self_time()
-        subtree_t = node.compute_subtree_time()
-        bscore = subtree_t
-        mid_conc = find_midpoint_concurrency(node, concurrency_info.timeline_segments)
+    for node, mid_conc in zip(all_nodes, midpoint_concurrency):
+        subtree_t = subtree_times[id(node)]
 
         m = NodeMetrics(uuid=node.uuid,
                         operation_type=node.operation_type,
@@ -392,10 +416,10 @@ def analyze_calls_and_build_result(roots: list[CallNode], output_dir: str | None
                         start_time=node.start_time,
                         end_time=node.end_time,
                         duration=node.duration,
-                        self_time=self_t,
+                        self_time=self_times[id(node)],
                         subtree_time=subtree_t,
                         concurrency_midpoint=mid_conc,
-                        bottleneck_score=bscore)
+                        bottleneck_score=subtree_t)
         node_metrics_map[node.uuid] = m
 
     # 3) top 5
@@ -22,17 +22,95 @@ Advanced bottleneck analysis for a dataframe that contains:
 - other metadata...
 
 We pair start/end events by UUID, compute operation durations,
-then analyze concurrency and produce a summary report.
+then analyze concurrency and produce a summary report. All steps operate on sorted NumPy arrays rather than on
+individual DataFrame rows.
 """
 
 import numpy as np
 import pandas as pd
 
 from nat.data_models.intermediate_step import IntermediateStep
+from nat.profiler.inference_optimization.concurrency_timeline import concurrency_sweep
 from nat.profiler.inference_optimization.data_models import SimpleBottleneckReport
 from nat.profiler.inference_optimization.data_models import SimpleOperationStats
 from nat.profiler.utils import create_standardized_dataframe
 
+_OPERATION_COLUMNS = ["operation_type", "operation_name", "start_time", "end_time", "duration", "UUID"]
+
+
+def _operation_type(event_type: str) -> str | None:
+    """
+    Return 'LLM' if event_type starts with 'LLM_', 'TOOL' if event_type starts with 'TOOL_',
+    else None (unknown).
+    """
+    if event_type.startswith("LLM_"):
+        return "LLM"
+    if event_type.startswith("TOOL_"):
+        return "TOOL"
+    return None
+
+
+def _first_valid_per_group(values: np.ndarray, codes: np.ndarray, default: str) -> np.ndarray:
+    """Return the first non-null value of each group of sorted codes, or `default` if a group has none."""
+    first = pd.Series(values, dtype=object).groupby(codes, sort=True).first()
+    return first.astype(object).where(first.notna(), default).to_numpy()
+
+
+def _pair_operations(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pair the START and END events of each LLM and TOOL operation by UUID.
+
+    Events are sorted once by (UUID, event_timestamp), after which every UUID is a contiguous group and the per-group
+    reductions are computed with NumPy instead of iterating over a DataFrame per UUID.
+    The operation type is taken from the earliest event of each UUID, the start time is the earliest matching START,
+    the end time is the latest matching END, and the name is the first non-null `llm_name`/`tool_name`.
+    """
+    codes, uuids = pd.factorize(df["UUID"], sort=True)
+    timestamps = df["event_timestamp"].to_numpy(dtype=np.float64)
+
+    # Stable sort by UUID, then timestamp, dropping events without a UUID
+    order = np.lexsort((timestamps, codes))
+    order = order[codes[order] >= 0]
+    if len(order) == 0:
+        return pd.DataFrame(columns=_OPERATION_COLUMNS)
+
+    codes = codes[order]
+    timestamps = timestamps[order]
+    event_types = df["event_type"].to_numpy(dtype=object)[order]
+
+    group_first = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    group_sizes = np.diff(np.r_[group_first, len(codes)])
+
+    # Identify operation_type from the first row's event_type
+    group_types = np.array([_operation_type(event_type) for event_type in event_types[group_first]], dtype=object)
+    row_types = np.repeat(group_types, group_sizes)
+    is_llm = row_types == "LLM"
+    is_tool = row_types == "TOOL"
+    is_start = (is_llm & (event_types == "LLM_START")) | (is_tool & (event_types == "TOOL_START"))
+    is_end = (is_llm & (event_types == "LLM_END")) | (is_tool & (event_types == "TOOL_END"))
+
+    # We'll just take the earliest start and the latest end for the entire group.
+    start_times = np.minimum.reduceat(np.where(is_start, timestamps, np.inf), group_first)
+    end_times = np.maximum.reduceat(np.where(is_end, timestamps, -np.inf), group_first)
+
+    # Possibly incomplete or single event, unknown operation types or no matching start/end are skipped
+    valid = ((group_sizes >= 2) & pd.notna(group_types) & (np.add.reduceat(is_start, group_first) > 0)
+             & (np.add.reduceat(is_end, group_first) > 0))
+
+    # For the name, we pick 'llm_name' or 'tool_name' depending on operation_type
+    names = np.where(group_types == "LLM",
+                     _first_valid_per_group(df["llm_name"].to_numpy(dtype=object)[order], codes, "unknown_llm"),
+                     _first_valid_per_group(df["tool_name"].to_numpy(dtype=object)[order], codes, "unknown_tool"))
+
+    return pd.DataFrame({
+        "operation_type": group_types[valid],
+        "operation_name": names[valid],
+        "start_time": start_times[valid],
+        "end_time": end_times[valid],
+        "duration": end_times[valid] - start_times[valid],
+        "UUID": uuids.to_numpy(dtype=object)[codes[group_first][valid]],
+    })
+
 
 # ----------------------------------------------------------------------
 # Main Function
@@ -70,134 +148,37 @@ def profile_workflow_bottlenecks(all_steps: list[list[IntermediateStep]]) -> Sim
     #   start_time
     #   end_time
     #   duration = end_time - start_time
-    # We'll store them in a list of dicts, then convert to DataFrame.
-    operations_records = []
-
-    # We'll create a copy to avoid mutating user data
-    dfc = df.copy()
-
-    # We define a small helper to map event_type -> (operation_type, which_name_field)
-    def get_operation_info(event_type: str) -> str | None:
-        """
-        Return 'LLM' if event_type starts with 'LLM_', 'TOOL' if event_type starts with 'TOOL_',
-        else None (unknown).
-        """
-        if event_type.startswith("LLM_"):
-            return "LLM"
-        if event_type.startswith("TOOL_"):
-            return "TOOL"
-        return None
-
-    # Group by UUID so we can pair each START with the corresponding END
-    grouped = dfc.groupby("UUID", as_index=False, group_keys=True)
-
-    for uuid_val, group_df in grouped:
-        if len(group_df) < 2:
-            # Possibly incomplete or single event, skip
-            continue
-
-        # We might have multiple events with the same UUID, but typically we expect:
-        #   LLM_START, LLM_END (or TOOL_START, TOOL_END).
-        # Sort by timestamp
-        group_df = group_df.sort_values("event_timestamp")
-
-        # Identify operation_type from the first row's event_type
-        first_event_type = group_df["event_type"].iloc[0]
-        operation_type = get_operation_info(first_event_type)
-        if not operation_type:
-            # unknown or not LLM_/TOOL_
-            continue
-
-        # We'll attempt to find the start row and the end row
-        # Usually there's exactly 1 start, 1 end
-        start_rows = group_df[group_df["event_type"] == f"{operation_type}_START"]
-        end_rows = group_df[group_df["event_type"] == f"{operation_type}_END"]
-
-        if len(start_rows) == 0 or len(end_rows) == 0:
-            # No matching start/end
-            continue
-
-        # We'll just take the earliest start and the latest end for the entire group.
-        start_time = start_rows["event_timestamp"].min()
-        end_time = end_rows["event_timestamp"].max()
-        duration = end_time - start_time
-
-        # For the name, we pick 'llm_name' or 'tool_name' depending on operation_type
-        if operation_type == "LLM":
-            # Among the rows, pick a non-null llm_name if present
-            op_names = group_df["llm_name"].dropna().unique()
-            # fallback to a default if none
-            operation_name = op_names[0] if len(op_names) else "unknown_llm"
-        else:
-            op_names = group_df["tool_name"].dropna().unique()
-            operation_name = op_names[0] if len(op_names) else "unknown_tool"
-
-        operations_records.append({
-            "operation_type": operation_type,
-            "operation_name": operation_name,
-            "start_time": start_time,
-            "end_time": end_time,
-            "duration": duration,
-            "UUID": uuid_val
-        })
-
-    if not operations_records:
+    operations_df = _pair_operations(df)
+
+    if operations_df.empty:
         # No valid operations found
         return SimpleBottleneckReport(stats={}, summary="No operations found to profile.")
 
-    operations_df = pd.DataFrame(operations_records)
-
     # -------------------------------------------------------------
     # 2) Concurrency Analysis
     # -------------------------------------------------------------
     # We want to find the maximum concurrency for each operation_name.
     # We'll do a timeline-based approach: for each operation we have a start_time, end_time
     # We'll create +1 event at start_time, -1 event at end_time, then do a running sum.
-    # Then we can measure concurrency across the entire timeline. However, we want concurrency
-    # specifically *by operation_name* as well as overall.
     #
     # We'll do it in two passes:
     #   A) Overall concurrency ignoring operation_name
-    #   B) concurrency per (operation_type, operation_name)
-    # Then we can combine them for a "peak concurrency" measure.
+    #   B) concurrency per operation_name
+    # Each pass is a cumulative sum over the stably sorted start/end events.
+    start_times = operations_df["start_time"].to_numpy(dtype=np.float64)
+    end_times = operations_df["end_time"].to_numpy(dtype=np.float64)
 
     # A) Overall concurrency (not always essential, but might be interesting)
-    timeline_events = []
-    for row in operations_df.itertuples(index=False):
-        timeline_events.append((row.start_time, +1))
-        timeline_events.append((row.end_time, -1))
-
-    timeline_events.sort(key=lambda x: x[0])  # sort by time
-    current_concurrency = 0
-    concurrency_trace = []
-    for ts, delta in timeline_events:
-        current_concurrency += delta
-        concurrency_trace.append((ts, current_concurrency))
-    overall_max_concurrency = max(c[1] for c in concurrency_trace) if concurrency_trace else 0
+    _, running = concurrency_sweep(start_times, end_times)
+    overall_max_concurrency = int(running.max())
 
     # B) concurrency by operation_name
-    # We'll generate timeline events per operation_name
-    # Then compute the max concurrency for that subset
-    operation_names = operations_df["operation_name"].unique()
+    operation_names = operations_df["operation_name"].to_numpy()
     max_concurrency_by_name = {}
-
-    for op_name in operation_names:
-        sub = operations_df[operations_df["operation_name"] == op_name]
-        events_sub = []
-        for row in sub.itertuples(index=False):
-            events_sub.append((row.start_time, +1))
-            events_sub.append((row.end_time, -1))
-        if not events_sub:
-            max_concurrency_by_name[op_name] = 0
-            continue
-        events_sub.sort(key=lambda x: x[0])
-        c_curr = 0
-        c_max = 0
-        for ts, delta in events_sub:
-            c_curr += delta
-            if c_curr > c_max:  # pylint: disable=consider-using-max-builtin
-                c_max = c_curr
-        max_concurrency_by_name[op_name] = c_max
+    for op_name in operations_df["operation_name"].unique():
+        mask = operation_names == op_name
+        _, running = concurrency_sweep(start_times[mask], end_times[mask])
+        max_concurrency_by_name[op_name] = max(0, int(running.max()))
 
     # -------------------------------------------------------------
     # 3) Compute summary stats per (operation_type, operation_name)
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Sweep-line concurrency helpers shared by the bottleneck and concurrency analyses.
+
+Every call contributes a +1 event at its start and a -1 event at its end. The events are interleaved per call
+(start, end, start, end, ...) and stably sorted by time, so that calls sharing a boundary are ordered the same way as
+the per-event loops these helpers replace. The running concurrency is then a cumulative sum over the sorted events.
+"""
+
+import numpy as np
+
+
+def concurrency_sweep(start_times: np.ndarray, end_times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sort the start/end events of all calls and compute the running concurrency after each event.
+
+    Parameters
+    ----------
+    start_times : np.ndarray
+        Start time of each call.
+    end_times : np.ndarray
+        End time of each call, aligned with ``start_times``.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The sorted event times and the concurrency after each event.
+    """
+    times = np.empty(2 * len(start_times), dtype=np.float64)
+    times[0::2] = start_times
+    times[1::2] = end_times
+
+    deltas = np.empty(len(times), dtype=np.int64)
+    deltas[0::2] = 1
+    deltas[1::2] = -1
+
+    order = np.argsort(times, kind="stable")
+    return times[order], np.cumsum(deltas[order])
+
+
+def concurrency_segments(start_times: np.ndarray, end_times: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build the piecewise-constant concurrency timeline ``[(seg_start, seg_end, concurrency), ...]`` of a set of calls.
+
+    A segment spans two consecutive distinct event times, and its concurrency accounts for every event up to and
+    including its start.
+
+    Parameters
+    ----------
+    start_times : np.ndarray
+        Start time of each call.
+    end_times : np.ndarray
+        End time of each call, aligned with ``start_times``.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Segment starts, segment ends and the concurrency within each segment.
+    """
+    times, running = concurrency_sweep(start_times, end_times)
+    boundary = times[1:] > times[:-1]
+    return times[:-1][boundary], times[1:][boundary], running[:-1][boundary]
+
+
+def concurrency_at(points: np.ndarray, seg_starts: np.ndarray, seg_ends: np.ndarray,
+                   seg_concurrency: np.ndarray) -> np.ndarray:
+    """
+    Look up the concurrency at each point in time, or 0.0 for points outside of the timeline.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Points in time to look up.
+    seg_starts, seg_ends, seg_concurrency : np.ndarray
+        The timeline returned by `concurrency_segments`.
+
+    Returns
+    -------
+    np.ndarray
+        The concurrency of the segment ``[seg_start, seg_end)`` containing each point.
+    """
+    result = np.zeros(len(points), dtype=np.float64)
+    if len(seg_starts) == 0:
+        return result
+
+    idx = np.searchsorted(seg_starts, points, side="right") - 1
+    clipped = np.clip(idx, 0, None)
+    inside = (idx >= 0) & (points < seg_ends[clipped])
+    result[inside] = seg_concurrency[clipped[inside]]
+    return result
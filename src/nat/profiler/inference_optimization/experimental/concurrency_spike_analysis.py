@@ -35,6 +35,8 @@ import numpy as np
 import pandas as pd
 
 from nat.data_models.intermediate_step import IntermediateStep
+from nat.profiler.inference_optimization.concurrency_timeline import concurrency_at
+from nat.profiler.inference_optimization.concurrency_timeline import concurrency_segments
 from nat.profiler.inference_optimization.data_models import ConcurrencyAnalysisResult
 from nat.profiler.inference_optimization.data_models import ConcurrencyCallNode
 from nat.profiler.inference_optimization.data_models import ConcurrencyCorrelationStats
@@ -45,42 +47,46 @@ from nat.profiler.utils import create_standardized_dataframe
 # 1) Building the Per-Example Call Trees
 # --------------------------------------------------------------------------------
 
+_UNKNOWN_NAMES = {"LLM": "unknown_llm", "TOOL": "unknown_tool"}
 
-def build_call_tree_for_example(example_df: pd.DataFrame) -> list[ConcurrencyCallNode]:
+
+def _parse_op_type(et: str) -> str | None:
+    if et.startswith("LLM_"):
+        return "LLM"
+    if et.startswith("TOOL_"):
+        return "TOOL"
+    return None
+
+
+def _column(df: pd.DataFrame, name: str) -> list:
+    return df[name].tolist() if name in df.columns else [None] * len(df)
+
+
+def _build_call_tree(columns: dict[str, list], example_num: int, begin: int, end: int) -> list[ConcurrencyCallNode]:
     """
-    Sort events by time, push on `*_START`, pop on `*_END`, build stack-based calls for a single example.
+    Build the call tree of the events in ``[begin, end)``, which must belong to a single example and be sorted by
+    timestamp. Columns are passed as plain lists, which is much cheaper than iterating over DataFrame rows.
     """
     stack: list[ConcurrencyCallNode] = []
     top_level: dict[str, ConcurrencyCallNode] = {}
     partial_map: dict[str, ConcurrencyCallNode] = {}
 
-    def parse_op_type(et: str) -> str | None:
-        et = et.upper()
-        if et.startswith("LLM_"):
-            return "LLM"
-        if et.startswith("TOOL_"):
-            return "TOOL"
-        return None
-
-    def get_op_name(row: pd.Series, op_type: str) -> str:
-        if op_type == "LLM":
-            return row.get("llm_name") or "unknown_llm"
-        if op_type == "TOOL":
-            return row.get("tool_name") or "unknown_tool"
-        return "unknown_op"
+    event_types = columns["event_type"]
+    uuids = columns["UUID"]
+    timestamps = columns["event_timestamp"]
+    names = {"LLM": columns["llm_name"], "TOOL": columns["tool_name"]}
 
-    example_num = int(example_df["example_number"].iloc[0])
-
-    for _, row in example_df.iterrows():
-        et = row["event_type"].value.upper()
-        uuid = str(row["UUID"])
-        ts = float(row["event_timestamp"])
-        op_type = parse_op_type(et)
+    for i in range(begin, end):
+        et = event_types[i].value.upper()
+        op_type = _parse_op_type(et)
         if not op_type:
             continue
 
+        uuid = str(uuids[i])
+        ts = float(timestamps[i])
+
         if et.endswith("_START"):
-            op_name = get_op_name(row, op_type)
+            op_name = names[op_type][i] or _UNKNOWN_NAMES[op_type]
             node = ConcurrencyCallNode(
                 uuid=uuid,
                 example_number=example_num,
@@ -105,23 +111,40 @@ def build_call_tree_for_example(example_df: pd.DataFrame) -> list[ConcurrencyCal
             node = partial_map[uuid]
             node.end_time = ts
             node.duration = max(0.0, node.end_time - node.start_time)
-            node.prompt_tokens = row.get("prompt_tokens")
-            node.completion_tokens = row.get("completion_tokens")
-            node.total_tokens = row.get("total_tokens")
-            node.tool_outputs = row.get("metadata").get("tool_outputs") if (
-                row.get("metadata") and row.get("metadata").get("tool_outputs")) else None
-            node.llm_text_output = row.get("llm_text_output")
+            node.prompt_tokens = columns["prompt_tokens"][i]
+            node.completion_tokens = columns["completion_tokens"][i]
+            node.total_tokens = columns["total_tokens"][i]
+            metadata = columns["metadata"][i]
+            node.tool_outputs = metadata.get("tool_outputs") if (metadata and metadata.get("tool_outputs")) else None
+            node.llm_text_output = columns["llm_text_output"][i]
 
             if stack and stack[-1].uuid == uuid:
                 stack.pop()
             del partial_map[uuid]
 
     # gather top-level
-    roots = []
-    for _, nd in top_level.items():
-        if nd.parent is None:
-            roots.append(nd)
-    return roots
+    return [nd for nd in top_level.values() if nd.parent is None]
+
+
+_TREE_COLUMNS = ("event_type",
+                 "UUID",
+                 "event_timestamp",
+                 "llm_name",
+                 "tool_name",
+                 "prompt_tokens",
+                 "completion_tokens",
+                 "total_tokens",
+                 "metadata",
+                 "llm_text_output")
+
+
+def build_call_tree_for_example(example_df: pd.DataFrame) -> list[ConcurrencyCallNode]:
+    """
+    Sort events by time, push on `*_START`, pop on `*_END`, build stack-based calls for a single example.
+    """
+    columns = {name: _column(example_df, name) for name in _TREE_COLUMNS}
+    example_num = int(example_df["example_number"].iloc[0])
+    return _build_call_tree(columns, example_num, 0, len(example_df))
 
 
 def build_call_tree_per_example(df: pd.DataFrame) -> list[ConcurrencyCallNode]:
@@ -136,10 +159,16 @@ def build_call_tree_per_example(df: pd.DataFrame) -> list[ConcurrencyCallNode]:
     dfc = df.copy()
     dfc.sort_values(["example_number", "event_timestamp"], inplace=True)
 
+    # Extract the columns once, each example is then a contiguous range of the sorted rows
+    columns = {name: _column(dfc, name) for name in _TREE_COLUMNS}
+    example_numbers = dfc["example_number"].to_numpy()
+    bounds = np.flatnonzero(example_numbers[1:] != example_numbers[:-1]) + 1
+    starts = np.concatenate(([0], bounds)).tolist()
+    ends = np.concatenate((bounds, [len(dfc)])).tolist()
+
     all_roots: list[ConcurrencyCallNode] = []
-    for _, grp in dfc.groupby("example_number"):
-        r = build_call_tree_for_example(grp)
-        all_roots.extend(r)
+    for begin, end in zip(starts, ends):
+        all_roots.extend(_build_call_tree(columns, int(example_numbers[begin]), begin, end))
     return all_roots
 
 
@@ -148,15 +177,34 @@ def flatten_calls(roots: list[ConcurrencyCallNode]) -> list[ConcurrencyCallNode]
     DFS to produce a flat list of all calls (including nested).
     """
     all_nodes = []
+    stack = list(reversed(roots))
+    while stack:
+        node = stack.pop()
+        all_nodes.append(node)
+        stack.extend(reversed(node.children))
+    return all_nodes
 
-    def dfs(n: ConcurrencyCallNode):
-        all_nodes.append(n)
-        for c in n.children:
-            dfs(c)
 
-    for rt in roots:
-        dfs(rt)
-    return all_nodes
+def _call_times(all_nodes: list[ConcurrencyCallNode]) -> tuple[np.ndarray, np.ndarray]:
+    start_times = np.fromiter((n.start_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    end_times = np.fromiter((n.end_time for n in all_nodes), dtype=np.float64, count=len(all_nodes))
+    return start_times, end_times
+
+
+def _segments(start_times: np.ndarray, end_times: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    valid = start_times <= end_times
+    return concurrency_segments(start_times[valid], end_times[valid])
+
+
+def _distribution(seg_starts: np.ndarray, seg_ends: np.ndarray, seg_concurrency: np.ndarray) -> dict[int, float]:
+    """Total time spent at each concurrency level, keyed in order of first appearance on the timeline."""
+    if len(seg_concurrency) == 0:
+        return {}
+
+    durations = np.bincount(seg_concurrency, weights=seg_ends - seg_starts)
+    levels, first_seen = np.unique(seg_concurrency, return_index=True)
+    levels = levels[np.argsort(first_seen)].tolist()
+    return {level: float(durations[level]) for level in levels}
 
 
 # --------------------------------------------------------------------------------
@@ -172,25 +220,7 @@ def compute_concurrency_distribution(roots: list[ConcurrencyCallNode]) -> dict[i
     if not all_nodes:
         return {}
 
-    events = []
-    for n in all_nodes:
-        if n.start_time <= n.end_time:
-            events.append((n.start_time, +1))
-            events.append((n.end_time, -1))
-
-    events.sort(key=lambda x: x[0])
-    dist_map: dict[int, float] = {}
-    curr_conc = 0
-    prev_time = events[0][0]
-
-    for (time_val, delta) in events:
-        if time_val > prev_time:
-            length = time_val - prev_time
-            dist_map[curr_conc] = dist_map.get(curr_conc, 0.0) + length
-        curr_conc += delta
-        prev_time = time_val
-
-    return dist_map
+    return _distribution(*_segments(*_call_times(all_nodes)))
 
 
 def build_concurrency_segments(roots: list[ConcurrencyCallNode]) -> list[tuple[float, float, int]]:
@@ -201,24 +231,8 @@ def build_concurrency_segments(roots: list[ConcurrencyCallNode]) -> list[tuple[f
     if not all_nodes:
         return []
 
-    events = []
-    for n in all_nodes:
-        if n.start_time <= n.end_time:
-            events.append((n.start_time, +1))
-            events.append((n.end_time, -1))
-
-    events.sort(key=lambda x: x[0])
-    segments: list[tuple[float, float, int]] = []
-    curr_conc = 0
-    prev_time = events[0][0]
-
-    for (t, delta) in events:
-        if t > prev_time:
-            segments.append((prev_time, t, curr_conc))
-        curr_conc += delta
-        prev_time = t
-
-    return segments
+    seg_starts, seg_ends, seg_concurrency = _segments(*_call_times(all_nodes))
+    return list(zip(seg_starts.tolist(), seg_ends.tolist(), seg_concurrency.tolist()))
 
 
 def find_percentile_concurrency(dist_map: dict[int, float], percentile: float) -> float:
@@ -277,27 +291,38 @@ def find_calls_active_in_interval(roots: list[ConcurrencyCallNode], start_t: flo
 # 4) Correlations & Average Latency by Concurrency
 # --------------------------------------------------------------------------------
 
+
+def _token_array(values: list) -> np.ndarray:
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
 def correlate_spike_calls(spikes: list[ConcurrencySpikeInfo], roots: list[ConcurrencyCallNode]) \
         -> ConcurrencyCorrelationStats:
     """
     For each spike, gather calls that overlap, compute average prompt_tokens, total_tokens across them.
     """
+    all_nodes = flatten_calls(roots)
+    start_times, end_times = _call_times(all_nodes)
+    prompt_tokens = _token_array([c.prompt_tokens for c in all_nodes])
+    total_tokens = _token_array([c.total_tokens for c in all_nodes])
+
     p_tokens = []
     t_tokens = []
 
     for sp in spikes:
-        active = find_calls_active_in_interval(roots, sp.start_time, sp.end_time)
+        # Overlap => not (call.end_time <= start_t or call.start_time >= end_t), in flattened call order
+        active = np.flatnonzero((end_times > sp.start_time) & (start_times < sp.end_time))
         # record the active call uuids for each spike
-        sp.active_uuids = list({c.uuid for c in active})
+        sp.active_uuids = list({all_nodes[i].uuid for i in active.tolist()})
 
-        for c in active:
-            if c.prompt_tokens and c.prompt_tokens > 0:
-                p_tokens.append(c.prompt_tokens)
-            if c.total_tokens and c.total_tokens > 0:
-                t_tokens.append(c.total_tokens)
+        active_prompt = prompt_tokens[active]
+        active_total = total_tokens[active]
+        p_tokens.append(active_prompt[active_prompt > 0])
+        t_tokens.append(active_total[active_total > 0])
 
-    def safe_avg(lst):
-        return float(np.mean(lst)) if lst else 0.0
+    def safe_avg(arrays):
+        values = np.concatenate(arrays) if arrays else np.empty(0)
+        return float(np.mean(values)) if len(values) else 0.0
 
     return ConcurrencyCorrelationStats(
         avg_prompt_tokens=safe_avg(p_tokens),
@@ -327,30 +352,37 @@ def compute_midpoint_concurrency(n: ConcurrencyCallNode, segments: list[tuple[fl
     return 0.0
 
 
+def _average_latency_by_midpoint_concurrency(all_nodes: list[ConcurrencyCallNode],
+                                             start_times: np.ndarray,
+                                             end_times: np.ndarray,
+                                             seg_starts: np.ndarray,
+                                             seg_ends: np.ndarray,
+                                             seg_concurrency: np.ndarray) -> dict[int, float]:
+    # Zero-length calls have no midpoint concurrency
+    midpoints = 0.5 * (start_times + end_times)
+    levels = concurrency_at(midpoints, seg_starts, seg_ends, seg_concurrency)
+    levels[start_times >= end_times] = 0.0
+    levels = levels.astype(np.int64)
+
+    durations = np.fromiter((c.duration for c in all_nodes), dtype=np.float64, count=len(all_nodes))
+    unique_levels, first_seen = np.unique(levels, return_index=True)
+
+    result = {}
+    for c_level in unique_levels[np.argsort(first_seen)].tolist():
+        result[c_level] = float(np.mean(durations[levels == c_level]))
+    return result
+
+
 def average_latency_by_midpoint_concurrency(roots: list[ConcurrencyCallNode]) -> dict[int, float]:
     """
     For each call, find concurrency at midpoint, then bucket durations by concurrency, compute avg.
     """
-    segs = build_concurrency_segments(roots)
     all_nodes = flatten_calls(roots)
-
-    # concurrency => list of durations
-    from collections import defaultdict
-    calls_by_conc = defaultdict(list)
-
-    for c in all_nodes:
-        mc = compute_midpoint_concurrency(c, segs)
-        # round or cast to int
-        c_level = int(mc)
-        calls_by_conc[c_level].append(c.duration)
-
-    result = {}
-    for c_level, durations in calls_by_conc.items():
-        if durations:
-            result[c_level] = float(np.mean(durations))
-        else:
-            result[c_level] = 0.0
-    return result
+    start_times, end_times = _call_times(all_nodes)
+    return _average_latency_by_midpoint_concurrency(all_nodes,
+                                                    start_times,
+                                                    end_times,
+                                                    *_segments(start_times, end_times))
 
 
 # --------------------------------------------------------------------------------
@@ -394,8 +426,10 @@ def concurrency_spike_analysis(
     all_calls = flatten_calls(roots)
     num_calls = len(all_calls)
 
-    # Concurrency distribution
-    dist_map = compute_concurrency_distribution(roots)
+    # Concurrency segments & distribution, computed once over all calls
+    start_times, end_times = _call_times(all_calls)
+    seg_starts, seg_ends, seg_concurrency = _segments(start_times, end_times)
+    dist_map = _distribution(seg_starts, seg_ends, seg_concurrency)
     total_time = sum(dist_map.values())
 
     p50_c = find_percentile_concurrency(dist_map, 50)
@@ -407,15 +441,20 @@ def concurrency_spike_analysis(
     if concurrency_spike_threshold is None:
         concurrency_spike_threshold = max(1, int(np.ceil(p90_c)))
 
-    # Build concurrency segments, detect spikes
-    segments = build_concurrency_segments(roots)
+    # Detect spikes
+    segments = list(zip(seg_starts.tolist(), seg_ends.tolist(), seg_concurrency.tolist()))
     spike_intervals = detect_concurrency_spikes(segments, concurrency_spike_threshold)
 
     # Correlate
     corr_stats = correlate_spike_calls(spike_intervals, roots)
 
     # Average latency by concurrency
-    avg_lat_by_conc = average_latency_by_midpoint_concurrency(roots)
+    avg_lat_by_conc = _average_latency_by_midpoint_concurrency(all_calls,
+                                                               start_times,
+                                                               end_times,
+                                                               seg_starts,
+                                                               seg_ends,
+                                                               seg_concurrency)
 
     # Build textual report
     lines = []
@@ -0,0 +1,261 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Streaming profiler which maintains running aggregates while an evaluation is in progress.
+
+Unlike `ProfilerRunner`, which processes every intermediate step once all examples have completed, the online profiler
+observes the steps of each example as they are emitted. Quantiles are estimated with t-digests, so the memory used
+does not grow with the number of examples and a snapshot of the metrics can be taken at any time.
+"""
+
+import math
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.profiler.inference_metrics_model import InferenceMetricsModel
+from nat.profiler.tdigest import TDigest
+
+
+class LLMTokenCounts(BaseModel):
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+
+
+class OnlineProfilerMetrics(BaseModel):
+    """A snapshot of the metrics maintained by the `OnlineProfiler`."""
+    examples_completed: int = Field(default=0, description="Number of examples whose workflow run has completed")
+    examples_in_progress: int = Field(default=0, description="Number of examples whose workflow is currently running")
+    workflow_run_time: InferenceMetricsModel = Field(default_factory=InferenceMetricsModel,
+                                                     description="Run time of each completed example in seconds")
+    llm_latency: InferenceMetricsModel = Field(default_factory=InferenceMetricsModel,
+                                               description="Latency of each LLM call in seconds")
+    throughput: InferenceMetricsModel = Field(default_factory=InferenceMetricsModel,
+                                              description="Completed examples per second")
+    token_usage: dict[str, LLMTokenCounts] = Field(default_factory=dict, description="Token usage per LLM")
+    llm_concurrency_seconds: dict[int, float] = Field(
+        default_factory=dict, description="Seconds spent with a given number of LLM calls in flight across examples")
+    max_llm_concurrency: int = Field(default=0, description="Largest number of LLM calls in flight at the same time")
+
+
+class _RunningStats:
+    """Running mean and variance (Welford) together with a t-digest of the samples."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.digest = TDigest()
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.digest.add(value)
+
+    def to_metrics(self) -> InferenceMetricsModel:
+        """Mirrors `ProfilerRunner._compute_confidence_intervals`, with estimated rather than exact percentiles."""
+        n = self.count
+        if n == 0:
+            return InferenceMetricsModel()
+        if n == 1:
+            return InferenceMetricsModel(n=n,
+                                         mean=self.mean,
+                                         ninetieth_interval=(self.mean, self.mean),
+                                         ninety_fifth_interval=(self.mean, self.mean),
+                                         ninety_ninth_interval=(self.mean, self.mean),
+                                         p90=self.mean,
+                                         p95=self.mean,
+                                         p99=self.mean)
+
+        # Population standard deviation, as in the batch computation
+        se = math.sqrt(max(self._m2, 0.0) / n) / math.sqrt(n)
+
+        intervals = {}
+        for confidence, zvalue in \
+                [("ninetieth_interval", 1.645), ("ninety_fifth_interval", 1.96), ("ninety_ninth_interval", 2.576)]:
+            margin = zvalue * se
+            intervals[confidence] = (self.mean - margin, self.mean + margin)
+
+        return InferenceMetricsModel(n=n,
+                                     mean=self.mean,
+                                     p90=self.digest.quantile(0.90),
+                                     p95=self.digest.quantile(0.95),
+                                     p99=self.digest.quantile(0.99),
+                                     **intervals)
+
+
+class _ExampleState:
+
+    __slots__ = ("min_timestamp", "max_timestamp", "previous_llm_start_time", "open_llm_calls")
+
+    def __init__(self):
+        self.min_timestamp = math.inf
+        self.max_timestamp = -math.inf
+        self.previous_llm_start_time: float | None = None
+        self.open_llm_calls: set[str] = set()
+
+
+class OnlineProfiler:
+    """
+    Computes profiler metrics incrementally from the intermediate steps of an evaluation run.
+
+    Each example is registered with `start_example`, its steps are passed to `observe` as they are emitted, and it is
+    finalized with `end_example`. The metrics follow the definitions used by `ProfilerRunner`:
+
+    - The run time of an example is the time between its earliest and latest step.
+    - The latency of an LLM call is the time between an `LLM_END` step and the preceding `LLM_START` step.
+    - Throughput is the number of completed examples divided by the time between the earliest and latest step.
+
+    In addition, token usage is counted per LLM, and the time spent with a given number of LLM calls in flight is
+    accumulated across all examples.
+    """
+
+    def __init__(self):
+        self._examples: dict[int, _ExampleState] = {}
+        self._next_example_id = 0
+        self._examples_completed = 0
+
+        self._workflow_run_time = _RunningStats()
+        self._llm_latency = _RunningStats()
+        self._token_usage: dict[str, LLMTokenCounts] = {}
+
+        self._min_timestamp = math.inf
+        self._max_timestamp = -math.inf
+
+        self._llm_in_flight = 0
+        self._max_llm_concurrency = 0
+        self._last_concurrency_change: float | None = None
+        self._llm_concurrency_seconds: dict[int, float] = {}
+
+    def start_example(self) -> int:
+        """Register a new example and return the identifier to pass to `observe` and `end_example`."""
+        example_id = self._next_example_id
+        self._next_example_id += 1
+        self._examples[example_id] = _ExampleState()
+        return example_id
+
+    def observe(self, example_id: int, step: IntermediateStep) -> None:
+        """Update the aggregates with a step emitted by the workflow run of an example."""
+        example = self._examples.get(example_id)
+        if example is None:
+            return
+
+        timestamp = step.event_timestamp
+        example.min_timestamp = min(example.min_timestamp, timestamp)
+        example.max_timestamp = max(example.max_timestamp, timestamp)
+
+        event_type = step.event_type
+        if event_type == IntermediateStepType.LLM_START:
+            example.previous_llm_start_time = timestamp
+            if step.UUID not in example.open_llm_calls:
+                example.open_llm_calls.add(step.UUID)
+                self._update_llm_concurrency(timestamp, 1)
+
+        elif event_type == IntermediateStepType.LLM_END:
+            if example.previous_llm_start_time is not None:
+                self._llm_latency.add(timestamp - example.previous_llm_start_time)
+                example.previous_llm_start_time = None
+
+            if step.UUID in example.open_llm_calls:
+                example.open_llm_calls.discard(step.UUID)
+                self._update_llm_concurrency(timestamp, -1)
+
+            usage_info = step.payload.usage_info
+            counts = self._token_usage.setdefault(step.payload.name or "unknown", LLMTokenCounts())
+            counts.calls += 1
+            if usage_info is not None:
+                counts.prompt_tokens += usage_info.token_usage.prompt_tokens
+                counts.completion_tokens += usage_info.token_usage.completion_tokens
+                counts.total_tokens += usage_info.token_usage.total_tokens
+
+    def end_example(self, example_id: int, completed: bool = True) -> None:
+        """
+        Finalize an example.
+
+        Parameters
+        ----------
+        example_id : int
+            The identifier returned by `start_example`.
+        completed : bool
+            Whether the workflow run of the example completed. The run time of failed examples is not recorded.
+        """
+        example = self._examples.pop(example_id, None)
+        if example is None:
+            return
+
+        # LLM calls which never ended are no longer in flight
+        if example.open_llm_calls:
+            self._update_llm_concurrency(max(example.max_timestamp, self._last_concurrency_change),
+                                         -len(example.open_llm_calls))
+
+        if not completed or example.min_timestamp > example.max_timestamp:
+            return
+
+        self._examples_completed += 1
+        self._workflow_run_time.add(example.max_timestamp - example.min_timestamp)
+        self._min_timestamp = min(self._min_timestamp, example.min_timestamp)
+        self._max_timestamp = max(self._max_timestamp, example.max_timestamp)
+
+    def _update_llm_concurrency(self, timestamp: float, delta: int) -> None:
+        # Steps of concurrent examples can arrive slightly out of order, time never moves backwards
+        if self._last_concurrency_change is not None and timestamp > self._last_concurrency_change:
+            elapsed = timestamp - self._last_concurrency_change
+            self._llm_concurrency_seconds[self._llm_in_flight] = self._llm_concurrency_seconds.get(
+                self._llm_in_flight, 0.0) + elapsed
+
+        if self._last_concurrency_change is None or timestamp > self._last_concurrency_change:
+            self._last_concurrency_change = timestamp
+
+        self._llm_in_flight += delta
+        self._max_llm_concurrency = max(self._max_llm_concurrency, self._llm_in_flight)
+
+    def _throughput(self) -> InferenceMetricsModel:
+        """Mirrors `ProfilerRunner._compute_throughput_estimates`."""
+        n = self._examples_completed
+        total_time = self._max_timestamp - self._min_timestamp
+        if n <= 1 or total_time <= 0:
+            return InferenceMetricsModel()
+
+        throughput_value = n / total_time
+        standard_error = throughput_value / math.sqrt(n)
+
+        intervals = {}
+        for confidence, zvalue in \
+                [("ninetieth_interval", 1.645), ("ninety_fifth_interval", 1.96), ("ninety_ninth_interval", 2.576)]:
+            ci_lower = throughput_value - zvalue * standard_error
+            ci_upper = throughput_value + zvalue * standard_error
+            intervals[confidence] = (max(ci_lower, 0.0), ci_upper)
+
+        return InferenceMetricsModel(n=n, mean=throughput_value, **intervals)
+
+    def snapshot(self) -> OnlineProfilerMetrics:
+        """Return the current value of all metrics."""
+        return OnlineProfilerMetrics(examples_completed=self._examples_completed,
+                                     examples_in_progress=len(self._examples),
+                                     workflow_run_time=self._workflow_run_time.to_metrics(),
+                                     llm_latency=self._llm_latency.to_metrics(),
+                                     throughput=self._throughput(),
+                                     token_usage={
+                                         name: counts.model_copy()
+                                         for name, counts in self._token_usage.items()
+                                     },
+                                     llm_concurrency_seconds=dict(sorted(self._llm_concurrency_seconds.items())),
+                                     max_llm_concurrency=self._max_llm_concurrency)
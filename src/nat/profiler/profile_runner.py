@@ -28,6 +28,8 @@ from nat.data_models.intermediate_step import IntermediateStep
 from nat.profiler.data_models import ProfilerResults
 from nat.profiler.forecasting.model_trainer import ModelTrainer
 from nat.profiler.inference_metrics_model import InferenceMetricsModel
+from nat.profiler.inference_optimization.data_models import WorkflowRuntimeMetrics
+from nat.profiler.online_profiler import OnlineProfilerMetrics
 from nat.profiler.utils import create_standardized_dataframe
 from nat.utils.type_converter import TypeConverter
 
@@ -82,11 +84,16 @@ class ProfilerRunner:
         # Ensure output directory
         os.makedirs(output_dir, exist_ok=True)
 
-    async def run(self, all_steps: list[list[IntermediateStep]]) -> ProfilerResults:
+    async def run(self,
+                  all_steps: list[list[IntermediateStep]],
+                  online_metrics: OnlineProfilerMetrics | None = None) -> ProfilerResults:
         """
         Main entrypoint: Works on Input DataFrame generated from eval to fit forecasting model,
         writes out combined requests JSON, then computes and saves additional metrics,
         and optionally fits a forecasting model.
+
+        When `online_metrics` computed by the `OnlineProfiler` during the run are provided, the run time, latency and
+        throughput metrics are taken from them instead of being recomputed from `all_steps`.
         """
         from nat.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import \
             multi_example_call_profiling
@@ -143,13 +150,24 @@ class ProfilerRunner:
         # ------------------------------------------------------------
         # Compute and save additional performance metrics
         # ------------------------------------------------------------
-        workflow_run_time_ci: InferenceMetricsModel = self._compute_workflow_run_time_confidence_intervals()
+        if online_metrics is not None:
+            workflow_run_time_ci = online_metrics.workflow_run_time
+            llm_latency_ci = online_metrics.llm_latency
+            throughput_ci = online_metrics.throughput
+
+            if self.write_output:
+                online_metrics_path = os.path.join(self.output_dir, "online_profiler_metrics.json")
+                with open(online_metrics_path, 'w', encoding='utf-8') as f:
+                    json.dump(online_metrics.model_dump(mode="json"), f, indent=2)
+                logger.info("Wrote online profiler metrics to: %s", online_metrics_path)
+        else:
+            workflow_run_time_ci: InferenceMetricsModel = self._compute_workflow_run_time_confidence_intervals()
 
-        # 2. 90, 95, 99% confidence intervals of mean LLM latency
-        llm_latency_ci: InferenceMetricsModel = self._compute_llm_latency_confidence_intervals()
+            # 2. 90, 95, 99% confidence intervals of mean LLM latency
+            llm_latency_ci: InferenceMetricsModel = self._compute_llm_latency_confidence_intervals()
 
-        # 3. 90, 95, 99% estimates of throughput
-        throughput_ci: InferenceMetricsModel = self._compute_throughput_estimates()
+            # 3. 90, 95, 99% estimates of throughput
+            throughput_ci: InferenceMetricsModel = self._compute_throughput_estimates()
 
         # Collect all computed metrics
         simple_metrics = SimpleMetricsHolder(workflow_run_time_confidence_intervals=workflow_run_time_ci.model_dump(),
@@ -179,7 +197,11 @@ class ProfilerRunner:
             # Compute and save workflow runtime metrics
             # ------------------------------------------------------------
 
-            workflow_runtimes = compute_workflow_runtime_metrics(all_steps)
+            if online_metrics is not None:
+                run_time = online_metrics.workflow_run_time
+                workflow_runtimes = WorkflowRuntimeMetrics(p90=run_time.p90, p95=run_time.p95, p99=run_time.p99)
+            else:
+                workflow_runtimes = compute_workflow_runtime_metrics(all_steps)
             workflow_runtimes_results = workflow_runtimes
 
         inference_optimization_results = InferenceOptimizationHolder(confidence_intervals=simple_metrics,
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+
+
+class TDigest:
+    """
+    A merging t-digest for estimating quantiles of a stream in bounded memory.
+
+    Samples are buffered and periodically merged into at most about `compression` centroids. The scale function keeps
+    centroids near the tails small, so extreme quantiles such as p99 remain accurate.
+
+    Parameters
+    ----------
+    compression : float
+        Trades memory for accuracy, the digest holds on the order of `compression` centroids. Defaults to 200.
+    """
+
+    def __init__(self, compression: float = 200.0):
+        if compression <= 0:
+            raise ValueError("compression must be positive")
+
+        self._compression = compression
+        self._buffer_size = max(int(5 * compression), 50)
+        self._means: list[float] = []
+        self._weights: list[float] = []
+        self._buffer: list[float] = []
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def add(self, value: float) -> None:
+        """Record a single sample."""
+        self._buffer.append(value)
+        self._count += 1
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+
+        if len(self._buffer) >= self._buffer_size:
+            self._merge()
+
+    def _k_limit(self, q: float) -> float:
+        """Return the largest quantile a centroid starting at `q` may extend to (k1 scale function)."""
+        k = self._compression / (2 * math.pi) * math.asin(2 * min(q, 1.0) - 1) + 1
+        if k >= self._compression / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / self._compression) + 1) / 2
+
+    def _merge(self) -> None:
+        if not self._buffer:
+            return
+
+        points = sorted(zip(self._means + self._buffer, self._weights + [1.0] * len(self._buffer)))
+        self._buffer = []
+
+        total = float(self._count)
+        means: list[float] = []
+        weights: list[float] = []
+        mean, weight = points[0]
+        q0 = 0.0
+        q_limit = self._k_limit(q0)
+
+        for value, value_weight in points[1:]:
+            if q0 + (weight + value_weight) / total <= q_limit:
+                weight += value_weight
+                mean += (value - mean) * value_weight / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                q0 += weight / total
+                q_limit = self._k_limit(q0)
+                mean, weight = value, value_weight
+
+        means.append(mean)
+        weights.append(weight)
+        self._means = means
+        self._weights = weights
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile of the recorded samples.
+
+        Parameters
+        ----------
+        q : float
+            The quantile, between 0 and 1.
+
+        Returns
+        -------
+        float
+            The estimated quantile, or 0.0 when nothing was recorded.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantile must be between 0 and 1")
+        if self._count == 0:
+            return 0.0
+
+        self._merge()
+        means = self._means
+        weights = self._weights
+        if len(means) == 1:
+            return means[0]
+
+        target = q * self._count
+
+        # Between the minimum and the center of the first centroid
+        if target < weights[0] / 2:
+            return self._min + (means[0] - self._min) * target / (weights[0] / 2)
+
+        # Between the center of the last centroid and the maximum
+        if target > self._count - weights[-1] / 2:
+            tail = self._count - target
+            return self._max - (self._max - means[-1]) * tail / (weights[-1] / 2)
+
+        cumulative = weights[0] / 2
+        for i in range(len(means) - 1):
+            step = (weights[i] + weights[i + 1]) / 2
+            if cumulative + step >= target:
+                return means[i] + (means[i + 1] - means[i]) * (target - cumulative) / step
+            cumulative += step
+
+        return means[-1]
@@ -48,6 +48,16 @@ class MilvusRetrieverConfig(RetrieverBaseConfig, name="milvus_retriever"):
     description: str | None = Field(default=None,
                                     description="If present it will be used as the tool description",
                                     alias="collection_description")
+    batch_searches: bool = Field(
+        default=False,
+        description="Coalesce concurrent searches with the same parameters into a single search with many vectors.")
+    max_batch_size: int = Field(default=32, gt=0, description="Maximum number of queries searched together.")
+    max_batch_wait: float = Field(default=0.005,
+                                  ge=0,
+                                  description="Time in seconds a search waits for other searches to batch with.")
+    embedding_cache_size: int = Field(default=0,
+                                      ge=0,
+                                      description="Number of query embeddings to cache. The cache is disabled if 0.")
 
 
 @register_retriever_provider(config_type=MilvusRetrieverConfig)
@@ -69,6 +79,10 @@ async def milvus_retriever_client(config: MilvusRetrieverConfig, builder: Builde
         client=milvus_client,
         embedder=embedder,
         content_field=config.content_field,
+        batch_searches=config.batch_searches,
+        max_batch_size=config.max_batch_size,
+        max_batch_wait=config.max_batch_wait,
+        embedding_cache_size=config.embedding_cache_size,
     )
 
     # Using parameters in the config to set default values which can be overridden during the function call.
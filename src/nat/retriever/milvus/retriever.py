@@ -13,7 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import json
 import logging
+from collections import OrderedDict
 from functools import partial
 
 from langchain_core.embeddings import Embeddings
@@ -32,6 +35,78 @@ class CollectionNotFoundError(RetrieverError):
     pass
 
 
+class _PendingSearch:
+
+    __slots__ = ("params", "vectors", "futures", "flushed")
+
+    def __init__(self, params: dict):
+        self.params = params
+        self.vectors: list[list[float]] = []
+        self.futures: list[asyncio.Future] = []
+        self.flushed = False
+
+
+class _SearchBatcher:
+    """
+    Coalesces concurrent searches with identical parameters into a single Milvus search with many vectors.
+
+    A batch is sent once it holds `max_batch_size` vectors, or `max_wait` seconds after its first vector was submitted.
+    """
+
+    def __init__(self, search_fn, max_batch_size: int, max_wait: float):
+        self._search_fn = search_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._pending: dict[str, _PendingSearch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, vector: list[float], params: dict) -> list:
+        key = json.dumps(params, sort_keys=True, default=str)
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingSearch(params)
+            self._start(self._flush_later(key, batch))
+
+        future = asyncio.get_running_loop().create_future()
+        batch.vectors.append(vector)
+        batch.futures.append(future)
+        if len(batch.vectors) >= self._max_batch_size:
+            # Later searches start a new batch
+            del self._pending[key]
+            self._start(self._flush(key, batch))
+
+        return await future
+
+    def _start(self, coro) -> None:
+        # Keep a reference to the task, the event loop only keeps weak references
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_later(self, key: str, batch: _PendingSearch) -> None:
+        await asyncio.sleep(self._max_wait)
+        await self._flush(key, batch)
+
+    async def _flush(self, key: str, batch: _PendingSearch) -> None:
+        if batch.flushed:
+            return
+        batch.flushed = True
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+
+        try:
+            results = await self._search_fn(batch.vectors, **batch.params)
+        except Exception as e:  # pylint: disable=broad-except
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, hits in zip(batch.futures, results):
+            if not future.done():
+                future.set_result(hits)
+
+
 class MilvusRetriever(Retriever):
     """
     Client for retrieving document chunks from a Milvus vectorstore
@@ -43,15 +118,32 @@ class MilvusRetriever(Retriever):
         embedder: Embeddings,
         content_field: str = "text",
         use_iterator: bool = False,
+        batch_searches: bool = False,
+        max_batch_size: int = 32,
+        max_batch_wait: float = 0.005,
+        embedding_cache_size: int = 0,
     ) -> None:
         """
         Initialize the Milvus Retriever using a preconfigured MilvusClient
 
         Args:
            client (MilvusClient): Preinstantiate pymilvus.MilvusClient object.
+           embedder (Embeddings): The embedder used to vectorize the queries.
+           content_field (str): The field holding the content of the documents.
+           use_iterator (bool): Whether to use a search iterator, allowing for the retrieval of more results.
+           batch_searches (bool): Whether to coalesce concurrent searches with the same parameters into a single
+               Milvus search with many vectors.
+           max_batch_size (int): The maximum number of queries searched together when batching searches.
+           max_batch_wait (float): The time in seconds a search waits for other searches to batch with.
+           embedding_cache_size (int): The number of query embeddings to cache, 0 disables the cache.
         """
         self._client = client
         self._embedder = embedder
+        self._collection_fields: dict[str, asyncio.Task[list[str]]] = {}
+        self._embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._embedding_cache_size = embedding_cache_size
+        self._batcher = _SearchBatcher(self._search_vectors, max_batch_size, max_batch_wait) if batch_searches else None
+        self._bound_kwargs: dict = {}
 
         if use_iterator and "search_iterator" not in dir(self._client):
             raise ValueError("This version of the pymilvus.MilvusClient does not support the search iterator.")
@@ -72,6 +164,7 @@ class MilvusRetriever(Retriever):
         if "query" in kwargs:
             kwargs = {k: v for k, v in kwargs.items() if k != "query"}
         self._search_func = partial(self._search_func, **kwargs)
+        self._bound_kwargs.update(kwargs)
         self._bound_params = list(kwargs.keys())
         logger.debug("Binding paramaters for search function: %s", kwargs)
 
@@ -84,9 +177,119 @@ class MilvusRetriever(Retriever):
     def _validate_collection(self, collection_name: str) -> bool:
         return collection_name in self._client.list_collections()
 
+    async def _describe_collection_fields(self, collection_name: str) -> list[str]:
+        # The client is synchronous, don't block the event loop on round trips to the server
+        if not await asyncio.to_thread(self._validate_collection, collection_name):
+            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
+        collection_schema = await asyncio.to_thread(self._client.describe_collection, collection_name)
+        return [field.get("name") for field in collection_schema.get("fields", [])]
+
+    async def _get_collection_fields(self, collection_name: str) -> list[str]:
+        """
+        Return the field names of a collection. The schema is retrieved once, concurrent searches of a collection whose
+        schema is not known yet share a single request.
+        """
+        task = self._collection_fields.get(collection_name)
+        if task is not None and task.done() and not task.cancelled() and task.exception() is None:
+            return task.result()
+
+        if task is None or task.done():
+            task = asyncio.create_task(self._describe_collection_fields(collection_name))
+            self._collection_fields[collection_name] = task
+
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            # Don't cache failures, e.g. the collection may be created later
+            if self._collection_fields.get(collection_name) is task:
+                del self._collection_fields[collection_name]
+            raise
+
+    async def _embed_query(self, query: str) -> list[float]:
+        vector = self._embedding_cache.get(query)
+        if vector is not None:
+            self._embedding_cache.move_to_end(query)
+            return vector
+
+        vector = await self._embedder.aembed_query(query)
+        if self._embedding_cache_size > 0:
+            self._embedding_cache[query] = vector
+            if len(self._embedding_cache) > self._embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+        return vector
+
+    async def _get_output_fields(self,
+                                 collection_name: str,
+                                 output_fields: list[str] | None,
+                                 vector_field_name: str | None) -> list[str]:
+        available_fields = await self._get_collection_fields(collection_name)
+
+        if self.content_field not in available_fields:
+            raise ValueError(f"The specified content field: {self.content_field} is not part of the schema.")
+
+        if vector_field_name not in available_fields:
+            raise ValueError(f"The specified vector field name: {vector_field_name} is not part of the schema.")
+
+        # If no output fields are specified, return all of them
+        if not output_fields:
+            output_fields = [field for field in available_fields if field != vector_field_name]
+
+        if self.content_field not in output_fields:
+            output_fields = output_fields + [self.content_field]
+
+        return output_fields
+
+    async def _search_vectors(self,
+                              vectors: list[list[float]],
+                              *,
+                              collection_name: str,
+                              top_k: int,
+                              filters: str | None,
+                              output_fields: list[str],
+                              search_params: dict | None,
+                              timeout: float | None,
+                              vector_field_name: str | None) -> list:
+        """Search the nearest neighbors of each vector with a single request, and return the hits of each vector."""
+        return await asyncio.to_thread(
+            self._client.search,
+            collection_name=collection_name,
+            data=vectors,
+            filter=filters,
+            output_fields=output_fields,
+            search_params=search_params if search_params else {"metric_type": "L2"},
+            timeout=timeout,
+            anns_field=vector_field_name,
+            limit=top_k,
+        )
+
     async def search(self, query: str, **kwargs):
         return await self._search_func(query=query, **kwargs)
 
+    async def search_many(self, queries: list[str], **kwargs) -> list[RetrieverOutput]:
+        """
+        Retrieve document chunks for several queries, with a single Milvus search for all of them.
+
+        Accepts the same parameters as `search`, parameters bound with `bind` are used as defaults.
+        """
+        params = {**self._bound_kwargs, **kwargs}
+        collection_name = params["collection_name"]
+        vector_field_name = params.get("vector_field_name", "vector")
+
+        output_fields = await self._get_output_fields(collection_name, params.get("output_fields"), vector_field_name)
+        unique_queries = list(dict.fromkeys(queries))
+        unique_vectors = await asyncio.gather(*(self._embed_query(query) for query in unique_queries))
+        vectors_by_query = dict(zip(unique_queries, unique_vectors))
+        results = await self._search_vectors([vectors_by_query[query] for query in queries],
+                                             collection_name=collection_name,
+                                             top_k=params["top_k"],
+                                             filters=params.get("filters"),
+                                             output_fields=output_fields,
+                                             search_params=params.get("search_params"),
+                                             timeout=params.get("timeout"),
+                                             vector_field_name=vector_field_name)
+
+        return [_wrap_milvus_results(hits, content_field=self.content_field) for hits in results]
+
     async def _search_with_iterator(self,
                                     query: str,
                                     *,
@@ -108,19 +311,17 @@ class MilvusRetriever(Retriever):
                      collection_name,
                      top_k)
 
-        if not self._validate_collection(collection_name):
-            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
+        available_fields = await self._get_collection_fields(collection_name)
 
         # If no output fields are specified, return all of them
         if not output_fields:
-            collection_schema = self._client.describe_collection(collection_name)
-            output_fields = [
-                field["name"] for field in collection_schema.get("fields") if field["name"] != vector_field_name
-            ]
+            output_fields = [field for field in available_fields if field != vector_field_name]
 
-        search_vector = self._embedder.embed_query(query)
+        search_vector = await self._embed_query(query)
 
-        search_iterator = self._client.search_iterator(
+        # The iterator methods are blocking network calls, they run in a worker thread
+        search_iterator = await asyncio.to_thread(
+            self._client.search_iterator,
             collection_name=collection_name,
             data=[search_vector],
             batch_size=kwargs.get("batch_size", 1000),
@@ -134,8 +335,8 @@ class MilvusRetriever(Retriever):
             partition_names=kwargs.get("partition_names", None),
         )
 
-        results = []
-        try:
+        def _drain_iterator():
+            results = []
             while True:
                 _res = search_iterator.next()
                 res = _res.get_res()
@@ -153,6 +354,9 @@ class MilvusRetriever(Retriever):
 
                 return _wrap_milvus_results(results, content_field=self.content_field)
 
+        try:
+            return await asyncio.to_thread(_drain_iterator)
+
         except Exception as e:
             logger.exception("Exception when retrieving results from milvus for query %s: %s", query, e)
             raise RetrieverError(f"Error when retrieving documents from {collection_name} for query '{query}'") from e
@@ -176,36 +380,23 @@ class MilvusRetriever(Retriever):
                      collection_name,
                      top_k)
 
-        if not self._validate_collection(collection_name):
-            raise CollectionNotFoundError(f"Collection: {collection_name} does not exist")
-
-        available_fields = [v.get("name") for v in self._client.describe_collection(collection_name).get("fields", {})]
-
-        if self.content_field not in available_fields:
-            raise ValueError(f"The specified content field: {self.content_field} is not part of the schema.")
-
-        if vector_field_name not in available_fields:
-            raise ValueError(f"The specified vector field name: {vector_field_name} is not part of the schema.")
-
-        # If no output fields are specified, return all of them
-        if not output_fields:
-            output_fields = [field for field in available_fields if field != vector_field_name]
-
-        if self.content_field not in output_fields:
-            output_fields.append(self.content_field)
-
-        search_vector = self._embedder.embed_query(query)
-        res = self._client.search(
-            collection_name=collection_name,
-            data=[search_vector],
-            filter=filters,
-            output_fields=output_fields,
-            search_params=search_params if search_params else {"metric_type": "L2"},
-            timeout=timeout,
-            anns_field=vector_field_name,
-            limit=top_k,
-        )
-
+        output_fields = await self._get_output_fields(collection_name, output_fields, vector_field_name)
+        search_vector = await self._embed_query(query)
+        params = {
+            "collection_name": collection_name,
+            "top_k": top_k,
+            "filters": filters,
+            "output_fields": output_fields,
+            "search_params": search_params,
+            "timeout": timeout,
+            "vector_field_name": vector_field_name,
+        }
+
+        if self._batcher is not None:
+            hits = await self._batcher.submit(search_vector, params)
+            return _wrap_milvus_results(hits, content_field=self.content_field)
+
+        res = await self._search_vectors([search_vector], **params)
         return _wrap_milvus_results(res[0], content_field=self.content_field)
 
 
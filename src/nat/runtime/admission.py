@@ -0,0 +1,276 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+import typing
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from nat.observability.metrics import GlobalMetricsRegistry
+
+# Header holding the number of seconds the client is willing to wait for the response
+REQUEST_TIMEOUT_HEADER = "x-request-timeout"
+
+# Deadline of the current request, in `time.monotonic` seconds
+request_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+# Weight of the latest run in the moving average of the run latency
+_LATENCY_EWMA_WEIGHT = 0.2
+
+_concurrency_limit = GlobalMetricsRegistry.get().gauge(
+    "nat_admission_concurrency_limit",
+    "Current limit of simultaneous workflow runs set by admission control.").labels()
+_rejections = GlobalMetricsRegistry.get().counter("nat_admission_rejections_total",
+                                                  "Number of workflow runs rejected by admission control.",
+                                                  label_names=("reason", ))
+_rejected_queue_full = _rejections.labels("queue_full")
+_rejected_shed = _rejections.labels("shed")
+_rejected_deadline = _rejections.labels("deadline")
+
+
+class AdmissionRejectedError(Exception):
+    """
+    Raised when a workflow run is not admitted.
+
+    Args:
+        message (str): The reason of the rejection
+        status_code (int): 429 when the queue is full, 503 when the run cannot start before its deadline or was shed
+            from the queue by a higher priority run
+        retry_after (int): Suggested number of seconds to wait before retrying
+    """
+
+    def __init__(self, message: str, status_code: int, retry_after: int):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def parse_request_timeout(value: str | None) -> float | None:
+    """Convert the value of the request timeout header into a deadline, invalid values are ignored."""
+    if value is None:
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(timeout) or timeout < 0:
+        return None
+    return time.monotonic() + timeout
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "future")
+
+    def __init__(self, priority: int, seq: int, future: asyncio.Future):
+        self.priority = priority
+        self.seq = seq
+        self.future = future
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        # Highest priority first, then first come first served
+        return (-self.priority, self.seq) < (-other.priority, other.seq)
+
+
+class AdmissionController:
+    """
+    Limits the number of simultaneous workflow runs, shared by the session managers of all the endpoints.
+
+    Runs which cannot start immediately wait in a bounded queue, ordered by priority. When the queue is full a run is
+    admitted only if it can shed a queued run of lower priority. Runs are rejected as soon as their deadline passes, or
+    when the expected queueing time already exceeds their deadline.
+
+    When `target_latency` is set the concurrency limit adapts to the observed latency (AIMD): it is decreased
+    multiplicatively by `backoff_ratio` when a run is slower than the target, and increased additively while runs meet
+    the target and the limit is reached, up to `max_concurrency`.
+
+    Args:
+        max_concurrency (int): The maximum number of simultaneous workflow runs
+        min_concurrency (int): The lower bound of the adaptive concurrency limit
+        max_queue_size (int): The maximum number of runs waiting to start
+        target_latency (float | None): The latency in seconds above which the concurrency limit is decreased, the
+            limit is fixed to `max_concurrency` when not set
+        backoff_ratio (float): The factor applied to the concurrency limit when a run exceeds `target_latency`
+    """
+
+    def __init__(self,
+                 max_concurrency: int = 8,
+                 *,
+                 min_concurrency: int = 1,
+                 max_queue_size: int = 64,
+                 target_latency: float | None = None,
+                 backoff_ratio: float = 0.9):
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("Expected 1 <= min_concurrency <= max_concurrency")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size cannot be negative")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_queue_size = max_queue_size
+        self.target_latency = target_latency
+        self.backoff_ratio = backoff_ratio
+
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._latency: float | None = None
+        self._last_decrease = float("-inf")
+
+        _concurrency_limit.set(max_concurrency)
+
+    @property
+    def limit(self) -> int:
+        """The current number of runs allowed to execute simultaneously."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._waiters)
+
+    def retry_after(self) -> int:
+        """Estimate the number of seconds until the queue drains."""
+        latency = self._latency if self._latency is not None else 1.0
+        return max(1, math.ceil(latency * (len(self._waiters) + 1) / self.limit))
+
+    def _estimated_wait(self, priority: int) -> float:
+        if self._latency is None:
+            return 0.0
+        ahead = sum(1 for waiter in self._waiters if waiter.priority >= priority)
+        return self._latency * (ahead + 1) / self.limit
+
+    def _reject(self, message: str, status_code: int, counter) -> AdmissionRejectedError:
+        counter.inc()
+        return AdmissionRejectedError(message, status_code=status_code, retry_after=self.retry_after())
+
+    def check(self, priority: int = 0, deadline: float | None = None) -> None:
+        """
+        Raise `AdmissionRejectedError` if a run would be rejected right away, allowing callers to reject a request
+        before starting a streaming response.
+        """
+        now = time.monotonic()
+        if deadline is not None and deadline <= now:
+            raise self._reject("Request deadline exceeded before the workflow started", 503, _rejected_deadline)
+
+        if self._in_flight < self.limit and not self._waiters:
+            return
+
+        if len(self._waiters) >= self.max_queue_size:
+            lowest = max(self._waiters, default=None)
+            if lowest is None or lowest.priority >= priority:
+                raise self._reject("Too many requests are waiting for the workflow", 429, _rejected_queue_full)
+
+        if deadline is not None and self._estimated_wait(priority) > deadline - now:
+            raise self._reject("The workflow cannot start before the request deadline", 503, _rejected_deadline)
+
+    @asynccontextmanager
+    async def acquire(self, priority: int = 0, deadline: float | None = None) -> typing.AsyncIterator[None]:
+        """
+        Wait for a slot to run a workflow.
+
+        Args:
+            priority (int): Runs of higher priority leave the queue first
+            deadline (float | None): The `time.monotonic` time after which the run is rejected if it hasn't started
+        """
+        self.check(priority, deadline)
+
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            await self._wait(priority, deadline)
+
+        start = time.monotonic()
+        completed = False
+        try:
+            yield
+            completed = True
+        finally:
+            # Cancelled and failed runs don't reflect the latency of the workflow
+            if completed:
+                self._observe_latency(start, time.monotonic() - start)
+            self._release()
+
+    async def _wait(self, priority: int, deadline: float | None) -> None:
+        if len(self._waiters) >= self.max_queue_size:
+            # `check` guarantees that a queued run has a lower priority
+            lowest = max(self._waiters)
+            self._remove(lowest)
+            lowest.future.set_exception(
+                self._reject("Request shed in favor of a higher priority request", 503, _rejected_shed))
+
+        waiter = _Waiter(priority, next(self._seq), asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiters, waiter)
+
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            # Unlike `wait_for`, `wait` never cancels the future, a slot granted at the same time is not lost
+            done, _ = await asyncio.wait((waiter.future, ), timeout=timeout)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        if not done:
+            self._abandon(waiter)
+            raise self._reject("Request deadline exceeded while waiting for the workflow", 503, _rejected_deadline)
+
+        waiter.future.result()
+
+    def _remove(self, waiter: _Waiter) -> None:
+        self._waiters.remove(waiter)
+        heapq.heapify(self._waiters)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        if not waiter.future.done():
+            self._remove(waiter)
+            waiter.future.cancel()
+        elif not waiter.future.cancelled() and waiter.future.exception() is None:
+            # The slot was granted but won't be used
+            self._release()
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < self.limit:
+            waiter = heapq.heappop(self._waiters)
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+    def _observe_latency(self, start: float, latency: float) -> None:
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += _LATENCY_EWMA_WEIGHT * (latency - self._latency)
+
+        if self.target_latency is None:
+            return
+
+        if latency > self.target_latency:
+            # Runs started before the last decrease ran under the previous limit, only decrease once per round trip
+            if start >= self._last_decrease:
+                self._limit = max(float(self.min_concurrency), self._limit * self.backoff_ratio)
+                self._last_decrease = time.monotonic()
+        elif self._in_flight >= self.limit:
+            self._limit = min(float(self.max_concurrency), self._limit + 1 / self._limit)
+
+        _concurrency_limit.set(self.limit)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import typing
 from enum import Enum
@@ -37,6 +38,7 @@ class RunnerState(Enum):
     RUNNING = 2
     COMPLETED = 3
     FAILED = 4
+    CANCELLED = 5
 
 
 _T = typing.TypeVar("_T")
@@ -114,7 +116,7 @@ class Runner:
 
         self._context_state.input_message.reset(self._input_message_token)
 
-        if (self._state not in (RunnerState.COMPLETED, RunnerState.FAILED)):
+        if (self._state not in (RunnerState.COMPLETED, RunnerState.FAILED, RunnerState.CANCELLED)):
             raise ValueError("Cannot exit the context without completing the workflow")
 
     @typing.overload
@@ -148,6 +150,9 @@ class Runner:
             self._state = RunnerState.COMPLETED
 
             return result
+        except asyncio.CancelledError:
+            self._cancel()
+            raise
         except Exception as e:
             logger.exception("Error running workflow: %s", e)
             event_stream = self._context_state.event_stream.get()
@@ -180,6 +185,10 @@ class Runner:
                 if event_stream:
                     event_stream.on_complete()
 
+        except (asyncio.CancelledError, GeneratorExit):
+            # Cancelled, or the consumer stopped iterating, e.g. because the client disconnected
+            self._cancel()
+            raise
         except Exception as e:
             logger.exception("Error running workflow: %s", e)
             event_stream = self._context_state.event_stream.get()
@@ -189,6 +198,13 @@ class Runner:
 
             raise
 
+    def _cancel(self) -> None:
+        logger.debug("Workflow run cancelled")
+        event_stream = self._context_state.event_stream.get()
+        if event_stream:
+            event_stream.on_complete()
+        self._state = RunnerState.CANCELLED
+
 
 # Compatibility aliases with previous releases
 AIQRunnerState = RunnerState
@@ -15,6 +15,7 @@
 
 import asyncio
 import contextvars
+import time
 import typing
 from collections.abc import Awaitable
 from collections.abc import Callable
@@ -32,9 +33,21 @@ from nat.data_models.authentication import AuthProviderBaseConfig
 from nat.data_models.config import Config
 from nat.data_models.interactive import HumanResponse
 from nat.data_models.interactive import InteractionPrompt
+from nat.observability.metrics import GlobalMetricsRegistry
+from nat.runtime.admission import REQUEST_TIMEOUT_HEADER
+from nat.runtime.admission import AdmissionController
+from nat.runtime.admission import parse_request_timeout
+from nat.runtime.admission import request_deadline
 
 _T = typing.TypeVar("_T")
 
+_session_queue_depth = GlobalMetricsRegistry.get().gauge(
+    "nat_session_queue_depth", "Number of workflow runs waiting for a session concurrency slot.").labels()
+_session_in_flight = GlobalMetricsRegistry.get().gauge("nat_session_in_flight",
+                                                       "Number of workflow runs currently executing.").labels()
+_session_wait_duration = GlobalMetricsRegistry.get().histogram(
+    "nat_session_semaphore_wait_seconds", "Time spent waiting for a session concurrency slot.").labels()
+
 
 class UserManagerBase:
     pass
@@ -42,7 +55,11 @@ class UserManagerBase:
 
 class SessionManager:
 
-    def __init__(self, workflow: Workflow, max_concurrency: int = 8):
+    def __init__(self,
+                 workflow: Workflow,
+                 max_concurrency: int = 8,
+                 admission_controller: AdmissionController | None = None,
+                 priority: int = 0):
         """
         The SessionManager class is used to run and manage a user workflow session. It runs and manages the context,
         and configuration of a workflow with the specified concurrency.
@@ -53,6 +70,11 @@ class SessionManager:
             The workflow to run
         max_concurrency : int, optional
             The maximum number of simultaneous workflow invocations, by default 8
+        admission_controller : AdmissionController | None, optional
+            Admission controller shared with other session managers, replaces `max_concurrency` when set, by default
+            None
+        priority : int, optional
+            Priority of the workflow runs in the admission controller queue, by default 0
         """
 
         if (workflow is None):
@@ -61,6 +83,8 @@ class SessionManager:
         self._workflow: Workflow = workflow
 
         self._max_concurrency = max_concurrency
+        self._admission_controller = admission_controller
+        self._priority = priority
         self._context_state = ContextState.get()
         self._context = Context(self._context_state)
 
@@ -86,6 +110,26 @@ class SessionManager:
     def context(self) -> Context:
         return self._context
 
+    @property
+    def max_concurrency(self) -> int:
+        """The maximum number of simultaneous workflow runs, 0 if unlimited."""
+        if self._admission_controller is not None:
+            return self._admission_controller.max_concurrency
+        return self._max_concurrency
+
+    def check_admission(self) -> None:
+        """
+        Raise `AdmissionRejectedError` if a workflow run of the current request would be rejected by the admission
+        controller. Used to reject streaming requests before their response starts.
+        """
+        if self._admission_controller is not None:
+            self._admission_controller.check(self._priority, request_deadline.get())
+
+    def _acquire_slot(self) -> typing.AsyncContextManager:
+        if self._admission_controller is not None:
+            return self._admission_controller.acquire(self._priority, request_deadline.get())
+        return self._semaphore
+
     @asynccontextmanager
     async def session(self,
                       user_manager=None,
@@ -127,13 +171,29 @@ class SessionManager:
         """
         Start a workflow run
         """
-        async with self._semaphore:
-            # Apply the saved context
-            for k, v in self._saved_context.items():
-                k.set(v)
-
-            async with self._workflow.run(message) as runner:
-                yield runner
+        queued = True
+        _session_queue_depth.inc()
+        wait_start_ns = time.perf_counter_ns()
+        try:
+            async with self._acquire_slot():
+                queued = False
+                _session_queue_depth.dec()
+                _session_wait_duration.observe_ns(time.perf_counter_ns() - wait_start_ns)
+                _session_in_flight.inc()
+
+                try:
+                    # Apply the saved context
+                    for k, v in self._saved_context.items():
+                        k.set(v)
+
+                    async with self._workflow.run(message) as runner:
+                        yield runner
+                finally:
+                    _session_in_flight.dec()
+        finally:
+            # Cancelled while waiting for a slot
+            if queued:
+                _session_queue_depth.dec()
 
     def set_metadata_from_http_request(self, request: HTTPConnection | None) -> None:
         """
@@ -154,6 +214,8 @@ class SessionManager:
         self._context.metadata._request.client_port = request.client.port
         self._context.metadata._request.cookies = request.cookies
 
+        request_deadline.set(parse_request_timeout(request.headers.get(REQUEST_TIMEOUT_HEADER)))
+
         if request.headers.get("conversation-id"):
             self._context_state.conversation_id.set(request.headers["conversation-id"])
 
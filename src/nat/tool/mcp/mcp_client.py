@@ -15,6 +15,8 @@
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 from contextlib import asynccontextmanager
 from enum import Enum
@@ -28,6 +30,7 @@ from pydantic import Field
 from pydantic import create_model
 
 from nat.tool.mcp.exceptions import MCPToolNotFoundError
+from nat.tool.mcp.mcp_session_pool import get_session_pool
 from nat.utils.exception_handlers.mcp import mcp_exception_handler
 
 logger = logging.getLogger(__name__)
@@ -107,6 +110,11 @@ def model_from_mcp_schema(name: str, mcp_input_schema: dict) -> type[BaseModel]:
     return create_model(f"{_generate_valid_classname(name)}InputSchema", **schema_dict)
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_model_from_mcp_schema(name: str, mcp_input_schema_json: str) -> type[BaseModel]:
+    return model_from_mcp_schema(name, json.loads(mcp_input_schema_json))
+
+
 class MCPSSEClient:
     """
     Client for creating a session and connecting to an MCP server using SSE
@@ -131,7 +139,9 @@ class MCPSSEClient:
 
 class MCPBuilder(MCPSSEClient):
     """
-    Builder class used to connect to an MCP Server and generate ToolClients
+    Builder class used to connect to an MCP Server and generate ToolClients.
+
+    Requests are sent over the sessions of the pool shared by all the clients of the server, see `MCPSessionPool`.
 
     Args:
         url (str): The url of the MCP server
@@ -140,6 +150,7 @@ class MCPBuilder(MCPSSEClient):
     def __init__(self, url):
         super().__init__(url)
         self._tools = None
+        self._tools_version = None
 
     @mcp_exception_handler
     async def get_tools(self):
@@ -152,13 +163,18 @@ class MCPBuilder(MCPSSEClient):
         Raises:
             MCPError: If connection or tool retrieval fails
         """
-        async with self.connect_to_sse_server() as session:
-            response = await session.list_tools()
+        pool = get_session_pool(self.url)
+        version = pool.tools_version
+        if self._tools is not None and self._tools_version == version:
+            return self._tools
 
-        return {
+        tools = await pool.list_tools()
+        self._tools = {
             tool.name: MCPToolClient(self.url, tool.name, tool.description, tool_input_schema=tool.inputSchema)
-            for tool in response.tools
+            for tool in tools
         }
+        self._tools_version = version
+        return self._tools
 
     @mcp_exception_handler
     async def get_tool(self, tool_name: str) -> MCPToolClient:
@@ -175,19 +191,16 @@ class MCPBuilder(MCPSSEClient):
             MCPToolNotFoundError: If no tool is available with that name
             MCPError: If connection fails
         """
-        if not self._tools:
-            self._tools = await self.get_tools()
+        tools = await self.get_tools()
 
-        tool = self._tools.get(tool_name)
+        tool = tools.get(tool_name)
         if not tool:
             raise MCPToolNotFoundError(tool_name, self.url)
         return tool
 
     @mcp_exception_handler
     async def call_tool(self, tool_name: str, tool_args: dict | None):
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(tool_name, tool_args)
-            return result
+        return await get_session_pool(self.url).call_tool(tool_name, tool_args)
 
 
 class MCPToolClient(MCPSSEClient):
@@ -205,7 +218,8 @@ class MCPToolClient(MCPSSEClient):
         super().__init__(url)
         self._tool_name = tool_name
         self._tool_description = tool_description
-        self._input_schema = model_from_mcp_schema(self._tool_name, tool_input_schema) if tool_input_schema else None
+        self._tool_input_schema = tool_input_schema
+        self._input_schema = None
 
     @property
     def name(self):
@@ -226,6 +240,10 @@ class MCPToolClient(MCPSSEClient):
         """
         Returns the tool's input_schema.
         """
+        # Built on first use, most tools served by a server are never used by a given workflow
+        if self._input_schema is None and self._tool_input_schema:
+            self._input_schema = _cached_model_from_mcp_schema(self._tool_name,
+                                                               json.dumps(self._tool_input_schema, sort_keys=True))
         return self._input_schema
 
     def set_description(self, description: str):
@@ -242,8 +260,7 @@ class MCPToolClient(MCPSSEClient):
         Args:
             tool_args (dict[str, Any]): A dictionary of key value pairs to serve as inputs for the MCP tool.
         """
-        async with self.connect_to_sse_server() as session:
-            result = await session.call_tool(self._tool_name, tool_args)
+        result = await get_session_pool(self.url).call_tool(self._tool_name, tool_args)
 
         output = []
         for res in result.content:
@@ -0,0 +1,275 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from contextlib import asynccontextmanager
+
+from mcp import ClientSession
+from mcp import types
+from mcp.client.sse import sse_client
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Opens the read and write streams of a connection to an MCP server
+TransportFactory = Callable[[], AbstractAsyncContextManager[tuple[typing.Any, typing.Any]]]
+
+
+class MCPSessionPoolMetrics(BaseModel):
+    """Health metrics of an `MCPSessionPool`."""
+    url: str
+    max_sessions: int
+    open_sessions: int
+    in_flight_requests: int
+    requests: int
+    failed_requests: int
+    connects: int
+    connection_failures: int
+    tool_list_cache_hits: int
+    tool_list_invalidations: int
+    last_error: str | None = None
+
+
+class _PooledSession:
+    """
+    A session owned by a background task.
+
+    The SSE transport is built on anyio task groups, which must be entered and exited by the same task. The session is
+    therefore opened and closed by a dedicated task, and is shared by any number of concurrent requests.
+    """
+
+    def __init__(self, transport: TransportFactory, message_handler: Callable):
+        self._transport = transport
+        self._message_handler = message_handler
+        self._task: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self.session: ClientSession | None = None
+        self.error: BaseException | None = None
+        self.in_flight = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.session is not None and not self._closing.is_set()
+
+    async def open(self) -> None:
+        self._task = asyncio.create_task(self._run())
+        await self._ready.wait()
+        if self.session is None:
+            raise self.error or ConnectionError("MCP session closed while connecting")
+
+    def mark_broken(self) -> None:
+        """Close the session, requests in flight fail with a connection closed error."""
+        self._closing.set()
+
+    async def close(self) -> None:
+        self._closing.set()
+        if self._task is not None:
+            await self._task
+
+    async def _handle_message(self, message) -> None:
+        if isinstance(message, Exception):
+            # The transport reports connection errors as messages, the session cannot be used anymore
+            logger.warning("MCP session transport failed: %s", message)
+            self.error = message
+            self.mark_broken()
+        await self._message_handler(message)
+
+    async def _run(self) -> None:
+        try:
+            async with self._transport() as (read, write):
+                async with ClientSession(read, write, message_handler=self._handle_message) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    await self._closing.wait()
+        except Exception as e:  # pylint: disable=broad-except
+            self.error = e
+            logger.debug("MCP session ended with error: %s", e, exc_info=True)
+        finally:
+            self.session = None
+            self._closing.set()
+            self._ready.set()
+
+
+class MCPSessionPool:
+    """
+    Long-lived sessions to an MCP server, shared by all the tools served by the server.
+
+    A session multiplexes concurrent requests, additional sessions are only opened while every open session has requests
+    in flight, up to `max_sessions`. Sessions which lose their connection are reopened by the next request. The tool
+    list is cached until the server sends a `notifications/tools/list_changed` notification or a session is reopened.
+
+    The pool can be used as an async context manager to keep its sessions open for the duration of the context, the
+    sessions are closed when the last context exits.
+
+    Args:
+        url (str): The url of the MCP server
+        max_sessions (int): The maximum number of sessions opened to the server
+        transport (TransportFactory | None): Opens a connection to the server, defaults to an SSE connection to `url`
+    """
+
+    def __init__(self, url: str, max_sessions: int = 1, transport: TransportFactory | None = None):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
+        self.url = url
+        self.max_sessions = max_sessions
+        self._transport = transport or (lambda: sse_client(url=url))
+        self._sessions: list[_PooledSession] = []
+        self._lock = asyncio.Lock()
+        self._references = 0
+
+        self._tools: list[types.Tool] | None = None
+        self._tools_version = 0
+
+        self._requests = 0
+        self._failed_requests = 0
+        self._connects = 0
+        self._connection_failures = 0
+        self._tool_list_cache_hits = 0
+        self._tool_list_invalidations = 0
+        self._last_error: str | None = None
+
+    async def __aenter__(self) -> MCPSessionPool:
+        self._references += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._references -= 1
+        if self._references == 0:
+            await self.aclose()
+
+    @property
+    def tools_version(self) -> int:
+        """Incremented each time the cached tool list is invalidated."""
+        return self._tools_version
+
+    def invalidate_tools(self) -> None:
+        self._tools = None
+        self._tools_version += 1
+        self._tool_list_invalidations += 1
+
+    async def _on_message(self, message) -> None:
+        if isinstance(message, types.ServerNotification) and isinstance(message.root,
+                                                                        types.ToolListChangedNotification):
+            logger.debug("Tool list of MCP server %s changed", self.url)
+            self.invalidate_tools()
+
+    async def _acquire(self) -> _PooledSession:
+        async with self._lock:
+            self._sessions = [pooled for pooled in self._sessions if pooled.is_open]
+
+            least_loaded = min(self._sessions, key=lambda pooled: pooled.in_flight, default=None)
+            if least_loaded is not None and (least_loaded.in_flight == 0 or len(self._sessions) >= self.max_sessions):
+                return least_loaded
+
+            pooled = _PooledSession(self._transport, self._on_message)
+            self._connects += 1
+            try:
+                await pooled.open()
+            except Exception as e:
+                self._connection_failures += 1
+                self._last_error = str(e)
+                raise
+
+            if not self._sessions and self._tools is not None:
+                # No notification could be received while no session was open, the cached tools may be stale
+                self.invalidate_tools()
+            self._sessions.append(pooled)
+            return pooled
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """Borrow an open session, other requests may use the same session concurrently."""
+        pooled = await self._acquire()
+        pooled.in_flight += 1
+        self._requests += 1
+        try:
+            yield pooled.session
+        except Exception as e:
+            self._failed_requests += 1
+            self._last_error = str(e)
+            raise
+        finally:
+            pooled.in_flight -= 1
+
+    async def call_tool(self, tool_name: str, tool_args: dict | None) -> types.CallToolResult:
+        async with self.session() as session:
+            return await session.call_tool(tool_name, tool_args)
+
+    async def list_tools(self) -> list[types.Tool]:
+        """Return the tools served by the server, from the cache when it is valid."""
+        if self._tools is not None:
+            self._tool_list_cache_hits += 1
+            return self._tools
+
+        version = self._tools_version
+        async with self.session() as session:
+            response = await session.list_tools()
+
+        # Don't cache a list which was invalidated while it was being retrieved
+        if version == self._tools_version:
+            self._tools = response.tools
+        return response.tools
+
+    def metrics(self) -> MCPSessionPoolMetrics:
+        return MCPSessionPoolMetrics(url=self.url,
+                                     max_sessions=self.max_sessions,
+                                     open_sessions=sum(1 for pooled in self._sessions if pooled.is_open),
+                                     in_flight_requests=sum(pooled.in_flight for pooled in self._sessions),
+                                     requests=self._requests,
+                                     failed_requests=self._failed_requests,
+                                     connects=self._connects,
+                                     connection_failures=self._connection_failures,
+                                     tool_list_cache_hits=self._tool_list_cache_hits,
+                                     tool_list_invalidations=self._tool_list_invalidations,
+                                     last_error=self._last_error)
+
+    async def aclose(self) -> None:
+        """Close all the sessions, the pool reopens sessions if it is used again."""
+        async with self._lock:
+            sessions, self._sessions = self._sessions, []
+        await asyncio.gather(*(pooled.close() for pooled in sessions))
+
+
+_session_pools: dict[str, tuple[asyncio.AbstractEventLoop, MCPSessionPool]] = {}
+
+
+def get_session_pool(url: str) -> MCPSessionPool:
+    """
+    Return the session pool shared by all the clients of the MCP server at `url`.
+
+    Sessions are bound to the event loop which opened them, a separate pool is created when called from another loop.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _session_pools.get(url)
+    if entry is None or entry[0] is not loop:
+        entry = (loop, MCPSessionPool(url))
+        _session_pools[url] = entry
+    return entry[1]
+
+
+def get_session_pool_metrics() -> list[MCPSessionPoolMetrics]:
+    """Return the metrics of the session pools of the running event loop."""
+    loop = asyncio.get_running_loop()
+    return [pool.metrics() for pool_loop, pool in _session_pools.values() if pool_loop is loop]
@@ -55,6 +55,7 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):  # pylint: disable=
 
     from nat.tool.mcp.mcp_client import MCPBuilder
     from nat.tool.mcp.mcp_client import MCPToolClient
+    from nat.tool.mcp.mcp_session_pool import get_session_pool
 
     client = MCPBuilder(url=str(config.url))
 
@@ -90,7 +91,9 @@ async def mcp_tool(config: MCPToolConfig, builder: Builder):  # pylint: disable=
             # If the tool call fails, raise the exception.
             raise
 
-    yield FunctionInfo.create(single_fn=_response_fn,
-                              description=tool.description,
-                              input_schema=tool.input_schema,
-                              converters=[_convert_from_str])
+    # The sessions to the server are shared by all the tools it serves, and closed once the last of them is torn down
+    async with get_session_pool(str(config.url)):
+        yield FunctionInfo.create(single_fn=_response_fn,
+                                  description=tool.description,
+                                  input_schema=tool.input_schema,
+                                  converters=[_convert_from_str])
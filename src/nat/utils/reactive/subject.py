@@ -13,7 +13,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import logging
 import threading
+from collections import deque
 from collections.abc import Callable
 from typing import TypeVar
 
@@ -22,6 +25,8 @@ from nat.utils.reactive.observable import Observable
 from nat.utils.reactive.observer import Observer
 from nat.utils.reactive.subscription import Subscription
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
 OnNext = Callable[[T], None]
@@ -32,9 +37,10 @@ OnComplete = Callable[[], None]
 class Subject(Observable[T], Observer[T], SubjectBase[T]):
     """
     A Subject is both an Observer (receives events) and an Observable (sends events).
-    - Maintains a list of ObserverBase[T].
+    - Maintains an immutable tuple of ObserverBase[T], replaced on subscribe and unsubscribe (copy-on-write).
     - No internal buffering or replay; events are only delivered to current subscribers.
-    - Thread-safe via a lock.
+    - Thread-safe: subscribing and unsubscribing are serialized by a lock, emitting items reads the current tuple
+      without taking the lock or copying it.
 
     Once on_error or on_complete is called, the Subject is closed.
     """
@@ -44,7 +50,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         self._lock = threading.RLock()
         self._closed = False
         self._error: Exception | None = None
-        self._observers: list[Observer[T]] = []
+        self._observers: tuple[Observer[T], ...] = ()
         self._disposed = False
 
     # ==========================================================================
@@ -60,9 +66,17 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
                 # Already disposed => no subscription
                 return Subscription(self, None)
 
-            self._observers.append(observer)
+            self._observers = (*self._observers, observer)
             return Subscription(self, observer)
 
+    @property
+    def has_observers(self) -> bool:
+        """
+        Whether any observer would receive an item emitted now. Producers can check this to skip building items which
+        are expensive to create.
+        """
+        return bool(self._observers) and not self._closed
+
     # ==========================================================================
     # ObserverBase[T] - for producers
     # ==========================================================================
@@ -71,14 +85,12 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         Called by producers to emit an item. Delivers synchronously to each observer.
         If closed or disposed, do nothing.
         """
-        with self._lock:
-            if self._closed or self._disposed:
-                return
-            # Copy the current observers to avoid mutation issues
-            current_observers = list(self._observers)
+        # Disposing sets `_closed`. The observers tuple is never mutated, observers subscribing or unsubscribing while
+        # the item is delivered don't affect this delivery.
+        if self._closed:
+            return
 
-        # Deliver outside the lock
-        for obs in current_observers:
+        for obs in self._observers:
             obs.on_next(value)
 
     def on_error(self, exc: Exception) -> None:
@@ -88,7 +100,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            current_obs = list(self._observers)
+            current_obs = self._observers
 
         for obs in current_obs:
             obs.on_error(exc)
@@ -101,7 +113,7 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if self._closed or self._disposed:
                 return
-            current_observers = list(self._observers)
+            current_observers = self._observers
             self.dispose()
 
         for obs in current_observers:
@@ -113,7 +125,8 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
     def _unsubscribe_observer(self, observer: Observer[T]) -> None:
         with self._lock:
             if not self._disposed and observer in self._observers:
-                self._observers.remove(observer)
+                index = self._observers.index(observer)
+                self._observers = self._observers[:index] + self._observers[index + 1:]
 
     # ==========================================================================
     # Disposal
@@ -126,6 +139,86 @@ class Subject(Observable[T], Observer[T], SubjectBase[T]):
         with self._lock:
             if not self._disposed:
                 self._disposed = True
-                self._observers.clear()
+                self._observers = ()
                 self._closed = True
                 self._error = None
+
+
+class _ErrorItem:
+    """Wraps an error queued by `AsyncDispatchSubject`, so that it can't be mistaken for an item."""
+
+    __slots__ = ("exc", )
+
+    def __init__(self, exc: Exception) -> None:
+        self.exc = exc
+
+
+_COMPLETE = object()
+
+
+class AsyncDispatchSubject(Subject[T]):
+    """
+    A Subject which delivers events to its observers from the event loop, instead of the producer's stack.
+
+    Producers only append the event to a queue, observers which are slow to process items don't delay the producer.
+    Events are delivered in order, each to the observers subscribed at the time it is delivered. Producers may emit
+    events from any thread, a single callback is scheduled on the loop for all the events queued until it runs.
+
+    Args:
+        loop (asyncio.AbstractEventLoop | None): The loop delivering the events, defaults to the running loop
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        super().__init__()
+        self._loop = loop if loop is not None else asyncio.get_running_loop()
+        self._pending: deque[object] = deque()
+        self._scheduled = False
+        self._stopped = False
+
+    @property
+    def pending(self) -> int:
+        """The number of events waiting to be delivered."""
+        return len(self._pending)
+
+    def on_next(self, value: T) -> None:
+        if self._stopped or self._closed:
+            return
+        self._enqueue(value)
+
+    def on_error(self, exc: Exception) -> None:
+        if self._stopped or self._closed:
+            return
+        self._enqueue(_ErrorItem(exc))
+
+    def on_complete(self) -> None:
+        # Events queued before completion are still delivered, the Subject is closed once they are
+        if self._stopped or self._closed:
+            return
+        self._stopped = True
+        self._enqueue(_COMPLETE)
+
+    def dispose(self) -> None:
+        super().dispose()
+        self._pending.clear()
+
+    def _enqueue(self, event: object) -> None:
+        self._pending.append(event)
+        if not self._scheduled:
+            self._scheduled = True
+            self._loop.call_soon_threadsafe(self._deliver_pending)
+
+    def _deliver_pending(self) -> None:
+        # Reset before draining, an event queued after the queue is found empty schedules another callback
+        self._scheduled = False
+        pending = self._pending
+        while pending:
+            event = pending.popleft()
+            try:
+                if event is _COMPLETE:
+                    super().on_complete()
+                elif isinstance(event, _ErrorItem):
+                    super().on_error(event.exc)
+                else:
+                    super().on_next(event)
+            except Exception as e:
+                logger.exception("Error delivering event to observers: %s", e)
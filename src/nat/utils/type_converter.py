@@ -30,9 +30,27 @@ class ConvertException(Exception):
     pass
 
 
+# A sequence of converters applied one after the other, the empty path converts a value to itself
+_ConversionPath = tuple[Callable[[typing.Any], typing.Any], ...]
+
+
+class _PathSearch:
+    """State of the resolution of a conversion path."""
+
+    __slots__ = ("cacheable", )
+
+    def __init__(self):
+        # Whether the outcome only depends on the type of the data, which is not the case when a converter rejects a
+        # specific value
+        self.cacheable = True
+
+
 class TypeConverter:
     _global_initialized = False
 
+    # Incremented whenever a converter is added to any converter, converters inherit the converters of their parent
+    _generation = 0
+
     def __init__(self, converters: list[Callable[[typing.Any], typing.Any]], parent: "TypeConverter | None" = None):
         """
         Parameters
@@ -46,6 +64,10 @@ class TypeConverter:
         self._converters: OrderedDict[type, OrderedDict[type, Callable]] = OrderedDict()
         self._indirect_warnings_shown: set[tuple[type, type]] = set()
 
+        # dict[(from_type, to_type), path], a path of None records that no conversion exists
+        self._path_cache: dict[tuple[type, typing.Any], _ConversionPath | None] = {}
+        self._path_cache_generation = TypeConverter._generation
+
         for converter in converters:
             self.add_converter(converter)
 
@@ -83,27 +105,73 @@ class TypeConverter:
         self._converters.setdefault(to_type, OrderedDict())[from_type] = converter
         # to do(MDD): If needed, sort by specificity here.
 
+        # Resolved paths may no longer be the preferred ones, in this converter or in any of its children
+        TypeConverter._generation += 1
+
+    def _get_cached_path(self, key: tuple[type, typing.Any]) -> _ConversionPath | None:
+        """Return the cached path for `key`, raises KeyError if the path was not resolved yet."""
+        if self._path_cache_generation != TypeConverter._generation:
+            self._path_cache.clear()
+            self._path_cache_generation = TypeConverter._generation
+        return self._path_cache[key]
+
     def _convert(self, data: typing.Any, to_type: type[_T]) -> _T | None:
         """
         Attempts to convert `data` into `to_type`. Returns None if no path is found.
+
+        The path resolved for a pair of source and target types is cached, as well as the absence of a path, so that
+        later conversions between the same types apply the converters without searching for them.
         """
+        if to_type is None:
+            return data
+
+        key = (type(data), to_type)
+        try:
+            path = self._get_cached_path(key)
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable target type, e.g. annotated with unhashable metadata
+            key = None
+        else:
+            if path is None:
+                return None
+            try:
+                result = data
+                for converter in path:
+                    result = converter(result)
+                if result is not None:
+                    return result
+            except ConvertException:
+                pass
+            # The cached path rejected this value, fall back to a full resolution
+
+        search = _PathSearch()
+        resolved = self._resolve(data, to_type, search)
+
+        if key is not None and search.cacheable:
+            self._path_cache[key] = resolved[1] if resolved is not None else None
+
+        return resolved[0] if resolved is not None else None
+
+    def _resolve(self, data: typing.Any, to_type: type[_T], search: _PathSearch) -> tuple[_T, _ConversionPath] | None:
         decomposed = DecomposedType(to_type)
 
         # 1) If data is already correct type, return it
-        if to_type is None or decomposed.is_instance((data, to_type)):
-            return data
+        if decomposed.is_instance((data, to_type)):
+            return data, ()
 
         root = decomposed.root
 
         # 2) Attempt direct in *this* converter
-        direct_result = self._try_direct_conversion(data, root)
-        if direct_result is not None:
-            return direct_result
+        direct = self._try_direct_conversion(data, root, search)
+        if direct is not None and direct[0] is not None:
+            return direct
 
         # 3) If direct fails entirely, do indirect in *this* converter
-        indirect_result = self._try_indirect_convert(data, to_type)
-        if indirect_result is not None:
-            return indirect_result
+        indirect = self._try_indirect_convert(data, to_type, search)
+        if indirect is not None and indirect[0] is not None:
+            return indirect
 
         # 4) If we still haven't succeeded, return None
         return None
@@ -166,7 +234,8 @@ class TypeConverter:
     # -------------------------------------------------
     # INTERNAL DIRECT CONVERSION (with parent fallback)
     # -------------------------------------------------
-    def _try_direct_conversion(self, data: typing.Any, target_root_type: type) -> typing.Any | None:
+    def _try_direct_conversion(self, data: typing.Any, target_root_type: type,
+                               search: _PathSearch) -> tuple[typing.Any, _ConversionPath] | None:
         """
         Tries direct conversion in *this* converter's registry.
         If no match here, we forward to parent's direct conversion
@@ -178,26 +247,30 @@ class TypeConverter:
                 for convert_from_type, from_type_converter in to_type_converters.items():
                     if isinstance(data, DecomposedType(convert_from_type).root):
                         try:
-                            return from_type_converter(data)
+                            result = from_type_converter(data)
+                            if result is None:
+                                search.cacheable = False
+                            return result, (from_type_converter, )
                         except ConvertException:
-                            pass
+                            search.cacheable = False
 
         # If we can't convert directly here, try parent
         if self._parent is not None:
-            return self._parent._try_direct_conversion(data, target_root_type)
+            return self._parent._try_direct_conversion(data, target_root_type, search)
 
         return None
 
     # -------------------------------------------------
     # INTERNAL INDIRECT CONVERSION (with parent fallback)
     # -------------------------------------------------
-    def _try_indirect_convert(self, data: typing.Any, to_type: type[_T]) -> _T | None:
+    def _try_indirect_convert(self, data: typing.Any, to_type: type[_T],
+                              search: _PathSearch) -> tuple[_T, _ConversionPath] | None:
         """
         Attempt indirect conversion (DFS) in *this* converter.
         If no success, fallback to parent's indirect attempt.
         """
         visited = set()
-        final = self._try_indirect_conversion(data, to_type, visited)
+        final = self._try_indirect_conversion(data, to_type, visited, search)
         if final is not None:
             # Warn once if found a chain
             self._maybe_warn_indirect(type(data), to_type)
@@ -205,21 +278,22 @@ class TypeConverter:
 
         # If no success, try parent's indirect
         if self._parent is not None:
-            parent_final = self._parent._try_indirect_convert(data, to_type)
+            parent_final = self._parent._try_indirect_convert(data, to_type, search)
             if parent_final is not None:
                 self._maybe_warn_indirect(type(data), to_type)
                 return parent_final
 
         return None
 
-    def _try_indirect_conversion(self, data: typing.Any, to_type: type[_T], visited: set[type]) -> _T | None:
+    def _try_indirect_conversion(self, data: typing.Any, to_type: type[_T], visited: set[type],
+                                 search: _PathSearch) -> tuple[_T, _ConversionPath] | None:
         """
         DFS attempt to find a chain of conversions from type(data) to to_type,
         ignoring parent. If not found, returns None.
         """
         # 1) If data is already correct type
         if isinstance(data, to_type):
-            return data
+            return data, ()
 
         current_type = type(data)
         if current_type in visited:
@@ -234,13 +308,13 @@ class TypeConverter:
                     try:
                         next_data = from_type_converter(data)
                         if isinstance(next_data, to_type):
-                            return next_data
+                            return next_data, (from_type_converter, )
                         # else keep going
-                        deeper = self._try_indirect_conversion(next_data, to_type, visited)
+                        deeper = self._try_indirect_conversion(next_data, to_type, visited, search)
                         if deeper is not None:
-                            return deeper
+                            return deeper[0], (from_type_converter, ) + deeper[1]
                     except ConvertException:
-                        pass
+                        search.cacheable = False
 
         return None
 
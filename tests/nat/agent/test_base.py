@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 from unittest.mock import AsyncMock
 from unittest.mock import Mock
@@ -39,6 +40,8 @@ class MockBaseAgent(BaseAgent):
         self.tools[1].name = "Tool B"
         self.callbacks = []
         self.detailed_logs = detailed_logs
+        self.tool_concurrency_limits = {}
+        self._tool_semaphores = {}
 
     async def _build_graph(self, state_schema: type) -> CompiledGraph:
         """Mock implementation."""
@@ -191,7 +194,8 @@ class TestCallTool:
         assert isinstance(result, ToolMessage)
         assert result.content == "Tool response"
         assert tool.ainvoke.call_count == 2
-        mock_sleep.assert_called_once_with(2)  # 2^1 = 2 seconds for first retry
+        mock_sleep.assert_called_once()
+        assert 0 <= mock_sleep.call_args.args[0] <= 2  # jittered within 2^1 = 2 seconds for first retry
 
     async def test_tool_call_all_retries_exhausted(self, base_agent):
         """Test that tool call returns error message when all retries are exhausted."""
@@ -209,7 +213,7 @@ class TestCallTool:
         assert tool.ainvoke.call_count == 2  # 2 total attempts with max_retries=2
         # Should have called sleep once: 2^1=2 (only first attempt fails and retries)
         assert mock_sleep.call_count == 1
-        mock_sleep.assert_called_once_with(2)
+        assert 0 <= mock_sleep.call_args.args[0] <= 2
 
     async def test_tool_call_none_response(self, base_agent):
         """Test handling of None response from tool."""
@@ -251,6 +255,70 @@ class TestCallTool:
         assert "Tool call failed after all retry attempts" in result.content
         assert tool.ainvoke.call_count == 0
 
+    async def test_tool_call_timeout(self, base_agent):
+        """Test that a tool call is abandoned once its deadline passes, without retrying."""
+        tool = base_agent.tools[0]  # Tool A
+
+        async def _slow_tool(*_args, **_kwargs):
+            await asyncio.sleep(10)
+
+        tool.ainvoke = AsyncMock(side_effect=_slow_tool)
+
+        result = await base_agent._call_tool(tool, {"query": "test"}, max_retries=3, timeout=0.05)
+
+        assert result.status == "error"
+        assert "timed out" in result.content
+        assert tool.ainvoke.call_count == 1
+
+    async def test_tool_call_no_retry_past_deadline(self, base_agent):
+        """Test that a retry whose backoff would end past the deadline is not attempted."""
+        tool = base_agent.tools[0]  # Tool A
+        tool.ainvoke = AsyncMock(side_effect=Exception("Error"))
+
+        with patch('nat.agent.base.random.uniform', return_value=2.0), \
+                patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await base_agent._call_tool(tool, {"query": "test"}, max_retries=3, timeout=1.0)
+
+        assert result.status == "error"
+        assert tool.ainvoke.call_count == 1
+        mock_sleep.assert_not_called()
+
+    async def test_tool_concurrency_limit(self, base_agent):
+        """Test that concurrent calls of a tool are bounded by its concurrency limit."""
+        base_agent.tool_concurrency_limits = {"Tool A": 2}
+        tool = base_agent.tools[0]  # Tool A
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _tool(*_args, **_kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "Tool response"
+
+        tool.ainvoke = AsyncMock(side_effect=_tool)
+
+        results = await asyncio.gather(*(base_agent._call_tool(tool, {"query": "test"}) for _ in range(6)))
+
+        assert [result.content for result in results] == ["Tool response"] * 6
+        assert max_in_flight == 2
+
+    async def test_tool_call_cancellation(self, base_agent):
+        """Test that cancelling a tool call during its retry backoff is not swallowed."""
+        tool = base_agent.tools[0]  # Tool A
+        tool.ainvoke = AsyncMock(side_effect=Exception("Error"))
+
+        with patch('nat.agent.base.random.uniform', return_value=10.0):
+            task = asyncio.create_task(base_agent._call_tool(tool, {"query": "test"}, max_retries=3))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert tool.ainvoke.call_count == 1
+
 
 class TestLogToolResponse:
     """Test the _log_tool_response method."""
@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
 from unittest.mock import patch
 
 import pytest
@@ -218,10 +220,9 @@ async def test_executor_node_handle_input_types(mock_rewoo_agent):
                                      _create_step_info("step2", "#E2", "mock_tool_B", "arg3, arg4")
                                  ]),
                                  intermediate_results={})
+    # The steps are independent and are both run by a single call of the executor node
     await mock_rewoo_agent.executor_node(mock_state)
     assert isinstance(mock_state.intermediate_results["#E1"].content, str)
-    # Call executor node again to make sure the intermediate result is correctly processed in the next step
-    await mock_rewoo_agent.executor_node(mock_state)
     assert isinstance(mock_state.intermediate_results["#E2"].content, str)
 
     mock_state = ReWOOGraphState(
@@ -238,12 +239,11 @@ async def test_executor_node_handle_input_types(mock_rewoo_agent):
             _create_step_info("step2", "#E2", "mock_tool_B", {"query": "#E1"})
         ]),
         intermediate_results={})
+    # The second step depends on the first one, it is run with the intermediate result of the first step
     await mock_rewoo_agent.executor_node(mock_state)
     # The actual behavior is that dict input gets converted to string representation
     # and stored as string content in ToolMessage
     assert isinstance(mock_state.intermediate_results["#E1"].content, str)
-    # Call executor node again to make sure the intermediate result is correctly processed in the next step
-    await mock_rewoo_agent.executor_node(mock_state)
     assert isinstance(mock_state.intermediate_results["#E2"].content, str)
 
 
@@ -265,6 +265,94 @@ async def test_executor_node_should_not_be_invoked_after_all_steps_executed(mock
         await mock_rewoo_agent.executor_node(mock_state)
 
 
+def test_step_dependencies():
+    steps = [_create_step_info(f"step{i}", f"#E{i}", "mock_tool_A", "arg") for i in range(1, 11)]
+    steps.append(_create_step_info("step11", "#E11", "mock_tool_A", "Combine #E10 and #E2"))
+    steps.append(_create_step_info("step12", "#E12", "mock_tool_B", {"query": "#E11", "other": "#E13"}))
+    steps.append(_create_step_info("step13", "#E13", "mock_tool_B", "arg"))
+
+    dependencies = ReWOOAgentGraph._get_step_dependencies(steps)
+
+    assert dependencies[:10] == [set()] * 10
+    # "#E10" does not reference "#E1"
+    assert dependencies[10] == {1, 9}
+    # A later step is not a dependency
+    assert dependencies[11] == {10}
+
+
+def _create_timed_agent(mock_llm, mock_tool, max_concurrent_steps):
+    from nat.agent.rewoo_agent.prompt import PLANNER_SYSTEM_PROMPT
+    from nat.agent.rewoo_agent.prompt import PLANNER_USER_PROMPT
+    from nat.agent.rewoo_agent.prompt import SOLVER_SYSTEM_PROMPT
+    from nat.agent.rewoo_agent.prompt import SOLVER_USER_PROMPT
+
+    agent = ReWOOAgentGraph(llm=mock_llm,
+                            planner_prompt=ChatPromptTemplate([("system", PLANNER_SYSTEM_PROMPT),
+                                                               ("user", PLANNER_USER_PROMPT)]),
+                            solver_prompt=ChatPromptTemplate([("system", SOLVER_SYSTEM_PROMPT),
+                                                              ("user", SOLVER_USER_PROMPT)]),
+                            tools=[mock_tool('mock_tool_A'), mock_tool('mock_tool_B')],
+                            max_concurrent_steps=max_concurrent_steps)
+
+    calls = []
+    running = 0
+    max_running = 0
+
+    async def call_tool(tool, tool_input, config, max_retries):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        calls.append(tool_input)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return f"{tool.name}({tool_input})"
+
+    agent._call_tool = call_tool
+    return agent, calls, lambda: max_running
+
+
+@pytest.mark.parametrize("max_concurrent_steps,expected_max_running", [(4, 3), (2, 2), (1, 1)])
+async def test_executor_node_runs_independent_steps_concurrently(mock_llm,
+                                                                 mock_tool,
+                                                                 max_concurrent_steps,
+                                                                 expected_max_running):
+    agent, calls, max_running = _create_timed_agent(mock_llm, mock_tool, max_concurrent_steps)
+    state = ReWOOGraphState(task=HumanMessage(content="This is a task"),
+                            steps=AIMessage(content=[
+                                _create_step_info("step1", "#E1", "mock_tool_A", "brightness"),
+                                _create_step_info("step2", "#E2", "mock_tool_B", "content"),
+                                _create_step_info("step3", "#E3", "mock_tool_A", "summary of #E1 and #E2"),
+                                _create_step_info("step4", "#E4", "mock_tool_B", "colors"),
+                            ]))
+
+    result = await agent.executor_node(state)
+
+    assert max_running() == expected_max_running
+    # The dependent step is run after the steps it depends on, with their outputs
+    assert calls.index("summary of mock_tool_A(brightness) and mock_tool_B(content)") >= 2
+    assert list(result["intermediate_results"]) == ["#E1", "#E2", "#E3", "#E4"]
+    assert await agent.conditional_edge(state) == AgentDecision.END
+
+
+async def test_executor_node_pipelines_dependent_steps(mock_llm, mock_tool):
+    agent, _, _ = _create_timed_agent(mock_llm, mock_tool, max_concurrent_steps=4)
+    # Two chains of two steps, the plan completes in the time of a single chain
+    state = ReWOOGraphState(task=HumanMessage(content="This is a task"),
+                            steps=AIMessage(content=[
+                                _create_step_info("step1", "#E1", "mock_tool_A", "a"),
+                                _create_step_info("step2", "#E2", "mock_tool_A", "b"),
+                                _create_step_info("step3", "#E3", "mock_tool_B", "#E1"),
+                                _create_step_info("step4", "#E4", "mock_tool_B", "#E2"),
+                            ]))
+
+    start = time.perf_counter()
+    await agent.executor_node(state)
+
+    # Running the steps in order would take 0.2 seconds
+    assert time.perf_counter() - start < 0.18
+    assert state.intermediate_results["#E4"].content == "mock_tool_B(mock_tool_A(b))"
+
+
 def test_validate_planner_prompt_no_input():
     mock_prompt = ''
     with pytest.raises(ValueError):
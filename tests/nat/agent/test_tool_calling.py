@@ -13,12 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
+
 import pytest
 from langchain_core.messages import AIMessage
 from langchain_core.messages import HumanMessage
 from langchain_core.messages import ToolMessage
 from langgraph.graph.graph import CompiledGraph
-from langgraph.prebuilt import ToolNode
 
 from nat.agent.base import AgentDecision
 from nat.agent.tool_calling_agent.agent import ToolCallAgentGraph
@@ -51,8 +53,7 @@ def test_tool_calling_agent_init(mock_config_tool_calling_agent, mock_llm, mock_
     assert agent.llm == mock_llm
     assert agent.tools == tools
     assert agent.detailed_logs == mock_config_tool_calling_agent.verbose
-    assert isinstance(agent.tool_caller, ToolNode)
-    assert list(agent.tool_caller.tools_by_name.keys()) == ['Tool A', 'Tool B']
+    assert list(agent.tools_by_name.keys()) == ['Tool A', 'Tool B']
 
 
 @pytest.fixture(name='mock_tool_agent', scope="module")
@@ -129,6 +130,111 @@ async def test_tool_node_final_answer(mock_tool_agent):
     assert response.name == 'Tool A'
 
 
+def _tool_call(name: str, query: str, call_id: str) -> dict:
+    return {"name": name, "args": {"query": query}, "id": call_id, "type": "tool_call"}
+
+
+async def test_tool_node_runs_tool_calls_concurrently(mock_llm, mock_tool):
+    tools = [mock_tool('Tool A'), mock_tool('Tool B')]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _slow_arun(query, **_kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.1)
+        in_flight -= 1
+        return query
+
+    for tool in tools:
+        object.__setattr__(tool, '_arun', _slow_arun)
+
+    agent = ToolCallAgentGraph(llm=mock_llm, tools=tools, tool_concurrency_limits={'Tool A': 2})
+    message = AIMessage(content='',
+                        tool_calls=[
+                            _tool_call('Tool A', 'a1', 'call-1'),
+                            _tool_call('Tool A', 'a2', 'call-2'),
+                            _tool_call('Tool A', 'a3', 'call-3'),
+                            _tool_call('Tool B', 'b1', 'call-4'),
+                        ])
+    state = ToolCallAgentGraphState(messages=[HumanMessage(content='hello, world!'), message])
+
+    start = time.perf_counter()
+    state = await agent.tool_node(state)
+    elapsed = time.perf_counter() - start
+
+    # 'Tool A' is limited to 2 concurrent calls, its third call runs once one of the first two completes
+    assert max_in_flight == 3
+    assert elapsed < 0.3
+    responses = state.messages[2:]
+    assert [response.tool_call_id for response in responses] == ['call-1', 'call-2', 'call-3', 'call-4']
+    assert [response.content for response in responses] == ['a1', 'a2', 'a3', 'b1']
+
+
+async def test_tool_node_unknown_tool(mock_tool_agent):
+    message = AIMessage(content='', tool_calls=[_tool_call('Tool C', 'query', 'call-1')])
+    state = ToolCallAgentGraphState(messages=[HumanMessage(content='hello, world!'), message])
+    response = (await mock_tool_agent.tool_node(state)).messages[-1]
+    assert response.status == 'error'
+    assert response.tool_call_id == 'call-1'
+    assert 'There is no tool named Tool C' in response.content
+
+
+class _ToolError(Exception):
+    pass
+
+
+async def test_tool_node_raises_unhandled_tool_errors(mock_llm, mock_tool):
+    tool = mock_tool('Tool A')
+
+    async def _failing_arun(query, **_kwargs):
+        raise _ToolError(query)
+
+    object.__setattr__(tool, '_arun', _failing_arun)
+
+    message = AIMessage(content='', tool_calls=[_tool_call('Tool A', 'query', 'call-1')])
+    state = ToolCallAgentGraphState(messages=[HumanMessage(content='hello, world!'), message])
+
+    # The exception of the tool is raised as is
+    agent = ToolCallAgentGraph(llm=mock_llm, tools=[tool], handle_tool_errors=False)
+    with pytest.raises(_ToolError, match='query'):
+        await agent.tool_node(state)
+
+    agent = ToolCallAgentGraph(llm=mock_llm, tools=[tool])
+    response = (await agent.tool_node(state)).messages[-1]
+    assert response.status == 'error'
+    assert response.tool_call_id == 'call-1'
+    assert 'Last error: query' in response.content
+
+
+@pytest.mark.parametrize('output, expected_content',
+                         [
+                             ({
+                                 'a': 1
+                             }, '{"a": 1}'),
+                             ([1, 2], '[1, 2]'),
+                             ([{
+                                 'type': 'text', 'text': 'hello'
+                             }], [{
+                                 'type': 'text', 'text': 'hello'
+                             }]),
+                         ])
+async def test_tool_node_serializes_tool_outputs(mock_llm, mock_tool, output, expected_content):
+    tool = mock_tool('Tool A')
+
+    async def _arun(query, **_kwargs):
+        return output
+
+    object.__setattr__(tool, '_arun', _arun)
+
+    agent = ToolCallAgentGraph(llm=mock_llm, tools=[tool])
+    message = AIMessage(content='', tool_calls=[_tool_call('Tool A', 'query', 'call-1')])
+    state = ToolCallAgentGraphState(messages=[HumanMessage(content='hello, world!'), message])
+    response = (await agent.tool_node(state)).messages[-1]
+    assert response.content == expected_content
+
+
 @pytest.fixture(name="mock_tool_graph", scope="module")
 async def mock_graph(mock_tool_agent):
     return await mock_tool_agent.build_graph()
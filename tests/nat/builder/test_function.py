@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
 import typing
 from collections.abc import AsyncGenerator
 from types import NoneType
@@ -21,12 +23,14 @@ import pytest
 from pydantic import BaseModel
 
 from nat.builder.builder import Builder
+from nat.builder.context import ContextState
 from nat.builder.function import Function
 from nat.builder.function import LambdaFunction
 from nat.builder.function_info import FunctionInfo
 from nat.builder.workflow_builder import WorkflowBuilder
 from nat.cli.register_workflow import register_function
 from nat.data_models.function import FunctionBaseConfig
+from nat.utils.reactive.subject import Subject
 
 
 class DummyConfig(FunctionBaseConfig, name="dummy"):
@@ -41,6 +45,14 @@ class LambdaStreamFnConfig(FunctionBaseConfig, name="test_lambda_stream"):
     pass
 
 
+class BatchFnConfig(FunctionBaseConfig, name="test_batch"):
+    max_batch_size: int | None = None
+
+
+# Inputs of each call of the single and batch implementations of the `test_batch` function
+_batch_fn_calls: list[list[str]] = []
+
+
 @pytest.fixture(scope="module", autouse=True)
 async def _register_lambda_fn():
 
@@ -71,6 +83,27 @@ async def _register_lambda_stream_fn():
         yield FunctionInfo.from_fn(_inner_stream, converters=[_convert])
 
 
+@pytest.fixture(scope="module", autouse=True)
+async def _register_batch_fn():
+
+    @register_function(config_type=BatchFnConfig)
+    async def register(config: BatchFnConfig, b: Builder):
+
+        calls = _batch_fn_calls
+
+        async def _inner(some_input: str) -> str:
+            calls.append([some_input])
+            return some_input + "!"
+
+        async def _inner_batch(some_inputs: list[str]) -> list[str]:
+            calls.append(some_inputs)
+            if "fail" in some_inputs:
+                raise ValueError("Batch failed")
+            return [some_input + "!" for some_input in some_inputs]
+
+        yield FunctionInfo.from_fn(_inner, batch_fn=_inner_batch, max_batch_size=config.max_batch_size)
+
+
 async def test_direct_create_with_lambda():
 
     async with WorkflowBuilder() as builder:
@@ -682,3 +715,78 @@ async def test_astream_primitive_type_conversion_failure():
         with pytest.raises(ValueError, match="Cannot convert type .* to .* No match found"):
             async for output in fn_obj.astream("test", to_type=dict):
                 pass  # The exception should be raised during the first iteration
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+async def test_ainvoke_overhead_benchmark():
+    # Per call overhead of `Function.ainvoke`, intermediate step payloads are only built when the event stream is observed
+    context_state = ContextState.get()
+    num_calls = 20_000
+
+    async with WorkflowBuilder() as builder:
+        fn_obj = await builder.add_function(name="test_function", config=LambdaFnConfig())
+
+        async def _measure() -> float:
+            start = time.perf_counter()
+            for _ in range(num_calls):
+                await fn_obj.ainvoke("test", to_type=str)
+            return (time.perf_counter() - start) / num_calls * 1e6
+
+        token = context_state.event_stream.set(Subject())
+        try:
+            unobserved_us = await _measure()
+
+            context_state.event_stream.get().subscribe(lambda step: None)
+            observed_us = await _measure()
+        finally:
+            context_state.event_stream.reset(token)
+
+    print(f"Function.ainvoke overhead: {unobserved_us:.1f}us unobserved, {observed_us:.1f}us observed")
+    assert unobserved_us < observed_us
+
+
+async def test_batch_fn_combines_concurrent_invocations():
+
+    async with WorkflowBuilder() as builder:
+        fn_obj = await builder.add_function(name="test_function", config=BatchFnConfig(max_batch_size=3))
+        calls = _batch_fn_calls
+        calls.clear()
+
+        # A single invocation uses the single implementation
+        assert await fn_obj.ainvoke("a", to_type=str) == "a!"
+        assert calls == [["a"]]
+        calls.clear()
+
+        results = await asyncio.gather(*(fn_obj.ainvoke(str(i), to_type=str) for i in range(5)))
+        assert results == [f"{i}!" for i in range(5)]
+        assert calls == [["0", "1", "2"], ["3", "4"]]
+        calls.clear()
+
+        # A failed batch fails every invocation of the batch
+        results = await asyncio.gather(fn_obj.ainvoke("b"), fn_obj.ainvoke("fail"), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_batch_fn_validation():
+
+    async def _inner(some_input: str) -> str:
+        return some_input
+
+    async def _inner_stream(some_input: str) -> AsyncGenerator[str]:
+        yield some_input
+
+    def _sync_batch(some_inputs: list[str]) -> list[str]:
+        return some_inputs
+
+    async def _batch(some_inputs: list[str]) -> list[str]:
+        return some_inputs
+
+    with pytest.raises(ValueError, match="batch_fn must be a coroutine"):
+        FunctionInfo.from_fn(_inner, batch_fn=_sync_batch)
+
+    with pytest.raises(ValueError, match="single_fn must be provided if batch_fn is provided"):
+        FunctionInfo.from_fn(_inner_stream, batch_fn=_batch)
+
+    with pytest.raises(ValueError, match="max_batch_size must be at least 1"):
+        FunctionInfo.from_fn(_inner, batch_fn=_batch, max_batch_size=0)
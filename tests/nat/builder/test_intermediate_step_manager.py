@@ -25,9 +25,12 @@ from nat.builder.context import Context
 from nat.builder.context import ContextState
 from nat.builder.intermediate_step_manager import IntermediateStepManager
 from nat.builder.intermediate_step_manager import IntermediateStepPayload
+from nat.builder.intermediate_step_manager import StepRecord
 from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepState
 from nat.data_models.intermediate_step import IntermediateStepType
 from nat.data_models.invocation_node import InvocationNode
+from nat.utils.reactive.subject import Subject
 
 # --------------------------------------------------------------------------- #
 # Minimal stubs so the tests do not need the whole NAT code-base
@@ -295,3 +298,75 @@ async def test_async_with_task_end(mgr: IntermediateStepManager, output_steps: l
         assert child == actual.name
         assert parent is None or parent == actual.parent_id
         assert etype == actual.event_type
+
+
+@pytest.fixture(name="unobserved_mgr")
+def unobserved_mgr_fixture(ctx_state: ContextState):
+    """Manager whose event stream has no subscribers."""
+    token = ctx_state.event_stream.set(Subject())
+    yield IntermediateStepManager(context_state=ctx_state)
+    ctx_state.event_stream.reset(token)
+
+
+def _lazy_push(mgr: IntermediateStepManager, step_id: str, etype: IntermediateStepType, built: list[str]):
+
+    def _factory():
+        built.append(step_id)
+        return _payload(step_id=step_id, name=step_id, etype=etype)
+
+    state = IntermediateStepState.START if etype.value.endswith("_START") else IntermediateStepState.END
+    mgr.push_lazy_intermediate_step(StepRecord(UUID=step_id, event_type=etype, event_state=state, name=step_id),
+                                    _factory)
+
+
+def test_lazy_step_without_observers_skips_payload(ctx: Context, unobserved_mgr: IntermediateStepManager):
+    built = []
+
+    _lazy_push(unobserved_mgr, "outer", IntermediateStepType.FUNCTION_START, built)
+    assert ctx.active_span_id == "outer"
+
+    # Lazy steps can be mixed with regular steps
+    inner = _payload(step_id="inner")
+    unobserved_mgr.push_intermediate_step(inner)
+    assert ctx.active_span_id == "inner"
+    unobserved_mgr.push_intermediate_step(_payload(step_id="inner", etype=IntermediateStepType.LLM_END))
+
+    assert ctx.active_span_id == "outer"
+    _lazy_push(unobserved_mgr, "outer", IntermediateStepType.FUNCTION_END, built)
+
+    assert not built
+    assert not unobserved_mgr._outstanding_start_steps
+
+
+def test_lazy_step_with_observers_builds_payload(mgr: IntermediateStepManager, output_steps: list[IntermediateStep]):
+    built = []
+
+    _lazy_push(mgr, "outer", IntermediateStepType.FUNCTION_START, built)
+    _lazy_push(mgr, "inner", IntermediateStepType.FUNCTION_START, built)
+    _lazy_push(mgr, "inner", IntermediateStepType.FUNCTION_END, built)
+    _lazy_push(mgr, "outer", IntermediateStepType.FUNCTION_END, built)
+
+    assert built == ["outer", "inner", "inner", "outer"]
+    assert [(step.name, step.parent_id) for step in output_steps] == [("outer", "root"), ("inner", "outer"),
+                                                                      ("inner", "outer"), ("outer", "root")]
+
+
+async def test_function_steps_only_built_when_observed(ctx: Context, ctx_state: ContextState):
+    token = ctx_state.event_stream.set(Subject())
+    try:
+        with ctx.push_active_function("fn", input_data="hello") as manager:
+            assert ctx.active_span_id == ctx.active_function.function_id
+            manager.set_output("world")
+        assert ctx.active_span_id == "root"
+
+        output_steps = []
+        ctx.intermediate_step_manager.subscribe(output_steps.append)
+
+        with ctx.push_active_function("fn", input_data="hello") as manager:
+            manager.set_output("world")
+
+        assert [step.event_type
+                for step in output_steps] == [IntermediateStepType.FUNCTION_START, IntermediateStepType.FUNCTION_END]
+        assert output_steps[1].data.output == "world"
+    finally:
+        ctx_state.event_stream.reset(token)
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from nat.eval.config import EvaluationRunConfig
+from nat.eval.runners.sharded_eval_runner import ShardedEvaluationRunner
+
+
+def _thread_pool(max_workers, mp_context):  # pylint: disable=unused-argument
+    # Threads stand in for the worker processes, which would not see the patches applied by the test
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+async def test_run_all_runs_each_shard_then_merges():
+    config = EvaluationRunConfig(config_file=Path("config.yml"), num_shards=3)
+    shard_runs = []
+
+    def mock_run_shard(shard_config, job_id):
+        shard_runs.append((shard_config.shard_index, job_id))
+        if shard_config.shard_index == 1:
+            raise RuntimeError("shard failed")
+        return False
+
+    merged_output = MagicMock()
+    with patch("nat.eval.runners.sharded_eval_runner.ProcessPoolExecutor", _thread_pool), \
+         patch("nat.eval.runners.sharded_eval_runner._run_shard", mock_run_shard), \
+         patch("nat.eval.evaluate.EvaluationRun.prepare_sharded_run", return_value="job_1"), \
+         patch("nat.eval.evaluate.EvaluationRun.merge_shards",
+               AsyncMock(return_value=merged_output)) as mock_merge_shards:
+        output = await ShardedEvaluationRunner(config).run_all()
+
+    # A failed shard does not prevent the other shards from being merged
+    assert sorted(shard_runs) == [(0, "job_1"), (1, "job_1"), (2, "job_1")]
+    mock_merge_shards.assert_awaited_once_with("job_1")
+    assert output is merged_output
+
+    # The configuration of the caller is left untouched
+    assert config.shard_index is None
+
+
+def test_num_shards_must_be_positive():
+    with pytest.raises(ValueError):
+        ShardedEvaluationRunner(EvaluationRunConfig(config_file=Path("config.yml"), num_shards=0))
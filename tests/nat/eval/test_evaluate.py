@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import json
 import os
 import time
@@ -45,7 +46,12 @@ from nat.eval.evaluator.evaluator_model import EvalInput
 from nat.eval.evaluator.evaluator_model import EvalInputItem
 from nat.eval.evaluator.evaluator_model import EvalOutput
 from nat.eval.evaluator.evaluator_model import EvalOutputItem
+from nat.eval.utils.eval_checkpoint import CHECKPOINT_FILE_NAME
+from nat.eval.utils.eval_checkpoint import EvalCheckpoint
+from nat.eval.utils.sharding import shard_of
+from nat.eval.utils.sharding import shard_output_dir
 from nat.profiler.data_models import ProfilerResults
+from nat.profiler.online_profiler import OnlineProfiler
 from nat.runtime.session import SessionManager
 
 # pylint: disable=redefined-outer-name
@@ -216,6 +222,26 @@ async def test_run_workflow_local_success(evaluation_run, session_manager, gener
     assert not evaluation_run.workflow_interrupted
 
 
+async def test_run_workflow_local_online_profiler(evaluation_run, session_manager, mock_pull_intermediate):
+    """Test that the online profiler observes the steps of each item while the workflow runs."""
+    steps = mock_pull_intermediate.return_value
+
+    async def pull_and_observe(on_step=None):
+        for step in steps:
+            on_step(step)
+        return steps
+
+    mock_pull_intermediate.side_effect = pull_and_observe
+    evaluation_run.online_profiler = OnlineProfiler()
+
+    await evaluation_run.run_workflow_local(session_manager)
+
+    metrics = evaluation_run.online_profiler.snapshot()
+    assert metrics.examples_completed == 1
+    assert metrics.examples_in_progress == 0
+    assert metrics.token_usage["unknown"].calls == 1
+
+
 async def test_run_workflow_local_errors(evaluation_run, session_manager):
     """Test workflow with no 'single output' fails gracefully."""
 
@@ -295,6 +321,136 @@ async def test_run_workflow_local_workflow_interrupted(evaluation_run, eval_inpu
     assert evaluation_run.workflow_interrupted, "Expected workflow_interrupted to be True after failure"
 
 
+def _eval_items(count: int) -> list[EvalInputItem]:
+    return [
+        EvalInputItem(id=i,
+                      input_obj=f"Question {i}",
+                      expected_output_obj="Golden Answer",
+                      output_obj=None,
+                      expected_trajectory=[],
+                      trajectory=[],
+                      full_dataset_entry={
+                          "id": i, "question": f"Question {i}", "answer": "Golden Answer"
+                      }) for i in range(count)
+    ]
+
+
+async def test_run_workflow_local_bounded_workers(evaluation_run, session_manager):
+    """Test that no more than max_concurrency items are run at the same time."""
+    evaluation_run.eval_input = EvalInput(eval_input_items=_eval_items(10))
+    evaluation_run.eval_config.general.max_concurrency = 3
+    mock_runner = AsyncMock()
+    mock_runner.result = AsyncMock(return_value="answer")
+    mock_runner.convert = MagicMock(return_value="answer")
+    running = 0
+    max_running = 0
+
+    @asynccontextmanager
+    async def mock_run(_message):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        yield mock_runner
+        running -= 1
+
+    session_manager.run = mock_run
+
+    await evaluation_run.run_workflow_local(session_manager)
+
+    assert max_running == 3
+    assert all(item.output_obj == "answer" for item in evaluation_run.eval_input.eval_input_items)
+
+
+async def test_run_workflow_local_resume_from_checkpoint(evaluation_run, session_manager, tmp_path):
+    """Test that a resumed run only runs the workflow for the items missing from the checkpoint."""
+    evaluation_run.eval_config.general.output_dir = tmp_path
+    evaluation_run.eval_input = EvalInput(eval_input_items=_eval_items(3))
+    evaluation_run.setup_checkpoint()
+    await evaluation_run.checkpoint.record(
+        evaluation_run.eval_input.eval_input_items[0].model_copy(update={"output_obj": "previous answer"}))
+
+    resumed_run = EvaluationRun(evaluation_run.config.model_copy(update={"resume": True}))
+    resumed_run.eval_config = evaluation_run.eval_config
+    resumed_run.eval_input = EvalInput(eval_input_items=_eval_items(3))
+    resumed_run.setup_checkpoint()
+
+    inputs = []
+    original_run = session_manager.run
+
+    def tracking_run(message):
+        inputs.append(message)
+        return original_run(message)
+
+    session_manager.run = tracking_run
+
+    await resumed_run.run_workflow_local(session_manager)
+    evaluation_run.checkpoint.close()
+    resumed_run.checkpoint.close()
+
+    items = resumed_run.eval_input.eval_input_items
+    assert inputs == ["Question 1", "Question 2"]
+    assert items[0].output_obj == "previous answer"
+    assert 0 in resumed_run.usage_stats.usage_stats_items
+
+    # The checkpoint now records every item
+    assert [json.loads(line)["id"] for line in (tmp_path / "eval_checkpoint.jsonl").read_text().splitlines()] == \
+        [0, 1, 2]
+
+
+async def test_merge_shards(evaluation_run, default_eval_config, tmp_path):
+    """Test that the outputs written by the shards are merged into the outputs of a single run."""
+    default_eval_config.general.output_dir = tmp_path
+    default_eval_config.general.output.dir = tmp_path
+    mock_nat_config = Config()
+    mock_nat_config.eval = default_eval_config
+    mock_dataset_handler = MagicMock()
+    mock_dataset_handler.get_eval_input_from_dataset.return_value = EvalInput(eval_input_items=_eval_items(6))
+
+    # Every shard completes its items except item 5
+    step = IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_name="fn", function_id="fn-id"),
+                            payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_END))
+    shard_items = {0: [], 1: []}
+    for item in _eval_items(5):
+        shard_items[shard_of(item.id, 2)].append(
+            item.model_copy(update={
+                "output_obj": f"answer {item.id}", "trajectory": [step]
+            }))
+    for shard_index, items in shard_items.items():
+        checkpoint = EvalCheckpoint(shard_output_dir(tmp_path, shard_index) / CHECKPOINT_FILE_NAME)
+        checkpoint.reset()
+        for item in items:
+            await checkpoint.record(item)
+        checkpoint.close()
+        output = EvalOutput(
+            average_score=float(shard_index),
+            eval_output_items=[EvalOutputItem(id=item.id, score=float(shard_index), reasoning="") for item in items])
+        (shard_output_dir(tmp_path, shard_index) / "MockEvaluator_output.json").write_text(output.model_dump_json())
+
+    merge_run = EvaluationRun(evaluation_run.config.model_copy(update={"num_shards": 2}))
+    with patch("nat.runtime.loader.load_config", MagicMock(return_value=mock_nat_config)), \
+         patch("nat.eval.evaluate.DatasetHandler", return_value=mock_dataset_handler), \
+         patch("nat.eval.evaluate.OutputUploader", return_value=MagicMock(upload_directory=AsyncMock())), \
+         patch.object(merge_run, "profile_workflow",
+                      AsyncMock(return_value=ProfilerResults())) as mock_profile_workflow, \
+         patch.object(merge_run, "write_output", MagicMock()) as mock_write_output:
+        output = await merge_run.merge_shards()
+
+    items = output.eval_input.eval_input_items
+    assert [item.output_obj for item in items] == ["answer 0", "answer 1", "answer 2", "answer 3", "answer 4", None]
+    assert output.workflow_interrupted
+
+    (evaluator_name, merged), = output.evaluation_results
+    assert evaluator_name == "MockEvaluator"
+    assert len(merged.eval_output_items) == 5
+    assert merged.average_score == pytest.approx(len(shard_items[1]) / 5)
+
+    # The profiler runs once over the trajectories of all shards
+    mock_profile_workflow.assert_awaited_once()
+    mock_write_output.assert_called_once()
+
+
 async def test_run_workflow_remote_success(evaluation_run, generated_answer):
     """
     Mock RemoteWorkflowHandler and test evaluation with a remote workflow.
@@ -518,7 +674,8 @@ async def test_run_and_evaluate(evaluation_run, default_eval_config, session_man
          patch.object(evaluation_run, "run_evaluators", AsyncMock()) as mock_run_evaluators, \
          patch.object(evaluation_run, "profile_workflow",
                       AsyncMock(return_value=ProfilerResults())) as mock_profile_workflow, \
-         patch.object(evaluation_run, "write_output", MagicMock()) as mock_write_output:
+         patch.object(evaluation_run, "write_output", MagicMock()) as mock_write_output, \
+         patch.object(evaluation_run, "setup_checkpoint", MagicMock()) as mock_setup_checkpoint:
 
         # Run the function
         await evaluation_run.run_and_evaluate(session_manager=session_manager)
@@ -533,8 +690,10 @@ async def test_run_and_evaluate(evaluation_run, default_eval_config, session_man
         # Ensure workflow runs only if skip_workflow is False
         if not evaluation_run.config.skip_workflow:
             assert mock_run_workflow.call_count == 1, "run_workflow should be called once"
+            mock_setup_checkpoint.assert_called_once()
         else:
             mock_run_workflow.assert_not_called()
+            mock_setup_checkpoint.assert_not_called()
 
         # Ensure evaluators run
         mock_run_evaluators.assert_called_once_with({"MockEvaluator": mock_evaluator})
@@ -588,6 +747,37 @@ def test_append_job_id_to_output_dir(default_eval_config):
     assert job_id == provided_job_id
 
 
+def test_resume_reuses_latest_job_with_checkpoint(default_eval_run_config, eval_input, tmp_path):
+    """Test that a resumed run continues the most recent job with a checkpoint instead of starting a new job."""
+    eval_config = EvalConfig()
+    eval_config.general.output = EvalOutputConfig(dir=tmp_path,
+                                                  job_management=JobManagementConfig(append_job_id_to_output_dir=True))
+    eval_config.general.output_dir = tmp_path
+
+    evaluation_run = EvaluationRun(default_eval_run_config.model_copy(update={"resume": True}))
+    evaluation_run.eval_config = eval_config
+
+    # Without a checkpoint a new job is started
+    assert evaluation_run._resolve_job_id(None).startswith("job_")
+
+    jobs_dir = tmp_path / "jobs"
+    for job_id, mtime in [("job_old", 100), ("job_latest", 200)]:
+        checkpoint_file = jobs_dir / job_id / CHECKPOINT_FILE_NAME
+        checkpoint_file.parent.mkdir(parents=True)
+        checkpoint_file.write_text(json.dumps({"id": 1, "output_obj": job_id, "trajectory": []}) + "\n")
+        os.utime(checkpoint_file, (mtime, mtime))
+    # Jobs without a checkpoint, such as the one started above, are not resumed
+    (jobs_dir / "job_empty").mkdir()
+
+    job_id = evaluation_run._resolve_job_id(None)
+    assert job_id == "job_latest"
+
+    evaluation_run._set_output_dir(job_id)
+    evaluation_run.eval_input = eval_input
+    evaluation_run.setup_checkpoint()
+    assert eval_input.eval_input_items[0].output_obj == "job_latest"
+
+
 # Batch-4: Tests for cleaning up output directories
 
 
@@ -115,3 +115,15 @@ def test_get_agent_actions(intermediate_step_adapter, mock_intermediate_steps, f
 
     assert tool_output == "Tool output response", "Tool output mismatch"
     assert llm_output == "Final AI-generated response", "LLM output mismatch"
+
+
+def test_validate_intermediate_steps(intermediate_step_adapter, mock_intermediate_steps):
+    """Steps collected from the event stream are kept as is, dumped steps are validated."""
+    steps = mock_intermediate_steps[:2]
+    dumped = [step.model_dump() for step in mock_intermediate_steps[2:]]
+
+    validated = intermediate_step_adapter.validate_intermediate_steps(steps + dumped + [{"invalid": "step"}])
+
+    assert len(validated) == len(mock_intermediate_steps)
+    assert all(actual is expected for actual, expected in zip(validated, steps))
+    assert validated[2:] == mock_intermediate_steps[2:]
@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.invocation_node import InvocationNode
+from nat.eval.evaluator.evaluator_model import EvalInput
+from nat.eval.evaluator.evaluator_model import EvalInputItem
+from nat.eval.utils.eval_checkpoint import EvalCheckpoint
+
+
+def _item(item_id, output_obj=None, trajectory=None) -> EvalInputItem:
+    return EvalInputItem(id=item_id,
+                         input_obj="question",
+                         expected_output_obj="answer",
+                         output_obj=output_obj,
+                         trajectory=trajectory or [],
+                         full_dataset_entry={})
+
+
+async def test_checkpoint_round_trip(tmp_path):
+    step = IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_name="fn", function_id="fn-id"),
+                            payload=IntermediateStepPayload(event_type=IntermediateStepType.LLM_END, name="llm"))
+    checkpoint = EvalCheckpoint(tmp_path / "checkpoint.jsonl")
+    checkpoint.reset()
+    await checkpoint.record(_item(1, output_obj="first", trajectory=[step]))
+    await checkpoint.record(_item("2_rep0", output_obj={"answer": 2}))
+    checkpoint.close()
+
+    # Simulate a crash while the third item was being written
+    with open(checkpoint.path, "a", encoding="utf-8") as f:
+        f.write('{"id": 3, "output_obj": "thi')
+
+    eval_input = EvalInput(eval_input_items=[_item(1), _item("2_rep0"), _item(3)])
+    resumed = EvalCheckpoint(checkpoint.path)
+    restored = resumed.restore(eval_input)
+
+    first, second, third = eval_input.eval_input_items
+    assert restored == [first, second]
+    assert first.output_obj == "first"
+    assert first.trajectory[0].payload.UUID == step.payload.UUID
+    assert second.output_obj == {"answer": 2}
+    assert resumed.is_completed(first) and resumed.is_completed(second)
+    assert not resumed.is_completed(third)
+
+
+def test_missing_checkpoint_restores_nothing(tmp_path):
+    checkpoint = EvalCheckpoint(tmp_path / "missing.jsonl")
+    assert checkpoint.restore(EvalInput(eval_input_items=[_item(1)])) == []
+
+    checkpoint.reset()
+    checkpoint.close()
+    assert checkpoint.path.read_text() == ""
+
+
+async def test_concurrent_records_are_written_whole(tmp_path):
+    checkpoint = EvalCheckpoint(tmp_path / "checkpoint.jsonl")
+    checkpoint.reset()
+    await asyncio.gather(*[checkpoint.record(_item(i, output_obj="x" * 10_000)) for i in range(20)])
+    checkpoint.close()
+
+    lines = checkpoint.path.read_text().splitlines()
+    assert sorted(json.loads(line)["id"] for line in lines) == list(range(20))
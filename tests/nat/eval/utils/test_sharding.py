@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+
+import pytest
+
+from nat.eval.evaluator.evaluator_model import EvalInput
+from nat.eval.evaluator.evaluator_model import EvalInputItem
+from nat.eval.evaluator.evaluator_model import EvalOutput
+from nat.eval.evaluator.evaluator_model import EvalOutputItem
+from nat.eval.utils.sharding import merge_eval_outputs
+from nat.eval.utils.sharding import select_shard
+from nat.eval.utils.sharding import shard_of
+from nat.eval.utils.sharding import shard_output_dir
+
+
+def _item(item_id) -> EvalInputItem:
+    return EvalInputItem(id=item_id,
+                         input_obj="question",
+                         expected_output_obj="answer",
+                         output_obj=None,
+                         trajectory=[],
+                         full_dataset_entry={})
+
+
+def _output(scores: list[float], average_score) -> EvalOutput:
+    return EvalOutput(
+        average_score=average_score,
+        eval_output_items=[EvalOutputItem(id=i, score=score, reasoning="") for i, score in enumerate(scores)])
+
+
+def test_shards_partition_the_dataset():
+    eval_input = EvalInput(eval_input_items=[_item(i) for i in range(100)])
+
+    shards = [select_shard(eval_input, shard_index, 4) for shard_index in range(4)]
+
+    ids = sorted(item.id for shard in shards for item in shard.eval_input_items)
+    assert ids == list(range(100))
+    assert all(shard.eval_input_items for shard in shards)
+
+
+def test_shard_of_is_stable():
+    # The shard of an item must not depend on the process, e.g. on hash randomization
+    assert shard_of("item-1", 8) == shard_of("item-1", 8)
+    assert shard_of(42, 8) == shard_of("42", 8)
+    assert shard_of("item-1", 1) == 0
+
+
+def test_shard_output_dir():
+    assert shard_output_dir(Path("out"), 3) == Path("out/shards/shard_3")
+
+
+def test_merge_eval_outputs_weights_shard_averages():
+    merged = merge_eval_outputs([_output([1.0, 1.0, 1.0], 1.0), _output([0.0], 0.0), _output([], 0.0)])
+
+    assert merged.average_score == pytest.approx(0.75)
+    assert len(merged.eval_output_items) == 4
+
+
+def test_merge_eval_outputs_non_numeric_average():
+    merged = merge_eval_outputs([_output([1.0], 1.0), _output([0.0], {"accuracy": 0.0})])
+
+    assert merged.average_score is None
+    assert len(merged.eval_output_items) == 2
+
+
+def test_merge_eval_outputs_empty():
+    assert merge_eval_outputs([]).average_score == 0.0
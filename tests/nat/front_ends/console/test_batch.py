@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from nat.builder.builder import Builder
+from nat.builder.workflow_builder import WorkflowBuilder
+from nat.cli.register_workflow import register_function
+from nat.data_models.function import FunctionBaseConfig
+from nat.front_ends.console.batch import is_batch_input_file
+from nat.front_ends.console.batch import read_batch_inputs
+from nat.front_ends.console.batch import run_batch
+from nat.runtime.session import SessionManager
+
+
+class SlowUpperConfig(FunctionBaseConfig, name="test_batch_slow_upper"):
+    pass
+
+
+_running = {"current": 0, "max": 0}
+
+
+@pytest.fixture(scope="module", autouse=True)
+async def _register_slow_upper():
+
+    @register_function(config_type=SlowUpperConfig)
+    async def slow_upper(config: SlowUpperConfig, b: Builder):
+
+        async def _inner(message: str) -> str:
+            _running["current"] += 1
+            _running["max"] = max(_running["max"], _running["current"])
+            try:
+                # Later inputs complete first
+                await asyncio.sleep(0.01 * (10 - len(message) % 10))
+                if message == "fail":
+                    raise ValueError("failed input")
+                return message.upper()
+            finally:
+                _running["current"] -= 1
+
+        yield _inner
+
+
+def test_read_batch_inputs(tmp_path: Path):
+    jsonl_file = tmp_path / "inputs.jsonl"
+    jsonl_file.write_text('"a"\n\n{"uri": "b"}\n', encoding="utf-8")
+    assert is_batch_input_file(jsonl_file)
+    assert list(read_batch_inputs(jsonl_file)) == ["a", {"uri": "b"}]
+
+    csv_file = tmp_path / "inputs.csv"
+    csv_file.write_text("uri\nx\ny\n", encoding="utf-8")
+    assert list(read_batch_inputs(csv_file)) == ["x", "y"]
+
+    csv_file.write_text("uri,size\nx,1\n", encoding="utf-8")
+    assert list(read_batch_inputs(csv_file)) == [{"uri": "x", "size": "1"}]
+
+    assert not is_batch_input_file(tmp_path / "input.txt")
+
+    jsonl_file.write_text('"a"\nnot json\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="line 2"):
+        list(read_batch_inputs(jsonl_file))
+
+
+async def test_run_batch():
+    _running["max"] = 0
+    inputs = ["a", "bb", "fail", "ccc", "dddd", "eeeee", "ffffff"]
+
+    async with WorkflowBuilder() as builder:
+        await builder.set_workflow(SlowUpperConfig())
+        session_manager = SessionManager(builder.build(), max_concurrency=2)
+
+        output = io.StringIO()
+        stats = await run_batch(session_manager, iter(inputs), output)
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [record["index"] for record in records] == list(range(len(inputs)))
+    assert [record["output"] for record in records] == ["A", "BB", None, "CCC", "DDDD", "EEEEE", "FFFFFF"]
+    assert records[2]["error"] == "failed input"
+
+    assert _running["max"] == 2
+    assert stats.inputs == len(inputs)
+    assert stats.errors == 1
+    assert stats.inputs_per_second > 0
+    assert 0 < stats.latency_p50_seconds <= stats.latency_p99_seconds
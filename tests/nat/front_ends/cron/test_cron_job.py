@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from nat.builder.builder import Builder
+from nat.builder.workflow_builder import WorkflowBuilder
+from nat.cli.register_workflow import register_function
+from nat.data_models.function import FunctionBaseConfig
+from nat.front_ends.cron.cron_front_end_config import CronFrontEndConfig
+from nat.front_ends.cron.cron_job import get_output_key
+from nat.front_ends.cron.cron_job import run_cron_job
+from nat.object_store.in_memory_object_store import InMemoryObjectStore
+from nat.object_store.models import ObjectStoreItem
+from nat.runtime.session import SessionManager
+
+
+class KeyUpperConfig(FunctionBaseConfig, name="test_cron_key_upper"):
+    pass
+
+
+@pytest.fixture(scope="module", autouse=True)
+async def _register_key_upper():
+
+    @register_function(config_type=KeyUpperConfig)
+    async def key_upper(config: KeyUpperConfig, b: Builder):
+
+        async def _inner(key: str) -> str:
+            if key.endswith("broken.jpg"):
+                raise ValueError("unreadable photo")
+            return key.upper()
+
+        yield _inner
+
+
+def test_job_config_validates_schedule():
+    with pytest.raises(ValueError):
+        CronFrontEndConfig.Job(name="tag", schedule="every night", object_store="store")
+
+
+@pytest.mark.parametrize("input_prefix, output_prefix", [("photos/", ""), ("", ""), ("photos/", "photos")])
+def test_job_config_validates_output_prefix(input_prefix: str, output_prefix: str):
+    # Every input would be skipped as an output
+    with pytest.raises(ValueError):
+        CronFrontEndConfig.Job(name="tag",
+                               schedule="@daily",
+                               object_store="store",
+                               input_prefix=input_prefix,
+                               output_prefix=output_prefix)
+
+
+async def test_run_cron_job():
+    job = CronFrontEndConfig.Job(name="tag",
+                                 schedule="0 2 * * *",
+                                 object_store="store",
+                                 input_prefix="photos/",
+                                 output_prefix="photos/tags/",
+                                 max_concurrency=2)
+    assert get_output_key(job, "photos/a.jpg") == "photos/tags/a.jpg.json"
+
+    store = InMemoryObjectStore()
+    for name in ("a.jpg", "b.jpg", "broken.jpg"):
+        await store.put_object(f"photos/{name}", ObjectStoreItem(data=b"jpeg"))
+    await store.put_object("other/c.jpg", ObjectStoreItem(data=b"jpeg"))
+
+    async with WorkflowBuilder() as builder:
+        await builder.set_workflow(KeyUpperConfig())
+        session_manager = SessionManager(builder.build(), max_concurrency=job.max_concurrency)
+
+        stats = await run_cron_job(job, session_manager, store)
+        assert (stats.inputs, stats.skipped, stats.errors) == (3, 0, 1)
+
+        output = await store.get_object("photos/tags/a.jpg.json")
+        assert json.loads(output.data) == "PHOTOS/A.JPG"
+        assert output.metadata == {"input_key": "photos/a.jpg"}
+        assert sorted([key async for key in store.list_keys("photos/tags/")
+                       ]) == ["photos/tags/a.jpg.json", "photos/tags/b.jpg.json"]
+
+        # The next run only retries the failed input
+        await store.put_object("photos/d.jpg", ObjectStoreItem(data=b"jpeg"))
+        stats = await run_cron_job(job, session_manager, store)
+        assert (stats.inputs, stats.skipped, stats.errors) == (4, 2, 1)
+        assert json.loads((await store.get_object("photos/tags/d.jpg.json")).data) == "PHOTOS/D.JPG"
@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime
+
+import pytest
+
+from nat.front_ends.cron.cron_schedule import CronSchedule
+
+
+@pytest.mark.parametrize("expression, moment, expected",
+                         [
+                             ("*/15 * * * *", datetime(2025, 1, 1, 10, 7, 30), datetime(2025, 1, 1, 10, 15)),
+                             ("0 2 * * *", datetime(2025, 1, 1, 2, 0), datetime(2025, 1, 2, 2, 0)),
+                             ("@daily", datetime(2025, 12, 31, 23, 59), datetime(2026, 1, 1, 0, 0)),
+                             ("30 1 * * 1-5", datetime(2025, 8, 1, 12, 0), datetime(2025, 8, 4, 1, 30)),
+                             ("0 0 29 2 *", datetime(2025, 3, 1), datetime(2028, 2, 29)),
+                             ("0 0 13 * 5", datetime(2025, 6, 1), datetime(2025, 6, 6)),
+                             ("0 8,20 * 6 7", datetime(2025, 6, 1, 9, 0), datetime(2025, 6, 1, 20, 0)),
+                         ])
+def test_next_after(expression: str, moment: datetime, expected: datetime):
+    assert CronSchedule(expression).next_after(moment) == expected
+
+
+@pytest.mark.parametrize("expression",
+                         ["* * * *", "60 * * * *", "* * * * 8", "*/0 * * * *", "a * * * *", "5-1 * * * *"])
+def test_invalid_expression(expression: str):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_never_runs():
+    with pytest.raises(ValueError, match="never runs"):
+        CronSchedule("0 0 30 2 *").next_after(datetime(2025, 1, 1))
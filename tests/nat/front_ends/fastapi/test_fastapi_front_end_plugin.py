@@ -32,6 +32,7 @@ from nat.data_models.api_server import ChatResponseChunk
 from nat.data_models.api_server import Message
 from nat.data_models.config import Config
 from nat.data_models.config import GeneralConfig
+from nat.front_ends.fastapi.fastapi_front_end_config import BatchGenerateResponseItem
 from nat.front_ends.fastapi.fastapi_front_end_config import FastApiFrontEndConfig
 from nat.front_ends.fastapi.fastapi_front_end_plugin_worker import FastApiFrontEndPluginWorker
 from nat.object_store.in_memory_object_store import InMemoryObjectStoreConfig
@@ -274,6 +275,56 @@ async def test_async_job_status_not_found():
         assert response.status_code == 404
 
 
+async def test_admission_control_rejects_expired_deadline():
+    front_end_config = FastApiFrontEndConfig(admission_control=FastApiFrontEndConfig.AdmissionControl())
+
+    config = Config(
+        general=GeneralConfig(front_end=front_end_config),
+        workflow=EchoFunctionConfig(use_openai_api=False),
+    )
+
+    workflow_path = front_end_config.workflow.path
+    stream_path = front_end_config.workflow.path + "/stream"
+
+    async with _build_client(config) as client:
+        response = await client.post(workflow_path, json={"message": "Hello"}, headers={"X-Request-Timeout": "5"})
+        assert response.status_code == 200
+        assert response.json() == {"value": "Hello"}
+
+        # The deadline has passed before the workflow could start
+        for path in (workflow_path, stream_path):
+            response = await client.post(path, json={"message": "Hello"}, headers={"X-Request-Timeout": "0"})
+            assert response.status_code == 503
+            assert int(response.headers["Retry-After"]) >= 1
+
+
+async def test_generate_batch():
+    front_end_config = FastApiFrontEndConfig(max_batch_inputs=10)
+
+    config = Config(
+        general=GeneralConfig(front_end=front_end_config),
+        workflow=EchoFunctionConfig(use_openai_api=False),
+    )
+
+    batch_path = f"{front_end_config.workflow.path}/batch"
+
+    async with _build_client(config) as client:
+        inputs = [{"message": f"Hello {i}"} for i in range(5)]
+        response = await client.post(batch_path, json={"inputs": inputs})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        items = [BatchGenerateResponseItem.model_validate_json(line) for line in response.text.splitlines()]
+        assert sorted(item.index for item in items) == list(range(5))
+        for item in items:
+            assert item.error is None
+            assert item.output == {"value": f"Hello {item.index}"}
+
+        response = await client.post(batch_path, json={"inputs": [{"message": "Hello"}] * 11})
+        assert response.status_code == 422
+
+
 async def test_static_file_endpoints():
     # Configure the in-memory object store
     object_store_name = "test_store"
@@ -335,3 +386,108 @@ async def test_static_file_endpoints():
         # GET: Should now 404
         response = await client.get(f"/static/{file_path}")
         assert response.status_code == 404
+
+
+async def test_static_file_upload_pipeline():
+    object_store_name = "test_store"
+    front_end_config = FastApiFrontEndConfig(object_store=object_store_name,
+                                             object_store_pipeline=FastApiFrontEndConfig.ObjectStorePipeline(
+                                                 key_prefix="photos/", max_workers=2))
+
+    config = Config(
+        general=GeneralConfig(front_end=front_end_config),
+        object_stores={object_store_name: InMemoryObjectStoreConfig()},
+        workflow=EchoFunctionConfig(),
+    )
+
+    async with _build_client(config) as client:
+        for file_path in ("photos/a.jpg", "other/b.jpg"):
+            response = await client.post(f"/static/{file_path}",
+                                         files={"file": ("photo.jpg", io.BytesIO(b"jpeg"), "image/jpeg")})
+            assert response.status_code == 200
+
+        # The upload is processed in the background, its output is stored next to it
+        deadline = time.monotonic() + 5
+        response = await client.get("/static/photos/a.jpg.result.json")
+        while response.status_code == 404 and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+            response = await client.get("/static/photos/a.jpg.result.json")
+
+        assert response.status_code == 200
+        assert response.json() == "photos/a.jpg"
+
+        response = await client.get("/static/other/b.jpg.result.json")
+        assert response.status_code == 404
+
+
+class _FailingJobStoreCloseWorker(FastApiFrontEndPluginWorker):
+
+    @override
+    def create_job_store(self, namespace: str):
+        job_store = super().create_job_store(namespace)
+
+        async def aclose():
+            raise RuntimeError("Unable to close the job store")
+
+        job_store.aclose = aclose
+        return job_store
+
+
+async def test_shutdown_closes_pipeline_when_job_store_close_fails():
+    object_store_name = "test_store"
+    front_end_config = FastApiFrontEndConfig(
+        object_store=object_store_name,
+        object_store_pipeline=FastApiFrontEndConfig.ObjectStorePipeline(key_prefix="photos/"))
+
+    config = Config(
+        general=GeneralConfig(front_end=front_end_config),
+        object_stores={object_store_name: InMemoryObjectStoreConfig()},
+        workflow=EchoFunctionConfig(),
+    )
+
+    worker = _FailingJobStoreCloseWorker(config)
+    app = worker.build_app()
+
+    with pytest.raises(RuntimeError, match="Unable to close the job store"):
+        async with LifespanManager(app):
+            assert worker._job_stores
+            pipeline = worker._object_store_pipeline
+            assert pipeline is not None and pipeline._workers
+
+    assert not pipeline._workers
+    assert worker._object_store_pipeline is None
+
+
+async def test_metrics_endpoint():
+    object_store_name = "metrics_store"
+
+    config = Config(
+        general=GeneralConfig(front_end=FastApiFrontEndConfig(object_store=object_store_name)),
+        object_stores={object_store_name: InMemoryObjectStoreConfig()},
+        workflow=EchoFunctionConfig(),
+    )
+
+    async with _build_client(config) as client:
+        response = await client.post("/generate", json={"message": "Hello"})
+        assert response.status_code == 200
+
+        response = await client.get("/static/missing.txt")
+        assert response.status_code == 404
+
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+
+        body = response.text
+        assert "# TYPE nat_function_duration_seconds histogram" in body
+        assert "nat_session_semaphore_wait_seconds_count" in body
+        assert 'nat_object_store_errors_total{object_store="metrics_store",operation="get"}' in body
+
+
+async def test_metrics_endpoint_disabled():
+    config = Config(general=GeneralConfig(front_end=FastApiFrontEndConfig(metrics_path=None)),
+                    workflow=EchoFunctionConfig())
+
+    async with _build_client(config) as client:
+        response = await client.get("/metrics")
+        assert response.status_code == 404
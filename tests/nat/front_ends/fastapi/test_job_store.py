@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from nat.front_ends.fastapi.job_store import JobStatus
+from nat.front_ends.fastapi.job_store import JobStore
+from nat.front_ends.fastapi.job_store import JobStoreBase
+from nat.front_ends.fastapi.job_store import create_job_store
+from nat.front_ends.fastapi.sqlite_job_store import SQLiteJobStore
+
+
+class _Output(BaseModel):
+    value: str
+
+
+@pytest.fixture(name="job_store", params=["memory", "sqlite"])
+async def job_store_fixture(request, tmp_path: Path) -> JobStoreBase:
+    url = f"sqlite:///{tmp_path / 'jobs.db'}" if request.param == "sqlite" else None
+    job_store = create_job_store(url, namespace="test")
+    yield job_store
+    await job_store.aclose()
+
+
+async def test_job_lifecycle(job_store: JobStoreBase):
+    job_id = await job_store.create_job(config_file="config.yml", expiry_seconds=10)
+
+    job = await job_store.get_job(job_id)
+    assert job.status == JobStatus.SUBMITTED
+    assert job.config_file == "config.yml"
+    assert job.expiry_seconds == JobStoreBase.MIN_EXPIRY
+    assert job_store.get_expires_at(job) is None
+
+    await job_store.update_status(job_id, "success", output=_Output(value="done"))
+
+    job = await job_store.get_job(job_id)
+    assert job.status == JobStatus.SUCCESS
+    assert job_store.get_expires_at(job) == job.updated_at + timedelta(seconds=JobStoreBase.MIN_EXPIRY)
+    assert [job.job_id for job in await job_store.get_jobs_by_status("success")] == [job_id]
+    assert await job_store.get_jobs_by_status("running") == []
+
+    with pytest.raises(ValueError):
+        await job_store.update_status("unknown", "success")
+
+
+async def test_get_last_and_all_jobs(job_store: JobStoreBase):
+    assert await job_store.get_last_job() is None
+
+    job_ids = [await job_store.create_job(job_id=f"job-{i}") for i in range(3)]
+
+    assert (await job_store.get_last_job()).job_id == job_ids[-1]
+    assert sorted(job.job_id for job in await job_store.get_all_jobs()) == job_ids
+
+
+async def test_cleanup_expired_jobs(job_store: JobStoreBase, tmp_path: Path):
+    output_dirs = []
+    for i in range(3):
+        output_dir = tmp_path / f"output-{i}"
+        output_dir.mkdir()
+        output_dirs.append(output_dir)
+        await job_store.create_job(job_id=f"job-{i}")
+        await job_store.update_status(f"job-{i}", "success", output_path=str(output_dir))
+    await job_store.create_job(job_id="active")
+
+    # Expire all the finished jobs
+    now = datetime.now(UTC) + timedelta(seconds=JobStoreBase.MAX_EXPIRY)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("nat.front_ends.fastapi.job_store.datetime", _frozen_datetime(now))
+        mp.setattr("nat.front_ends.fastapi.sqlite_job_store.datetime", _frozen_datetime(now))
+        await job_store.cleanup_expired_jobs()
+
+    # The most recent finished job and the active job are kept
+    assert sorted(job.job_id for job in await job_store.get_all_jobs()) == ["active", "job-2"]
+    assert [output_dir.exists() for output_dir in output_dirs] == [False, False, True]
+
+
+def _frozen_datetime(now: datetime) -> type:
+
+    class _FrozenDatetime(datetime):
+
+        @classmethod
+        def now(cls, tz=None):
+            return now
+
+    return _FrozenDatetime
+
+
+async def test_wait_for_job_wakes_on_completion(job_store: JobStoreBase):
+    job_id = await job_store.create_job()
+
+    async def _complete():
+        await asyncio.sleep(0.05)
+        await job_store.update_status(job_id, "running")
+        await asyncio.sleep(0.05)
+        await job_store.update_status(job_id, "success")
+
+    start = time.perf_counter()
+    waiters = [job_store.wait_for_job(job_id, timeout=10) for _ in range(100)]
+    jobs, _ = await asyncio.gather(asyncio.gather(*waiters), _complete())
+    elapsed = time.perf_counter() - start
+
+    assert all(job.status == JobStatus.SUCCESS for job in jobs)
+    assert elapsed < 1.0
+    assert not job_store._waiters
+
+
+async def test_wait_for_job_updated_from_thread(job_store: JobStoreBase):
+    job_id = await job_store.create_job()
+
+    def _fail():
+        time.sleep(0.05)
+        asyncio.run(job_store.update_status(job_id, "failure", error="boom"))
+
+    thread = threading.Thread(target=_fail)
+    thread.start()
+    job = await job_store.wait_for_job(job_id, timeout=10)
+    thread.join()
+
+    assert job.status == JobStatus.FAILURE
+    assert job.error == "boom"
+
+
+async def test_wait_for_job_timeout(job_store: JobStoreBase):
+    job_id = await job_store.create_job()
+
+    job = await job_store.wait_for_job(job_id, timeout=0.05)
+
+    assert job.status == JobStatus.SUBMITTED
+    assert not job_store._waiters
+
+
+async def test_wait_for_finished_or_unknown_job(job_store: JobStoreBase):
+    job_id = await job_store.create_job()
+    await job_store.update_status(job_id, "success")
+
+    assert (await job_store.wait_for_job(job_id)).status == JobStatus.SUCCESS
+    assert await job_store.wait_for_job("unknown") is None
+
+
+async def test_sqlite_job_store_shared_by_workers(tmp_path: Path):
+    url = f"sqlite:///{tmp_path / 'jobs.db'}"
+    worker_a = SQLiteJobStore(url, namespace="generation")
+    worker_b = SQLiteJobStore(url, namespace="generation")
+    other_namespace = SQLiteJobStore(url, namespace="evaluation")
+    worker_b.poll_interval = 0.05
+
+    try:
+        job_id = await worker_a.create_job()
+        assert (await worker_b.get_job(job_id)).status == JobStatus.SUBMITTED
+        assert await other_namespace.get_job(job_id) is None
+
+        async def _complete():
+            await asyncio.sleep(0.1)
+            await worker_a.update_status(job_id, "success", output=_Output(value="done"))
+
+        job, _ = await asyncio.gather(worker_b.wait_for_job(job_id, timeout=10), _complete())
+
+        assert job.status == JobStatus.SUCCESS
+        assert job.output == {"value": "done"}
+    finally:
+        for job_store in (worker_a, worker_b, other_namespace):
+            await job_store.aclose()
+
+
+def test_create_job_store():
+    assert isinstance(create_job_store(None, namespace="test"), JobStore)
+
+    with pytest.raises(ValueError, match="Unsupported job store URL"):
+        create_job_store("mongodb://localhost", namespace="test")
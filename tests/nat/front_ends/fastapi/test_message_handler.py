@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
+from nat.data_models.api_server import TextContent
+from nat.data_models.api_server import UserMessageContent
+from nat.data_models.api_server import UserMessages
+from nat.data_models.api_server import WebSocketMessageType
+from nat.data_models.api_server import WebSocketUserMessage
+from nat.data_models.api_server import WorkflowSchemaType
+from nat.front_ends.fastapi.message_handler import WebSocketMessageHandler
+
+
+def _user_message(message_id: str, text: str) -> WebSocketUserMessage:
+    return WebSocketUserMessage(
+        type=WebSocketMessageType.USER_MESSAGE,
+        schema_type=WorkflowSchemaType.GENERATE,
+        id=message_id,
+        content=UserMessageContent(messages=[UserMessages(role="user", content=[TextContent(text=text)])]))
+
+
+async def test_one_workflow_runs_per_connection():
+    handler = WebSocketMessageHandler(AsyncMock(), MagicMock(), MagicMock())
+    release = asyncio.Event()
+    payloads = []
+
+    async def run_workflow(payload, *args, **kwargs):
+        payloads.append(payload)
+        await release.wait()
+
+    handler._run_workflow = run_workflow
+
+    await handler.process_workflow_request(_user_message("first", "Hello"))
+    await asyncio.sleep(0)
+    # A message received while the workflow runs is ignored, and does not replace the id the replies refer to
+    await handler.process_workflow_request(_user_message("second", "Hi"))
+    await asyncio.sleep(0)
+    assert payloads == ["Hello"]
+    assert handler._message_parent_id == "first"
+
+    release.set()
+    await handler._running_workflow_task
+    await asyncio.sleep(0)
+    assert handler._running_workflow_task is None
+
+    await handler.process_workflow_request(_user_message("third", "Hey"))
+    await handler._running_workflow_task
+    assert payloads == ["Hello", "Hey"]
+
+
+async def test_close_cancels_running_workflow():
+    handler = WebSocketMessageHandler(AsyncMock(), MagicMock(), MagicMock())
+    started = asyncio.Event()
+
+    async def run_workflow(*args, **kwargs):
+        started.set()
+        await asyncio.Event().wait()
+
+    handler._run_workflow = run_workflow
+
+    await handler.process_workflow_request(_user_message("first", "Hello"))
+    task = handler._running_workflow_task
+    await started.wait()
+
+    await handler.__aexit__(None, None, None)
+    assert task.cancelled()
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from nat.builder.workflow_builder import WorkflowBuilder
+from nat.front_ends.fastapi.object_store_pipeline import ObjectStorePipeline
+from nat.front_ends.fastapi.object_store_pipeline import PipelineObjectStore
+from nat.front_ends.fastapi.object_store_pipeline import _pipeline_queue_depth
+from nat.object_store.in_memory_object_store import InMemoryObjectStore
+from nat.object_store.models import ObjectStoreItem
+from nat.runtime.session import SessionManager
+from nat.test.functions import EchoFunctionConfig
+
+
+@pytest.fixture(name="session_manager")
+async def session_manager_fixture():
+    async with WorkflowBuilder() as builder:
+        await builder.set_workflow(EchoFunctionConfig())
+        yield SessionManager(builder.build())
+
+
+async def test_pipeline_processes_written_objects(session_manager: SessionManager):
+    inner = InMemoryObjectStore()
+    pipeline = ObjectStorePipeline(session_manager, inner, key_prefix="photos/", max_workers=2)
+    store = PipelineObjectStore(inner, pipeline)
+    pipeline.start()
+    try:
+        await store.put_object("photos/a.jpg", ObjectStoreItem(data=b"jpeg"))
+        await store.upsert_object("photos/b.jpg", ObjectStoreItem(data=b"jpeg"))
+        await store.put_object("other/c.jpg", ObjectStoreItem(data=b"jpeg"))
+        # Outputs written by a client are not processed
+        await store.put_object("photos/d.jpg.result.json", ObjectStoreItem(data=b"{}"))
+        await pipeline.join()
+    finally:
+        await pipeline.aclose()
+
+    output = await inner.get_object("photos/a.jpg.result.json")
+    assert json.loads(output.data) == "photos/a.jpg"
+    assert output.content_type == "application/json"
+    assert output.metadata == {"input_key": "photos/a.jpg"}
+
+    assert sorted([key async for key in inner.list_keys()]) == [
+        "other/c.jpg",
+        "photos/a.jpg",
+        "photos/a.jpg.result.json",
+        "photos/b.jpg",
+        "photos/b.jpg.result.json",
+        "photos/d.jpg.result.json",
+    ]
+
+
+async def test_pipeline_queue_is_bounded(session_manager: SessionManager):
+    pipeline = ObjectStorePipeline(session_manager, InMemoryObjectStore(), max_queue_size=2)
+
+    # Without workers nothing is consumed from the queue
+    assert pipeline.submit("a.jpg")
+    assert pipeline.submit("b.jpg")
+    assert not pipeline.submit("c.jpg")
+
+    pipeline.start()
+    await pipeline.join()
+    await pipeline.aclose()
+
+
+async def test_pipeline_close_discards_queued_objects(session_manager: SessionManager):
+    pipeline = ObjectStorePipeline(session_manager, InMemoryObjectStore())
+    queue_depth = _pipeline_queue_depth.value
+
+    assert pipeline.submit("a.jpg")
+    assert pipeline.submit("b.jpg")
+    assert _pipeline_queue_depth.value == queue_depth + 2
+
+    await pipeline.aclose()
+    assert _pipeline_queue_depth.value == queue_depth
+    # Discarded objects do not block a pending join
+    await pipeline.join()
+
+
+def test_pipeline_requires_output_suffix(session_manager: SessionManager):
+    with pytest.raises(ValueError):
+        ObjectStorePipeline(session_manager, InMemoryObjectStore(), output_suffix="")
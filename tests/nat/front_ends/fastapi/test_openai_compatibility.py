@@ -305,6 +305,35 @@ async def test_openai_compatible_mode_stream_parameter():
         assert event_source.response.headers["content-type"] == "text/event-stream; charset=utf-8"
 
 
+async def test_openai_compatible_mode_non_streaming_from_streaming_workflow():
+    """Test that a streaming only workflow returns its aggregated chunks when streaming is not requested"""
+
+    front_end_config = FastApiFrontEndConfig()
+    front_end_config.workflow.openai_api_v1_path = "/v1/chat/completions"
+
+    config = Config(
+        general=GeneralConfig(front_end=front_end_config),
+        workflow=StreamingEchoFunctionConfig(use_openai_api=True),
+    )
+
+    async with _build_client(config) as client:
+        response = await client.post("/v1/chat/completions",
+                                     json={
+                                         "messages": [{
+                                             "content": "Hello", "role": "user"
+                                         }, {
+                                             "content": " world", "role": "user"
+                                         }],
+                                         "stream": False
+                                     })
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/json")
+        chat_response = ChatResponse.model_validate(response.json())
+        assert chat_response.object == "chat.completion"
+        assert chat_response.choices[0].message.content == "Hello world"
+
+
 async def test_legacy_mode_backward_compatibility():
     """Test that legacy mode maintains exact backward compatibility"""
 
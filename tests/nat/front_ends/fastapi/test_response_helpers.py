@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+from starlette.requests import ClientDisconnect
+
+from nat.builder.builder import Builder
+from nat.builder.workflow_builder import WorkflowBuilder
+from nat.cli.register_workflow import register_function
+from nat.data_models.api_server import ResponsePayloadOutput
+from nat.data_models.function import FunctionBaseConfig
+from nat.front_ends.fastapi.response_helpers import cancel_on_disconnect
+from nat.front_ends.fastapi.response_helpers import generate_single_response
+from nat.front_ends.fastapi.response_helpers import generate_streaming_response
+from nat.runtime.session import SessionManager
+
+
+class BlockingConfig(FunctionBaseConfig, name="test_blocking"):
+    pass
+
+
+class BlockingStreamConfig(FunctionBaseConfig, name="test_blocking_stream"):
+    pass
+
+
+@pytest.fixture(scope="module", autouse=True)
+async def _register_blocking_functions():
+
+    @register_function(config_type=BlockingConfig)
+    async def blocking(config: BlockingConfig, b: Builder):
+
+        async def _inner(message: str) -> str:
+            await asyncio.Event().wait()
+            return message
+
+        yield _inner
+
+    @register_function(config_type=BlockingStreamConfig)
+    async def blocking_stream(config: BlockingStreamConfig, b: Builder):
+
+        async def _inner(message: str) -> AsyncGenerator[str]:
+            yield message
+            await asyncio.Event().wait()
+
+        yield _inner
+
+
+class _Request:
+    """Minimal request whose client disconnects when `disconnect` is called."""
+
+    def __init__(self):
+        self._disconnected = asyncio.Event()
+
+    def disconnect(self):
+        self._disconnected.set()
+
+    async def receive(self):
+        await self._disconnected.wait()
+        return {"type": "http.disconnect"}
+
+
+async def test_cancel_on_disconnect():
+    async with WorkflowBuilder() as builder:
+        await builder.set_workflow(BlockingConfig())
+        session_manager = SessionManager(builder.build(), max_concurrency=1)
+
+        request = _Request()
+        asyncio.get_running_loop().call_later(0.05, request.disconnect)
+
+        with pytest.raises(ClientDisconnect):
+            await cancel_on_disconnect(request, generate_single_response("hello", session_manager))
+
+        # The concurrency slot was released
+        assert not session_manager._semaphore.locked()
+
+
+async def test_cancel_on_disconnect_result():
+    request = _Request()
+
+    async def _result():
+        return "hello"
+
+    assert await cancel_on_disconnect(request, _result()) == "hello"
+
+
+async def test_streaming_response_cancelled_on_disconnect():
+    async with WorkflowBuilder() as builder:
+        await builder.set_workflow(BlockingStreamConfig())
+        session_manager = SessionManager(builder.build(), max_concurrency=1)
+
+        request = _Request()
+        outputs = []
+
+        async def _consume():
+            async for item in generate_streaming_response("hello",
+                                                          session_manager=session_manager,
+                                                          streaming=True,
+                                                          request=request):
+                if isinstance(item, ResponsePayloadOutput):
+                    outputs.append(item.payload)
+                    request.disconnect()
+
+        # Ends once the client disconnects, although the workflow never completes
+        await asyncio.wait_for(_consume(), timeout=5)
+
+        assert outputs == ["hello"]
+        assert not session_manager._semaphore.locked()
@@ -526,3 +526,24 @@ def test_function_events_in_custom_mode(step_adaptor_custom, make_intermediate_s
     # Steps should still be added to history
     assert step_adaptor_custom._history[-2] is step_start
     assert step_adaptor_custom._history[-1] is step_end
+
+
+def test_llm_chunks_accumulated_per_run(step_adaptor_default, make_intermediate_step):
+    """Chunks of concurrent LLM runs are accumulated separately."""
+
+    def _chunk(chunk: str, UUID: str) -> IntermediateStep:
+        step = make_intermediate_step(event_type=IntermediateStepType.LLM_NEW_TOKEN, UUID=UUID)
+        step.payload.data = StreamEventData(chunk=chunk)
+        return step
+
+    step_adaptor_default.process(make_intermediate_step(IntermediateStepType.LLM_START, data_input="a", UUID="run-a"))
+    step_adaptor_default.process(make_intermediate_step(IntermediateStepType.LLM_START, data_input="b", UUID="run-b"))
+
+    step_adaptor_default.process(_chunk("Hello", "run-a"))
+    step_adaptor_default.process(_chunk("Bonjour", "run-b"))
+    result_a = step_adaptor_default.process(_chunk(" world", "run-a"))
+    result_b = step_adaptor_default.process(_chunk(" monde", "run-b"))
+
+    assert "Hello world" in result_a.payload
+    assert "Bonjour" not in result_a.payload
+    assert "Bonjour monde" in result_b.payload
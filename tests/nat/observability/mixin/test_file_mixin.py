@@ -16,11 +16,13 @@
 # pylint: disable=redefined-outer-name
 
 import asyncio
+import gzip
 import re
 
 import aiofiles
 import pytest
 
+from nat.observability.mixin.file_compression import FileCompression
 from nat.observability.mixin.file_mixin import FileExportMixin
 from nat.observability.mixin.file_mode import FileMode
 
@@ -685,3 +687,130 @@ class TestFileExportMixinRolling:
         # Should have cleaned up to only 1 file (the newest)
         rolled_files = list(temp_dir.glob("cleanup_init_*.log"))
         assert len(rolled_files) <= 1
+
+
+class TestFileExportMixinBuffering:
+    """Test suite for buffered writes and compressed rolling."""
+
+    @pytest.fixture
+    def file_mixin_class(self):
+        """Create a concrete class that uses FileExportMixin."""
+
+        class MockSuperclass:
+
+            def __init__(self, *args, **kwargs):
+                pass
+
+        class TestFileExporter(FileExportMixin, MockSuperclass):
+            pass
+
+        return TestFileExporter
+
+    async def test_items_are_buffered_until_flush(self, file_mixin_class, tmp_path):
+        """Test that buffered items are only written on flush."""
+        output_path = tmp_path / "buffered.log"
+        exporter = file_mixin_class(output_path=output_path, project="test", buffer_size=1024, flush_interval=60)
+
+        await exporter.export_processed("first")
+        await exporter.export_processed(["second", "third"])
+        assert not output_path.exists()
+
+        await exporter.flush()
+        assert output_path.read_text() == "first\nsecond\nthird\n"
+
+        # Flushing an empty buffer is a no-op
+        await exporter.flush()
+        assert output_path.read_text() == "first\nsecond\nthird\n"
+
+    async def test_buffer_is_written_when_full(self, file_mixin_class, tmp_path):
+        """Test that reaching buffer_size triggers a write."""
+        output_path = tmp_path / "full.log"
+        exporter = file_mixin_class(output_path=output_path, project="test", buffer_size=10, flush_interval=60)
+
+        await exporter.export_processed("0123456789")
+        assert output_path.read_text() == "0123456789\n"
+
+    async def test_buffer_is_written_after_flush_interval(self, file_mixin_class, tmp_path):
+        """Test that buffered items are written once the flush interval elapses."""
+        output_path = tmp_path / "interval.log"
+        exporter = file_mixin_class(output_path=output_path, project="test", buffer_size=1024, flush_interval=0.01)
+
+        await exporter.export_processed("delayed")
+        for _ in range(100):
+            if output_path.exists():
+                break
+            await asyncio.sleep(0.01)
+
+        assert output_path.read_text() == "delayed\n"
+
+    async def test_concurrent_buffered_writes_keep_all_items(self, file_mixin_class, tmp_path):
+        """Test that concurrent buffered writes do not lose or interleave items."""
+        output_path = tmp_path / "concurrent.log"
+        exporter = file_mixin_class(output_path=output_path, project="test", buffer_size=64, flush_interval=60)
+
+        await asyncio.gather(*(exporter.export_processed(f"message_{i}") for i in range(200)))
+        await exporter.flush()
+
+        lines = output_path.read_text().splitlines()
+        assert sorted(lines) == sorted(f"message_{i}" for i in range(200))
+
+    async def test_buffered_overwrite_truncates_once(self, file_mixin_class, tmp_path):
+        """Test that overwrite mode only truncates the file on the first buffered write."""
+        output_path = tmp_path / "overwrite.log"
+        output_path.write_text("stale\n")
+        exporter = file_mixin_class(output_path=output_path, project="test", mode="overwrite", buffer_size=1)
+
+        await exporter.export_processed("first")
+        await exporter.export_processed("second")
+        assert output_path.read_text() == "first\nsecond\n"
+
+    async def test_buffered_rolling_with_gzip(self, file_mixin_class, tmp_path):
+        """Test that rolled files are compressed and matched by cleanup."""
+        output_path = tmp_path / "rolling" / "app.log"
+        exporter = file_mixin_class(output_path=output_path,
+                                    project="test",
+                                    enable_rolling=True,
+                                    max_file_size=10,
+                                    max_files=2,
+                                    buffer_size=1,
+                                    compression=FileCompression.GZIP)
+
+        for i in range(5):
+            await exporter.export_processed(f"message number {i}")
+
+        rolled_files = sorted(output_path.parent.glob("app_*.log.gz"))
+        assert len(rolled_files) == 2
+        assert not list(output_path.parent.glob("app_*.log"))
+        assert output_path.read_text() == "message number 4\n"
+
+        with gzip.open(rolled_files[-1], "rt") as f:
+            assert f.read() == "message number 3\n"
+
+    async def test_unbuffered_rolling_with_gzip(self, file_mixin_class, tmp_path):
+        """Test that compression also applies to the unbuffered write path."""
+        output_path = tmp_path / "rolling" / "app.log"
+        exporter = file_mixin_class(output_path=output_path,
+                                    project="test",
+                                    enable_rolling=True,
+                                    max_file_size=10,
+                                    compression="gzip")
+
+        await exporter.export_processed("first message")
+        await exporter.export_processed("second message")
+
+        rolled_files = list(output_path.parent.glob("app_*.log.gz"))
+        assert len(rolled_files) == 1
+        with gzip.open(rolled_files[0], "rt") as f:
+            assert f.read() == "first message\n"
+
+    def test_file_info_includes_buffering(self, file_mixin_class, tmp_path):
+        """Test that get_file_info reports buffering and compression settings."""
+        pytest.importorskip("zstandard")
+        exporter = file_mixin_class(output_path=tmp_path / "info.log",
+                                    project="test",
+                                    buffer_size=4096,
+                                    compression=FileCompression.ZSTD)
+
+        info = exporter.get_file_info()
+        assert info["buffer_size"] == 4096
+        assert info["compression"] == "zstd"
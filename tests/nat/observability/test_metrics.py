@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import uuid
+
+import pytest
+
+from nat.builder.context import Context
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import UsageInfo
+from nat.data_models.object_store import NoSuchKeyError
+from nat.object_store.in_memory_object_store import InMemoryObjectStore
+from nat.object_store.instrumented_object_store import InstrumentedObjectStore
+from nat.object_store.models import ObjectStoreItem
+from nat.observability.metrics import GlobalMetricsRegistry
+from nat.observability.metrics import Histogram
+from nat.observability.metrics import MetricsRegistry
+from nat.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+
+
+def test_histogram_buckets_are_log_linear():
+    histogram = Histogram(min_exponent=4, max_exponent=6, sub_bucket_bits=1)
+
+    assert histogram.upper_bounds_ns() == [16.0, 24.0, 32.0, 48.0, 64.0, math.inf]
+
+    for value in (0, 15, 16, 23, 24, 47, 48, 63, 64, 10_000):
+        histogram.observe_ns(value)
+
+    assert histogram.bucket_counts() == [2, 2, 1, 1, 2, 2]
+    assert histogram.count == 10
+    assert histogram.sum_ns == sum((0, 15, 16, 23, 24, 47, 48, 63, 64, 10_000))
+
+
+def test_histogram_quantile_error_is_bounded():
+    histogram = Histogram()
+    values = [1_000_000 * i for i in range(1, 1001)]
+    for value in values:
+        histogram.observe_ns(value)
+
+    for q, expected in ((0.5, values[499]), (0.99, values[989])):
+        estimate = histogram.quantile(q)
+        assert expected <= estimate <= expected * (1 + 2**-3)
+
+    assert Histogram().quantile(0.5) == 0.0
+    with pytest.raises(ValueError):
+        histogram.quantile(1.5)
+
+
+def test_registry_returns_existing_family():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests_total", "Requests.", ("route", ))
+
+    assert registry.counter("requests_total", "Requests.", ("route", )) is counter
+    assert counter.labels("/a") is counter.labels("/a")
+
+    with pytest.raises(ValueError):
+        registry.gauge("requests_total", "Requests.", ("route", ))
+    with pytest.raises(ValueError):
+        counter.labels("/a", "extra")
+
+
+def test_render_prometheus():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.", ("route", )).labels('/a"b').inc(3)
+    registry.gauge("in_flight", "In flight.").labels().set(2)
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route", ))
+    histogram.labels("/a").observe_ns(1_000)
+    histogram.labels("/a").observe_ns(3_000_000_000_000)
+
+    lines = registry.render_prometheus().splitlines()
+
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{route="/a\\"b"} 3' in lines
+    assert "in_flight 2" in lines
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{route="/a",le="4.096e-06"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 2' in lines
+    assert 'latency_seconds_count{route="/a"} 2' in lines
+    assert 'latency_seconds_sum{route="/a"} 3000.000001' in lines
+
+
+def _histogram_count(name: str, *labels: str) -> int:
+    family = GlobalMetricsRegistry.get().get(name)
+    assert family is not None
+    return family.labels(*labels).count
+
+
+def test_push_active_function_records_metrics():
+    context = Context.get()
+    function_name = f"metrics_fn_{uuid.uuid4().hex}"
+    errors = GlobalMetricsRegistry.get().get("nat_function_errors_total")
+    in_flight = GlobalMetricsRegistry.get().get("nat_function_in_flight")
+
+    with context.push_active_function(function_name, input_data=None):
+        assert in_flight.labels(function_name).value == 1
+
+    with pytest.raises(RuntimeError):
+        with context.push_active_function(function_name, input_data=None):
+            raise RuntimeError("boom")
+
+    assert in_flight.labels(function_name).value == 0
+    assert _histogram_count("nat_function_duration_seconds", function_name) == 2
+    assert errors.labels(function_name).value == 1
+
+
+def test_llm_end_records_latency_and_tokens():
+    step_manager = Context.get().intermediate_step_manager
+    model = f"model_{uuid.uuid4().hex}"
+    step_id = str(uuid.uuid4())
+
+    step_manager.push_intermediate_step(
+        IntermediateStepPayload(UUID=step_id, event_type=IntermediateStepType.LLM_START, name=model))
+    step_manager.push_intermediate_step(
+        IntermediateStepPayload(
+            UUID=step_id,
+            event_type=IntermediateStepType.LLM_END,
+            name=model,
+            usage_info=UsageInfo(token_usage=TokenUsageBaseModel(prompt_tokens=7, completion_tokens=3))))
+
+    tokens = GlobalMetricsRegistry.get().get("nat_llm_tokens_total")
+    assert _histogram_count("nat_llm_duration_seconds", model) == 1
+    assert tokens.labels(model, "prompt").value == 7
+    assert tokens.labels(model, "completion").value == 3
+
+
+async def test_instrumented_object_store():
+    name = f"store_{uuid.uuid4().hex}"
+    store = InstrumentedObjectStore(name, InMemoryObjectStore())
+    errors = GlobalMetricsRegistry.get().get("nat_object_store_errors_total")
+
+    await store.put_object("key", ObjectStoreItem(data=b"value"))
+    assert (await store.get_object("key")).data == b"value"
+
+    with pytest.raises(NoSuchKeyError):
+        await store.get_object("missing")
+
+    assert _histogram_count("nat_object_store_duration_seconds", name, "put") == 1
+    assert _histogram_count("nat_object_store_duration_seconds", name, "get") == 2
+    assert errors.labels(name, "get").value == 1
@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=redefined-outer-name  # pytest fixtures
+
+import os
+import subprocess
+import sys
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.invocation_node import InvocationNode
+from nat.data_models.telemetry_exporter import TailSamplingConfig
+from nat.data_models.telemetry_exporter import TraceSamplingConfig
+from nat.observability.exporter.base_exporter import BaseExporter
+from nat.observability.trace_sampler import TraceSampler
+from nat.utils.reactive.subject import Subject
+
+
+def _step(event_type: IntermediateStepType,
+          step_id: str,
+          parent_id: str = "root",
+          name: str = "fn",
+          timestamp: float = 0.0,
+          metadata: dict | None = None) -> IntermediateStep:
+    payload = IntermediateStepPayload(event_type=event_type,
+                                      UUID=step_id,
+                                      name=name,
+                                      event_timestamp=timestamp,
+                                      metadata=metadata)
+    return IntermediateStep(parent_id=parent_id,
+                            function_ancestry=InvocationNode(function_name=name, function_id=step_id),
+                            payload=payload)
+
+
+def _trace(root_id: str,
+           duration: float = 1.0,
+           child_name: str = "tool",
+           error: bool = False) -> list[IntermediateStep]:
+    child_id = str(uuid.uuid4())
+    return [
+        _step(IntermediateStepType.FUNCTION_START, root_id, timestamp=0.0),
+        _step(IntermediateStepType.TOOL_START, child_id, parent_id=root_id, name=child_name, timestamp=0.1),
+        _step(IntermediateStepType.TOOL_END,
+              child_id,
+              parent_id=root_id,
+              name=child_name,
+              timestamp=0.2,
+              metadata={"error": {
+                  "type": "ValueError", "message": "boom"
+              }} if error else None),
+        _step(IntermediateStepType.FUNCTION_END, root_id, timestamp=duration),
+    ]
+
+
+def _run(sampler: TraceSampler, events: list[IntermediateStep]) -> list[IntermediateStep]:
+    exported = []
+    for event in events:
+        exported.extend(sampler.offer(event))
+    return exported
+
+
+@pytest.fixture
+def drop_all_with_tail():
+    return TraceSamplingConfig(ratio=0.0, tail=TailSamplingConfig(latency_threshold=5.0, name_patterns=[r"^lut_.*"]))
+
+
+def test_ratio_one_exports_everything():
+    sampler = TraceSampler(TraceSamplingConfig(ratio=1.0))
+    events = _trace(str(uuid.uuid4()))
+    assert _run(sampler, events) == events
+    assert sampler.traces_kept == 1
+
+
+def test_ratio_zero_without_tail_drops_everything():
+    sampler = TraceSampler(TraceSamplingConfig(ratio=0.0))
+    assert not _run(sampler, _trace(str(uuid.uuid4()), error=True))
+    assert sampler.traces_dropped == 1
+
+
+def test_head_sampling_is_deterministic_and_proportional():
+    config = TraceSamplingConfig(ratio=0.25)
+    root_ids = [str(uuid.uuid4()) for _ in range(2000)]
+
+    first = [bool(_run(TraceSampler(config), _trace(root_id))) for root_id in root_ids]
+    second = [bool(_run(TraceSampler(config), _trace(root_id))) for root_id in root_ids]
+
+    assert first == second
+    assert 0.18 < sum(first) / len(first) < 0.32
+
+
+def test_head_sampling_of_non_uuid_root_ids_is_stable_across_processes():
+    script = ("from nat.data_models.telemetry_exporter import TraceSamplingConfig\n"
+              "from nat.observability.trace_sampler import TraceSampler\n"
+              "sampler = TraceSampler(TraceSamplingConfig(ratio=0.5))\n"
+              "print([sampler._head_sampled(f'run-{i}') for i in range(100)])\n")
+
+    decisions = {
+        subprocess.run([sys.executable, "-c", script],
+                       env={
+                           **os.environ, "PYTHONHASHSEED": seed
+                       },
+                       capture_output=True,
+                       text=True,
+                       check=True).stdout
+        for seed in ("1", "2")
+    }
+    assert len(decisions) == 1
+
+
+def test_tail_keeps_errored_trace(drop_all_with_tail):
+    sampler = TraceSampler(drop_all_with_tail)
+    events = _trace(str(uuid.uuid4()), error=True)
+
+    # Nothing is exported until the root step ends, then the whole trace is released in order
+    assert not _run(sampler, events[:-1])
+    assert list(sampler.offer(events[-1])) == events
+
+
+def test_tail_keeps_slow_trace(drop_all_with_tail):
+    sampler = TraceSampler(drop_all_with_tail)
+    events = _trace(str(uuid.uuid4()), duration=6.0)
+    assert _run(sampler, events) == events
+
+
+def test_tail_keeps_trace_matching_name(drop_all_with_tail):
+    sampler = TraceSampler(drop_all_with_tail)
+    events = _trace(str(uuid.uuid4()), child_name="lut_finder")
+    assert _run(sampler, events) == events
+
+
+def test_tail_drops_fast_successful_trace(drop_all_with_tail):
+    sampler = TraceSampler(drop_all_with_tail)
+    assert not _run(sampler, _trace(str(uuid.uuid4())))
+    assert sampler.traces_dropped == 1
+
+
+def test_tail_drops_trace_exceeding_buffer_limit():
+    config = TraceSamplingConfig(ratio=0.0, tail=TailSamplingConfig(max_buffered_events=2))
+    sampler = TraceSampler(config)
+    assert not _run(sampler, _trace(str(uuid.uuid4()), error=True))
+    assert sampler.traces_dropped == 1
+
+
+def test_flush_releases_incomplete_traces(drop_all_with_tail):
+    sampler = TraceSampler(drop_all_with_tail)
+    events = _trace(str(uuid.uuid4()))[:-1]
+    assert not _run(sampler, events)
+    assert list(sampler.flush()) == events
+    assert not sampler.flush()
+
+
+def test_interleaved_traces_are_sampled_independently(drop_all_with_tail):
+    sampler = TraceSampler(drop_all_with_tail)
+    kept = _trace(str(uuid.uuid4()), error=True)
+    dropped = _trace(str(uuid.uuid4()))
+
+    exported = _run(sampler, [event for pair in zip(kept, dropped) for event in pair])
+    assert exported == kept
+
+
+def test_unknown_steps_pass_through():
+    sampler = TraceSampler(TraceSamplingConfig(ratio=0.0))
+    orphan = _step(IntermediateStepType.TOOL_START, "child", parent_id="unknown-parent")
+    assert sampler.offer(orphan) == (orphan, )
+
+
+class _RecordingExporter(BaseExporter):
+
+    def __init__(self, context_state):
+        super().__init__(context_state)
+        self.exported_events = []
+
+    def export(self, event: IntermediateStep) -> None:
+        self.exported_events.append(event)
+
+
+async def test_exporter_applies_sampling(drop_all_with_tail):
+    subject = Subject()
+    context_state = Mock()
+    context_state.event_stream.get.return_value = subject
+
+    exporter = _RecordingExporter(context_state)
+    exporter.set_sampling(drop_all_with_tail)
+    assert exporter.sampling_config is drop_all_with_tail
+
+    kept = _trace(str(uuid.uuid4()), error=True)
+    incomplete = _trace(str(uuid.uuid4()))[:-1]
+
+    async with exporter.start():
+        for event in _trace(str(uuid.uuid4())) + kept + incomplete:
+            subject.on_next(event)
+
+        assert exporter.exported_events == kept
+
+    # Buffered traces which never completed are flushed when the exporter stops
+    assert exporter.exported_events == kept + incomplete
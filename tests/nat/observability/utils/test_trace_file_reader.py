@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import uuid
+
+import pytest
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.invocation_node import InvocationNode
+from nat.observability.exporter.file_exporter import FileExporter
+from nat.observability.utils.trace_file_reader import find_trace_files
+from nat.observability.utils.trace_file_reader import group_steps_by_trace
+from nat.observability.utils.trace_file_reader import read_intermediate_steps
+
+
+def _step(event_type: IntermediateStepType, step_id: str, parent_id: str = "root") -> IntermediateStep:
+    return IntermediateStep(parent_id=parent_id,
+                            function_ancestry=InvocationNode(function_name="fn", function_id=step_id),
+                            payload=IntermediateStepPayload(event_type=event_type, UUID=step_id, name="fn"))
+
+
+def _trace() -> list[IntermediateStep]:
+    root_id = str(uuid.uuid4())
+    child_id = str(uuid.uuid4())
+    return [
+        _step(IntermediateStepType.WORKFLOW_START, root_id),
+        _step(IntermediateStepType.LLM_START, child_id, parent_id=root_id),
+        _step(IntermediateStepType.LLM_END, child_id, parent_id=root_id),
+        _step(IntermediateStepType.WORKFLOW_END, root_id),
+    ]
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+async def test_read_exported_rolled_files(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    output_dir = tmp_path / f"traces_{compression}"
+    exporter = FileExporter(output_path=output_dir / "traces.jsonl",
+                            project=f"reader_{compression}",
+                            enable_rolling=True,
+                            max_file_size=1024,
+                            max_files=100,
+                            buffer_size=1,
+                            compression=compression)
+
+    first, second = _trace(), _trace()
+    processor = exporter._processor
+    for step in first + second:
+        await exporter.export_processed(await processor.process(step))
+    await exporter.flush()
+
+    assert len(list(output_dir.iterdir())) > 1
+
+    steps = list(read_intermediate_steps(output_dir))
+    assert [s.UUID for s in steps] == [s.UUID for s in first + second]
+
+    grouped = group_steps_by_trace(steps)
+    assert [[s.UUID for s in trace] for trace in grouped] == [[s.UUID for s in first], [s.UUID for s in second]]
+
+
+def test_read_skips_invalid_lines(tmp_path):
+    trace_file = tmp_path / "traces.jsonl"
+    steps = _trace()
+    trace_file.write_text("\n".join([steps[0].model_dump_json(), "not json", "", steps[-1].model_dump_json()]))
+
+    assert [s.UUID for s in read_intermediate_steps(trace_file)] == [steps[0].UUID, steps[-1].UUID]
+
+
+def test_read_missing_path(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(read_intermediate_steps(tmp_path / "missing"))
+
+
+def test_find_trace_files_orders_segments_by_name(tmp_path):
+    names = [
+        "traces.jsonl",
+        "traces_20260101_000000_000002.jsonl",
+        "traces_20260101_000000_000001.jsonl.gz",
+        "traces_20260101_000000_000003.jsonl.zst",
+        "traces_20260101_000000_000003.jsonl",
+        "other.jsonl",
+        "notes.txt",
+    ]
+    # Modification times in reverse order of the segments, e.g. after compressing rolled files in the background
+    for i, name in enumerate(names):
+        f = tmp_path / name
+        f.write_text("")
+        os.utime(f, (1000 - i, 1000 - i))
+
+    assert [f.name for f in find_trace_files(tmp_path, "traces.jsonl")] == [
+        "traces_20260101_000000_000001.jsonl.gz",
+        "traces_20260101_000000_000002.jsonl",
+        "traces_20260101_000000_000003.jsonl",
+        "traces.jsonl",
+    ]
+
+    with pytest.raises(ValueError, match="base_filename"):
+        find_trace_files(tmp_path)
+
+
+def test_read_skips_undecodable_files(tmp_path):
+    first, second = _trace(), _trace()
+    (tmp_path / "traces_20260101_000000_000001.jsonl").write_text("\n".join(s.model_dump_json() for s in first))
+    (tmp_path / "traces_20260101_000000_000002.jsonl.gz").write_bytes(b"not gzip")
+    (tmp_path / "traces_20260101_000000_000003.jsonl").write_bytes(b"\xff\xfe\n")
+    (tmp_path / "traces.jsonl").write_text("\n".join(s.model_dump_json() for s in second))
+
+    assert [s.UUID for s in read_intermediate_steps(tmp_path)] == [s.UUID for s in first + second]
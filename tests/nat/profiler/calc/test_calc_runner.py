@@ -22,9 +22,11 @@ import pytest
 from nat.profiler.calc.calc_runner import CalcRunner
 from nat.profiler.calc.data_models import CalcRunnerConfig
 from nat.profiler.calc.data_models import CalcRunnerOutput
+from nat.profiler.calc.data_models import LoadLevelResult
 from nat.profiler.calc.data_models import SizingMetricPerItem
 from nat.profiler.calc.data_models import SizingMetrics
 from nat.profiler.calc.data_models import SizingMetricsAlerts
+from nat.profiler.calc.load_generator import throughput_estimate
 
 
 def make_sizing_metrics(latency, runtime, interrupted=False):
@@ -127,3 +129,73 @@ async def test_calc_runner(latencies, runtimes):
             assert output.calc_data[concurrency].gpu_estimates.gpu_estimate_by_wf_runtime is None
         else:
             assert output.calc_data[concurrency].gpu_estimates.gpu_estimate_by_wf_runtime is not None
+
+
+class FakeLoadGenerator:
+    """Load generator whose p95 workflow runtime grows linearly with the tested concurrency."""
+
+    def __init__(self, runtime_per_concurrency: float):
+        self.runtime_per_concurrency = runtime_per_concurrency
+        self.tested = []
+
+    async def calibrate(self, num_requests):
+        return 0.5
+
+    async def run(self, rate, duration):
+        concurrency = round(rate * 0.5)
+        self.tested.append(concurrency)
+        runtime = self.runtime_per_concurrency * concurrency
+        return (LoadLevelResult(offered_rps=rate,
+                                requests_sent=10,
+                                requests_completed=10,
+                                throughput=throughput_estimate(10, duration)),
+                make_sizing_metrics(latency=1.0, runtime=runtime))
+
+
+def make_adaptive_config(**kwargs):
+    return make_config(target_latency=0, target_runtime=200.0).model_copy(update={
+        "adaptive": True, "endpoint": "http://localhost:8000", **kwargs
+    })
+
+
+async def test_adaptive_sweep_bisects_knee():
+    runner = CalcRunner(make_adaptive_config())
+    load_generator = FakeLoadGenerator(runtime_per_concurrency=10.0)
+
+    sweep = await runner.run_adaptive_sweep(load_generator)
+
+    # Doubling until the target is exceeded at 32, then bisecting between 16 and 32
+    assert load_generator.tested == [1, 2, 4, 8, 16, 32, 24, 20, 22, 21]
+    assert sweep.sustainable_concurrency == 20
+    assert sweep.knee_concurrency == 21
+    assert sweep.sustainable_throughput.mean == pytest.approx(10 / runner.config.adaptive_level_duration)
+    assert list(sweep.levels) == sorted(load_generator.tested)
+    assert list(runner.metrics_per_concurrency) == sorted(load_generator.tested)
+    assert not sweep.levels[21].within_targets
+
+
+async def test_adaptive_sweep_stops_at_max_concurrency():
+    runner = CalcRunner(make_adaptive_config(adaptive_max_concurrency=12))
+    load_generator = FakeLoadGenerator(runtime_per_concurrency=1.0)
+
+    sweep = await runner.run_adaptive_sweep(load_generator)
+
+    assert load_generator.tested == [1, 2, 4, 8, 12]
+    assert sweep.sustainable_concurrency == 12
+    assert sweep.knee_concurrency is None
+
+
+async def test_adaptive_sweep_no_sustainable_concurrency():
+    runner = CalcRunner(make_adaptive_config())
+
+    sweep = await runner.run_adaptive_sweep(FakeLoadGenerator(runtime_per_concurrency=500.0))
+
+    assert sweep.sustainable_concurrency == 0
+    assert sweep.knee_concurrency == 1
+    assert sweep.sustainable_throughput.n == 0
+
+
+@pytest.mark.parametrize("update", [{"endpoint": None}, {"target_workflow_runtime_p95": 0}, {"offline_mode": True}])
+def test_adaptive_config_validation(update):
+    with pytest.raises(ValueError):
+        CalcRunner(make_adaptive_config(**update))
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.invocation_node import InvocationNode
+from nat.eval.evaluator.evaluator_model import EvalInputItem
+from nat.profiler.calc.load_generator import PoissonLoadGenerator
+from nat.profiler.calc.load_generator import llm_latencies
+from nat.profiler.calc.load_generator import throughput_estimate
+
+
+def _step(event_type: IntermediateStepType, timestamp: float, uuid: str) -> IntermediateStep:
+    return IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_name="fn", function_id="fn-id"),
+                            payload=IntermediateStepPayload(event_type=event_type, event_timestamp=timestamp,
+                                                            UUID=uuid))
+
+
+def _items(count: int) -> list[EvalInputItem]:
+    return [
+        EvalInputItem(id=i,
+                      input_obj=f"question {i}",
+                      expected_output_obj="answer",
+                      output_obj=None,
+                      trajectory=[],
+                      full_dataset_entry={}) for i in range(count)
+    ]
+
+
+def test_llm_latencies_match_calls_by_uuid():
+    trajectory = [
+        _step(IntermediateStepType.LLM_START, 0.0, "a"),
+        _step(IntermediateStepType.LLM_START, 1.0, "b"),
+        _step(IntermediateStepType.LLM_END, 3.0, "a"),
+        _step(IntermediateStepType.LLM_END, 1.5, "b"),
+        _step(IntermediateStepType.LLM_END, 4.0, "unmatched"),
+    ]
+    assert llm_latencies(trajectory) == [3.0, 0.5]
+
+
+def test_throughput_estimate():
+    estimate = throughput_estimate(100, 10.0)
+    assert estimate.mean == 10.0
+    assert estimate.ninety_fifth_interval == pytest.approx((8.04, 11.96))
+    assert throughput_estimate(0, 10.0).n == 0
+
+
+async def test_open_loop_load():
+    in_flight = 0
+    max_in_flight = 0
+    requests = []
+
+    async def send_request(item: EvalInputItem):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        requests.append(item.id)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        if item.id == 2:
+            raise RuntimeError("request failed")
+        item.output_obj = "answer"
+        item.trajectory = [
+            _step(IntermediateStepType.LLM_START, 0.0, "a"), _step(IntermediateStepType.LLM_END, 0.02, "a")
+        ]
+
+    load_generator = PoissonLoadGenerator(send_request, _items(3), seed=0)
+    load_result, sizing_metrics = await load_generator.run(rate=200.0, duration=0.5)
+
+    # About rate * duration requests are sent, without waiting for earlier requests to complete
+    assert 50 < load_result.requests_sent < 150
+    assert max_in_flight > 1
+    assert requests[:4] == [0, 1, 2, 0]
+
+    assert load_result.requests_failed == load_result.requests_sent // 3
+    assert load_result.requests_completed == load_result.requests_sent - load_result.requests_failed
+    assert load_result.throughput.n == load_result.requests_completed
+    assert sizing_metrics.alerts.workflow_interrupted
+    assert len(sizing_metrics.per_item_metrics) == load_result.requests_completed
+    assert sizing_metrics.workflow_runtime_p95 >= 0.05
+    assert sizing_metrics.llm_latency_p95 == pytest.approx(0.02)
+
+
+async def test_calibrate():
+
+    async def send_request(item: EvalInputItem):
+        await asyncio.sleep(0.01)
+        item.output_obj = "answer"
+
+    assert await PoissonLoadGenerator(send_request, _items(1)).calibrate(3) >= 0.01
+
+    async def failing_request(item: EvalInputItem):
+        raise RuntimeError("unreachable")
+
+    with pytest.raises(RuntimeError):
+        await PoissonLoadGenerator(failing_request, _items(1)).calibrate(3)
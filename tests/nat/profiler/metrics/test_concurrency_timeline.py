@@ -0,0 +1,162 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from nat.builder.framework_enum import LLMFrameworkEnum
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import UsageInfo
+from nat.data_models.invocation_node import InvocationNode
+from nat.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from nat.profiler.inference_optimization.bottleneck_analysis.nested_stack_analysis import multi_example_call_profiling
+from nat.profiler.inference_optimization.bottleneck_analysis.simple_stack_analysis import profile_workflow_bottlenecks
+from nat.profiler.inference_optimization.concurrency_timeline import concurrency_at
+from nat.profiler.inference_optimization.concurrency_timeline import concurrency_segments
+from nat.profiler.inference_optimization.concurrency_timeline import concurrency_sweep
+from nat.profiler.inference_optimization.experimental.concurrency_spike_analysis import concurrency_spike_analysis
+from nat.profiler.intermediate_property_adapter import IntermediatePropertyAdaptor
+
+
+def _reference_segments(intervals: list[tuple[float, float]]) -> list[tuple[float, float, int]]:
+    """The per-event loop the vectorized timeline replaces."""
+    events = []
+    for start, end in intervals:
+        events.append((start, +1))
+        events.append((end, -1))
+    events.sort(key=lambda x: x[0])
+
+    segments = []
+    curr = 0
+    prev_time = events[0][0]
+    for t, delta in events:
+        if t > prev_time:
+            segments.append((prev_time, t, curr))
+        curr += delta
+        prev_time = t
+    return segments
+
+
+def _reference_max(intervals: list[tuple[float, float]]) -> int:
+    events = []
+    for start, end in intervals:
+        events.append((start, +1))
+        events.append((end, -1))
+    events.sort(key=lambda x: x[0])
+
+    curr = 0
+    trace = []
+    for _, delta in events:
+        curr += delta
+        trace.append(curr)
+    return max(trace)
+
+
+def _random_intervals(rnd: random.Random, count: int) -> list[tuple[float, float]]:
+    intervals = []
+    for _ in range(count):
+        # Rounded times produce many shared boundaries
+        start = round(rnd.uniform(0, 20), 1)
+        intervals.append((start, start + round(rnd.expovariate(0.5), 1)))
+    return intervals
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_segments_match_event_loop(seed: int):
+    intervals = _random_intervals(random.Random(seed), 200)
+    starts = np.array([s for s, _ in intervals])
+    ends = np.array([e for _, e in intervals])
+
+    seg_starts, seg_ends, seg_concurrency = concurrency_segments(starts, ends)
+    segments = list(zip(seg_starts.tolist(), seg_ends.tolist(), seg_concurrency.tolist()))
+
+    assert segments == _reference_segments(intervals)
+    assert int(concurrency_sweep(starts, ends)[1].max()) == _reference_max(intervals)
+
+
+def test_shared_boundaries_follow_call_order():
+    # The first call ends when the second starts, in call order the end is applied first
+    _, running = concurrency_sweep(np.array([0.0, 1.0]), np.array([1.0, 2.0]))
+    assert running.max() == 1
+
+    _, running = concurrency_sweep(np.array([1.0, 0.0]), np.array([2.0, 1.0]))
+    assert running.max() == 2
+
+
+def test_concurrency_at():
+    seg_starts, seg_ends, seg_concurrency = concurrency_segments(np.array([0.0, 1.0]), np.array([2.0, 3.0]))
+
+    result = concurrency_at(np.array([-1.0, 0.0, 1.5, 2.0, 2.999, 3.0]), seg_starts, seg_ends, seg_concurrency)
+    assert result.tolist() == [0.0, 1.0, 2.0, 1.0, 1.0, 0.0]
+
+    empty = concurrency_segments(np.array([]), np.array([]))
+    assert concurrency_at(np.array([1.0]), *empty).tolist() == [0.0]
+
+
+def _synthetic_steps(num_events: int, events_per_example: int = 100) -> list[list[IntermediatePropertyAdaptor]]:
+    rnd = random.Random(0)
+
+    def step(event_type: IntermediateStepType, uuid: str, timestamp: float, name: str, usage: UsageInfo | None = None):
+        return IntermediatePropertyAdaptor.from_intermediate_step(
+            IntermediateStep(parent_id="root",
+                             function_ancestry=InvocationNode(function_name=name, function_id="fn"),
+                             payload=IntermediateStepPayload(event_type=event_type,
+                                                             event_timestamp=timestamp,
+                                                             framework=LLMFrameworkEnum.LANGCHAIN,
+                                                             name=name,
+                                                             UUID=uuid,
+                                                             usage_info=usage)))
+
+    all_steps = []
+    counter = 0
+    for _ in range(num_events // events_per_example):
+        steps = []
+        t = rnd.uniform(0, 100)
+        while len(steps) < events_per_example:
+            counter += 1
+            start, t = t, t + rnd.expovariate(1.0)
+            if rnd.random() < 0.5:
+                name = rnd.choice(["llama", "mixtral"])
+                usage = UsageInfo(token_usage=TokenUsageBaseModel(prompt_tokens=rnd.randint(1, 500), total_tokens=600))
+                steps.append(step(IntermediateStepType.LLM_START, f"u{counter}", start, name))
+                steps.append(step(IntermediateStepType.LLM_END, f"u{counter}", t, name, usage))
+            else:
+                name = rnd.choice(["search", "calculator"])
+                steps.append(step(IntermediateStepType.TOOL_START, f"u{counter}", start, name))
+                steps.append(step(IntermediateStepType.TOOL_END, f"u{counter}", t, name))
+        all_steps.append(steps)
+
+    return all_steps
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+@pytest.mark.parametrize("analysis",
+                         [multi_example_call_profiling, profile_workflow_bottlenecks, concurrency_spike_analysis])
+def test_analysis_benchmark_100k_events(analysis):
+    # The row-by-row implementations took roughly 12s, 55s and 130s on this workload
+    all_steps = _synthetic_steps(100_000)
+
+    start = time.perf_counter()
+    analysis(all_steps)
+    elapsed = time.perf_counter() - start
+
+    print(f"{analysis.__name__}: {elapsed:.2f}s for 100k events")
+    assert elapsed < 30.0
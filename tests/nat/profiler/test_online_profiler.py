@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+import random
+
+import pytest
+
+from nat.data_models.intermediate_step import IntermediateStep
+from nat.data_models.intermediate_step import IntermediateStepPayload
+from nat.data_models.intermediate_step import IntermediateStepType
+from nat.data_models.intermediate_step import UsageInfo
+from nat.data_models.invocation_node import InvocationNode
+from nat.data_models.profiler import ProfilerConfig
+from nat.profiler.callbacks.token_usage_base_model import TokenUsageBaseModel
+from nat.profiler.online_profiler import OnlineProfiler
+from nat.profiler.profile_runner import ProfilerRunner
+from nat.profiler.tdigest import TDigest
+
+
+def _step(event_type: IntermediateStepType,
+          timestamp: float,
+          uuid: str,
+          name: str = "llama",
+          usage: TokenUsageBaseModel | None = None) -> IntermediateStep:
+    return IntermediateStep(parent_id="root",
+                            function_ancestry=InvocationNode(function_name="fn", function_id="fn-id"),
+                            payload=IntermediateStepPayload(event_type=event_type,
+                                                            event_timestamp=timestamp,
+                                                            name=name,
+                                                            UUID=uuid,
+                                                            usage_info=UsageInfo(token_usage=usage) if usage else None))
+
+
+def _example(start: float, llm_calls: list[tuple[float, float]], prefix: str) -> list[IntermediateStep]:
+    steps = [_step(IntermediateStepType.WORKFLOW_START, start, f"{prefix}-workflow", name="workflow")]
+    for i, (llm_start, llm_end) in enumerate(llm_calls):
+        usage = TokenUsageBaseModel(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+        steps.append(_step(IntermediateStepType.LLM_START, llm_start, f"{prefix}-{i}"))
+        steps.append(_step(IntermediateStepType.LLM_END, llm_end, f"{prefix}-{i}", usage=usage))
+    end = max([start] + [end for _, end in llm_calls]) + 0.5
+    steps.append(_step(IntermediateStepType.WORKFLOW_END, end, f"{prefix}-workflow", name="workflow"))
+    return steps
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "exponential"])
+def test_tdigest_rank_error_is_small(distribution: str):
+    rnd = random.Random(0)
+    digest = TDigest()
+    values = []
+    for _ in range(50_000):
+        value = rnd.random() if distribution == "uniform" else rnd.expovariate(1.0)
+        digest.add(value)
+        values.append(value)
+    values.sort()
+
+    for q in (0.01, 0.5, 0.9, 0.95, 0.99, 0.999):
+        rank = bisect.bisect_left(values, digest.quantile(q)) / len(values)
+        assert abs(rank - q) < 0.005
+
+    assert digest.quantile(0.0) == values[0]
+    assert digest.quantile(1.0) == values[-1]
+    assert digest.count == len(values)
+
+
+def test_tdigest_small_inputs():
+    assert TDigest().quantile(0.5) == 0.0
+
+    digest = TDigest()
+    digest.add(3.0)
+    assert digest.quantile(0.99) == 3.0
+
+    with pytest.raises(ValueError):
+        digest.quantile(2.0)
+
+
+async def test_online_metrics_match_batch_profiler(tmp_path):
+    rnd = random.Random(0)
+    all_steps = []
+    for example in range(20):
+        start = example * 0.7
+        calls = []
+        t = start + 0.1
+        for _ in range(3):
+            calls.append((t, t + rnd.uniform(0.1, 2.0)))
+            t = calls[-1][1] + 0.05
+        all_steps.append(_example(start, calls, f"example-{example}"))
+
+    profiler = OnlineProfiler()
+    for steps in all_steps:
+        example_id = profiler.start_example()
+        for step in steps:
+            profiler.observe(example_id, step)
+        profiler.end_example(example_id)
+    online = profiler.snapshot()
+
+    batch_runner = ProfilerRunner(ProfilerConfig(), tmp_path / "batch", write_output=False)
+    batch = await batch_runner.run(all_steps)
+    batch_run_time = batch_runner._compute_workflow_run_time_confidence_intervals()
+    batch_throughput = batch_runner._compute_throughput_estimates()
+
+    for online_metric, batch_metric in ((online.llm_latency, batch.llm_latency_ci),
+                                        (online.workflow_run_time, batch_run_time),
+                                        (online.throughput, batch_throughput)):
+        assert online_metric.n == batch_metric.n
+        assert online_metric.mean == pytest.approx(batch_metric.mean)
+        assert online_metric.ninety_fifth_interval == pytest.approx(batch_metric.ninety_fifth_interval)
+
+    # Percentiles are estimated, with few samples the t-digest keeps every sample
+    assert online.llm_latency.p90 == pytest.approx(batch.llm_latency_ci.p90, rel=0.05)
+
+    assert online.examples_completed == 20
+    assert online.token_usage["llama"].calls == 60
+    assert online.token_usage["llama"].total_tokens == 900
+
+    # Reusing the online metrics produces the same report without recomputing them
+    reused = await ProfilerRunner(ProfilerConfig(base_metrics=True), tmp_path / "online").run(all_steps,
+                                                                                              online_metrics=online)
+    assert reused.llm_latency_ci == online.llm_latency
+    assert reused.workflow_runtime_metrics.p99 == online.workflow_run_time.p99
+    assert (tmp_path / "online" / "online_profiler_metrics.json").exists()
+
+
+def test_llm_concurrency_across_examples():
+    profiler = OnlineProfiler()
+    first = profiler.start_example()
+    second = profiler.start_example()
+
+    profiler.observe(first, _step(IntermediateStepType.LLM_START, 0.0, "a"))
+    profiler.observe(second, _step(IntermediateStepType.LLM_START, 1.0, "b"))
+    profiler.observe(first, _step(IntermediateStepType.LLM_END, 2.0, "a"))
+
+    live = profiler.snapshot()
+    assert live.examples_in_progress == 2
+    assert live.max_llm_concurrency == 2
+    assert live.llm_concurrency_seconds == {1: 1.0, 2: 1.0}
+
+    profiler.end_example(first)
+
+    # The second example fails with its LLM call still open
+    profiler.observe(second, _step(IntermediateStepType.WORKFLOW_START, 4.0, "w", name="workflow"))
+    profiler.end_example(second, completed=False)
+
+    metrics = profiler.snapshot()
+    assert metrics.examples_in_progress == 0
+    assert metrics.examples_completed == 1
+    assert metrics.workflow_run_time.mean == 2.0
+    assert metrics.llm_concurrency_seconds == {1: 3.0, 2: 1.0}
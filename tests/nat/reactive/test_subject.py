@@ -13,7 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import time
+
+import pytest
+
 from nat.utils.reactive.observer import Observer
+from nat.utils.reactive.subject import AsyncDispatchSubject
 from nat.utils.reactive.subject import Subject
 
 
@@ -84,3 +90,73 @@ def test_subject_late_subscriber_after_dispose():
     sub.subscribe(Observer(on_next=items.append))
     sub.on_next("ignored")
     assert not items
+
+
+def test_subject_unsubscribe_during_delivery():
+    sub = Subject[str]()
+    items1, items2 = [], []
+
+    def _on_next(value: str):
+        items1.append(value)
+        sub2.unsubscribe()
+
+    sub.subscribe(Observer(on_next=_on_next))
+    sub2 = sub.subscribe(Observer(on_next=items2.append))
+
+    # The item being delivered still reaches the observer unsubscribed during its delivery
+    sub.on_next("a")
+    sub.on_next("b")
+    assert items1 == ["a", "b"]
+    assert items2 == ["a"]
+
+
+async def test_async_dispatch_subject():
+    sub = AsyncDispatchSubject[str]()
+    items, completed = [], []
+    sub.subscribe(on_next=items.append, on_complete=lambda: completed.append(True))
+
+    sub.on_next("a")
+    sub.on_next("b")
+    sub.on_complete()
+    sub.on_next("ignored")
+
+    # Nothing is delivered on the producer's stack
+    assert not items
+    assert sub.pending == 3
+
+    await asyncio.sleep(0)
+    assert items == ["a", "b"]
+    assert completed == [True]
+    assert not sub.has_observers
+
+
+async def test_async_dispatch_subject_from_thread():
+    sub = AsyncDispatchSubject[int]()
+    items = []
+    sub.subscribe(on_next=items.append)
+
+    def _produce():
+        for i in range(1000):
+            sub.on_next(i)
+
+    await asyncio.to_thread(_produce)
+    await asyncio.sleep(0)
+    assert items == list(range(1000))
+
+
+@pytest.mark.slow
+@pytest.mark.benchmark
+def test_subject_on_next_benchmark():
+    # Events per second emitted to a single observer, the previous implementation took a lock and copied the observer
+    # list for each event
+    num_events = 1_000_000
+    sub = Subject[int]()
+    sub.subscribe(on_next=lambda value: None)
+
+    start = time.perf_counter()
+    for i in range(num_events):
+        sub.on_next(i)
+    elapsed = time.perf_counter() - start
+
+    print(f"Subject.on_next: {num_events / elapsed:,.0f} events/s")
+    assert elapsed < 10.0
@@ -13,6 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import threading
+
 import pytest
 from langchain_core.embeddings import Embeddings
 from pytest_httpserver import HTTPServer
@@ -258,6 +261,139 @@ async def test_milvus_validation(milvus_retriever):
         _ = await milvus_retriever.search(query="Test query", collection_name="collection1", top_k=2)
 
 
+class CountingMilvusClient(CustomMilvusClient):
+    """Returns hits for each searched vector, and records the calls made to the server."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.searched_vectors: list[int] = []
+        self.describe_calls = 0
+
+    def describe_collection(self, collection_name: str):
+        self.describe_calls += 1
+        return super().describe_collection(collection_name)
+
+    def search(self, *, data: list, **kwargs):
+        self.searched_vectors.append(len(data))
+        hits = super().search(data=data, **kwargs)[0]
+        return [[{**hit, "id": f"{vector[0]}-{hit['id']}"} for hit in hits] for vector in data]
+
+
+class CountingEmbeddings(Embeddings):
+
+    def __init__(self):
+        self.embedded: list[str] = []
+
+    def embed_query(self, text):
+        self.embedded.append(text)
+        return [len(self.embedded), 1, 2, 3]
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+
+async def test_milvus_batched_search():
+    client = CountingMilvusClient()
+    retriever = MilvusRetriever(client=client, embedder=CountingEmbeddings(), batch_searches=True, max_batch_wait=0.05)
+    retriever.bind(collection_name="collection1", top_k=2)
+
+    results = await asyncio.gather(*(retriever.search(query=f"query {i}") for i in range(5)))
+
+    # One search with all the vectors, each query gets the hits of its own vector
+    assert client.searched_vectors == [5]
+    assert len({res.results[0].document_id for res in results}) == 5
+    for res in results:
+        assert len(res) == 2
+        _validate_document_milvus(res.results[0])
+
+    # Searches with different parameters are not batched together
+    await asyncio.gather(retriever.search(query="a", top_k=1), retriever.search(query="b", top_k=3))
+    assert sorted(client.searched_vectors[1:]) == [1, 1]
+
+    # The collection schema is only retrieved once
+    assert client.describe_calls == 1
+
+
+async def test_milvus_batch_size_limit():
+    client = CountingMilvusClient()
+    retriever = MilvusRetriever(client=client,
+                                embedder=CountingEmbeddings(),
+                                batch_searches=True,
+                                max_batch_size=2,
+                                max_batch_wait=0.05)
+
+    await asyncio.gather(*(retriever.search(query=f"query {i}", collection_name="collection1", top_k=2)
+                           for i in range(5)))
+
+    assert sorted(client.searched_vectors) == [1, 2, 2]
+
+
+class _SearchIteratorPage(list):
+
+    def get_res(self):
+        return [list(self)]
+
+
+class IteratorMilvusClient(CustomMilvusClient):
+    """Search iterator recording the threads its blocking calls run on."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.call_threads: list[int] = []
+
+    def search_iterator(self, **kwargs):
+        self.call_threads.append(threading.get_ident())
+        pages = [self.search(**kwargs)[0], []]
+        client = self
+
+        class _Iterator:
+
+            def next(self):
+                client.call_threads.append(threading.get_ident())
+                return _SearchIteratorPage(pages.pop(0))
+
+            def close(self):
+                client.call_threads.append(threading.get_ident())
+
+        return _Iterator()
+
+    def search(self, **kwargs):
+        kwargs.pop("batch_size", None)
+        kwargs.pop("round_decimal", None)
+        kwargs.pop("partition_names", None)
+        return super().search(**kwargs)
+
+
+async def test_milvus_search_iterator_runs_off_the_event_loop():
+    client = IteratorMilvusClient()
+    retriever = MilvusRetriever(client=client, embedder=TestEmbeddings(), use_iterator=True)
+
+    res = await retriever.search(query="Test query", collection_name="collection1", top_k=2)
+
+    assert len(res) == 2
+    _validate_document_milvus(res.results[0])
+    assert client.call_threads
+    assert threading.get_ident() not in client.call_threads
+
+
+async def test_milvus_search_many_and_embedding_cache():
+    client = CountingMilvusClient()
+    embedder = CountingEmbeddings()
+    retriever = MilvusRetriever(client=client, embedder=embedder, embedding_cache_size=2)
+    retriever.bind(collection_name="collection2", top_k=3)
+
+    results = await retriever.search_many(["a", "b", "a"], output_fields=["title"])
+    assert client.searched_vectors == [3]
+    assert [len(res) for res in results] == [3, 3, 3]
+    _validate_document_milvus(results[0].results[0], ["title"])
+
+    # Cached embeddings are reused, the least recently used embedding is evicted
+    await retriever.search(query="a")
+    await retriever.search(query="c")
+    await retriever.search(query="b")
+    assert embedder.embedded == ["a", "b", "c", "b"]
+
+
 @pytest.fixture(name="nemo_retriever")
 def get_nemo_retriever(httpserver: HTTPServer):
     httpserver.expect_request(
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from collections.abc import AsyncGenerator
 
 import pytest
@@ -25,6 +26,7 @@ from nat.cli.register_workflow import register_function
 from nat.data_models.function import FunctionBaseConfig
 from nat.observability.exporter_manager import ExporterManager
 from nat.runtime.runner import Runner
+from nat.runtime.runner import RunnerState
 
 
 class DummyConfig(FunctionBaseConfig, name="dummy_runner"):
@@ -39,6 +41,10 @@ class StreamOutputConfig(FunctionBaseConfig, name="stream_output_runner"):
     pass
 
 
+class BlockingOutputConfig(FunctionBaseConfig, name="blocking_output_runner"):
+    pass
+
+
 @pytest.fixture(scope="module", autouse=True)
 async def _register_single_output_fn():
 
@@ -63,6 +69,19 @@ async def _register_stream_output_fn():
         yield _inner_stream
 
 
+@pytest.fixture(scope="module", autouse=True)
+async def _register_blocking_output_fn():
+
+    @register_function(config_type=BlockingOutputConfig)
+    async def register(config: BlockingOutputConfig, b: Builder):
+
+        async def _inner(message: str) -> str:
+            await asyncio.Event().wait()
+            return message
+
+        yield _inner
+
+
 async def test_runner_result_successful_type_conversion():
     """Test that Runner.result() successfully converts output when compatible to_type is provided."""
 
@@ -282,3 +301,28 @@ async def test_runner_state_management():
         async with runner:
             result = await runner.result()
             assert result == "test!"
+
+
+async def test_runner_cancellation():
+    """Test that a cancelled run exits the context with the cancellation rather than a state error."""
+
+    async with WorkflowBuilder() as builder:
+        entry_fn = await builder.add_function(name="test_function", config=BlockingOutputConfig())
+
+        runner = Runner(input_message="test",
+                        entry_fn=entry_fn,
+                        context_state=ContextState(),
+                        exporter_manager=ExporterManager())
+
+        async def _run():
+            async with runner:
+                return await runner.result()
+
+        task = asyncio.create_task(_run())
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert runner._state == RunnerState.CANCELLED
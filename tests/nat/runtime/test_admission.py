@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+
+import pytest
+
+from nat.runtime.admission import AdmissionController
+from nat.runtime.admission import AdmissionRejectedError
+from nat.runtime.admission import parse_request_timeout
+
+
+async def _hold(controller: AdmissionController, release: asyncio.Event, started: list, name: str, **kwargs):
+    async with controller.acquire(**kwargs):
+        started.append(name)
+        await release.wait()
+
+
+async def _until_queued(controller: AdmissionController, queue_size: int):
+    while controller.queue_size < queue_size:
+        await asyncio.sleep(0)
+
+
+async def test_priority_order():
+    controller = AdmissionController(max_concurrency=1)
+    release = asyncio.Event()
+    started = []
+
+    tasks = [asyncio.create_task(_hold(controller, release, started, "running"))]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(_hold(controller, release, started, "low", priority=0)))
+    tasks.append(asyncio.create_task(_hold(controller, release, started, "high", priority=1)))
+    await _until_queued(controller, 2)
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert started == ["running", "high", "low"]
+    assert controller.in_flight == 0
+
+
+async def test_queue_full_rejects_and_sheds():
+    controller = AdmissionController(max_concurrency=1, max_queue_size=1)
+    release = asyncio.Event()
+    started = []
+
+    running = asyncio.create_task(_hold(controller, release, started, "running"))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(_hold(controller, release, started, "queued", priority=0))
+    await _until_queued(controller, 1)
+
+    # Same priority as the queued run
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with controller.acquire(priority=0):
+            pass
+    assert exc_info.value.status_code == 429
+
+    # A higher priority run sheds the queued run
+    urgent = asyncio.create_task(_hold(controller, release, started, "urgent", priority=1))
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        await queued
+    assert exc_info.value.status_code == 503
+
+    release.set()
+    await asyncio.gather(running, urgent)
+    assert started == ["running", "urgent"]
+    assert controller.in_flight == 0
+
+
+async def test_deadline():
+    controller = AdmissionController(max_concurrency=1)
+    release = asyncio.Event()
+    started = []
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with controller.acquire(deadline=time.monotonic()):
+            pass
+    assert exc_info.value.status_code == 503
+
+    running = asyncio.create_task(_hold(controller, release, started, "running"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejectedError) as exc_info:
+        async with controller.acquire(deadline=time.monotonic() + 0.05):
+            pass
+    assert exc_info.value.status_code == 503
+    assert controller.queue_size == 0
+
+    release.set()
+    await running
+    assert controller.in_flight == 0
+
+
+async def test_cancelled_while_queued():
+    controller = AdmissionController(max_concurrency=1)
+    release = asyncio.Event()
+    started = []
+
+    running = asyncio.create_task(_hold(controller, release, started, "running"))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(_hold(controller, release, started, "queued"))
+    await _until_queued(controller, 1)
+
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert controller.queue_size == 0
+
+    release.set()
+    await running
+    assert started == ["running"]
+    assert controller.in_flight == 0
+
+
+async def test_aimd():
+    controller = AdmissionController(max_concurrency=4, min_concurrency=2, target_latency=0.01, backoff_ratio=0.5)
+
+    async with controller.acquire():
+        await asyncio.sleep(0.02)
+    assert controller.limit == 2
+
+    # The limit never drops below min_concurrency
+    async with controller.acquire():
+        await asyncio.sleep(0.02)
+    assert controller.limit == 2
+
+    # Fast runs using the whole limit increase it additively
+    async def _fast_run():
+        async with controller.acquire():
+            await asyncio.sleep(0)
+
+    for _ in range(10):
+        await asyncio.gather(*(_fast_run() for _ in range(controller.limit)))
+    assert controller.limit == 4
+
+
+def test_parse_request_timeout():
+    assert parse_request_timeout(None) is None
+    assert parse_request_timeout("invalid") is None
+    assert parse_request_timeout("-1") is None
+    assert parse_request_timeout("nan") is None
+
+    deadline = parse_request_timeout("2.5")
+    assert deadline == pytest.approx(time.monotonic() + 2.5, abs=0.1)
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp import types
+from mcp.server.lowlevel import Server
+from mcp.shared.memory import create_client_server_memory_streams
+
+from nat.tool.mcp.mcp_client import MCPBuilder
+from nat.tool.mcp.mcp_session_pool import MCPSessionPool
+
+ECHO_SCHEMA = {"type": "object", "properties": {"text": {"type": "string"}}, "required": ["text"]}
+
+
+class _MCPServer:
+    """In-memory MCP server counting the connections and the tool list requests it receives."""
+
+    def __init__(self):
+        self.connections = 0
+        self.list_tools_requests = 0
+        self.server = Server("test")
+
+        @self.server.list_tools()
+        async def _list_tools() -> list[types.Tool]:
+            self.list_tools_requests += 1
+            return [
+                types.Tool(name="echo", description="Echo the text", inputSchema=ECHO_SCHEMA),
+                types.Tool(name="change_tools", description="Change the tools", inputSchema={"type": "object"}),
+            ]
+
+        @self.server.call_tool()
+        async def _call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+            if name == "change_tools":
+                await self.server.request_context.session.send_tool_list_changed()
+                return [types.TextContent(type="text", text="changed")]
+            await asyncio.sleep(0.05)
+            return [types.TextContent(type="text", text=arguments["text"])]
+
+    @asynccontextmanager
+    async def connect(self):
+        self.connections += 1
+        async with create_client_server_memory_streams() as (client_streams, server_streams):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(lambda: self.server.run(*server_streams, self.server.create_initialization_options()))
+                try:
+                    yield client_streams
+                finally:
+                    tg.cancel_scope.cancel()
+
+
+@pytest.fixture(name="mcp_server")
+def mcp_server_fixture() -> _MCPServer:
+    return _MCPServer()
+
+
+async def test_concurrent_calls_share_a_session(mcp_server: _MCPServer):
+    async with MCPSessionPool("memory://test", transport=mcp_server.connect) as pool:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(pool.call_tool("echo", {"text": str(i)}) for i in range(10)))
+        elapsed = time.perf_counter() - start
+
+        assert [result.content[0].text for result in results] == [str(i) for i in range(10)]
+        assert mcp_server.connections == 1
+        assert elapsed < 0.4
+
+        metrics = pool.metrics()
+        assert metrics.open_sessions == 1
+        assert metrics.requests == 10
+        assert metrics.in_flight_requests == 0
+
+    assert pool.metrics().open_sessions == 0
+
+
+async def test_sessions_grow_with_load(mcp_server: _MCPServer):
+    async with MCPSessionPool("memory://test", max_sessions=2, transport=mcp_server.connect) as pool:
+        await asyncio.gather(*(pool.call_tool("echo", {"text": "hello"}) for _ in range(4)))
+        assert mcp_server.connections == 2
+        assert pool.metrics().open_sessions == 2
+
+
+async def test_tool_list_cache(mcp_server: _MCPServer):
+    async with MCPSessionPool("memory://test", transport=mcp_server.connect) as pool:
+        tools = await pool.list_tools()
+        assert [tool.name for tool in tools] == ["echo", "change_tools"]
+        await pool.list_tools()
+        assert mcp_server.list_tools_requests == 1
+
+        # The server notifies the client that the tool list changed
+        version = pool.tools_version
+        await pool.call_tool("change_tools", {})
+        assert pool.tools_version == version + 1
+
+        await pool.list_tools()
+        assert mcp_server.list_tools_requests == 2
+
+        metrics = pool.metrics()
+        assert metrics.tool_list_cache_hits == 1
+        assert metrics.tool_list_invalidations == 1
+
+
+async def test_reconnect_after_connection_loss(mcp_server: _MCPServer):
+    async with MCPSessionPool("memory://test", transport=mcp_server.connect) as pool:
+        await pool.list_tools()
+
+        # Simulate a lost connection
+        await pool._sessions[0].close()
+        assert pool.metrics().open_sessions == 0
+
+        result = await pool.call_tool("echo", {"text": "hello"})
+        assert result.content[0].text == "hello"
+        assert mcp_server.connections == 2
+
+        # Tool list changes could not be received while disconnected
+        assert pool.metrics().tool_list_invalidations == 1
+        list_tools_requests = mcp_server.list_tools_requests
+        await pool.list_tools()
+        assert mcp_server.list_tools_requests == list_tools_requests + 1
+
+
+async def test_connection_failure(mcp_server: _MCPServer):
+
+    @asynccontextmanager
+    async def _refuse_connection():
+        raise ConnectionError("connection refused")
+        yield  # pylint: disable=unreachable
+
+    async with MCPSessionPool("memory://test", transport=_refuse_connection) as pool:
+        with pytest.raises(ConnectionError):
+            await pool.call_tool("echo", {"text": "hello"})
+
+        metrics = pool.metrics()
+        assert metrics.connection_failures == 1
+        assert metrics.last_error == "connection refused"
+
+
+async def test_builder_uses_session_pool(mcp_server: _MCPServer, monkeypatch):
+    pool = MCPSessionPool("memory://test", transport=mcp_server.connect)
+    monkeypatch.setattr("nat.tool.mcp.mcp_client.get_session_pool", lambda url: pool)
+
+    async with pool:
+        builder = MCPBuilder(url="memory://test")
+        tools = await builder.get_tools()
+        assert await builder.get_tools() is tools
+
+        tool = await builder.get_tool("echo")
+        assert tool.input_schema.model_fields.keys() == {"text"}
+        assert await tool.acall({"text": "hello"}) == "hello"
+        assert await tool.acall({"text": "world"}) == "world"
+
+        assert mcp_server.connections == 1
+        assert mcp_server.list_tools_requests == 1
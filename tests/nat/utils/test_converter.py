@@ -459,3 +459,64 @@ def test_try_convert_preserves_object_identity():
     original_dict = {"key": "value"}
     result = converter.try_convert(original_dict, list)
     assert result is original_dict  # Same object, not a copy
+
+
+def test_conversion_path_is_cached():
+    calls = []
+
+    def dict_to_str(d: dict) -> str:
+        calls.append("dict_to_str")
+        return str(d["value"])
+
+    def str_to_float(s: str) -> float:
+        calls.append("str_to_float")
+        return float(s)
+
+    converter = TypeConverter([str_to_float, dict_to_str], parent=None)
+
+    assert converter.convert({"value": "1.5"}, float) == 1.5
+    assert converter._path_cache[(dict, float)] == (dict_to_str, str_to_float)
+
+    # The cached path is applied without searching for converters
+    calls.clear()
+    assert converter.convert({"value": "2.5"}, float) == 2.5
+    assert calls == ["dict_to_str", "str_to_float"]
+
+    # Missing conversions are cached too
+    with pytest.raises(ValueError):
+        converter.convert([1], float)
+    assert converter._path_cache[(list, float)] is None
+
+    # Adding a converter invalidates the cache
+    def list_to_float(values: list) -> float:
+        return float(sum(values))
+
+    converter.add_converter(list_to_float)
+    assert converter.convert([1, 2], float) == 3.0
+
+
+def test_conversion_cache_invalidated_by_parent():
+    parent = TypeConverter([], parent=None)
+    child = TypeConverter([], parent=parent)
+
+    with pytest.raises(ValueError):
+        child.convert(4, str)
+
+    parent.add_converter(convert_int_to_str)
+    assert child.convert(4, str) == "4"
+
+
+def test_rejected_values_are_not_cached():
+    converter = TypeConverter([convert_str_to_int], parent=None)
+
+    # The converter rejects this value, which doesn't mean strings can't be converted
+    with pytest.raises(ValueError):
+        converter.convert("abc", int)
+    assert (str, int) not in converter._path_cache
+
+    assert converter.convert("12", int) == 12
+    assert converter._path_cache[(str, int)] == (convert_str_to_int, )
+
+    # A value rejected by the cached path falls back to a full resolution
+    with pytest.raises(ValueError):
+        converter.convert("abc", int)